@@ -292,6 +292,24 @@ ovh_ai_breaker = CircuitBreaker(
     expected_exception=ServiceUnavailableError,
 )
 
+# Circuit breaker for Mistral AI chat completions
+mistral_breaker = CircuitBreaker(
+    name="mistral-api",
+    failure_threshold=5,
+    success_threshold=2,
+    recovery_timeout=60,
+    expected_exception=ServiceUnavailableError,
+)
+
+# Circuit breaker for the Dify RAG guideline service
+dify_rag_breaker = CircuitBreaker(
+    name="dify-rag",
+    failure_threshold=3,  # RAG calls are slow (90s timeout), give up sooner
+    success_threshold=2,
+    recovery_timeout=120,
+    expected_exception=ServiceUnavailableError,
+)
+
 # Circuit breaker for Redis/Celery
 redis_breaker = CircuitBreaker(
     name="redis",
@@ -312,17 +330,15 @@ def get_circuit_breaker(name: str) -> CircuitBreaker | None:
     Returns:
         CircuitBreaker instance or None if not found
     """
-    breakers = {
-        "ovh-ai-api": ovh_ai_breaker,
-        "redis": redis_breaker,
-    }
-    return breakers.get(name)
+    return get_all_circuit_breakers().get(name)
 
 
 def get_all_circuit_breakers() -> dict[str, CircuitBreaker]:
     """Get all configured circuit breakers."""
     return {
         "ovh-ai-api": ovh_ai_breaker,
+        "mistral-api": mistral_breaker,
+        "dify-rag": dify_rag_breaker,
         "redis": redis_breaker,
     }
 
@@ -48,6 +48,12 @@ class Settings(BaseSettings):
     # ==================
     redis_url: str | None = Field(default=None, description="Redis connection string for Celery")
     redis_max_connections: int = Field(default=50, description="Maximum Redis connections")
+    progress_stream_max_connections: int = Field(
+        default=500, description="Maximum concurrent progress event streams per API process"
+    )
+    progress_stream_heartbeat_seconds: int = Field(
+        default=15, description="Interval between keep-alive comments on progress streams"
+    )
 
     # ==================
     # Cache Settings
@@ -92,6 +98,10 @@ class Settings(BaseSettings):
     secret_key: SecretStr | None = Field(
         default=None, description="Secret key for session encryption"
     )
+    pipeline_text_hash_key: SecretStr | None = Field(
+        default=None,
+        description="HMAC key of the content hashes of stored step texts (default: ENCRYPTION_KEY)",
+    )
     admin_access_code: str = Field(
         default="admin123",
         description="Access code for settings UI",
@@ -181,6 +191,49 @@ class Settings(BaseSettings):
     # File Processing Settings
     # ==================
     max_file_size_mb: int = Field(default=50, description="Maximum upload file size in MB")
+    upload_max_concurrent_ingestions: int = Field(
+        default=4,
+        description="Maximum uploads validated, analyzed and encrypted at once per API process",
+    )
+    quality_analysis_workers: int = Field(
+        default=2,
+        description="Processes per API process for upload quality analysis (0: run in a thread)",
+    )
+    quality_analysis_time_budget_seconds: float = Field(
+        default=8.0, description="Time budget per document for upload quality analysis"
+    )
+    quality_analysis_max_sample_pages: int = Field(
+        default=12, description="Maximum PDF pages sampled by upload quality analysis"
+    )
+    quality_analysis_cache_ttl_seconds: int = Field(
+        default=86400, description="How long quality analyses are cached by content hash"
+    )
+    ai_log_buffered_writes: bool = Field(
+        default=True,
+        description="Write AI cost/interaction logs in background batches instead of per call",
+    )
+    ai_log_batch_size: int = Field(default=200, description="Maximum AI log rows per INSERT")
+    ai_log_flush_interval_seconds: float = Field(
+        default=2.0, description="Maximum time an AI log row waits in the buffer"
+    )
+    ai_log_queue_size: int = Field(
+        default=5000, description="Buffered AI log rows per process before spilling to Redis"
+    )
+    ai_log_spill_max_len: int = Field(
+        default=100000, description="Approximate maximum length of the Redis AI log spill stream"
+    )
+    ai_log_max_write_attempts: int = Field(
+        default=5,
+        description="Failed inserts of a spilled AI log batch before it is dead-lettered",
+    )
+    ai_cost_rollup_refresh_hours: int = Field(
+        default=24,
+        ge=0,
+        description="Closed hours re-aggregated on every cost rollup run to count late AI logs",
+    )
+    export_batch_size: int = Field(
+        default=1000, description="Rows fetched per server-side cursor round trip in exports"
+    )
     allowed_file_types: list[str] = Field(
         default_factory=lambda: [".pdf", ".docx", ".txt", ".jpg", ".jpeg", ".png"],
         description="Allowed file extensions",
@@ -205,6 +258,32 @@ class Settings(BaseSettings):
     ai_request_delay_ms: int = Field(
         default=100, description="Delay between AI requests in milliseconds"
     )
+    pipeline_max_parallel_steps: int = Field(
+        default=3,
+        ge=1,
+        description="Pipeline steps of one job executed at once (1: strictly sequential)",
+    )
+    pipeline_chunk_max_tokens: int = Field(
+        default=3000, ge=500, description="Default input tokens per chunk for chunked steps"
+    )
+    pipeline_chunk_max_parallel: int = Field(
+        default=3, ge=1, description="Chunks of one step sent to the model at once"
+    )
+    pipeline_stream_interval_ms: int = Field(
+        default=500,
+        ge=50,
+        description="Interval between partial output events of streaming steps",
+    )
+    llm_cache_enabled: bool = Field(
+        default=False,
+        description="Cache responses of repeatable LLM calls by prompt hash (opt-in)",
+    )
+    llm_cache_ttl_seconds: int = Field(
+        default=86400, ge=60, description="Expiry of cached LLM responses in Redis"
+    )
+    llm_cache_max_entries: int = Field(
+        default=256, ge=0, description="Cached LLM responses kept in memory per process"
+    )
 
     # ==================
     # Logging Settings
@@ -18,6 +18,8 @@ SECURITY CRITICAL:
 Token Format:
 - AES-256-GCM: version(1) + timestamp(8) + nonce(12) + ciphertext + tag(16)
 - Version byte 0xAE distinguishes from Fernet's 0x80
+- Binary (raw bytes, for LargeBinary columns): header(16) + sealed 1MB segments,
+  see encrypt_binary()
 
 Usage:
     from app.core.encryption import encryptor
@@ -36,12 +38,15 @@ Usage:
 """
 
 import base64
+from collections.abc import Iterable, Iterator
+from functools import partial
 import logging
 import os
 import struct
 import time
-from typing import Any
+from typing import Any, BinaryIO
 
+from cryptography.exceptions import InvalidTag
 from cryptography.fernet import Fernet, InvalidToken
 from cryptography.hazmat.primitives.ciphers.aead import AESGCM
 
@@ -75,6 +80,41 @@ AES256GCM_NONCE_SIZE = 12
 # Timestamp size (8 bytes for 64-bit timestamp)
 AES256GCM_TIMESTAMP_SIZE = 8
 
+# Binary token magic (0xAF is never the first byte of a base64 token or UTF-8 text)
+BINARY_TOKEN_MAGIC = b"\xafDWB"
+
+# Binary token format version
+BINARY_TOKEN_VERSION = 0x01
+
+# Plaintext bytes per sealed segment of a binary token
+BINARY_SEGMENT_SIZE = 1024 * 1024
+
+# Random nonce prefix shared by all segments of a binary token
+BINARY_NONCE_PREFIX_SIZE = 7
+
+# magic(4) + version(1) + segment size(4) + nonce prefix(7)
+BINARY_HEADER_SIZE = len(BINARY_TOKEN_MAGIC) + 1 + 4 + BINARY_NONCE_PREFIX_SIZE
+
+# AES-GCM authentication tag size
+AES256GCM_TAG_SIZE = 16
+
+
+def _segment_nonce(nonce_prefix: bytes, index: int, final: bool) -> bytes:
+    """Build the 96-bit nonce of a binary token segment: prefix + index + final flag."""
+    return nonce_prefix + struct.pack(">IB", index, final)
+
+
+def _rechunk(chunks: Iterable[bytes], size: int) -> Iterator[bytes]:
+    """Regroup chunks of any size into pieces of exactly size bytes (last may be shorter)."""
+    buffer = bytearray()
+    for chunk in chunks:
+        buffer += chunk
+        while len(buffer) >= size:
+            yield bytes(buffer[:size])
+            del buffer[:size]
+    if buffer:
+        yield bytes(buffer)
+
 
 class FieldEncryptor:
     """
@@ -836,6 +876,238 @@ class FieldEncryptor:
             logger.error(f"Binary decryption failed: {e}")
             raise DecryptionError(f"Failed to decrypt binary field: {e}") from e
 
+    @staticmethod
+    def is_binary_token(value: bytes | None) -> bool:
+        """
+        Check if a value is a raw binary token from encrypt_binary().
+
+        Args:
+            value: Value to check
+
+        Returns:
+            True if value starts with the binary token header
+        """
+        return (
+            isinstance(value, bytes | bytearray | memoryview)
+            and len(value) >= BINARY_HEADER_SIZE + AES256GCM_TAG_SIZE
+            and bytes(value[: len(BINARY_TOKEN_MAGIC)]) == BINARY_TOKEN_MAGIC
+        )
+
+    def encrypt_binary(self, binary_data: bytes | None) -> bytes | None:
+        """
+        Encrypt binary data (e.g., file content) into a raw binary token.
+
+        Unlike encrypt_binary_field(), nothing is base64-encoded: the token is
+        stored as-is in a LargeBinary (bytea) column and is only ~16 bytes per
+        MB larger than the input.
+
+        Token format (version 0x01):
+        - Bytes 0-3: Magic (0xAF "DWB")
+        - Byte 4: Version (0x01)
+        - Bytes 5-8: Segment size (32-bit, big-endian)
+        - Bytes 9-15: Nonce prefix (random, 56-bit)
+        - Remaining: Segments, each AES-256-GCM ciphertext + tag of up to
+          segment size plaintext bytes
+
+        Segment i is sealed with nonce prefix + i (32-bit) + final flag (1 byte)
+        and the header as associated data, so segments can't be reordered,
+        dropped or truncated without failing authentication.
+
+        Args:
+            binary_data: Binary data to encrypt (bytes or None)
+
+        Returns:
+            Binary token, or None if input is None (input as-is if encryption is disabled)
+
+        Raises:
+            EncryptionError: If encryption fails
+        """
+        if binary_data is None or not self.is_enabled():
+            return binary_data
+
+        view = memoryview(binary_data)
+        segments = (
+            view[offset : offset + BINARY_SEGMENT_SIZE]
+            for offset in range(0, len(view), BINARY_SEGMENT_SIZE)
+        )
+        try:
+            return b"".join(self._seal_segments(segments, BINARY_SEGMENT_SIZE))
+        except Exception as e:
+            logger.error(f"Binary encryption failed: {e}")
+            raise EncryptionError(f"Failed to encrypt binary data: {e}") from e
+
+    def decrypt_binary(self, token: bytes | None) -> bytes | None:
+        """
+        Decrypt a raw binary token from encrypt_binary() in one pass.
+
+        Args:
+            token: Binary token (bytes or None)
+
+        Returns:
+            Decrypted binary data, or None if input is None (input as-is if
+            encryption is disabled)
+
+        Raises:
+            DecryptionError: If the token is malformed or fails authentication
+        """
+        if token is None or not self.is_enabled():
+            return token
+
+        view = memoryview(token)
+        header, segment_size = self._parse_binary_header(view)
+        sealed_size = segment_size + AES256GCM_TAG_SIZE
+        body = view[BINARY_HEADER_SIZE:]
+        if len(body) < AES256GCM_TAG_SIZE:
+            raise DecryptionError(f"Binary token too short: {len(token)} bytes")
+
+        last = (len(body) - 1) // sealed_size
+        sealed_segments = (
+            (body[index * sealed_size : (index + 1) * sealed_size], index == last)
+            for index in range(last + 1)
+        )
+        return b"".join(self._open_segments(header, sealed_segments))
+
+    def encrypt_binary_stream(
+        self, chunks: Iterable[bytes], segment_size: int = BINARY_SEGMENT_SIZE
+    ) -> Iterator[bytes]:
+        """
+        Encrypt a stream of binary chunks into a binary token, segment by segment.
+
+        Only one segment is held in memory; concatenating the yielded pieces gives
+        the same format as encrypt_binary() (decryptable with decrypt_binary()).
+
+        Args:
+            chunks: Plaintext chunks of any size
+            segment_size: Plaintext bytes per sealed segment
+
+        Yields:
+            Token pieces (header, then one sealed segment at a time)
+
+        Raises:
+            EncryptionError: If encryption is disabled or fails
+        """
+        if not self.is_enabled():
+            raise EncryptionError("Encryption is disabled, cannot produce a binary token")
+        yield from self._seal_segments(_rechunk(chunks, segment_size), segment_size)
+
+    def encrypt_binary_file(self, file: BinaryIO) -> bytes:
+        """
+        Encrypt a readable binary file (e.g. a spooled upload) into a binary token.
+
+        The file is read one segment at a time, so only the token is held in memory.
+
+        Args:
+            file: Binary file positioned at the start of the content
+
+        Returns:
+            Binary token (same format as encrypt_binary())
+
+        Raises:
+            EncryptionError: If encryption is disabled or fails
+        """
+        chunks = iter(partial(file.read, BINARY_SEGMENT_SIZE), b"")
+        return b"".join(self.encrypt_binary_stream(chunks))
+
+    def decrypt_binary_stream(self, chunks: Iterable[bytes]) -> Iterator[bytes]:
+        """
+        Decrypt a binary token arriving in chunks of any size.
+
+        Args:
+            chunks: Token pieces (e.g. from encrypt_binary_stream() or a file)
+
+        Yields:
+            Decrypted plaintext, one segment at a time
+
+        Raises:
+            DecryptionError: If the token is malformed or fails authentication
+        """
+        chunks = iter(chunks)
+        buffer = bytearray()
+        for chunk in chunks:
+            buffer += chunk
+            if len(buffer) >= BINARY_HEADER_SIZE:
+                break
+        header, segment_size = self._parse_binary_header(memoryview(buffer))
+        header = bytes(header)
+        del buffer[:BINARY_HEADER_SIZE]
+
+        def sealed_segments() -> Iterator[tuple[bytes, bool]]:
+            sealed_size = segment_size + AES256GCM_TAG_SIZE
+            for chunk in chunks:
+                buffer.extend(chunk)
+                # Keep the last segment buffered: only the end of the stream marks it final
+                while len(buffer) > sealed_size:
+                    yield bytes(buffer[:sealed_size]), False
+                    del buffer[:sealed_size]
+            if len(buffer) < AES256GCM_TAG_SIZE:
+                raise DecryptionError("Binary token is truncated")
+            yield bytes(buffer), True
+
+        yield from self._open_segments(header, sealed_segments())
+
+    def _seal_segments(self, segments: Iterator, segment_size: int) -> Iterator[bytes]:
+        """Yield the header and sealed segments of a binary token."""
+        cipher = self._get_aesgcm_cipher()
+        nonce_prefix = os.urandom(BINARY_NONCE_PREFIX_SIZE)
+        header = (
+            BINARY_TOKEN_MAGIC
+            + struct.pack(">BI", BINARY_TOKEN_VERSION, segment_size)
+            + nonce_prefix
+        )
+        yield header
+
+        # Look one segment ahead to flag the final one (an empty input is one empty segment)
+        current = next(segments, b"")
+        index = 0
+        while True:
+            following = next(segments, None)
+            final = following is None
+            yield cipher.encrypt(_segment_nonce(nonce_prefix, index, final), current, header)
+            if final:
+                return
+            current = following
+            index += 1
+
+    def _open_segments(
+        self, header: bytes | memoryview, sealed_segments: Iterable[tuple[Any, bool]]
+    ) -> Iterator[bytes]:
+        """Decrypt (segment, is_final) pairs, trying the previous key for key rotation."""
+        header = bytes(header)
+        nonce_prefix = header[-BINARY_NONCE_PREFIX_SIZE:]
+        ciphers = [self._get_aesgcm_cipher()]
+        previous_cipher = self._get_aesgcm_previous_cipher()
+        if previous_cipher:
+            ciphers.append(previous_cipher)
+
+        for index, (sealed, final) in enumerate(sealed_segments):
+            nonce = _segment_nonce(nonce_prefix, index, final)
+            for cipher in ciphers:
+                try:
+                    plaintext = cipher.decrypt(nonce, sealed, header)
+                except InvalidTag:
+                    continue
+                # The whole token uses one key
+                ciphers = [cipher]
+                break
+            else:
+                raise DecryptionError(f"Failed to decrypt binary token (segment {index})")
+            yield plaintext
+
+    @staticmethod
+    def _parse_binary_header(view: memoryview) -> tuple[memoryview, int]:
+        """Validate a binary token header and return it with the segment size."""
+        if len(view) < BINARY_HEADER_SIZE or bytes(view[:4]) != BINARY_TOKEN_MAGIC:
+            raise DecryptionError("Not a binary token (missing header)")
+        version, segment_size = struct.unpack(">BI", view[4:9])
+        if version != BINARY_TOKEN_VERSION:
+            raise DecryptionError(
+                f"Unsupported binary token version: 0x{version:02X} "
+                f"(expected 0x{BINARY_TOKEN_VERSION:02X})"
+            )
+        if segment_size == 0:
+            raise DecryptionError("Invalid binary token segment size: 0")
+        return view[:BINARY_HEADER_SIZE], segment_size
+
     def encrypt_json_field(self, json_data: dict | None) -> str | None:
         """
         Encrypt a JSON/dict field by serializing to JSON string first.
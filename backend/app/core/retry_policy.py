@@ -18,6 +18,7 @@ from typing import Any
 
 from tenacity import (
     AsyncRetrying,
+    RetryCallState,
     RetryError,
     Retrying,
     before_sleep_log,
@@ -25,9 +26,15 @@ from tenacity import (
     retry_if_exception_type,
     stop_after_attempt,
     wait_exponential,
+    wait_exponential_jitter,
 )
 
-from app.core.exceptions import CircuitBreakerError, RateLimitError, is_retryable_error
+from app.core.exceptions import (
+    CircuitBreakerError,
+    PipelineStepError,
+    RateLimitError,
+    is_retryable_error,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -68,6 +75,23 @@ def is_transient_error(exception: Exception) -> bool:
     return any(pattern in error_msg for pattern in transient_patterns)
 
 
+def is_infrastructure_error(exception: Exception) -> bool:
+    """
+    Check if exception signals a provider infrastructure outage (503, ring-balancer).
+
+    These need longer backoff than ordinary transient errors to give the
+    provider's load balancer time to recover.
+
+    Args:
+        exception: The exception to check
+
+    Returns:
+        True if the error is an infrastructure outage, False otherwise
+    """
+    error_msg = str(exception).lower()
+    return "503" in error_msg or "service unavailable" in error_msg or "ring-balancer" in error_msg
+
+
 # ==================== Retry Policies ====================
 
 
@@ -182,6 +206,43 @@ def get_database_retry_policy() -> dict[str, Any]:
     }
 
 
+def get_pipeline_step_retry_policy(max_attempts: int) -> dict[str, Any]:
+    """
+    Get retry policy for AI pipeline steps (ModularPipelineExecutor.execute_step).
+
+    Use with AsyncRetrying so backoff never blocks the event loop. Waits are
+    jittered so jobs hitting the same outage don't retry in lockstep:
+    - Infrastructure errors (503): ~5s, 10s, 20s (max 30s)
+    - Other failures: ~1s, 2s, 4s (max 10s)
+    - Output validation failures (PipelineStepError): immediate, the provider is healthy
+    Open circuit breakers fail fast and are never retried.
+
+    Args:
+        max_attempts: Total attempts including the first call (step.max_retries)
+
+    Returns:
+        Dictionary with tenacity retry configuration
+    """
+    infrastructure_wait = wait_exponential_jitter(initial=5, max=30, jitter=2)
+    default_wait = wait_exponential_jitter(initial=1, max=10, jitter=1)
+
+    def wait_for_error(retry_state: RetryCallState) -> float:
+        exception = retry_state.outcome.exception()
+        if isinstance(exception, PipelineStepError):
+            return 0.0
+        if is_infrastructure_error(exception):
+            return infrastructure_wait(retry_state)
+        return default_wait(retry_state)
+
+    return {
+        "stop": stop_after_attempt(max(1, max_attempts)),
+        "wait": wait_for_error,
+        "retry": retry_if_exception(lambda e: not isinstance(e, CircuitBreakerError)),
+        "before_sleep": before_sleep_log(logger, logging.WARNING),
+        "reraise": True,
+    }
+
+
 # ==================== Retry Decorators ====================
 
 
@@ -3,9 +3,16 @@ Database package initialization
 """
 
 from .chat_feedback_models import ChatMessageFeedbackDB
-from .connection import get_engine, get_session
+from .connection import get_engine, get_pool_status, get_session
 from .models import AIInteractionLog, Base
 
 # DocumentPromptsDB and PipelineStepConfigDB removed - using unified system instead
 
-__all__ = ["get_engine", "get_session", "Base", "AIInteractionLog", "ChatMessageFeedbackDB"]
+__all__ = [
+    "get_engine",
+    "get_pool_status",
+    "get_session",
+    "Base",
+    "AIInteractionLog",
+    "ChatMessageFeedbackDB",
+]
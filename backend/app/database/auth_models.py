@@ -223,6 +223,9 @@ class AuditAction(str, Enum):
     SETTINGS_UPDATE = "settings_update"
     FEATURE_FLAG_CHANGED = "feature_flag_changed"
 
+    # Data export actions
+    AUDIT_EXPORT = "audit_export"
+
     # Security actions
     PERMISSION_DENIED = "permission_denied"
     AUTH_FAILURE = "auth_failure"
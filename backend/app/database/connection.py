@@ -1,31 +1,133 @@
 """
 Database connection and session management using centralized configuration.
+
+The engine (and its connection pool) is created once per process and shared by
+every session factory in this module. After a fork (Celery prefork workers) the
+child process transparently gets a fresh pool so connections are never shared
+across processes.
 """
 
 from collections.abc import Generator
 from contextlib import contextmanager
 import logging
+import os
+import threading
+import time
+from typing import Any
 
 from sqlalchemy import create_engine
+from sqlalchemy import exc as sa_exc
+from sqlalchemy.engine import Engine
 from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import QueuePool
 
 from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
 
-def get_engine():
+class PoolMetrics:
     """
-    Get SQLAlchemy engine with configuration from settings.
+    Thread-safe counters for connection pool checkouts.
 
-    PostgreSQL is required for production. Configuration is validated on startup.
+    - checkout latency: time spent inside the pool handing out a connection
+      (includes opening a new connection when the pool grows)
+    - waits: checkouts that started while every pool and overflow slot was in use
+    - timeouts: checkouts that gave up after pool_timeout seconds
     """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        """Reset all counters (called after fork and by tests)."""
+        with self._lock:
+            self.checkouts = 0
+            self.total_checkout_ms = 0.0
+            self.max_checkout_ms = 0.0
+            self.waits = 0
+            self.total_wait_ms = 0.0
+            self.max_wait_ms = 0.0
+            self.timeouts = 0
+            self.connections_created = 0
+
+    def record_checkout(self, elapsed_ms: float, waited: bool) -> None:
+        with self._lock:
+            self.checkouts += 1
+            self.total_checkout_ms += elapsed_ms
+            self.max_checkout_ms = max(self.max_checkout_ms, elapsed_ms)
+            if waited:
+                self.waits += 1
+                self.total_wait_ms += elapsed_ms
+                self.max_wait_ms = max(self.max_wait_ms, elapsed_ms)
+
+    def record_timeout(self, elapsed_ms: float) -> None:
+        with self._lock:
+            self.timeouts += 1
+            self.waits += 1
+            self.total_wait_ms += elapsed_ms
+            self.max_wait_ms = max(self.max_wait_ms, elapsed_ms)
+
+    def record_connect(self) -> None:
+        with self._lock:
+            self.connections_created += 1
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return a JSON-serializable copy of the counters."""
+        with self._lock:
+            return {
+                "checkouts": self.checkouts,
+                "avg_checkout_ms": round(self.total_checkout_ms / self.checkouts, 3)
+                if self.checkouts
+                else 0.0,
+                "max_checkout_ms": round(self.max_checkout_ms, 3),
+                "waits": self.waits,
+                "avg_wait_ms": round(self.total_wait_ms / self.waits, 3) if self.waits else 0.0,
+                "max_wait_ms": round(self.max_wait_ms, 3),
+                "timeouts": self.timeouts,
+                "connections_created": self.connections_created,
+            }
+
+
+pool_metrics = PoolMetrics()
+
+
+class InstrumentedQueuePool(QueuePool):
+    """QueuePool that records checkout latency and wait time in pool_metrics."""
+
+    def _do_get(self):
+        max_overflow = getattr(self, "_max_overflow", 0)
+        exhausted = max_overflow >= 0 and self.checkedout() >= self.size() + max_overflow
+        start = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except sa_exc.TimeoutError:
+            pool_metrics.record_timeout((time.perf_counter() - start) * 1000)
+            raise
+        pool_metrics.record_checkout((time.perf_counter() - start) * 1000, waited=exhausted)
+        return connection
+
+    def _create_connection(self):
+        pool_metrics.record_connect()
+        return super()._create_connection()
+
+
+_engine: Engine | None = None
+_engine_pid: int | None = None
+_session_factory: sessionmaker | None = None
+_engine_lock = threading.Lock()
+
+
+def _create_engine() -> Engine:
+    """Create the process-wide engine from settings."""
     database_url = settings.database_url
 
     # PostgreSQL configuration
     engine = create_engine(
         database_url,
         echo=settings.debug,  # SQL query logging in debug mode
+        poolclass=InstrumentedQueuePool,
         pool_pre_ping=True,  # Verify connections before using
         pool_size=settings.db_pool_size,
         max_overflow=settings.db_max_overflow,
@@ -38,11 +140,88 @@ def get_engine():
     return engine
 
 
+def get_engine() -> Engine:
+    """
+    Get the process-wide SQLAlchemy engine.
+
+    The engine is created lazily on first use and then reused. If the current
+    process is a fork of the process that created it, the inherited pool is
+    discarded (without closing the parent's connections) and a fresh one is used.
+
+    PostgreSQL is required for production. Configuration is validated on startup.
+    """
+    global _engine, _engine_pid, _session_factory
+
+    pid = os.getpid()
+    if _engine is not None and _engine_pid == pid:
+        return _engine
+
+    with _engine_lock:
+        if _engine is None:
+            _engine = _create_engine()
+            _session_factory = sessionmaker(autocommit=False, autoflush=False, bind=_engine)
+        elif _engine_pid != pid:
+            # Forked child: never touch the parent's sockets, just drop the references
+            _engine.dispose(close=False)
+            pool_metrics.reset()
+            logger.info(f"Database pool reset after fork (pid {_engine_pid} → {pid})")
+        _engine_pid = pid
+
+    return _engine
+
+
+def reset_engine_after_fork() -> None:
+    """
+    Give a freshly forked process its own connection pool.
+
+    Connected to Celery's worker_process_init signal; get_engine() also detects
+    forks on its own, so calling this is an optimization, not a requirement.
+    """
+    get_engine()
+
+
+def dispose_engine() -> None:
+    """Close all pooled connections of this process (e.g. on shutdown)."""
+    if _engine is not None and _engine_pid == os.getpid():
+        _engine.dispose()
+        logger.info("Database engine disposed")
+
+
+def get_session_factory() -> sessionmaker:
+    """Get the process-wide session factory bound to the shared engine."""
+    get_engine()
+    return _session_factory
+
+
+def get_pool_status() -> dict[str, Any]:
+    """
+    Get connection pool state and checkout metrics for this process.
+
+    Used by /health/detailed and the monitoring router.
+    """
+    pool = get_engine().pool
+    status: dict[str, Any] = {
+        "process_id": os.getpid(),
+        "pool_class": type(pool).__name__,
+    }
+    if isinstance(pool, QueuePool):
+        status.update(
+            {
+                "pool_size": pool.size(),
+                "max_overflow": getattr(pool, "_max_overflow", settings.db_max_overflow),
+                "checked_out": pool.checkedout(),
+                "checked_in": pool.checkedin(),
+                "overflow": pool.overflow(),
+                "pool_timeout_seconds": settings.db_pool_timeout,
+            }
+        )
+    status["metrics"] = pool_metrics.snapshot()
+    return status
+
+
 def get_session() -> Generator[Session, None, None]:
     """Get database session"""
-    engine = get_engine()
-    session_local = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-    session = session_local()
+    session = get_session_factory()()
     try:
         yield session
     finally:
@@ -78,14 +257,12 @@ def get_db_session_context():
 
     This is the preferred way to get a session in Celery tasks and scripts.
     """
-    engine = get_engine()
-    session_local = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-    session = session_local()
+    session = get_session_factory()()
     try:
         yield session
     finally:
         session.close()
 
 
-# Global engine instance
+# Global engine instance (same object as get_engine())
 engine = get_engine()
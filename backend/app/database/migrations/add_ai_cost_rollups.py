@@ -0,0 +1,47 @@
+"""
+Migration: Add ai_cost_rollups table and created_at index on ai_interaction_logs
+
+ai_cost_rollups holds hourly/daily pre-aggregated AI costs maintained by the
+rollup_ai_costs Celery task. New deployments get both via create_all(); existing
+databases need the created_at index added explicitly, since the cost queries and
+the hourly rollup filter ai_interaction_logs by time range.
+"""
+
+import logging
+import sys
+
+from sqlalchemy import text
+
+from app.database.connection import get_engine
+from app.database.unified_models import AICostRollupDB
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def run_migration():
+    """Create ai_cost_rollups and index ai_interaction_logs.created_at."""
+    engine = get_engine()
+
+    logger.info("Creating 'ai_cost_rollups' table (if missing)...")
+    AICostRollupDB.__table__.create(bind=engine, checkfirst=True)
+
+    with engine.connect() as conn:
+        logger.info("Adding index on 'ai_interaction_logs.created_at' (if missing)...")
+        conn.execute(
+            text(
+                "CREATE INDEX IF NOT EXISTS ix_ai_interaction_logs_created_at "
+                "ON ai_interaction_logs (created_at)"
+            )
+        )
+        conn.commit()
+
+    logger.info("Migration completed: ai_cost_rollups ready.")
+
+
+if __name__ == "__main__":
+    try:
+        run_migration()
+    except Exception as e:
+        logger.error(f"Migration failed: {e}")
+        sys.exit(1)
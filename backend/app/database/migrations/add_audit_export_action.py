@@ -0,0 +1,84 @@
+"""
+Migration: Add AUDIT_EXPORT to the auditaction enum
+
+Audit log exports are recorded with AuditAction.AUDIT_EXPORT (row count and
+whether the download completed). PostgreSQL stores the action as the native
+enum type auditaction, which doesn't have the value yet in existing databases.
+
+Enum values can't be removed in PostgreSQL, so there is no rollback.
+
+Usage:
+    python -m app.database.migrations.add_audit_export_action
+"""
+
+import logging
+import sys
+
+from sqlalchemy import text
+
+from app.database.connection import get_engine
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def migrate_up():
+    """Add AUDIT_EXPORT to the auditaction enum type."""
+
+    engine = get_engine()
+
+    # ADD VALUE can't run inside a transaction block before PostgreSQL 12
+    migration_sql = "ALTER TYPE auditaction ADD VALUE IF NOT EXISTS 'AUDIT_EXPORT';"
+
+    try:
+        with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+            conn.execute(text(migration_sql))
+            logger.info("✅ Migration complete: Added AUDIT_EXPORT to auditaction")
+            return True
+
+    except Exception as e:
+        logger.error(f"❌ Migration failed: {e}")
+        return False
+
+
+def verify_migration():
+    """Verify the migration was successful."""
+
+    engine = get_engine()
+
+    verify_sql = """
+    SELECT enumlabel
+    FROM pg_enum
+    JOIN pg_type ON pg_enum.enumtypid = pg_type.oid
+    WHERE pg_type.typname = 'auditaction'
+    AND enumlabel = 'AUDIT_EXPORT';
+    """
+
+    try:
+        with engine.connect() as conn:
+            row = conn.execute(text(verify_sql)).fetchone()
+
+            if row:
+                logger.info(f"✅ Migration verified: auditaction has {row[0]}")
+                return True
+            logger.error("❌ Verification failed: Enum value not found")
+            return False
+
+    except Exception as e:
+        logger.error(f"❌ Verification failed: {e}")
+        return False
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == "verify":
+        logger.info("🔍 Verifying migration...")
+        success = verify_migration()
+    else:
+        logger.info("🚀 Running migration...")
+        success = migrate_up()
+
+        if success:
+            logger.info("🔍 Verifying migration...")
+            verify_migration()
+
+    sys.exit(0 if success else 1)
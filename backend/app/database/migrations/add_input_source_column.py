@@ -0,0 +1,123 @@
+"""
+Migration: Add input_source column to dynamic_pipeline_steps
+
+Lets a step declare where its input comes from: NULL (or "previous_output")
+keeps reading the previous step's output, any other value names a pipeline
+context variable such as "original_text". Steps reading a context variable
+don't wait for earlier steps and run concurrently with them.
+
+Existing steps keep NULL, so execution is unchanged until a step is
+configured with an input source.
+
+Usage:
+    python -m app.database.migrations.add_input_source_column
+"""
+
+import logging
+import sys
+
+from sqlalchemy import text
+
+from app.database.connection import get_engine
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def migrate_up():
+    """Add input_source column to dynamic_pipeline_steps table."""
+
+    engine = get_engine()
+
+    migration_sql = """
+    ALTER TABLE dynamic_pipeline_steps
+    ADD COLUMN IF NOT EXISTS input_source VARCHAR(100) DEFAULT NULL;
+
+    COMMENT ON COLUMN dynamic_pipeline_steps.input_source IS
+    'NULL or previous_output: input is the previous step output. Otherwise the name of a context variable (e.g. original_text); such steps can run concurrently with earlier steps.';
+    """
+
+    try:
+        with engine.connect() as conn:
+            conn.execute(text(migration_sql))
+            conn.commit()
+            logger.info("✅ Migration complete: Added input_source column")
+            logger.info("   - Column: input_source VARCHAR(100) DEFAULT NULL")
+            return True
+
+    except Exception as e:
+        logger.error(f"❌ Migration failed: {e}")
+        return False
+
+
+def migrate_down():
+    """Remove input_source column (rollback)."""
+
+    engine = get_engine()
+
+    rollback_sql = """
+    ALTER TABLE dynamic_pipeline_steps
+    DROP COLUMN IF EXISTS input_source;
+    """
+
+    try:
+        with engine.connect() as conn:
+            conn.execute(text(rollback_sql))
+            conn.commit()
+            logger.info("✅ Rollback complete: Removed input_source column")
+            return True
+
+    except Exception as e:
+        logger.error(f"❌ Rollback failed: {e}")
+        return False
+
+
+def verify_migration():
+    """Verify the migration was successful."""
+
+    engine = get_engine()
+
+    verify_sql = """
+    SELECT column_name, data_type, column_default, is_nullable
+    FROM information_schema.columns
+    WHERE table_name = 'dynamic_pipeline_steps'
+    AND column_name = 'input_source';
+    """
+
+    try:
+        with engine.connect() as conn:
+            result = conn.execute(text(verify_sql))
+            row = result.fetchone()
+
+            if row:
+                logger.info("✅ Migration verified:")
+                logger.info(f"   Column: {row[0]}")
+                logger.info(f"   Type: {row[1]}")
+                logger.info(f"   Default: {row[2]}")
+                logger.info(f"   Nullable: {row[3]}")
+                return True
+            else:
+                logger.error("❌ Verification failed: Column not found")
+                return False
+
+    except Exception as e:
+        logger.error(f"❌ Verification failed: {e}")
+        return False
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == "down":
+        logger.info("🔄 Rolling back migration...")
+        success = migrate_down()
+    elif len(sys.argv) > 1 and sys.argv[1] == "verify":
+        logger.info("🔍 Verifying migration...")
+        success = verify_migration()
+    else:
+        logger.info("🚀 Running migration...")
+        success = migrate_up()
+
+        if success:
+            logger.info("🔍 Verifying migration...")
+            verify_migration()
+
+    sys.exit(0 if success else 1)
@@ -0,0 +1,126 @@
+"""
+Migration: Move step execution text into content-addressed pipeline_text_blobs
+
+Creates pipeline_text_blobs, adds input_hash/output_hash to
+pipeline_step_executions and moves existing inline input_text/output_text into
+blobs, so each distinct text is encrypted and stored once. Step text storage
+per job is reported before and after.
+
+Idempotent: rows that already reference blobs are skipped.
+
+Usage:
+    python -m app.database.migrations.add_pipeline_text_blobs
+"""
+
+import logging
+import sys
+
+from sqlalchemy import text
+
+from app.database.connection import get_engine, get_session_factory
+from app.database.modular_pipeline_models import PipelineStepExecutionDB, PipelineTextBlobDB
+from app.repositories.pipeline_step_execution_repository import PipelineStepExecutionRepository
+from app.repositories.pipeline_text_blob_repository import decrypt_text
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+BATCH_SIZE = 200
+
+
+def report_storage(conn, label: str) -> None:
+    """Log stored step text bytes (inline + blobs) in total and per job."""
+    inline_bytes, jobs = conn.execute(
+        text(
+            "SELECT COALESCE(SUM(COALESCE(octet_length(input_text), 0) "
+            "+ COALESCE(octet_length(output_text), 0)), 0), COUNT(DISTINCT job_id) "
+            "FROM pipeline_step_executions"
+        )
+    ).one()
+    blob_bytes = conn.execute(
+        text("SELECT COALESCE(SUM(octet_length(content)), 0) FROM pipeline_text_blobs")
+    ).scalar()
+    total = inline_bytes + blob_bytes
+    per_job = total / jobs if jobs else 0
+    logger.info(
+        f"📊 Step text storage {label}: {total / 1024 / 1024:.1f} MB "
+        f"({inline_bytes / 1024 / 1024:.1f} MB inline, {blob_bytes / 1024 / 1024:.1f} MB blobs), "
+        f"{per_job / 1024:.1f} KB per job over {jobs} jobs"
+    )
+
+
+def run_migration():
+    """Create pipeline_text_blobs and move inline step text into it."""
+    engine = get_engine()
+
+    logger.info("Creating 'pipeline_text_blobs' table (if missing)...")
+    PipelineTextBlobDB.__table__.create(bind=engine, checkfirst=True)
+
+    with engine.begin() as conn:
+        for column in ("input_hash", "output_hash"):
+            logger.info(f"Adding 'pipeline_step_executions.{column}' (if missing)...")
+            conn.execute(
+                text(
+                    f"ALTER TABLE pipeline_step_executions "
+                    f"ADD COLUMN IF NOT EXISTS {column} VARCHAR(64)"
+                )
+            )
+            conn.execute(
+                text(
+                    f"CREATE INDEX IF NOT EXISTS ix_pipeline_step_executions_{column} "
+                    f"ON pipeline_step_executions ({column})"
+                )
+            )
+
+    with engine.connect() as conn:
+        report_storage(conn, "before")
+
+    session = get_session_factory()()
+    try:
+        repository = PipelineStepExecutionRepository(session)
+        moved = 0
+        last_id = 0
+        while True:
+            batch = (
+                session.query(PipelineStepExecutionDB)
+                .filter(
+                    PipelineStepExecutionDB.id > last_id,
+                    PipelineStepExecutionDB.input_hash.is_(None),
+                    PipelineStepExecutionDB.output_hash.is_(None),
+                    (PipelineStepExecutionDB.input_text.isnot(None))
+                    | (PipelineStepExecutionDB.output_text.isnot(None)),
+                )
+                .order_by(PipelineStepExecutionDB.id)
+                .limit(BATCH_SIZE)
+                .all()
+            )
+            if not batch:
+                break
+
+            for execution in batch:
+                for text_field, hash_field in repository.blob_fields.items():
+                    plaintext = decrypt_text(getattr(execution, text_field))
+                    if plaintext is not None:
+                        content_hash = repository.blob_repository.add_reference(plaintext)
+                        setattr(execution, hash_field, content_hash)
+                    setattr(execution, text_field, None)
+                last_id = execution.id
+
+            session.commit()
+            moved += len(batch)
+            logger.info(f"   Moved text of {moved} step executions into blobs...")
+    finally:
+        session.close()
+
+    with engine.connect() as conn:
+        report_storage(conn, "after")
+
+    logger.info(f"Migration completed: {moved} step executions now reference text blobs.")
+
+
+if __name__ == "__main__":
+    try:
+        run_migration()
+    except Exception as e:
+        logger.error(f"Migration failed: {e}")
+        sys.exit(1)
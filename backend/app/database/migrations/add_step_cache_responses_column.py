@@ -0,0 +1,122 @@
+"""
+Migration: Add cache_responses column to dynamic_pipeline_steps
+
+Lets a step reuse cached LLM responses: with cache_responses enabled (and
+LLM_CACHE_ENABLED set), a call with the same model, prompts, temperature and
+max tokens as an earlier call returns the cached response instead of calling
+the model. Meant for repeatable steps such as classification and validation.
+
+Existing steps keep caching disabled.
+
+Usage:
+    python -m app.database.migrations.add_step_cache_responses_column
+"""
+
+import logging
+import sys
+
+from sqlalchemy import text
+
+from app.database.connection import get_engine
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def migrate_up():
+    """Add cache_responses column to dynamic_pipeline_steps table."""
+
+    engine = get_engine()
+
+    migration_sql = """
+    ALTER TABLE dynamic_pipeline_steps
+    ADD COLUMN IF NOT EXISTS cache_responses BOOLEAN NOT NULL DEFAULT FALSE;
+
+    COMMENT ON COLUMN dynamic_pipeline_steps.cache_responses IS
+    'Reuse cached LLM responses for identical prompts (model, prompts, temperature, max tokens). Requires LLM_CACHE_ENABLED.';
+    """
+
+    try:
+        with engine.connect() as conn:
+            conn.execute(text(migration_sql))
+            conn.commit()
+            logger.info("✅ Migration complete: Added cache_responses column")
+            logger.info("   - Column: cache_responses BOOLEAN DEFAULT FALSE")
+            return True
+
+    except Exception as e:
+        logger.error(f"❌ Migration failed: {e}")
+        return False
+
+
+def migrate_down():
+    """Remove cache_responses column (rollback)."""
+
+    engine = get_engine()
+
+    rollback_sql = """
+    ALTER TABLE dynamic_pipeline_steps
+    DROP COLUMN IF EXISTS cache_responses;
+    """
+
+    try:
+        with engine.connect() as conn:
+            conn.execute(text(rollback_sql))
+            conn.commit()
+            logger.info("✅ Rollback complete: Removed cache_responses column")
+            return True
+
+    except Exception as e:
+        logger.error(f"❌ Rollback failed: {e}")
+        return False
+
+
+def verify_migration():
+    """Verify the migration was successful."""
+
+    engine = get_engine()
+
+    verify_sql = """
+    SELECT column_name, data_type, column_default, is_nullable
+    FROM information_schema.columns
+    WHERE table_name = 'dynamic_pipeline_steps'
+    AND column_name = 'cache_responses';
+    """
+
+    try:
+        with engine.connect() as conn:
+            result = conn.execute(text(verify_sql))
+            row = result.fetchone()
+
+            if row:
+                logger.info("✅ Migration verified:")
+                logger.info(f"   Column: {row[0]}")
+                logger.info(f"   Type: {row[1]}")
+                logger.info(f"   Default: {row[2]}")
+                logger.info(f"   Nullable: {row[3]}")
+                return True
+            else:
+                logger.error("❌ Verification failed: Column not found")
+                return False
+
+    except Exception as e:
+        logger.error(f"❌ Verification failed: {e}")
+        return False
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == "down":
+        logger.info("🔄 Rolling back migration...")
+        success = migrate_down()
+    elif len(sys.argv) > 1 and sys.argv[1] == "verify":
+        logger.info("🔍 Verifying migration...")
+        success = verify_migration()
+    else:
+        logger.info("🚀 Running migration...")
+        success = migrate_up()
+
+        if success:
+            logger.info("🔍 Verifying migration...")
+            verify_migration()
+
+    sys.exit(0 if success else 1)
@@ -0,0 +1,123 @@
+"""
+Migration: Add chunking columns to dynamic_pipeline_steps
+
+Adds optional chunked execution per step: with chunking_enabled, long inputs
+are split at OCR page separators and markdown headings into chunks of about
+chunk_max_tokens input tokens (NULL = PIPELINE_CHUNK_MAX_TOKENS), processed
+concurrently and reassembled in order.
+
+Existing steps keep chunking disabled.
+
+Usage:
+    python -m app.database.migrations.add_step_chunking_columns
+"""
+
+import logging
+import sys
+
+from sqlalchemy import text
+
+from app.database.connection import get_engine
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def migrate_up():
+    """Add chunking_enabled and chunk_max_tokens columns to dynamic_pipeline_steps table."""
+
+    engine = get_engine()
+
+    migration_sql = """
+    ALTER TABLE dynamic_pipeline_steps
+    ADD COLUMN IF NOT EXISTS chunking_enabled BOOLEAN NOT NULL DEFAULT FALSE;
+
+    ALTER TABLE dynamic_pipeline_steps
+    ADD COLUMN IF NOT EXISTS chunk_max_tokens INTEGER DEFAULT NULL;
+    """
+
+    try:
+        with engine.connect() as conn:
+            conn.execute(text(migration_sql))
+            conn.commit()
+            logger.info("✅ Migration complete: Added chunking columns")
+            logger.info("   - Column: chunking_enabled BOOLEAN DEFAULT FALSE")
+            logger.info("   - Column: chunk_max_tokens INTEGER DEFAULT NULL")
+            return True
+
+    except Exception as e:
+        logger.error(f"❌ Migration failed: {e}")
+        return False
+
+
+def migrate_down():
+    """Remove chunking columns (rollback)."""
+
+    engine = get_engine()
+
+    rollback_sql = """
+    ALTER TABLE dynamic_pipeline_steps
+    DROP COLUMN IF EXISTS chunk_max_tokens;
+
+    ALTER TABLE dynamic_pipeline_steps
+    DROP COLUMN IF EXISTS chunking_enabled;
+    """
+
+    try:
+        with engine.connect() as conn:
+            conn.execute(text(rollback_sql))
+            conn.commit()
+            logger.info("✅ Rollback complete: Removed chunking columns")
+            return True
+
+    except Exception as e:
+        logger.error(f"❌ Rollback failed: {e}")
+        return False
+
+
+def verify_migration():
+    """Verify the migration was successful."""
+
+    engine = get_engine()
+
+    verify_sql = """
+    SELECT column_name, data_type, column_default, is_nullable
+    FROM information_schema.columns
+    WHERE table_name = 'dynamic_pipeline_steps'
+    AND column_name IN ('chunking_enabled', 'chunk_max_tokens');
+    """
+
+    try:
+        with engine.connect() as conn:
+            rows = conn.execute(text(verify_sql)).fetchall()
+
+            if len(rows) == 2:
+                logger.info("✅ Migration verified:")
+                for row in rows:
+                    logger.info(f"   Column: {row[0]} ({row[1]}, default {row[2]})")
+                return True
+            else:
+                logger.error("❌ Verification failed: Columns not found")
+                return False
+
+    except Exception as e:
+        logger.error(f"❌ Verification failed: {e}")
+        return False
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == "down":
+        logger.info("🔄 Rolling back migration...")
+        success = migrate_down()
+    elif len(sys.argv) > 1 and sys.argv[1] == "verify":
+        logger.info("🔍 Verifying migration...")
+        success = verify_migration()
+    else:
+        logger.info("🚀 Running migration...")
+        success = migrate_up()
+
+        if success:
+            logger.info("🔍 Verifying migration...")
+            verify_migration()
+
+    sys.exit(0 if success else 1)
@@ -263,8 +263,21 @@ class DynamicPipelineStepDB(Base):
     retry_on_failure = Column(Boolean, default=True, nullable=False)
     max_retries = Column(Integer, default=3, nullable=False)
 
+    # Chunked execution of long documents (split at OCR page separators and headings)
+    chunking_enabled = Column(Boolean, default=False, nullable=False)
+    chunk_max_tokens = Column(Integer, nullable=True)  # Input tokens per chunk (NULL = default)
+
+    # Reuse cached responses for identical prompts (needs LLM_CACHE_ENABLED)
+    cache_responses = Column(Boolean, default=False, nullable=False)
+
+    # Publish partial output while generating (user-facing steps, OVH models)
+    stream_output = Column(Boolean, default=False, nullable=False)
+
     # Input/Output configuration
     input_from_previous_step = Column(Boolean, default=True, nullable=False)
+    input_source = Column(
+        String(100), nullable=True
+    )  # NULL/"previous_output" = pipeline text, otherwise a context variable (e.g. "original_text"); such steps can run concurrently with earlier steps
     output_format = Column(String(50), nullable=True)  # e.g., "json", "markdown", "text"
 
     # Early termination conditions
@@ -415,8 +428,12 @@ class PipelineStepExecutionDB(Base):
     )
 
     # Input/Output
+    # Rows written before pipeline_text_blobs keep their (encrypted) text inline;
+    # newer rows reference the text by content hash (see PipelineTextBlobDB)
     input_text = Column(Text, nullable=True)
     output_text = Column(Text, nullable=True)
+    input_hash = Column(String(64), nullable=True, index=True)
+    output_hash = Column(String(64), nullable=True, index=True)
 
     # Model information
     model_used = Column(String(255), nullable=True)
@@ -448,6 +465,29 @@ class PipelineStepExecutionDB(Base):
         return f"<PipelineStepExecutionDB(job_id='{self.job_id}', step='{self.step_name}', status='{self.status}')>"
 
 
+class PipelineTextBlobDB(Base):
+    """
+    Content-addressed, encrypted step input/output text.
+
+    In a linear pipeline step N's output is step N+1's input, and skipped steps
+    pass their input through unchanged, so each distinct text is stored once and
+    referenced from pipeline_step_executions by its HMAC-SHA256 hash. ref_count is
+    the number of input_hash/output_hash references; blobs are deleted when it
+    drops to 0.
+    """
+
+    __tablename__ = "pipeline_text_blobs"
+
+    content_hash = Column(String(64), primary_key=True)  # HMAC-SHA256 of the plaintext
+    content = Column(Text, nullable=False)  # Encrypted text
+    size_bytes = Column(Integer, nullable=False)  # Plaintext size (UTF-8)
+    ref_count = Column(Integer, default=0, nullable=False)
+    created_at = Column(DateTime, default=func.now(), nullable=False)
+
+    def __repr__(self):
+        return f"<PipelineTextBlobDB(hash='{self.content_hash[:12]}', refs={self.ref_count})>"
+
+
 class UserFeedbackDB(Base):
     """
     User feedback for document translations (Issue #47).
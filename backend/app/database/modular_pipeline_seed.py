@@ -661,6 +661,7 @@ Return only the simplified version, without introductory comments.""",
                     "retry_on_failure": False,
                     "max_retries": 1,
                     "input_from_previous_step": True,
+                    "input_source": "original_text",  # Runs alongside the translation
                     "output_format": "append",
                     "document_class_id": arztbrief_id,
                     "ui_stage": "quality",
@@ -683,6 +684,7 @@ Return only the simplified version, without introductory comments.""",
                     "retry_on_failure": False,
                     "max_retries": 1,
                     "input_from_previous_step": True,
+                    "input_source": "original_text",  # Runs alongside the translation
                     "output_format": "append",
                     "document_class_id": befundbericht_id,
                     "ui_stage": "quality",
@@ -705,6 +707,7 @@ Return only the simplified version, without introductory comments.""",
                     "retry_on_failure": False,
                     "max_retries": 1,
                     "input_from_previous_step": True,
+                    "input_source": "original_text",  # Runs alongside the translation
                     "output_format": "append",
                     "document_class_id": laborwerte_id,
                     "ui_stage": "quality",
@@ -868,14 +871,14 @@ Gib nur das finale Ergebnis im Markdown-Format zurück, ohne Kommentare oder Erk
                     INSERT INTO dynamic_pipeline_steps (
                         name, description, "order", enabled, prompt_template,
                         selected_model_id, temperature, max_tokens,
-                        retry_on_failure, max_retries, input_from_previous_step,
+                        retry_on_failure, max_retries, input_from_previous_step, input_source,
                         output_format, is_branching_step, branching_field, document_class_id,
                         post_branching, stop_conditions, required_context_variables,
                         source_language, ui_stage, created_at, last_modified, modified_by
                     ) VALUES (
                         :name, :description, :order, :enabled, :prompt_template,
                         :selected_model_id, :temperature, :max_tokens,
-                        :retry_on_failure, :max_retries, :input_from_previous_step,
+                        :retry_on_failure, :max_retries, :input_from_previous_step, :input_source,
                         :output_format, :is_branching_step, :branching_field, :document_class_id,
                         :post_branching, :stop_conditions, :required_context_variables,
                         :source_language, :ui_stage, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP, :modified_by
@@ -887,6 +890,7 @@ Gib nur das finale Ergebnis im Markdown-Format zurück, ohne Kommentare oder Erk
                         "branching_field": step.get("branching_field", None),
                         "document_class_id": step.get("document_class_id", None),
                         "post_branching": step.get("post_branching", False),
+                        "input_source": step.get("input_source", None),
                         "stop_conditions": json.dumps(step.get("stop_conditions"))
                         if step.get("stop_conditions")
                         else None,
@@ -5,7 +5,18 @@ This module contains database models for system settings and logging.
 Legacy prompt models have been removed - use modular_pipeline_models instead.
 """
 
-from sqlalchemy import JSON, Boolean, Column, DateTime, Float, Integer, String, Text
+from sqlalchemy import (
+    JSON,
+    BigInteger,
+    Boolean,
+    Column,
+    DateTime,
+    Float,
+    Integer,
+    String,
+    Text,
+    UniqueConstraint,
+)
 from sqlalchemy.orm import declarative_base
 from sqlalchemy.sql import func
 
@@ -46,12 +57,56 @@ class AILogInteractionDB(Base):
 
     # Context
     document_type = Column(String(50), nullable=True)
-    created_at = Column(DateTime, default=func.now(), nullable=False)
+    created_at = Column(DateTime, default=func.now(), nullable=False, index=True)
 
     # Optional metadata (temperature, max_tokens, etc.)
     log_metadata = Column(JSON, nullable=True)
 
 
+class AICostRollupDB(Base):
+    """
+    Pre-aggregated AI cost totals per hour or day.
+
+    One row per (granularity, bucket_start, model_name, step_name, document_type),
+    maintained by the rollup_ai_costs Celery task. Cost dashboards read these rows
+    instead of scanning ai_interaction_logs, which is also pruned after 7 days.
+
+    Missing model names / document types are stored as "" because NULLs never
+    collide in a UNIQUE constraint.
+    """
+
+    __tablename__ = "ai_cost_rollups"
+    __table_args__ = (
+        UniqueConstraint(
+            "granularity",
+            "bucket_start",
+            "model_name",
+            "step_name",
+            "document_type",
+            name="uq_ai_cost_rollups_bucket",
+        ),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    granularity = Column(String(10), nullable=False)  # "hour" or "day"
+    bucket_start = Column(DateTime, nullable=False, index=True)
+
+    # Dimensions
+    model_name = Column(String(100), nullable=False, default="")
+    model_provider = Column(String(50), nullable=True)
+    step_name = Column(String(100), nullable=False)
+    document_type = Column(String(50), nullable=False, default="")
+
+    # Totals for the bucket
+    calls = Column(Integer, nullable=False, default=0)
+    input_tokens = Column(BigInteger, nullable=False, default=0)
+    output_tokens = Column(BigInteger, nullable=False, default=0)
+    total_tokens = Column(BigInteger, nullable=False, default=0)
+    total_cost_usd = Column(Float, nullable=False, default=0.0)
+
+    updated_at = Column(DateTime, default=func.now(), onupdate=func.now(), nullable=False)
+
+
 class SystemSettingsDB(Base):
     """
     Database model for system-wide settings.
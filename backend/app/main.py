@@ -31,8 +31,11 @@ from app.routers.privacy_metrics import router as privacy_metrics_router
 from app.routers.process_multi_file import router as multi_file_router
 from app.routers.settings_auth import router as settings_auth_router
 from app.routers.users import router as users_router
+from app.services.ai_log_writer import shutdown_ai_log_writer
 from app.services.cache_service import CacheService
 from app.services.cleanup import cleanup_temp_files
+from app.services.provider_clients import close_provider_clients
+from app.services.quality_analysis_runner import shutdown_pool as shutdown_quality_analysis_pool
 
 # Configure logging with centralized settings
 logging.basicConfig(
@@ -179,6 +182,15 @@ async def lifespan(app: FastAPI):
         with suppress(asyncio.CancelledError):
             await cleanup_task
 
+    # Stop upload quality analysis processes
+    shutdown_quality_analysis_pool()
+
+    # Write buffered AI cost logs
+    shutdown_ai_log_writer()
+
+    # Close shared AI provider HTTP clients
+    await close_provider_clients()
+
     # Close Redis cache connections
     if cache_service is not None:
         await cache_service.close()
@@ -187,6 +199,11 @@ async def lifespan(app: FastAPI):
     # Final cleanup (skip in test environment to avoid cleanup conflicts)
     if not is_testing:
         await cleanup_temp_files()
+
+        # Close pooled database connections of this process
+        from app.database.connection import dispose_engine
+
+        dispose_engine()
     logger.info("✅ Shutdown complete")
 
 
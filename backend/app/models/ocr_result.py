@@ -5,7 +5,7 @@ Dataclass for OCR extraction results.
 Used by OCREngineManager to return OCR data through the pipeline.
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any
 
 
@@ -20,6 +20,7 @@ class OCRResult:
         processing_time: Time taken for OCR extraction in seconds
         engine: OCR engine used (e.g., "MISTRAL_OCR", "PADDLEOCR")
         mode: Extraction mode ("mistral", "hybrid", "text")
+        page_latencies: Per-page OCR latency in seconds, in page order (if available)
 
     Example:
         >>> result = OCRResult(
@@ -41,6 +42,7 @@ class OCRResult:
     processing_time: float = 0.0
     engine: str = "UNKNOWN"
     mode: str = "text"
+    page_latencies: list[float] = field(default_factory=list)
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
@@ -51,6 +53,7 @@ class OCRResult:
             "processing_time": self.processing_time,
             "engine": self.engine,
             "mode": self.mode,
+            "page_latencies": self.page_latencies,
         }
 
     @classmethod
@@ -0,0 +1,150 @@
+"""
+AI Cost Rollup Repository
+
+Handles database operations for pre-aggregated AI cost buckets (ai_cost_rollups).
+"""
+
+from datetime import datetime, timedelta
+from typing import Any
+
+from sqlalchemy import func, null
+from sqlalchemy.orm import Session
+
+from app.database.unified_models import AICostRollupDB
+from app.repositories.base_repository import BaseRepository
+
+HOUR = "hour"
+DAY = "day"
+
+
+class AICostRollupRepository(BaseRepository[AICostRollupDB]):
+    """
+    Repository for hourly/daily AI cost rollups.
+
+    Buckets are half-open: a row with bucket_start=T covers logs created in
+    [T, T + 1 hour) or [T, T + 1 day).
+    """
+
+    GRANULARITIES = (HOUR, DAY)
+    GROUPABLE_COLUMNS = ("model_name", "step_name", "document_type")
+
+    def __init__(self, db: Session):
+        """
+        Initialize AI cost rollup repository.
+
+        Args:
+            db: Database session
+        """
+        super().__init__(db, AICostRollupDB)
+
+    def get_rolled_up_until(self) -> datetime | None:
+        """
+        Get the end of the newest hourly bucket.
+
+        Every log created before this time is included in the hourly rollups.
+
+        Returns:
+            Exclusive end of the newest hourly bucket, or None if nothing is rolled up
+        """
+        latest = (
+            self.db.query(func.max(self.model.bucket_start))
+            .filter(self.model.granularity == HOUR)
+            .scalar()
+        )
+        return latest + timedelta(hours=1) if latest else None
+
+    def replace_bucket(
+        self, granularity: str, bucket_start: datetime, rows: list[dict[str, Any]]
+    ) -> int:
+        """
+        Replace all rows of one bucket (idempotent re-aggregation).
+
+        Does not commit; the caller commits once per refresh.
+
+        Args:
+            granularity: "hour" or "day"
+            bucket_start: Start of the bucket
+            rows: Row values (model_name, step_name, document_type, model_provider,
+                calls, input_tokens, output_tokens, total_tokens, total_cost_usd)
+
+        Returns:
+            Number of rows written
+        """
+        self.db.query(self.model).filter(
+            self.model.granularity == granularity,
+            self.model.bucket_start == bucket_start,
+        ).delete(synchronize_session=False)
+
+        self.db.add_all(
+            self.model(granularity=granularity, bucket_start=bucket_start, **row) for row in rows
+        )
+        return len(rows)
+
+    def aggregate_buckets(
+        self, granularity: str, start: datetime | None, before: datetime | None
+    ) -> list[Any]:
+        """
+        Sum rollup rows in [start, before) per (model_name, step_name, document_type).
+
+        Used to derive daily buckets from hourly ones.
+        """
+        query = self.db.query(
+            self.model.model_name,
+            self.model.step_name,
+            self.model.document_type,
+            func.max(self.model.model_provider).label("model_provider"),
+            func.sum(self.model.calls).label("calls"),
+            func.sum(self.model.input_tokens).label("input_tokens"),
+            func.sum(self.model.output_tokens).label("output_tokens"),
+            func.sum(self.model.total_tokens).label("total_tokens"),
+            func.sum(self.model.total_cost_usd).label("total_cost_usd"),
+        ).filter(self.model.granularity == granularity)
+        query = self._apply_range(query, start, before)
+        return query.group_by(
+            self.model.model_name, self.model.step_name, self.model.document_type
+        ).all()
+
+    def aggregate_costs(
+        self,
+        granularity: str,
+        group_by: str | None = None,
+        start: datetime | None = None,
+        before: datetime | None = None,
+    ) -> list[Any]:
+        """
+        Sum calls, tokens and costs of buckets in [start, before).
+
+        Mirrors AILogInteractionRepository.aggregate_costs() so both sources can be
+        merged. Empty model names / document types are returned as None.
+
+        Args:
+            granularity: "hour" or "day"
+            group_by: None for a single total row, or one of GROUPABLE_COLUMNS
+            start: Optional inclusive lower bound on bucket_start
+            before: Optional exclusive upper bound on bucket_start
+
+        Returns:
+            Rows with key, provider, calls, tokens, cost
+        """
+        if group_by is not None and group_by not in self.GROUPABLE_COLUMNS:
+            raise ValueError(f"Cannot group AI costs by '{group_by}'")
+
+        key = func.nullif(getattr(self.model, group_by), "") if group_by else null()
+        query = self.db.query(
+            key.label("key"),
+            func.max(self.model.model_provider).label("provider"),
+            func.coalesce(func.sum(self.model.calls), 0).label("calls"),
+            func.coalesce(func.sum(self.model.total_tokens), 0).label("tokens"),
+            func.coalesce(func.sum(self.model.total_cost_usd), 0.0).label("cost"),
+        ).filter(self.model.granularity == granularity)
+        query = self._apply_range(query, start, before)
+        if group_by:
+            query = query.group_by(getattr(self.model, group_by))
+        return query.all()
+
+    def _apply_range(self, query, start: datetime | None, before: datetime | None):
+        if start:
+            query = query.filter(self.model.bucket_start >= start)
+        if before:
+            query = query.filter(self.model.bucket_start < before)
+        return query
@@ -4,9 +4,12 @@ AI Log Interaction Repository
 Handles database operations for AI interaction logs and cost tracking.
 """
 
+from collections.abc import Iterator
 from datetime import datetime
+from typing import Any
 
-from sqlalchemy.orm import Session
+from sqlalchemy import func, insert, null
+from sqlalchemy.orm import Query, Session
 
 from app.database.unified_models import AILogInteractionDB
 from app.repositories.base_repository import BaseRepository
@@ -20,6 +23,26 @@ class AILogInteractionRepository(BaseRepository[AILogInteractionDB]):
     and usage statistics beyond basic CRUD operations.
     """
 
+    # Columns cost aggregates can be grouped by
+    GROUPABLE_COLUMNS = ("model_name", "step_name", "document_type")
+
+    # Columns written by cost exports, in order
+    EXPORT_FIELDS = [
+        "created_at",
+        "processing_id",
+        "step_name",
+        "document_type",
+        "model_provider",
+        "model_name",
+        "input_tokens",
+        "output_tokens",
+        "total_tokens",
+        "input_cost_usd",
+        "output_cost_usd",
+        "total_cost_usd",
+        "processing_time_seconds",
+    ]
+
     def __init__(self, db: Session):
         """
         Initialize AI log interaction repository.
@@ -87,19 +110,156 @@ class AILogInteractionRepository(BaseRepository[AILogInteractionDB]):
         Returns:
             List of filtered AI interaction logs
         """
-        query = self.db.query(self.model)
+        query = self._apply_filters(
+            self.db.query(self.model), processing_id, start_date, end_date, document_type
+        )
+        return query.all()
 
+    def _apply_filters(
+        self,
+        query: Query,
+        processing_id: str | None = None,
+        start_date: datetime | None = None,
+        end_date: datetime | None = None,
+        document_type: str | None = None,
+        before: datetime | None = None,
+    ) -> Query:
+        """Apply the standard log filters (end_date inclusive, before exclusive)."""
         if processing_id:
             query = query.filter(self.model.processing_id == processing_id)
         if start_date:
             query = query.filter(self.model.created_at >= start_date)
         if end_date:
             query = query.filter(self.model.created_at <= end_date)
+        if before:
+            query = query.filter(self.model.created_at < before)
         if document_type:
             query = query.filter(self.model.document_type == document_type)
+        return query
+
+    def bulk_insert(self, rows: list[dict[str, Any]]) -> int:
+        """
+        Insert many log rows in one statement and commit.
+
+        Rows are sent as a multi-row INSERT ... VALUES; no ORM objects are built.
+
+        Args:
+            rows: Column values per log entry
+
+        Returns:
+            Number of inserted rows
+        """
+        if not rows:
+            return 0
+        self.db.execute(insert(self.model), rows)
+        self.db.commit()
+        return len(rows)
+
+    def iter_export_rows(
+        self,
+        processing_id: str | None = None,
+        start_date: datetime | None = None,
+        end_date: datetime | None = None,
+        document_type: str | None = None,
+        batch_size: int = 1000,
+    ) -> Iterator[dict[str, Any]]:
+        """
+        Stream per-call cost entries for export through a server-side cursor.
+
+        Args:
+            processing_id: Optional processing ID filter
+            start_date: Optional start date filter (inclusive)
+            end_date: Optional end date filter (inclusive)
+            document_type: Optional document type filter
+            batch_size: Rows fetched per round trip
+
+        Yields:
+            Dictionaries keyed by EXPORT_FIELDS, oldest first
+        """
+        query = self.db.query(*(getattr(self.model, field) for field in self.EXPORT_FIELDS))
+        query = self._apply_filters(query, processing_id, start_date, end_date, document_type)
+        for row in query.order_by(self.model.created_at, self.model.id).yield_per(batch_size):
+            yield dict(row._mapping)
+
+    def aggregate_costs(
+        self,
+        group_by: str | None = None,
+        processing_id: str | None = None,
+        start_date: datetime | None = None,
+        end_date: datetime | None = None,
+        before: datetime | None = None,
+    ) -> list[Any]:
+        """
+        Sum calls, tokens and costs in the database, optionally grouped by a column.
+
+        Args:
+            group_by: None for a single total row, or one of GROUPABLE_COLUMNS
+            processing_id: Optional processing ID filter
+            start_date: Optional start date filter (inclusive)
+            end_date: Optional end date filter (inclusive)
+            before: Optional exclusive upper bound on created_at
+
+        Returns:
+            Rows with key (group value, None when ungrouped), provider, calls, tokens, cost
+        """
+        if group_by is not None and group_by not in self.GROUPABLE_COLUMNS:
+            raise ValueError(f"Cannot group AI costs by '{group_by}'")
 
+        key = getattr(self.model, group_by) if group_by else None
+        query = self.db.query(
+            (key if key is not None else null()).label("key"),
+            func.max(self.model.model_provider).label("provider"),
+            func.count(self.model.id).label("calls"),
+            func.coalesce(func.sum(self.model.total_tokens), 0).label("tokens"),
+            func.coalesce(func.sum(self.model.total_cost_usd), 0.0).label("cost"),
+        )
+        query = self._apply_filters(query, processing_id, start_date, end_date, before=before)
+        if key is not None:
+            query = query.group_by(key)
         return query.all()
 
+    def aggregate_rollup_buckets(self, start: datetime, before: datetime) -> list[Any]:
+        """
+        Sum logs in [start, before) per (model_name, step_name, document_type).
+
+        Used to build ai_cost_rollups rows for one time bucket.
+
+        Returns:
+            Rows with model_name, step_name, document_type, model_provider, calls,
+            input_tokens, output_tokens, total_tokens, total_cost_usd
+        """
+        return (
+            self.db.query(
+                self.model.model_name,
+                self.model.step_name,
+                self.model.document_type,
+                func.max(self.model.model_provider).label("model_provider"),
+                func.count(self.model.id).label("calls"),
+                func.coalesce(func.sum(self.model.input_tokens), 0).label("input_tokens"),
+                func.coalesce(func.sum(self.model.output_tokens), 0).label("output_tokens"),
+                func.coalesce(func.sum(self.model.total_tokens), 0).label("total_tokens"),
+                func.coalesce(func.sum(self.model.total_cost_usd), 0.0).label("total_cost_usd"),
+            )
+            .filter(self.model.created_at >= start, self.model.created_at < before)
+            .group_by(self.model.model_name, self.model.step_name, self.model.document_type)
+            .all()
+        )
+
+    def get_earliest_created_at(self, since: datetime | None = None) -> datetime | None:
+        """
+        Get the creation time of the oldest stored log.
+
+        Args:
+            since: Only consider logs created at or after this time
+
+        Returns:
+            Oldest created_at, or None if there are no matching logs
+        """
+        query = self.db.query(func.min(self.model.created_at))
+        if since:
+            query = query.filter(self.model.created_at >= since)
+        return query.scalar()
+
     def get_by_step_name(self, step_name: str) -> list[AILogInteractionDB]:
         """
         Get all AI logs for a specific pipeline step.
@@ -153,8 +313,10 @@ class AILogInteractionRepository(BaseRepository[AILogInteractionDB]):
         Returns:
             Total cost in USD
         """
-        logs = self.get_filtered(processing_id, start_date, end_date)
-        return sum(log.total_cost_usd or 0 for log in logs)
+        (totals,) = self.aggregate_costs(
+            processing_id=processing_id, start_date=start_date, end_date=end_date
+        )
+        return float(totals.cost)
 
     def get_total_tokens(
         self,
@@ -173,8 +335,10 @@ class AILogInteractionRepository(BaseRepository[AILogInteractionDB]):
         Returns:
             Total token count
         """
-        logs = self.get_filtered(processing_id, start_date, end_date)
-        return sum(log.total_tokens or 0 for log in logs)
+        (totals,) = self.aggregate_costs(
+            processing_id=processing_id, start_date=start_date, end_date=end_date
+        )
+        return int(totals.tokens)
 
     def count_calls(
         self,
@@ -193,8 +357,10 @@ class AILogInteractionRepository(BaseRepository[AILogInteractionDB]):
         Returns:
             Count of AI API calls
         """
-        logs = self.get_filtered(processing_id, start_date, end_date)
-        return len(logs)
+        (totals,) = self.aggregate_costs(
+            processing_id=processing_id, start_date=start_date, end_date=end_date
+        )
+        return totals.calls
 
     def delete_old_logs(self, older_than: datetime) -> int:
         """
@@ -232,8 +398,6 @@ class AILogInteractionRepository(BaseRepository[AILogInteractionDB]):
         Returns:
             Dict with document_count, average_cost_per_document, min/max costs
         """
-        from sqlalchemy import func
-
         # Build base query - exclude feedback analysis entries
         base_filter = ~self.model.processing_id.like("feedback_%")
 
@@ -284,8 +448,6 @@ class AILogInteractionRepository(BaseRepository[AILogInteractionDB]):
         Returns:
             Dict with total_calls, total_tokens, total_cost_usd, average_cost_per_analysis
         """
-        from sqlalchemy import func
-
         # Base query for FEEDBACK_ANALYSIS step
         query = self.db.query(
             func.count(self.model.id).label("total_calls"),
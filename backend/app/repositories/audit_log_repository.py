@@ -5,13 +5,14 @@ Provides data access methods for audit logging including creation,
 querying, filtering, and export operations for security and compliance.
 """
 
+from collections.abc import Iterator
 from datetime import datetime, timedelta, timezone
 import logging
 from typing import Any
 from uuid import UUID
 
 from sqlalchemy import and_, desc, or_
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Query, Session
 
 from app.database.auth_models import AuditAction, AuditLogDB
 from app.repositories.base_repository import BaseRepository
@@ -22,6 +23,18 @@ logger = logging.getLogger(__name__)
 class AuditLogRepository(BaseRepository[AuditLogDB]):
     """Repository for audit log data access operations."""
 
+    # Columns written by audit log exports, in order
+    EXPORT_FIELDS = [
+        "timestamp",
+        "user_id",
+        "action",
+        "resource_type",
+        "resource_id",
+        "ip_address",
+        "user_agent",
+        "details",
+    ]
+
     def __init__(self, db: Session):
         super().__init__(db, AuditLogDB)
 
@@ -458,6 +471,73 @@ class AuditLogRepository(BaseRepository[AuditLogDB]):
             logger.error(f"Error cleaning up old audit logs: {e}")
             raise
 
+    def _export_query(
+        self, start_date: datetime | None = None, end_date: datetime | None = None
+    ) -> Query:
+        """Column query over the exported fields, newest first."""
+        query = self.db.query(*(getattr(AuditLogDB, field) for field in self.EXPORT_FIELDS))
+
+        if start_date:
+            query = query.filter(AuditLogDB.timestamp >= start_date)
+        if end_date:
+            query = query.filter(AuditLogDB.timestamp <= end_date)
+
+        return query.order_by(desc(AuditLogDB.timestamp))
+
+    def has_logs_in_range(
+        self, start_date: datetime | None = None, end_date: datetime | None = None
+    ) -> bool:
+        """
+        Check whether any audit logs exist in a date range.
+
+        Args:
+            start_date: Start date (inclusive), None for no lower bound
+            end_date: End date (inclusive), None for no upper bound
+
+        Returns:
+            True if at least one log matches
+        """
+        query = self._export_query(start_date, end_date).order_by(None)
+        return self.db.query(query.exists()).scalar()
+
+    def iter_export_rows(
+        self,
+        start_date: datetime | None = None,
+        end_date: datetime | None = None,
+        limit: int | None = None,
+        batch_size: int = 1000,
+    ) -> Iterator[dict[str, Any]]:
+        """
+        Stream audit logs for export through a server-side cursor.
+
+        Only the exported columns are selected and rows are fetched batch_size
+        at a time, so memory stays constant regardless of the number of rows.
+
+        Args:
+            start_date: Start date for export
+            end_date: End date for export
+            limit: Maximum number of records to export (None for all)
+            batch_size: Rows fetched per round trip
+
+        Yields:
+            Dictionaries keyed by EXPORT_FIELDS
+        """
+        query = self._export_query(start_date, end_date)
+        if limit is not None:
+            query = query.limit(limit)
+
+        for row in query.yield_per(batch_size):
+            yield {
+                "timestamp": row.timestamp.isoformat(),
+                "user_id": str(row.user_id) if row.user_id else None,
+                "action": row.action.value,
+                "resource_type": row.resource_type,
+                "resource_id": row.resource_id,
+                "ip_address": row.ip_address,
+                "user_agent": row.user_agent,
+                "details": row.details,
+            }
+
     def export_logs_csv(
         self,
         start_date: datetime | None = None,
@@ -467,6 +547,8 @@ class AuditLogRepository(BaseRepository[AuditLogDB]):
         """
         Export audit logs as CSV data.
 
+        Loads all rows into memory; use iter_export_rows() for large exports.
+
         Args:
             start_date: Start date for export
             end_date: End date for export
@@ -476,32 +558,11 @@ class AuditLogRepository(BaseRepository[AuditLogDB]):
             List of dictionaries with log data
         """
         try:
-            query = self.db.query(AuditLogDB)
-
-            if start_date:
-                query = query.filter(AuditLogDB.timestamp >= start_date)
-            if end_date:
-                query = query.filter(AuditLogDB.timestamp <= end_date)
-
-            logs = query.order_by(desc(AuditLogDB.timestamp)).limit(limit).all()
-
-            # Convert to dictionary format for CSV export
-            csv_data = []
-            for log in logs:
-                csv_data.append(
-                    {
-                        "timestamp": log.timestamp.isoformat(),
-                        "user_id": str(log.user_id) if log.user_id else None,
-                        "action": log.action.value,
-                        "resource_type": log.resource_type,
-                        "resource_id": log.resource_id,
-                        "ip_address": log.ip_address,
-                        "user_agent": log.user_agent,
-                        "details": log.details,
-                    }
-                )
+            csv_data = list(
+                self.iter_export_rows(start_date=start_date, end_date=end_date, limit=limit)
+            )
 
-            logger.info("Exported {len(csv_data)} audit logs to CSV format")
+            logger.info(f"Exported {len(csv_data)} audit logs to CSV format")
             return csv_data
         except Exception as e:
             logger.error(f"Error exporting audit logs to CSV: {e}")
@@ -229,6 +229,10 @@ class EncryptedRepositoryMixin:
     # Override this in subclasses to specify which fields to encrypt
     encrypted_fields: list[str] = []
 
+    # Ciphertext bytes decrypted by the most recent read call on this repository
+    # (get_by_id, get_all, get_by_job_id, ...). Zero after update_columns().
+    last_decrypted_bytes: int = 0
+
     def _should_encrypt_field(self, field_name: str) -> bool:
         """
         Check if a field should be encrypted.
@@ -316,64 +320,21 @@ class EncryptedRepositoryMixin:
                             original_preview = original_binary[:20].hex()
                             logger.debug(f"   Original preview (hex): {original_preview}...")
 
-                            # Encrypt binary → returns base64-encoded string
-                            encrypted_str = encryptor.encrypt_binary_field(original_binary)
-
-                            if encrypted_str:
-                                logger.debug(
-                                    f"   Encryption returned string of length: {len(encrypted_str)}"
-                                )
-
-                                # Verify encryption actually happened
-                                try:
-                                    original_as_str = original_binary.decode(
-                                        "utf-8", errors="ignore"
-                                    )
-                                    if encrypted_str == original_as_str:
-                                        logger.error(
-                                            f"❌ Encryption returned same value as input for {field}!"
-                                        )
-                                        raise ValueError("Encryption failed - returned plaintext")
-                                except UnicodeDecodeError:
-                                    # Can't decode as UTF-8, so definitely different
-                                    pass
-
-                                # Verify it looks encrypted (should start with Fernet token prefix)
-                                preview = encrypted_str[:20]
-                                logger.debug(f"   Encrypted preview: {preview}...")
-                                if not preview.startswith("gAAAAA"):
-                                    logger.warning(
-                                        f"   ⚠️ Encrypted data doesn't look like Fernet token: {preview}..."
-                                    )
-                                else:
-                                    logger.debug(
-                                        "   ✅ Verified: Encrypted token starts with 'gAAAAA' (Fernet format)"
-                                    )
-
-                                # Convert encrypted string to bytes for LargeBinary column
-                                encrypted_bytes = encrypted_str.encode("utf-8")
-                                encrypted_size = len(encrypted_bytes)
+                            # Encrypt binary → raw binary token (no base64, stored as-is)
+                            encrypted_bytes = encryptor.encrypt_binary(original_binary)
 
-                                # Store encrypted bytes
-                                encrypted_data[field] = encrypted_bytes
+                            if not encryptor.is_binary_token(encrypted_bytes):
+                                logger.error(f"❌ Encryption returned no binary token for {field}!")
+                                raise ValueError(f"Encryption failed for {field}")
 
-                                size_increase = (
-                                    (encrypted_size / original_size * 100)
-                                    if original_size > 0
-                                    else 0
-                                )
-                                logger.info(
-                                    f"✅ Encrypted binary field: {field} ({original_size} bytes → {encrypted_size} bytes, {size_increase:.1f}% size increase)"
-                                )
-
-                                # Final verification - check what we're about to store
-                                stored_preview = encrypted_bytes[:50].decode(
-                                    "utf-8", errors="ignore"
-                                )
-                                logger.debug(f"   Will store (first 50 chars): {stored_preview}...")
-                            else:
-                                logger.error(f"❌ Encryption returned None for {field}!")
-                                raise ValueError(f"Encryption failed for {field} - returned None")
+                            encrypted_data[field] = encrypted_bytes
+                            encrypted_size = len(encrypted_bytes)
+                            size_increase = (
+                                (encrypted_size / original_size * 100) if original_size > 0 else 0
+                            )
+                            logger.info(
+                                f"✅ Encrypted binary field: {field} ({original_size} bytes → {encrypted_size} bytes, {size_increase:.1f}% size increase)"
+                            )
                         else:
                             # If it's already a string (from database), treat as text
                             encrypted_data[field] = encryptor.encrypt_field(
@@ -435,10 +396,13 @@ class EncryptedRepositoryMixin:
         Returns:
             Entity with decrypted fields (modifies in-place)
         """
+        self.last_decrypted_bytes = 0
+
         if not entity or not self.encrypted_fields:
             return entity
 
         encryption_enabled = encryptor.is_enabled()
+        decrypted_bytes = 0
 
         for field in self.encrypted_fields:
             if hasattr(entity, field):
@@ -447,8 +411,23 @@ class EncryptedRepositoryMixin:
                     try:
                         if self._is_binary_field(field):
                             # Binary field: use binary decryption
+                            if encryptor.is_binary_token(encrypted_value):
+                                # Current format: raw binary token, decrypted in one pass
+                                if encryption_enabled:
+                                    decrypted_value = encryptor.decrypt_binary(encrypted_value)
+                                    setattr(entity, field, decrypted_value)
+                                    decrypted_bytes += len(encrypted_value)
+                                    logger.info(
+                                        f"✅ Decrypted binary field: {field} ({len(encrypted_value)} bytes → {len(decrypted_value)} bytes)"
+                                    )
+                                else:
+                                    logger.error(
+                                        f"❌ Field {field} contains encrypted data but encryption is disabled. "
+                                        f"Set ENCRYPTION_KEY environment variable to decrypt."
+                                    )
+                            # Legacy format: base64 text token stored as bytes
                             # First check if it's encrypted or plaintext binary
-                            if isinstance(encrypted_value, bytes):
+                            elif isinstance(encrypted_value, bytes):
                                 # Try to decode as UTF-8 to check if it's encrypted
                                 try:
                                     encrypted_value_str = encrypted_value.decode("utf-8")
@@ -489,6 +468,7 @@ class EncryptedRepositoryMixin:
                                                 encrypted_value_str
                                             )
                                             setattr(entity, field, decrypted_value)
+                                            decrypted_bytes += len(encrypted_value)
                                             logger.info(
                                                 f"✅ Decrypted binary field: {field} ({len(encrypted_value)} bytes → {len(decrypted_value)} bytes)"
                                             )
@@ -527,6 +507,7 @@ class EncryptedRepositoryMixin:
                                         str(encrypted_value)
                                     )
                                     setattr(entity, field, decrypted_value)
+                                    decrypted_bytes += len(str(encrypted_value))
                                     logger.debug(f"Decrypted binary field: {field}")
                                 else:
                                     # Not encrypted - convert to bytes if needed
@@ -547,6 +528,7 @@ class EncryptedRepositoryMixin:
                                 if encryption_enabled:
                                     decrypted_value = encryptor.decrypt_field(encrypted_value)
                                     setattr(entity, field, decrypted_value)
+                                    decrypted_bytes += len(value_str)
                                     logger.debug(f"Decrypted text field: {field}")
                                 else:
                                     # Encryption disabled but value is encrypted - log error
@@ -568,6 +550,12 @@ class EncryptedRepositoryMixin:
                             f"Returning value as-is for {field} (may be plaintext or encrypted)"
                         )
 
+        self.last_decrypted_bytes = decrypted_bytes
+        if decrypted_bytes:
+            logger.debug(
+                f"📊 Decrypted {decrypted_bytes} bytes for {self.model.__name__} (id={getattr(entity, 'id', None)})"
+            )
+
         return entity
 
     def _decrypt_entities(self, entities: list[ModelType]) -> list[ModelType]:
@@ -581,11 +569,15 @@ class EncryptedRepositoryMixin:
             List of entities with decrypted fields
         """
         if not entities or not self.encrypted_fields or not encryptor.is_enabled():
+            self.last_decrypted_bytes = 0
             return entities
 
+        total_decrypted_bytes = 0
         for entity in entities:
             self._decrypt_entity(entity)
+            total_decrypted_bytes += self.last_decrypted_bytes
 
+        self.last_decrypted_bytes = total_decrypted_bytes
         return entities
 
     # Override BaseRepository methods to add encryption/decryption
@@ -623,17 +615,11 @@ class EncryptedRepositoryMixin:
                         f"🔐 About to save encrypted {field}: {len(encrypted_kwargs[field])} bytes"
                     )
                     # Check if it looks encrypted
-                    try:
-                        preview = encrypted_kwargs[field][:50].decode("utf-8")
-                        if preview.startswith("gAAAAA"):
-                            logger.info("   ✅ Verified: Encrypted token format before save")
-                        else:
-                            logger.warning(
-                                f"   ⚠️ Doesn't look encrypted before save: {preview[:20]}..."
-                            )
-                    except UnicodeDecodeError:
+                    if encryptor.is_binary_token(encrypted_kwargs[field]):
+                        logger.info("   ✅ Verified: Encrypted token format before save")
+                    else:
                         logger.warning(
-                            "   ⚠️ Cannot decode as UTF-8 before save (might be plaintext binary)"
+                            "   ⚠️ Doesn't look encrypted before save (might be plaintext binary)"
                         )
 
         # Log what we're passing to super().create()
@@ -642,11 +628,7 @@ class EncryptedRepositoryMixin:
             if field in encrypted_kwargs and encrypted_kwargs[field] is not None:
                 if isinstance(encrypted_kwargs[field], bytes):
                     logger.info(f"   {field}: {len(encrypted_kwargs[field])} bytes")
-                    try:
-                        preview = encrypted_kwargs[field][:50].decode("utf-8")
-                        logger.info(f"      Preview: {preview[:30]}...")
-                    except UnicodeDecodeError:
-                        logger.warning("      Cannot decode as UTF-8 (might be plaintext binary)")
+                    logger.info(f"      Preview (hex): {encrypted_kwargs[field][:16].hex()}...")
 
         # Call parent create method
         entity = super().create(**encrypted_kwargs)
@@ -704,17 +686,11 @@ class EncryptedRepositoryMixin:
                 if saved_value is not None:
                     if isinstance(saved_value, bytes):
                         logger.info(f"🔍 After save, {field} in DB: {len(saved_value)} bytes")
-                        try:
-                            preview = saved_value[:50].decode("utf-8")
-                            if preview.startswith("gAAAAA"):
-                                logger.info("   ✅ Verified: Encrypted token format in database")
-                            else:
-                                logger.warning(
-                                    f"   ⚠️ Doesn't look encrypted in database: {preview[:20]}..."
-                                )
-                        except UnicodeDecodeError:
+                        if encryptor.is_binary_token(saved_value):
+                            logger.info("   ✅ Verified: Encrypted token format in database")
+                        else:
                             logger.warning(
-                                "   ⚠️ Cannot decode as UTF-8 in database (might be plaintext binary)"
+                                "   ⚠️ Doesn't look encrypted in database (might be plaintext binary)"
                             )
 
         # Decrypt fields for return (so service layer gets plaintext)
@@ -875,3 +851,73 @@ class EncryptedRepositoryMixin:
 
         # Re-fetch via get_by_id which handles decryption and expunging safely
         return self.get_by_id(record_id)
+
+    def update_columns(self, record_id: Any, **kwargs) -> dict[str, Any] | None:
+        """
+        Lightweight partial update that writes only the given columns.
+
+        Unlike update(), this never SELECTs the row and never re-fetches it afterwards,
+        so large encrypted columns (e.g. file_content) are neither loaded nor decrypted.
+        Use it for hot-path bookkeeping such as progress_percent or timing fields.
+
+        Encrypted fields passed in kwargs are still encrypted (and their searchable
+        hashes refreshed) before being written.
+
+        Args:
+            record_id: Primary key value
+            **kwargs: Columns to update
+
+        Returns:
+            Projection of the touched columns (plaintext values as passed in),
+            or None if no row matched
+        """
+        from sqlalchemy import update
+        from sqlalchemy.inspection import inspect
+        from sqlalchemy.orm.util import identity_key
+
+        self.last_decrypted_bytes = 0
+
+        if not kwargs:
+            return {}
+
+        values = dict(kwargs)
+        for field in self.encrypted_fields:
+            if field in values and values[field] is not None:
+                searchable_field = f"{field}_searchable"
+                if hasattr(self.model, searchable_field):
+                    values[searchable_field] = encryptor.generate_searchable_hash(values[field])
+
+        encrypted_values = self._encrypt_fields(values)
+
+        mapper = inspect(self.model)
+        pk_attr = mapper.primary_key[0].name
+
+        # Drop any identity-mapped instance without querying the database so a stale
+        # (possibly decrypted) copy can never be flushed back over the new values.
+        existing_entity = self.db.identity_map.get(identity_key(self.model, record_id))
+        if existing_entity is not None:
+            self.db.expunge(existing_entity)
+
+        update_stmt = (
+            update(self.model)
+            .where(getattr(self.model, pk_attr) == record_id)
+            .values(**encrypted_values)
+            .execution_options(synchronize_session=False)
+        )
+
+        try:
+            result = self.db.execute(update_stmt)
+            self.db.commit()
+        except Exception as e:
+            self.db.rollback()
+            logger.error(f"Error updating columns of {self.model.__name__} id={record_id}: {e}")
+            raise
+
+        if result.rowcount == 0:
+            logger.warning(f"{self.model.__name__} with {pk_attr}={record_id} not found")
+            return None
+
+        logger.debug(
+            f"Updated columns {sorted(kwargs)} of {self.model.__name__} with {pk_attr}={record_id}"
+        )
+        return dict(kwargs)
@@ -5,11 +5,12 @@ Handles database operations for chat request logging and analytics.
 Provides CRUD operations and specialized analytics queries.
 """
 
+from collections.abc import Iterator
 from datetime import date, datetime
 from typing import Any
 
 from sqlalchemy import and_, case, func
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Query, Session
 
 from app.database.chat_models import ChatLogDB
 from app.repositories.base_repository import BaseRepository
@@ -23,6 +24,29 @@ class ChatLogRepository(BaseRepository[ChatLogDB]):
     All queries are designed for GDPR compliance (no query text exposure).
     """
 
+    # Columns written by chat log exports, in order
+    EXPORT_FIELDS = [
+        "created_at",
+        "request_id",
+        "app_id",
+        "conversation_id",
+        "status",
+        "error_type",
+        "query_length",
+        "query_word_count",
+        "is_new_conversation",
+        "rate_limit_allowed",
+        "rate_limit_type",
+        "prompt_tokens",
+        "completion_tokens",
+        "total_tokens",
+        "cost_usd",
+        "response_time_ms",
+        "first_token_time_ms",
+        "stream_chunks",
+        "ip_address_hash",
+    ]
+
     def __init__(self, db: Session):
         """
         Initialize chat log repository.
@@ -107,6 +131,52 @@ class ChatLogRepository(BaseRepository[ChatLogDB]):
 
         return query.order_by(self.model.created_at.desc()).offset(offset).limit(limit).all()
 
+    def _export_query(
+        self,
+        app_id: str | None = None,
+        status: str | None = None,
+        start_date: datetime | None = None,
+        end_date: datetime | None = None,
+    ) -> Query:
+        """Column query over the exported fields, newest first."""
+        query = self.db.query(*(getattr(self.model, field) for field in self.EXPORT_FIELDS))
+
+        if app_id:
+            query = query.filter(self.model.app_id == app_id)
+        if status:
+            query = query.filter(self.model.status == status)
+        if start_date:
+            query = query.filter(self.model.created_at >= start_date)
+        if end_date:
+            query = query.filter(self.model.created_at <= end_date)
+
+        return query.order_by(self.model.created_at.desc())
+
+    def iter_export_rows(
+        self,
+        app_id: str | None = None,
+        status: str | None = None,
+        start_date: datetime | None = None,
+        end_date: datetime | None = None,
+        batch_size: int = 1000,
+    ) -> Iterator[dict[str, Any]]:
+        """
+        Stream chat logs for export through a server-side cursor.
+
+        Args:
+            app_id: Filter by app (guidelines/befund)
+            status: Filter by status
+            start_date: Filter by created_at >= start_date
+            end_date: Filter by created_at <= end_date
+            batch_size: Rows fetched per round trip
+
+        Yields:
+            Dictionaries keyed by EXPORT_FIELDS
+        """
+        query = self._export_query(app_id, status, start_date, end_date)
+        for row in query.yield_per(batch_size):
+            yield dict(row._mapping)
+
     # ==================== Analytics Queries ====================
 
     def get_overview_stats(
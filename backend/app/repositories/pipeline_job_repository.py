@@ -8,10 +8,12 @@ Includes transparent encryption for file_content field (binary PDF/image files).
 """
 
 import logging
+from typing import BinaryIO
 
 from sqlalchemy import and_
 from sqlalchemy.orm import Session
 
+from app.core.encryption import encryptor
 from app.database.modular_pipeline_models import PipelineJobDB, StepExecutionStatus
 from app.repositories.base_repository import BaseRepository, EncryptedRepositoryMixin
 
@@ -46,6 +48,46 @@ class PipelineJobRepository(EncryptedRepositoryMixin, BaseRepository[PipelineJob
     def __init__(self, db: Session):
         super().__init__(db, PipelineJobDB)
 
+    def create_from_file(self, file: BinaryIO, **kwargs) -> int:
+        """
+        Create a pipeline job whose file_content is read from a binary file.
+
+        The file is encrypted segment by segment instead of being read into memory
+        first, and file_content is not loaded back and decrypted after the insert
+        (unlike create()). Other encrypted fields in kwargs are encrypted as usual.
+
+        Args:
+            file: Binary file with the uploaded document (e.g. a spooled upload)
+            **kwargs: Other field values for the new job
+
+        Returns:
+            ID of the created job
+        """
+        file.seek(0)
+        if encryptor.is_enabled():
+            file_content = encryptor.encrypt_binary_file(file)
+        else:
+            logger.warning("⚠️ Encryption is disabled - file_content will be stored in plaintext!")
+            file_content = file.read()
+
+        try:
+            job = PipelineJobDB(file_content=file_content, **self._encrypt_fields(kwargs))
+            # The commit expires the job, releasing the token held by the instance
+            del file_content
+            self.db.add(job)
+            self.db.flush()
+            job_id = job.id
+            self.db.commit()
+        except Exception as e:
+            self.db.rollback()
+            logger.error(f"Error creating pipeline job from file: {e}")
+            raise
+
+        # Detach without reloading the (expired) file_content
+        self.db.expunge(job)
+        logger.info(f"✅ Created pipeline job {job_id} from file ({file.tell()} bytes)")
+        return job_id
+
     def get_by_job_id(self, job_id: str) -> PipelineJobDB | None:
         """
         Get pipeline job by job_id (UUID string).
@@ -4,16 +4,25 @@ Pipeline Step Execution Repository
 Provides data access methods for pipeline step execution tracking including CRUD operations
 and step status management.
 
-Includes transparent encryption for input_text and output_text fields.
+Includes transparent encryption for input_text and output_text fields. The texts
+are stored once per distinct content in pipeline_text_blobs and referenced by
+hash (input_hash/output_hash); reads fill input_text/output_text back in.
 """
 
 import logging
+from typing import Any
 
-from sqlalchemy import and_
+from sqlalchemy import and_, func
 from sqlalchemy.orm import Session
+from sqlalchemy.orm.attributes import set_committed_value
 
-from app.database.modular_pipeline_models import PipelineStepExecutionDB, StepExecutionStatus
+from app.database.modular_pipeline_models import (
+    PipelineStepExecutionDB,
+    PipelineTextBlobDB,
+    StepExecutionStatus,
+)
 from app.repositories.base_repository import BaseRepository, EncryptedRepositoryMixin
+from app.repositories.pipeline_text_blob_repository import PipelineTextBlobRepository
 
 logger = logging.getLogger(__name__)
 
@@ -24,7 +33,8 @@ class PipelineStepExecutionRepository(
     """
     Repository for pipeline step execution data access operations.
 
-    Encrypted fields: input_text, output_text
+    Encrypted fields: input_text, output_text (inline only for rows written
+    before text blobs; new rows store them in pipeline_text_blobs)
 
     IMPORTANT: EncryptedRepositoryMixin must come FIRST in inheritance order
     so that its create()/update()/get*() methods override BaseRepository methods.
@@ -33,8 +43,53 @@ class PipelineStepExecutionRepository(
     # Define fields to encrypt
     encrypted_fields = ["input_text", "output_text"]
 
+    # Text field → content hash column referencing pipeline_text_blobs
+    blob_fields = {"input_text": "input_hash", "output_text": "output_hash"}
+
     def __init__(self, db: Session):
         super().__init__(db, PipelineStepExecutionDB)
+        self.blob_repository = PipelineTextBlobRepository(db)
+
+    def create(self, **kwargs) -> PipelineStepExecutionDB:
+        """
+        Create a step execution, storing input_text/output_text as shared text blobs.
+
+        Args:
+            **kwargs: Field values for the new step execution
+
+        Returns:
+            Created step execution with input_text and output_text filled in
+        """
+        for text_field, hash_field in self.blob_fields.items():
+            text = kwargs.pop(text_field, None)
+            if text is not None:
+                kwargs[hash_field] = self.blob_repository.add_reference(text)
+        return super().create(**kwargs)
+
+    def _decrypt_entity(self, entity: PipelineStepExecutionDB | None):
+        if entity is not None:
+            self._load_blob_texts([entity])
+        return super()._decrypt_entity(entity)
+
+    def _decrypt_entities(self, entities: list[PipelineStepExecutionDB]):
+        self._load_blob_texts(entities)
+        return super()._decrypt_entities(entities)
+
+    def _load_blob_texts(self, executions: list[PipelineStepExecutionDB]) -> None:
+        """Fill input_text/output_text of executions that reference text blobs."""
+        missing = [
+            (execution, text_field, getattr(execution, hash_field))
+            for execution in executions
+            for text_field, hash_field in self.blob_fields.items()
+            if getattr(execution, hash_field) and getattr(execution, text_field) is None
+        ]
+        if not missing:
+            return
+
+        texts = self.blob_repository.get_texts(content_hash for _, _, content_hash in missing)
+        for execution, text_field, content_hash in missing:
+            # Not a change: keep the session from writing plaintext back on flush
+            set_committed_value(execution, text_field, texts.get(content_hash))
 
     def get_by_job_id(self, job_id: str) -> list[PipelineStepExecutionDB]:
         """
@@ -127,12 +182,26 @@ class PipelineStepExecutionRepository(
             Number of step executions cleared
         """
         try:
-            executions = self.get_by_job_id(job_id)
-            cleared_count = 0
-
-            for execution in executions:
-                self.update(execution.id, input_text=None, output_text=None)
-                cleared_count += 1
+            query = self.db.query(PipelineStepExecutionDB).filter(
+                PipelineStepExecutionDB.job_id == job_id
+            )
+            self.blob_repository.release(
+                content_hash
+                for row in query.with_entities(
+                    PipelineStepExecutionDB.input_hash, PipelineStepExecutionDB.output_hash
+                )
+                for content_hash in row
+            )
+            cleared_count = query.update(
+                {
+                    PipelineStepExecutionDB.input_text: None,
+                    PipelineStepExecutionDB.output_text: None,
+                    PipelineStepExecutionDB.input_hash: None,
+                    PipelineStepExecutionDB.output_hash: None,
+                },
+                synchronize_session=False,
+            )
+            self.db.commit()
 
             logger.info(
                 f"Cleared text content for {cleared_count} step executions (job_id={job_id})"
@@ -168,3 +237,84 @@ class PipelineStepExecutionRepository(
         except Exception as e:
             logger.error(f"Error getting failed executions: {e}")
             raise
+
+    def delete_by_job_id(self, job_id: str) -> int:
+        """
+        Delete all step executions of a job and release their text blobs.
+
+        Does not commit; the caller commits together with the job deletion.
+
+        Args:
+            job_id: Job UUID string
+
+        Returns:
+            Number of step executions deleted
+        """
+        return self._delete_where(PipelineStepExecutionDB.job_id == job_id)
+
+    def delete_orphaned(self, valid_job_ids: set[str]) -> int:
+        """
+        Delete step executions whose job no longer exists and release their text blobs.
+
+        Does not commit.
+
+        Args:
+            valid_job_ids: Job UUID strings of existing jobs
+
+        Returns:
+            Number of step executions deleted
+        """
+        if not valid_job_ids:
+            return self._delete_where()
+        return self._delete_where(~PipelineStepExecutionDB.job_id.in_(valid_job_ids))
+
+    def get_text_storage(self, job_id: str) -> dict[str, Any]:
+        """
+        Get step text storage of a job, with and without blob deduplication.
+
+        Args:
+            job_id: Job UUID string
+
+        Returns:
+            Dictionary with step count, logical_bytes (plaintext bytes of every
+            input/output reference, i.e. what inline storage writes) and
+            stored_bytes (plaintext bytes of the distinct blobs the job references)
+        """
+        references = []
+        for hash_field in self.blob_fields.values():
+            column = getattr(PipelineStepExecutionDB, hash_field)
+            references.extend(
+                content_hash
+                for (content_hash,) in self.db.query(column).filter(
+                    PipelineStepExecutionDB.job_id == job_id, column.isnot(None)
+                )
+            )
+
+        sizes = dict(
+            self.db.query(PipelineTextBlobDB.content_hash, PipelineTextBlobDB.size_bytes)
+            .filter(PipelineTextBlobDB.content_hash.in_(set(references)))
+            .all()
+        )
+        step_count = (
+            self.db.query(func.count(PipelineStepExecutionDB.id))
+            .filter(PipelineStepExecutionDB.job_id == job_id)
+            .scalar()
+        )
+        return {
+            "steps": step_count,
+            "logical_bytes": sum(sizes.get(h, 0) for h in references),
+            "stored_bytes": sum(sizes.values()),
+        }
+
+    def _delete_where(self, *criteria) -> int:
+        query = self.db.query(PipelineStepExecutionDB).filter(*criteria)
+        released = [
+            content_hash
+            for row in query.with_entities(
+                PipelineStepExecutionDB.input_hash, PipelineStepExecutionDB.output_hash
+            )
+            for content_hash in row
+        ]
+        deleted = query.delete(synchronize_session=False)
+        self.blob_repository.release(released)
+        return deleted
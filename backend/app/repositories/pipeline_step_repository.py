@@ -345,7 +345,12 @@ class PipelineStepRepository(BaseRepository[DynamicPipelineStepDB]):
             max_tokens=original.max_tokens,
             retry_on_failure=original.retry_on_failure,
             max_retries=original.max_retries,
+            chunking_enabled=original.chunking_enabled,
+            chunk_max_tokens=original.chunk_max_tokens,
+            cache_responses=original.cache_responses,
+            stream_output=original.stream_output,
             input_from_previous_step=original.input_from_previous_step,
+            input_source=original.input_source,
             output_format=original.output_format,
             document_class_id=original.document_class_id,
             is_branching_step=False,  # Don't duplicate branching
@@ -0,0 +1,182 @@
+"""
+Pipeline Text Blob Repository
+
+Handles the content-addressed, encrypted text store behind pipeline step
+executions (pipeline_text_blobs). Texts are keyed by an HMAC-SHA256 of their
+plaintext and reference counted, so identical step inputs/outputs are encrypted
+and written only once.
+
+Methods don't commit; the caller commits together with the referencing rows.
+"""
+
+from collections import Counter
+from collections.abc import Iterable
+from datetime import datetime
+import hashlib
+import hmac
+import logging
+import os
+
+from sqlalchemy import exists, or_
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.encryption import encryptor
+from app.database.modular_pipeline_models import PipelineStepExecutionDB, PipelineTextBlobDB
+from app.repositories.base_repository import BaseRepository
+
+logger = logging.getLogger(__name__)
+
+
+def hash_text(text: str) -> str:
+    """
+    Get the content hash (HMAC-SHA256 hex digest) of a text.
+
+    Keyed with PIPELINE_TEXT_HASH_KEY (default: ENCRYPTION_KEY), so the hashes
+    stored next to the encrypted texts can't be used to confirm a guessed text.
+    """
+    return hmac.new(_hash_key(), text.encode("utf-8"), hashlib.sha256).hexdigest()
+
+
+def _hash_key() -> bytes:
+    if settings.pipeline_text_hash_key is not None:
+        return settings.pipeline_text_hash_key.get_secret_value().encode("utf-8")
+    return os.getenv("ENCRYPTION_KEY", "").encode("utf-8")
+
+
+def decrypt_text(content: str | None) -> str | None:
+    """Decrypt stored text, passing through plaintext (written while encryption was off)."""
+    if content is not None and encryptor.is_enabled() and encryptor.is_encrypted(content):
+        return encryptor.decrypt_field(content)
+    return content
+
+
+class PipelineTextBlobRepository(BaseRepository[PipelineTextBlobDB]):
+    """
+    Repository for reference-counted step text blobs.
+
+    Encrypted field: content (encrypted/decrypted here, not via
+    EncryptedRepositoryMixin, because blobs are upserted rather than created).
+    """
+
+    def __init__(self, db: Session):
+        """
+        Initialize pipeline text blob repository.
+
+        Args:
+            db: Database session
+        """
+        super().__init__(db, PipelineTextBlobDB)
+
+    def add_reference(self, text: str) -> str:
+        """
+        Store a text (if not stored yet) and add one reference to it.
+
+        Args:
+            text: Plaintext to store
+
+        Returns:
+            Content hash to store in the referencing row
+        """
+        content_hash = hash_text(text)
+        if self._increment(content_hash, 1):
+            return content_hash
+
+        blob = PipelineTextBlobDB(
+            content_hash=content_hash,
+            content=encryptor.encrypt_field(text),
+            size_bytes=len(text.encode("utf-8")),
+            ref_count=1,
+        )
+        try:
+            with self.db.begin_nested():
+                self.db.add(blob)
+        except IntegrityError:
+            # Stored concurrently by another worker
+            self._increment(content_hash, 1)
+        return content_hash
+
+    def get_texts(self, content_hashes: Iterable[str]) -> dict[str, str]:
+        """
+        Load and decrypt texts by content hash.
+
+        Args:
+            content_hashes: Content hashes to load
+
+        Returns:
+            Mapping of content hash to plaintext (missing blobs are omitted)
+        """
+        unique_hashes = set(content_hashes)
+        if not unique_hashes:
+            return {}
+
+        rows = (
+            self.db.query(PipelineTextBlobDB.content_hash, PipelineTextBlobDB.content)
+            .filter(PipelineTextBlobDB.content_hash.in_(unique_hashes))
+            .all()
+        )
+        return {content_hash: decrypt_text(content) for content_hash, content in rows}
+
+    def release(self, content_hashes: Iterable[str | None]) -> int:
+        """
+        Drop references and delete blobs that are no longer referenced.
+
+        Args:
+            content_hashes: Content hashes of removed references (None values are ignored)
+
+        Returns:
+            Number of blobs deleted
+        """
+        counts = Counter(h for h in content_hashes if h)
+        if not counts:
+            return 0
+
+        for content_hash, count in counts.items():
+            self._increment(content_hash, -count)
+
+        return (
+            self.db.query(PipelineTextBlobDB)
+            .filter(
+                PipelineTextBlobDB.content_hash.in_(counts.keys()),
+                PipelineTextBlobDB.ref_count <= 0,
+            )
+            .delete(synchronize_session=False)
+        )
+
+    def delete_unreferenced(self, created_before: datetime) -> int:
+        """
+        Delete blobs no step execution refers to, whatever their ref_count.
+
+        Safety net for references removed without release() (e.g. bulk deletes).
+        Only blobs created before created_before are swept, so a blob whose first
+        referencing row isn't committed yet is never deleted.
+
+        Args:
+            created_before: Only delete blobs created before this time
+
+        Returns:
+            Number of blobs deleted
+        """
+        referenced = exists().where(
+            or_(
+                PipelineStepExecutionDB.input_hash == PipelineTextBlobDB.content_hash,
+                PipelineStepExecutionDB.output_hash == PipelineTextBlobDB.content_hash,
+            )
+        )
+        return (
+            self.db.query(PipelineTextBlobDB)
+            .filter(PipelineTextBlobDB.created_at < created_before, ~referenced)
+            .delete(synchronize_session=False)
+        )
+
+    def _increment(self, content_hash: str, delta: int) -> bool:
+        updated = (
+            self.db.query(PipelineTextBlobDB)
+            .filter(PipelineTextBlobDB.content_hash == content_hash)
+            .update(
+                {PipelineTextBlobDB.ref_count: PipelineTextBlobDB.ref_count + delta},
+                synchronize_session=False,
+            )
+        )
+        return updated > 0
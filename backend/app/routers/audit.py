@@ -14,10 +14,12 @@ from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, ConfigDict, Field
 from sqlalchemy.orm import Session
 
+from app.core.config import settings
 from app.core.permissions import require_admin
 from app.database.auth_models import AuditAction, UserDB
-from app.database.connection import get_session
+from app.database.connection import get_db_session_context, get_session
 from app.repositories.audit_log_repository import AuditLogRepository
+from app.services.streaming_export import ExportFormat, StreamingExport
 
 logger = logging.getLogger(__name__)
 
@@ -487,18 +489,94 @@ async def get_audit_summary(
         ) from e
 
 
-@router.get("/export/csv")
-async def export_audit_logs_csv(
+def _record_audit_export(
+    user_id: UUID,
+    export_format: ExportFormat,
+    start_date: datetime | None,
+    end_date: datetime | None,
+    record_count: int,
+    completed: bool,
+) -> None:
+    """Log an audit export once its stream has ended."""
+    with get_db_session_context() as db:
+        AuditLogRepository(db).create_log(
+            user_id=user_id,
+            action=AuditAction.AUDIT_EXPORT,
+            resource_type="audit_logs",
+            resource_id=f"{export_format.value}_export",
+            details={
+                "start_date": start_date.isoformat() if start_date else None,
+                "end_date": end_date.isoformat() if end_date else None,
+                "record_count": record_count,
+                "completed": completed,
+            },
+        )
+
+
+def _stream_audit_export(
+    export_format: ExportFormat,
+    compress: bool,
+    start_date: datetime | None,
+    end_date: datetime | None,
+    limit: int | None,
+    current_user: UserDB,
+    db: Session,
+) -> StreamingResponse:
+    """Build a streaming audit log export response."""
+    if not AuditLogRepository(db).has_logs_in_range(start_date=start_date, end_date=end_date):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="No audit logs found for the specified criteria",
+        )
+
+    user_id = current_user.id
+    user_email = current_user.email
+
+    def on_complete(record_count: int, completed: bool) -> None:
+        _record_audit_export(user_id, export_format, start_date, end_date, record_count, completed)
+        logger.info(
+            f"Admin {user_email} exported {record_count} audit logs to "
+            f"{export_format.value.upper()} (completed={completed})"
+        )
+
+    timestamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
+    export = StreamingExport(
+        rows=lambda session: AuditLogRepository(session).iter_export_rows(
+            start_date=start_date,
+            end_date=end_date,
+            limit=limit,
+            batch_size=settings.export_batch_size,
+        ),
+        fieldnames=AuditLogRepository.EXPORT_FIELDS,
+        filename_stem=f"audit_logs_{timestamp}",
+        export_format=export_format,
+        compress=compress,
+        on_complete=on_complete,
+    )
+    return StreamingResponse(export, media_type=export.media_type, headers=export.headers)
+
+
+@router.get("/export")
+async def export_audit_logs(
+    export_format: ExportFormat = Query(
+        ExportFormat.CSV, alias="format", description="Export format (csv or ndjson)"
+    ),
+    compress: bool = Query(False, description="Gzip the export"),
     start_date: datetime | None = Query(None, description="Start date for export"),
     end_date: datetime | None = Query(None, description="End date for export"),
-    limit: int = Query(10000, ge=1, le=50000, description="Maximum records to export"),
+    limit: int | None = Query(None, ge=1, description="Maximum records to export (default: all)"),
     current_user: UserDB = Depends(require_admin()),
     db: Session = Depends(get_session),
 ):
     """
-    Export audit logs as CSV (admin only).
+    Stream audit logs as CSV or NDJSON (admin only).
+
+    Rows are read through a server-side cursor and written as they arrive,
+    so exports of any size use constant memory.
 
     Args:
+        export_format: Export format
+        compress: Gzip the export
         start_date: Start date for export
         end_date: End date for export
         limit: Maximum records to export
@@ -506,68 +584,48 @@ async def export_audit_logs_csv(
         db: Database session
 
     Returns:
-        CSV file download
+        Streaming file download
     """
     try:
-        audit_repo = AuditLogRepository(db)
-
-        # Get CSV data
-        csv_data = audit_repo.export_logs_csv(start_date=start_date, end_date=end_date, limit=limit)
-
-        if not csv_data:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="No audit logs found for the specified criteria",
-            )
-
-        # Generate CSV content
-        import csv
-        import io
-
-        output = io.StringIO()
-        fieldnames = [
-            "timestamp",
-            "user_id",
-            "action",
-            "resource_type",
-            "resource_id",
-            "ip_address",
-            "user_agent",
-            "details",
-        ]
-        writer = csv.DictWriter(output, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(csv_data)
-
-        csv_content = output.getvalue()
-        output.close()
+        return _stream_audit_export(
+            export_format, compress, start_date, end_date, limit, current_user, db
+        )
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error exporting audit logs: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Failed to export audit logs"
+        ) from e
 
-        # Generate filename
-        timestamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
-        filename = f"audit_logs_{timestamp}.csv"
 
-        # Log export action
-        audit_repo.create_log(
-            user_id=current_user.id,
-            action=AuditAction.AUDIT_EXPORT,
-            resource_type="audit_logs",
-            resource_id="csv_export",
-            details={
-                "start_date": start_date.isoformat() if start_date else None,
-                "end_date": end_date.isoformat() if end_date else None,
-                "record_count": len(csv_data),
-            },
-        )
+@router.get("/export/csv")
+async def export_audit_logs_csv(
+    start_date: datetime | None = Query(None, description="Start date for export"),
+    end_date: datetime | None = Query(None, description="End date for export"),
+    limit: int | None = Query(None, ge=1, description="Maximum records to export (default: all)"),
+    compress: bool = Query(False, description="Gzip the export"),
+    current_user: UserDB = Depends(require_admin()),
+    db: Session = Depends(get_session),
+):
+    """
+    Stream audit logs as CSV (admin only).
 
-        logger.info(f"Admin {current_user.email} exported {len(csv_data)} audit logs to CSV")
+    Args:
+        start_date: Start date for export
+        end_date: End date for export
+        limit: Maximum records to export
+        compress: Gzip the export
+        current_user: Current authenticated admin user
+        db: Database session
 
-        # Return CSV file
-        return StreamingResponse(
-            io.BytesIO(csv_content.encode("utf-8")),
-            media_type="text/csv",
-            headers={"Content-Disposition": f"attachment; filename={filename}"},
+    Returns:
+        CSV file download
+    """
+    try:
+        return _stream_audit_export(
+            ExportFormat.CSV, compress, start_date, end_date, limit, current_user, db
         )
-
     except HTTPException:
         raise
     except Exception as e:
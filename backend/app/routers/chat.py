@@ -163,7 +163,7 @@ async def stream_chat_message(request: Request, chat_request: ChatRequest):
     user_agent = get_user_agent(request)
 
     # Check rate limit BEFORE processing
-    rate_limit_result = chat_rate_limiter.check_rate_limit(
+    rate_limit_result = await chat_rate_limiter.check_rate_limit_async(
         ip_address=ip_address,
         session_token=session_token,
         user_agent=user_agent,
@@ -171,7 +171,7 @@ async def stream_chat_message(request: Request, chat_request: ChatRequest):
 
     if not rate_limit_result.allowed:
         # Record the violation and apply escalating penalties
-        violation_result = chat_rate_limiter.record_violation(
+        violation_result = await chat_rate_limiter.record_violation_async(
             ip_address=ip_address,
             session_token=session_token,
             user_agent=user_agent,
@@ -447,7 +447,7 @@ async def stream_chat_message(request: Request, chat_request: ChatRequest):
             )
 
     # Record the message AFTER starting the stream (request is being processed)
-    chat_rate_limiter.record_message(
+    await chat_rate_limiter.record_message_async(
         ip_address=ip_address,
         session_token=session_token,
         user_agent=user_agent,
@@ -521,7 +521,7 @@ async def get_rate_limit_status(request: Request):
     ip_address = get_client_ip(request)
     session_token = get_session_token(request)
 
-    status = chat_rate_limiter.get_status(ip_address, session_token)
+    status = await chat_rate_limiter.get_status_async(ip_address, session_token)
 
     # Remove sensitive identifier from public response
     safe_status = {
@@ -7,19 +7,23 @@ Provides admin endpoints for viewing chat usage statistics, including:
 - Cost analysis by app
 - Error breakdown
 - Performance percentiles (p50/p95/p99)
+- Streaming CSV/NDJSON export of request logs
 """
 
-from datetime import date, datetime, timedelta
+from datetime import date, datetime, timedelta, timezone
 import logging
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 from sqlalchemy.orm import Session
 
+from app.core.config import settings
 from app.core.permissions import require_admin
 from app.database.auth_models import UserDB
 from app.database.connection import get_session
 from app.repositories.chat_log_repository import ChatLogRepository
+from app.services.streaming_export import ExportFormat, StreamingExport
 
 logger = logging.getLogger(__name__)
 
@@ -326,6 +330,48 @@ async def get_performance_stats(
         ) from e
 
 
+# ==================== EXPORT ====================
+
+
+@router.get("/export")
+async def export_chat_logs(
+    export_format: ExportFormat = Query(
+        ExportFormat.CSV, alias="format", description="Export format (csv or ndjson)"
+    ),
+    compress: bool = Query(False, description="Gzip the export"),
+    app_id: str | None = Query(None, description="Filter by app (guidelines/befund)"),
+    status_filter: str | None = Query(None, alias="status", description="Filter by status"),
+    start_date: datetime | None = Query(None, description="Start date filter"),
+    end_date: datetime | None = Query(None, description="End date filter"),
+    current_user: UserDB = Depends(require_admin()),
+):
+    """
+    Stream chat request logs as CSV or NDJSON (admin only).
+
+    Exports request metadata only (no query text). Rows are read through a
+    server-side cursor and written as they arrive.
+    """
+    admin_email = current_user.email
+    timestamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
+    export = StreamingExport(
+        rows=lambda db: ChatLogRepository(db).iter_export_rows(
+            app_id=app_id,
+            status=status_filter,
+            start_date=start_date,
+            end_date=end_date,
+            batch_size=settings.export_batch_size,
+        ),
+        fieldnames=ChatLogRepository.EXPORT_FIELDS,
+        filename_stem=f"chat_logs_{timestamp}",
+        export_format=export_format,
+        compress=compress,
+        on_complete=lambda count, completed: logger.info(
+            f"Admin {admin_email} exported {count} chat logs (completed={completed})"
+        ),
+    )
+    return StreamingResponse(export, media_type=export.media_type, headers=export.headers)
+
+
 # ==================== HEALTH CHECK ====================
 
 
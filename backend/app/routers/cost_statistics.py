@@ -2,18 +2,21 @@
 Cost Statistics Router
 
 Provides admin endpoints for viewing AI cost statistics, including
-cost overview, breakdowns by model/step, and per-processing-job details.
+cost overview, breakdowns by model/step, per-processing-job details and a
+streaming CSV/NDJSON export of individual cost entries.
 """
 
-from datetime import datetime
+from datetime import datetime, timezone
 from enum import Enum
 import logging
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 from sqlalchemy import func
 from sqlalchemy.orm import Session
 
+from app.core.config import settings
 from app.core.dependencies import get_ai_cost_tracker, get_ai_log_interaction_repository
 from app.core.permissions import require_admin
 from app.database.auth_models import UserDB
@@ -21,6 +24,7 @@ from app.database.connection import get_session
 from app.database.unified_models import AILogInteractionDB
 from app.repositories.ai_log_interaction_repository import AILogInteractionRepository
 from app.services.ai_cost_tracker import AICostTracker
+from app.services.streaming_export import ExportFormat, StreamingExport
 
 logger = logging.getLogger(__name__)
 
@@ -414,6 +418,47 @@ async def get_feedback_analysis_costs(
         ) from e
 
 
+# ==================== EXPORT ====================
+
+
+@router.get("/export")
+async def export_cost_logs(
+    export_format: ExportFormat = Query(
+        ExportFormat.CSV, alias="format", description="Export format (csv or ndjson)"
+    ),
+    compress: bool = Query(False, description="Gzip the export"),
+    processing_id: str | None = Query(None, description="Filter by processing ID"),
+    document_type: str | None = Query(None, description="Filter by document type"),
+    start_date: datetime | None = Query(None, description="Start date filter"),
+    end_date: datetime | None = Query(None, description="End date filter"),
+    current_user: UserDB = Depends(require_admin()),
+):
+    """
+    Stream per-call AI cost entries as CSV or NDJSON (admin only).
+
+    Rows are read through a server-side cursor and written as they arrive.
+    """
+    admin_email = current_user.email
+    timestamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
+    export = StreamingExport(
+        rows=lambda db: AILogInteractionRepository(db).iter_export_rows(
+            processing_id=processing_id,
+            start_date=start_date,
+            end_date=end_date,
+            document_type=document_type,
+            batch_size=settings.export_batch_size,
+        ),
+        fieldnames=AILogInteractionRepository.EXPORT_FIELDS,
+        filename_stem=f"ai_costs_{timestamp}",
+        export_format=export_format,
+        compress=compress,
+        on_complete=lambda count, completed: logger.info(
+            f"Admin {admin_email} exported {count} cost entries (completed={completed})"
+        ),
+    )
+    return StreamingResponse(export, media_type=export.media_type, headers=export.headers)
+
+
 # ==================== HEALTH CHECK ====================
 
 
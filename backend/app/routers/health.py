@@ -175,6 +175,18 @@ async def detailed_health_check():
             "ocr_capabilities": ocr_status,
         }
 
+        # Datenbank-Connection-Pool (prozessweit geteilt)
+        try:
+            from app.database.connection import get_pool_status
+
+            details["database_pool"] = get_pool_status()
+            if details["database_pool"]["metrics"]["timeouts"] > 0:
+                basic_health.services["database_pool"] = "degraded"
+            else:
+                basic_health.services["database_pool"] = "healthy"
+        except Exception as e:
+            basic_health.services["database_pool"] = f"error: {str(e)[:50]}"
+
         # Disk Space Check
         temp_space_gb = details["temp_space_available"] / (1024**3)
         if temp_space_gb < 1:  # Weniger als 1GB frei
@@ -26,6 +26,7 @@ from app.services.cache_service import CacheService, get_cache_service
 from app.services.document_class_manager import DocumentClassManager
 from app.services.modular_pipeline_executor import ModularPipelineManager
 from app.services.ocr_engine_manager import OCREngineManager
+from app.services.pipeline_plan_cache import publish_pipeline_config_change
 
 logger = logging.getLogger(__name__)
 
@@ -92,6 +93,16 @@ class PipelineStepRequest(BaseModel):
     retry_on_failure: bool = True
     max_retries: int = Field(3, ge=0, le=10)
     input_from_previous_step: bool = True
+    # Chunked execution of long documents (not for branching/stop condition steps)
+    chunking_enabled: bool = False
+    chunk_max_tokens: int | None = Field(None, ge=500, le=32000)
+    # Reuse cached responses for identical prompts (needs LLM_CACHE_ENABLED)
+    cache_responses: bool = False
+    # Publish partial output to progress events while generating (OVH models)
+    stream_output: bool = False
+    # Input source (null/"previous_output" = previous step's output, otherwise a
+    # context variable such as "original_text"; such steps can run concurrently)
+    input_source: str | None = Field(None, max_length=100, pattern="^[A-Za-z_][A-Za-z0-9_]*$")
     output_format: str | None = Field("text", pattern="^(text|json|markdown)$")
 
     # Pipeline branching fields
@@ -174,6 +185,11 @@ class PipelineStepResponse(BaseModel):
     retry_on_failure: bool
     max_retries: int
     input_from_previous_step: bool
+    input_source: str | None = None
+    chunking_enabled: bool = False
+    chunk_max_tokens: int | None = None
+    cache_responses: bool = False
+    stream_output: bool = False
     output_format: str | None
     created_at: datetime
     last_modified: datetime
@@ -467,6 +483,7 @@ async def create_step(
 
         # Invalidate pipeline steps cache
         await cache.delete_namespace(CacheService.NS_PIPELINE_STEPS)
+        await publish_pipeline_config_change()
 
         logger.info(f"✅ Created pipeline step: {step.name} (order: {step.order})")
         return step
@@ -504,6 +521,7 @@ async def update_step(
 
         # Invalidate pipeline steps cache
         await cache.delete_namespace(CacheService.NS_PIPELINE_STEPS)
+        await publish_pipeline_config_change()
 
         logger.info(f"✅ Updated pipeline step: {step.name} (ID: {step_id})")
         return step
@@ -536,6 +554,7 @@ async def delete_step(
 
     # Invalidate pipeline steps cache
     await cache.delete_namespace(CacheService.NS_PIPELINE_STEPS)
+    await publish_pipeline_config_change()
 
     logger.info(f"✅ Deleted pipeline step ID: {step_id}")
     return
@@ -576,6 +595,7 @@ async def duplicate_pipeline_step(
 
         # Invalidate pipeline steps cache
         await cache.delete_namespace(CacheService.NS_PIPELINE_STEPS)
+        await publish_pipeline_config_change()
 
         logger.info(f"✅ Duplicated pipeline step {step_id} as '{request.new_name}' (ID: {new_step.id})")
         return new_step
@@ -611,6 +631,7 @@ async def reorder_steps(
 
         # Invalidate pipeline steps cache
         await cache.delete_namespace(CacheService.NS_PIPELINE_STEPS)
+        await publish_pipeline_config_change()
 
         logger.info(f"✅ Reordered pipeline steps: {reorder_request.step_ids}")
         return {"success": True, "message": "Steps reordered successfully"}
@@ -830,6 +851,7 @@ async def update_model(
 
         # Invalidate models cache
         await cache.delete_namespace(CacheService.NS_AVAILABLE_MODELS)
+        await publish_pipeline_config_change()
 
         logger.info(f"✅ Updated model pricing: {updated_model.name} (ID: {model_id})")
         return updated_model
@@ -921,6 +943,7 @@ async def create_document_class(
 
         # Invalidate document classes cache
         await cache.delete_namespace(CacheService.NS_DOCUMENT_CLASSES)
+        await publish_pipeline_config_change()
 
         logger.info(f"✅ Created document class: {doc_class.class_key}")
         return doc_class
@@ -961,6 +984,7 @@ async def update_document_class(
 
         # Invalidate document classes cache
         await cache.delete_namespace(CacheService.NS_DOCUMENT_CLASSES)
+        await publish_pipeline_config_change()
 
         logger.info(f"✅ Updated document class: {doc_class.class_key}")
         return doc_class
@@ -999,6 +1023,7 @@ async def delete_document_class(
 
         # Invalidate document classes cache
         await cache.delete_namespace(CacheService.NS_DOCUMENT_CLASSES)
+        await publish_pipeline_config_change()
 
         logger.info(f"✅ Deleted document class ID: {class_id}")
         return
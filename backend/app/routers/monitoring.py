@@ -137,6 +137,23 @@ async def redis_debug():
         raise HTTPException(status_code=500, detail=str(e)) from e
 
 
+@router.get("/db-pool")
+async def db_pool_status():
+    """
+    Get SQLAlchemy connection pool state for this API process.
+
+    Returns:
+        Pool size, checked-out connections, overflow, and checkout latency / wait-time metrics
+    """
+    try:
+        from app.database.connection import get_pool_status
+
+        return get_pool_status()
+    except Exception as e:
+        logger.error(f"❌ Error reading database pool status: {str(e)}")
+        raise HTTPException(status_code=500, detail="Failed to read database pool status") from e
+
+
 @router.get("/flower-status")
 async def flower_status():
     """
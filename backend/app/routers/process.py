@@ -3,11 +3,13 @@ import logging
 import os
 import time
 
-from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, Request
+from fastapi import APIRouter, BackgroundTasks, Depends, Header, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from slowapi import Limiter
 from slowapi.util import get_remote_address
 
+from app.core.config import settings
 from app.core.dependencies import get_processing_service, get_statistics_service
 from app.core.permissions import get_current_user_optional
 from app.database.auth_models import UserDB
@@ -20,7 +22,13 @@ from app.models.document import (
     TranslationResult,
 )
 from app.services.pipeline_progress_tracker import PipelineProgressTracker
-from app.services.processing_service import STEP_DESCRIPTIONS, ProcessingService
+from app.services.processing_service import ProcessingService, apply_live_progress
+from app.services.progress_event_stream import (
+    StreamLimitError,
+    get_progress_event_broker,
+    parse_last_event_id,
+    stream_progress_events,
+)
 from app.services.statistics_service import StatisticsService
 
 # Setup logging
@@ -108,14 +116,7 @@ async def get_processing_status(
         tracker = PipelineProgressTracker()
         redis_progress = await tracker.get_progress(processing_id)
 
-        if redis_progress and redis_progress.get("current_step_name"):
-            status_dict["current_step_name"] = redis_progress["current_step_name"]
-            status_dict["ui_stage"] = redis_progress.get("ui_stage")
-            status_dict["progress_percent"] = redis_progress["progress_percent"]
-            status_dict["current_step"] = STEP_DESCRIPTIONS.get(
-                redis_progress["current_step_name"],
-                status_dict["current_step"],
-            )
+        apply_live_progress(status_dict, redis_progress)
 
         return ProcessingProgress(**status_dict)
 
@@ -128,6 +129,85 @@ async def get_processing_status(
         ) from e
 
 
+@router.get("/process/{processing_id}/events")
+async def stream_processing_status(
+    processing_id: str,
+    request: Request,
+    last_event_id: str | None = Header(default=None),
+    service: ProcessingService = Depends(get_processing_service),
+):
+    """
+    Server-Sent Events stream of the processing status (replaces polling /status)
+
+    - **processing_id**: ID der Verarbeitung
+    - **Last-Event-ID**: Header set by EventSource on reconnect; the snapshot is
+      skipped if nothing changed since
+
+    Sends `progress` events (same payload as /status) and `step_completed` events
+    and ends after a terminal status. Returns 503 when this server has no stream
+    capacity or Redis is unavailable; clients then fall back to polling /status.
+    """
+    broker = get_progress_event_broker()
+    if not await broker.start():
+        raise HTTPException(
+            status_code=503,
+            detail="Progress stream unavailable, please poll the status endpoint",
+            headers={"Retry-After": "30"},
+        )
+
+    try:
+        queue = broker.open_stream(processing_id)
+    except StreamLimitError as e:
+        logger.warning(f"⚠️ {e}")
+        raise HTTPException(
+            status_code=503,
+            detail="Too many open progress streams, please poll the status endpoint",
+            headers={"Retry-After": "30"},
+        ) from e
+
+    try:
+        # Read the event ID before the snapshot: later events are delivered by the queue
+        tracker = PipelineProgressTracker()
+        snapshot_event_id = await tracker.get_last_event_id(processing_id)
+        redis_progress = await tracker.get_progress(processing_id)
+        status_dict = service.get_processing_status(processing_id)
+        apply_live_progress(status_dict, redis_progress)
+    except ValueError as e:
+        broker.close_stream(processing_id, queue)
+        raise HTTPException(status_code=404, detail=str(e)) from e
+    except Exception as e:
+        broker.close_stream(processing_id, queue)
+        logger.error(f"❌ Status-Stream Fehler: {e}")
+        raise HTTPException(
+            status_code=500, detail=f"Fehler beim Abrufen des Status: {str(e)}"
+        ) from e
+
+    async def generate():
+        try:
+            async for chunk in stream_progress_events(
+                processing_id,
+                status_dict,
+                queue,
+                snapshot_event_id=snapshot_event_id,
+                last_event_id=parse_last_event_id(last_event_id),
+                is_disconnected=request.is_disconnected,
+                heartbeat_seconds=settings.progress_stream_heartbeat_seconds,
+            ):
+                yield chunk
+        finally:
+            broker.close_stream(processing_id, queue)
+
+    return StreamingResponse(
+        generate(),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "Connection": "keep-alive",
+            "X-Accel-Buffering": "no",  # Disable nginx buffering
+        },
+    )
+
+
 @router.get("/process/{processing_id}/result", response_model=TranslationResult)
 async def get_processing_result(
     processing_id: str,
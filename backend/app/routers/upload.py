@@ -1,3 +1,4 @@
+import asyncio
 from datetime import datetime
 import logging
 import os
@@ -5,17 +6,20 @@ import uuid
 
 from celery import Celery
 from fastapi import APIRouter, Depends, File, HTTPException, Request, UploadFile
+import psutil
 from slowapi import Limiter
 from slowapi.util import get_remote_address
 from sqlalchemy.orm import Session
 
+from app.core.config import settings
 from app.core.permissions import get_current_user_optional
 from app.database.auth_models import UserDB
 from app.database.connection import get_session
 from app.database.modular_pipeline_models import StepExecutionStatus
 from app.models.document import DocumentType, ProcessingStatus, UploadResponse
-from app.services.file_quality_detector import FileQualityDetector
-from app.services.file_validator import FileValidator
+from app.services.file_quality_detector import FileQualityDetector, ocr_quality_summary
+from app.services.file_validator import FileValidator, IngestedUpload
+from app.services.quality_analysis_runner import analyze_document
 
 logger = logging.getLogger(__name__)
 
@@ -27,6 +31,31 @@ limiter = Limiter(
     enabled=os.getenv("ENVIRONMENT") not in ["test", "development"],
 )
 
+# Begrenzt gleichzeitige Ingestions (Quality Gate + Verschlüsselung) pro Prozess
+_ingestion_slots: asyncio.Semaphore | None = None
+
+
+def _get_ingestion_slots() -> asyncio.Semaphore:
+    global _ingestion_slots
+    if _ingestion_slots is None:
+        _ingestion_slots = asyncio.Semaphore(settings.upload_max_concurrent_ingestions)
+    return _ingestion_slots
+
+
+def _current_rss() -> int:
+    """Resident Set Size dieses Prozesses in Bytes."""
+    return psutil.Process().memory_info().rss
+
+
+def _log_upload_memory(upload: IngestedUpload, rss_samples: list[int]) -> None:
+    """Loggt den RSS-Anstieg während eines Uploads (Spitze über den Messpunkten)."""
+    peak_increase = max(rss_samples) - rss_samples[0]
+    logger.info(
+        f"📊 Upload memory: peak RSS +{peak_increase / 1024 / 1024:.1f} MB "
+        f"for {upload.size / 1024 / 1024:.1f} MB file "
+        f"({'spooled to disk' if upload.spilled_to_disk else 'in memory'})"
+    )
+
 
 @router.post("/upload", response_model=UploadResponse)
 @limiter.limit("5/minute")  # Maximal 5 Uploads pro Minute (disabled in test/development)
@@ -49,6 +78,14 @@ async def upload_document(
     - **OCR**: Automatische Texterkennung für gescannte Dokumente
     """
 
+    async with _get_ingestion_slots():
+        return await _ingest_document(request, file, db)
+
+
+async def _ingest_document(request: Request, file: UploadFile, db: Session) -> UploadResponse:
+    rss_samples = [_current_rss()]
+    upload: IngestedUpload | None = None
+
     try:
         logger.debug(
             f"🔍 Upload-Request erhalten: {file.filename}, Content-Type: {file.content_type}"
@@ -59,10 +96,11 @@ async def upload_document(
             logger.error("❌ Dateiname fehlt!")
             raise HTTPException(status_code=400, detail="Dateiname fehlt")
 
-        # Dateivalidierung
+        # Dateivalidierung (Chunks werden beim Einlesen geprüft, gehasht und gespoolt)
         logger.debug(f"🔍 Validiere Datei: {file.filename}")
-        is_valid, error_message = await FileValidator.validate_file(file)
-        if not is_valid:
+        upload, error_message = await FileValidator.ingest_file(file, spool_dir=settings.temp_dir)
+        rss_samples.append(_current_rss())
+        if upload is None:
             logger.error(f"❌ Dateivalidierung fehlgeschlagen: {error_message}")
             raise HTTPException(
                 status_code=400, detail=f"Dateivalidierung fehlgeschlagen: {error_message}"
@@ -105,14 +143,13 @@ async def upload_document(
         file_type_str = FileValidator.get_file_type(file.filename)
         file_type = DocumentType.PDF if file_type_str == "pdf" else DocumentType.IMAGE
 
-        # Dateiinhalt lesen
-        file_content = await file.read()
-        file_size = len(file_content)
+        file_size = upload.size
 
         # Pipeline-Konfiguration laden (für Job-Snapshot)
         from app.services.modular_pipeline_executor import ModularPipelineExecutor
+        from app.services.pipeline_plan_cache import get_pipeline_plan_cache
 
-        executor = ModularPipelineExecutor(db)
+        executor = ModularPipelineExecutor(db, plan_cache=get_pipeline_plan_cache())
 
         # Lade aktuelle Pipeline- und OCR-Konfiguration
         pipeline_steps_list = executor.load_pipeline_steps()
@@ -121,16 +158,21 @@ async def upload_document(
         # Quality Gate: Check document quality before processing
         # Skip quality gate in test/development environment
         skip_quality_gate = os.getenv("ENVIRONMENT") in ["test", "development"]
+        quality_analysis = None
 
         if not skip_quality_gate:
             logger.debug(f"🔍 Running quality gate check for {file.filename}")
             quality_detector = FileQualityDetector()
 
             try:
-                # Analyze document quality
-                strategy, complexity, analysis = await quality_detector.analyze_file(
-                    file_content=file_content, file_type=file_type_str, filename=file.filename
+                # Analyze document quality (process pool, cached by content hash)
+                strategy, complexity, analysis = await analyze_document(
+                    upload.open(), file_type_str, file.filename, content_hash=upload.sha256
                 )
+                rss_samples.append(_current_rss())
+                if file_type_str == "pdf":
+                    # Reused by OCR to skip the embedded-text probe for scanned PDFs
+                    quality_analysis = ocr_quality_summary(analysis)
 
                 # Get quality threshold from OCR configuration (default: 0.5)
                 min_confidence = (
@@ -213,18 +255,23 @@ async def upload_document(
             "mistral_ocr_config": ocr_config_obj.mistral_ocr_config if ocr_config_obj else {},
             "paddleocr_config": ocr_config_obj.paddleocr_config if ocr_config_obj else {},
         }
+        if quality_analysis:
+            ocr_config["quality_analysis"] = quality_analysis
+        else:
+            # Lets the worker find an analysis that finished after the quality gate
+            ocr_config["content_sha256"] = upload.sha256
 
         # Erstelle Pipeline-Job in der Datenbank (using repository for encryption)
         from app.repositories.pipeline_job_repository import PipelineJobRepository
 
         job_repo = PipelineJobRepository(db)
-        job_repo.create(
+        job_repo.create_from_file(
+            upload.open(),  # Wird segmentweise aus der Spool-Datei verschlüsselt
             job_id=job_id,
             processing_id=processing_id,
             filename=file.filename,
             file_type=file_type_str,
             file_size=file_size,
-            file_content=file_content,  # Will be encrypted by repository
             client_ip=get_remote_address(request),
             status=StepExecutionStatus.PENDING,
             progress_percent=0,
@@ -232,6 +279,8 @@ async def upload_document(
             pipeline_config=pipeline_config,  # Snapshot der Pipeline-Konfiguration
             ocr_config=ocr_config,  # Snapshot der OCR-Konfiguration
         )
+        rss_samples.append(_current_rss())
+        _log_upload_memory(upload, rss_samples)
 
         # NOTE: Worker is NOT enqueued here anymore!
         # It will be enqueued when frontend calls /process/{id} with options (target_language, etc.)
@@ -267,6 +316,9 @@ async def upload_document(
         raise HTTPException(
             status_code=500, detail=f"Interner Server-Fehler beim Upload: {str(e)}"
         ) from e
+    finally:
+        if upload is not None:
+            upload.close()
 
 
 @router.delete("/upload/{processing_id}")
@@ -21,6 +21,13 @@ while maintaining comprehensive cost analytics for budget management.
     Caches pricing in-memory to avoid repeated database queries. Falls back to
     Llama 3.3 70B pricing if model not found.
 
+**Aggregation**:
+    Totals and breakdowns are computed with SQL GROUP BY queries. Closed hours are
+    pre-aggregated into ai_cost_rollups (hourly + daily) by the rollup_ai_costs
+    Celery task; date-range queries read whole days/hours from the rollups and
+    only the not-yet-rolled-up edges from ai_interaction_logs, so dashboard cost
+    stays flat as history grows (and survives the 7-day log retention).
+
 **Database Schema**:
     Writes to AILogInteractionDB (ai_interaction_logs table) with fields:
     - processing_id, step_name, model_provider, model_name
@@ -55,18 +62,64 @@ Example Cost Calculation:
     Total: $0.00243
 """
 
-from datetime import datetime
+from datetime import datetime, timedelta
 import logging
 from typing import Any
 
 from sqlalchemy.orm import Session
 
-from app.database.unified_models import AILogInteractionDB
+from app.core.config import settings
+from app.repositories.ai_cost_rollup_repository import DAY, HOUR, AICostRollupRepository
 from app.repositories.ai_log_interaction_repository import AILogInteractionRepository
 from app.repositories.available_model_repository import AvailableModelRepository
+from app.services.ai_log_writer import get_ai_log_writer
 
 logger = logging.getLogger(__name__)
 
+# An hour is rolled up only once it ended this long ago, so calls logged right at
+# the hour boundary are committed before their bucket is aggregated.
+ROLLUP_GRACE_PERIOD = timedelta(minutes=5)
+
+
+def _to_naive(value: datetime | None) -> datetime | None:
+    """Convert aware datetimes to naive local time (created_at is stored naive)."""
+    if value is not None and value.tzinfo is not None:
+        return value.astimezone().replace(tzinfo=None)
+    return value
+
+
+def _floor_hour(value: datetime) -> datetime:
+    return value.replace(minute=0, second=0, microsecond=0)
+
+
+def _ceil_hour(value: datetime) -> datetime:
+    floored = _floor_hour(value)
+    return floored if floored == value else floored + timedelta(hours=1)
+
+
+def _floor_day(value: datetime) -> datetime:
+    return value.replace(hour=0, minute=0, second=0, microsecond=0)
+
+
+def _ceil_day(value: datetime) -> datetime:
+    floored = _floor_day(value)
+    return floored if floored == value else floored + timedelta(days=1)
+
+
+def _rollup_row(bucket: Any) -> dict[str, Any]:
+    """Convert an aggregated bucket row into ai_cost_rollups column values."""
+    return {
+        "model_name": bucket.model_name or "",
+        "step_name": bucket.step_name,
+        "document_type": bucket.document_type or "",
+        "model_provider": bucket.model_provider,
+        "calls": int(bucket.calls or 0),
+        "input_tokens": int(bucket.input_tokens or 0),
+        "output_tokens": int(bucket.output_tokens or 0),
+        "total_tokens": int(bucket.total_tokens or 0),
+        "total_cost_usd": float(bucket.total_cost_usd or 0),
+    }
+
 
 class AICostTracker:
     """Lightweight AI cost tracking service with privacy-first design.
@@ -139,6 +192,7 @@ class AICostTracker:
         session: Session,
         model_repository: AvailableModelRepository | None = None,
         log_repository: AILogInteractionRepository | None = None,
+        rollup_repository: AICostRollupRepository | None = None,
     ):
         """Initialize cost tracker with database session.
 
@@ -147,10 +201,12 @@ class AICostTracker:
                 and writing to ai_interaction_logs table
             model_repository: Optional repository for model pricing (for DI)
             log_repository: Optional repository for log queries (for DI)
+            rollup_repository: Optional repository for cost rollups (for DI)
         """
         self.session = session
         self.model_repository = model_repository or AvailableModelRepository(session)
         self.log_repository = log_repository or AILogInteractionRepository(session)
+        self.rollup_repository = rollup_repository or AICostRollupRepository(session)
         self._pricing_cache = {}  # Cache pricing to avoid repeated DB queries
 
     def _get_model_pricing(self, model_name: str) -> dict[str, float]:
@@ -241,7 +297,8 @@ class AICostTracker:
 
         Primary method for recording token usage and costs after each AI invocation.
         Calculates costs automatically from token counts using dynamic pricing,
-        then persists to database. No text content stored - privacy compliant.
+        then queues the row for a batched insert. No text content stored - privacy
+        compliant.
 
         Args:
             processing_id: Unique document processing identifier (UUID)
@@ -257,7 +314,7 @@ class AICostTracker:
             metadata: Additional context (temperature, max_tokens, etc.) stored as JSON
 
         Returns:
-            AILogInteractionDB | None: Created database record, or None if logging failed
+            dict[str, Any] | None: Logged column values, or None if logging failed
 
         Example:
             >>> tracker = AICostTracker(session=db)
@@ -274,7 +331,7 @@ class AICostTracker:
             ...     metadata={"temperature": 0.7, "max_tokens": 4000}
             ... )
             >>> if log_entry:
-            ...     print(f"Logged ${log_entry.total_cost_usd:.6f}")
+            ...     print(f"Logged ${log_entry['total_cost_usd']:.6f}")
             Logged $0.002187
 
         Note:
@@ -284,12 +341,14 @@ class AICostTracker:
             3. Calculate: output_cost = (output_tokens / 1000) * output_price
             4. Total: total_cost = input_cost + output_cost
 
-            **Database Commit**:
-            Method commits transaction on success. Rollback on error.
-            Caller doesn't need to commit for cost logging.
+            **Database Write**:
+            The row is handed to the process-wide AILogWriter and inserted in a
+            background batch (see app.services.ai_log_writer). The caller's
+            session is not used or committed; the row appears in queries after
+            at most AI_LOG_FLUSH_INTERVAL_SECONDS.
 
             **Error Handling**:
-            - Database errors: Logged, rollback, return None
+            - Write errors: Handled by the writer (spilled to Redis or dropped)
             - Never propagates exceptions (non-critical operation)
             - Processing continues even if cost logging fails
 
@@ -312,32 +371,32 @@ class AICostTracker:
             output_cost = (output_tokens / 1000) * pricing["output"]
             total_cost = input_cost + output_cost
 
-            # Create log entry (NO TEXT CONTENT!)
-            log_entry = AILogInteractionDB(
-                processing_id=processing_id,
-                step_name=step_name,
+            # Log row (NO TEXT CONTENT!)
+            log_entry = {
+                "processing_id": processing_id,
+                "step_name": step_name,
                 # Token tracking
-                input_tokens=input_tokens,
-                output_tokens=output_tokens,
-                total_tokens=total_tokens,
+                "input_tokens": input_tokens,
+                "output_tokens": output_tokens,
+                "total_tokens": total_tokens,
                 # Cost tracking
-                input_cost_usd=input_cost,
-                output_cost_usd=output_cost,
-                total_cost_usd=total_cost,
+                "input_cost_usd": input_cost,
+                "output_cost_usd": output_cost,
+                "total_cost_usd": total_cost,
                 # Model info
-                model_provider=model_provider,
-                model_name=model_name,
+                "model_provider": model_provider,
+                "model_name": model_name,
                 # Metrics
-                confidence_score=confidence_score,
-                processing_time_seconds=processing_time_seconds,
+                "confidence_score": confidence_score,
+                "processing_time_seconds": processing_time_seconds,
                 # Context
-                document_type=document_type,
-                created_at=datetime.now(),
-                log_metadata=metadata,
-            )
+                "document_type": document_type,
+                "created_at": datetime.now(),
+                "log_metadata": metadata,
+            }
 
-            self.session.add(log_entry)
-            self.session.commit()
+            # Buffered and written in batches off the caller's session
+            get_ai_log_writer().submit(log_entry)
 
             logger.info(
                 f"💰 AI Call Logged | {step_name} | "
@@ -349,7 +408,6 @@ class AICostTracker:
 
         except Exception as e:
             logger.error(f"Failed to log AI cost: {e}")
-            self.session.rollback()
             return None
 
     def get_total_cost(
@@ -411,20 +469,18 @@ class AICostTracker:
             Never propagates exceptions - safe for production dashboards.
 
             **Performance**:
-            Query performance depends on filters and log volume:
-            - With processing_id: Fast (indexed column)
-            - Date range only: Slower on large tables (add index on created_at)
-            - No filters: Full table scan (use with caution on large datasets)
+            Aggregated in SQL. With processing_id: one indexed GROUP BY over that
+            document's logs. Otherwise whole hours/days come from ai_cost_rollups
+            (see _aggregate_costs()), so cost is independent of history size.
         """
         try:
-            # Query logs using repository with filtering
-            logs = self.log_repository.get_filtered(
+            rows = self._aggregate_costs(
                 processing_id=processing_id, start_date=start_date, end_date=end_date
             )
 
-            total_cost = sum(log.total_cost_usd or 0 for log in logs)
-            total_tokens = sum(log.total_tokens or 0 for log in logs)
-            total_calls = len(logs)
+            total_cost = sum(float(row.cost or 0) for row in rows)
+            total_tokens = sum(int(row.tokens or 0) for row in rows)
+            total_calls = sum(int(row.calls or 0) for row in rows)
 
             return {
                 "total_cost_usd": round(total_cost, 6),
@@ -518,38 +574,36 @@ class AICostTracker:
             Never propagates exceptions - safe for dashboards.
 
             **Performance**:
-            Processes all logs in Python (not database aggregation).
-            Consider date filtering for large datasets.
-            Typical: <1s for 10K logs, ~10s for 1M logs.
+            GROUP BY queries over ai_cost_rollups plus the not-yet-rolled-up edges
+            of ai_interaction_logs (see _aggregate_costs()).
         """
         try:
-            # Query logs using repository with date filtering
-            logs = self.log_repository.get_by_date_range(start_date=start_date, end_date=end_date)
-
             # Group by model
             by_model = {}
-            for log in logs:
-                model = log.model_name or "Unknown"
+            for row in self._aggregate_costs(
+                "model_name", start_date=start_date, end_date=end_date
+            ):
+                model = row.key or "Unknown"
                 if model not in by_model:
                     by_model[model] = {
                         "calls": 0,
                         "tokens": 0,
                         "cost_usd": 0,
-                        "provider": log.model_provider,
+                        "provider": row.provider,
                     }
-                by_model[model]["calls"] += 1
-                by_model[model]["tokens"] += log.total_tokens or 0
-                by_model[model]["cost_usd"] += log.total_cost_usd or 0
+                by_model[model]["calls"] += int(row.calls or 0)
+                by_model[model]["tokens"] += int(row.tokens or 0)
+                by_model[model]["cost_usd"] += float(row.cost or 0)
 
             # Group by step
             by_step = {}
-            for log in logs:
-                step = log.step_name
+            for row in self._aggregate_costs("step_name", start_date=start_date, end_date=end_date):
+                step = row.key
                 if step not in by_step:
                     by_step[step] = {"calls": 0, "tokens": 0, "cost_usd": 0}
-                by_step[step]["calls"] += 1
-                by_step[step]["tokens"] += log.total_tokens or 0
-                by_step[step]["cost_usd"] += log.total_cost_usd or 0
+                by_step[step]["calls"] += int(row.calls or 0)
+                by_step[step]["tokens"] += int(row.tokens or 0)
+                by_step[step]["cost_usd"] += float(row.cost or 0)
 
             # Round costs
             for model_data in by_model.values():
@@ -563,3 +617,130 @@ class AICostTracker:
         except Exception as e:
             logger.error(f"Failed to get cost breakdown: {e}")
             return {"by_model": {}, "by_step": {}, "error": str(e)}
+
+    def _aggregate_costs(
+        self,
+        group_by: str | None = None,
+        processing_id: str | None = None,
+        start_date: datetime | None = None,
+        end_date: datetime | None = None,
+    ) -> list[Any]:
+        """Aggregate costs from rollups where possible and raw logs elsewhere.
+
+        The range [start_date, end_date] is split into:
+            - whole days before the rollup watermark → daily rollups
+            - remaining whole hours before the watermark → hourly rollups
+            - partial edge hours and everything after the watermark → raw logs
+
+        Args:
+            group_by: None, "model_name", "step_name" or "document_type"
+            processing_id: Restrict to one document (raw logs only, indexed)
+            start_date: Inclusive lower bound (default: no limit)
+            end_date: Inclusive upper bound (default: no limit)
+
+        Returns:
+            Rows with key, provider, calls, tokens, cost. The same key may appear
+            several times (once per source) and must be summed by the caller.
+        """
+        start_date = _to_naive(start_date)
+        end_date = _to_naive(end_date)
+        raw = self.log_repository.aggregate_costs
+
+        rolled_up_until = None if processing_id else self.rollup_repository.get_rolled_up_until()
+        if rolled_up_until is None:
+            return raw(group_by, processing_id, start_date=start_date, end_date=end_date)
+
+        rollup_lo = _ceil_hour(start_date) if start_date else None
+        rollup_hi = min(rolled_up_until, _floor_hour(end_date)) if end_date else rolled_up_until
+        if rollup_lo is not None and rollup_lo >= rollup_hi:
+            return raw(group_by, start_date=start_date, end_date=end_date)
+
+        rows = []
+        if start_date and start_date < rollup_lo:
+            rows += raw(group_by, start_date=start_date, before=rollup_lo)
+        rows += raw(group_by, start_date=rollup_hi, end_date=end_date)
+
+        rollup = self.rollup_repository.aggregate_costs
+        day_lo = _ceil_day(rollup_lo) if rollup_lo else None
+        day_hi = _floor_day(rollup_hi)
+        if day_lo is None or day_lo < day_hi:
+            if rollup_lo is not None and rollup_lo < day_lo:
+                rows += rollup(HOUR, group_by, start=rollup_lo, before=day_lo)
+            rows += rollup(DAY, group_by, start=day_lo, before=day_hi)
+            if day_hi < rollup_hi:
+                rows += rollup(HOUR, group_by, start=day_hi, before=rollup_hi)
+        else:
+            rows += rollup(HOUR, group_by, start=rollup_lo, before=rollup_hi)
+
+        return rows
+
+    def refresh_rollups(self, now: datetime | None = None) -> dict[str, Any]:
+        """Roll up closed hours since the last run into ai_cost_rollups.
+
+        Aggregates each closed hour after the watermark into hourly rows, then
+        rebuilds the daily rows of every day touched from its hourly rows. The
+        last AI_COST_ROLLUP_REFRESH_HOURS closed hours are aggregated again on
+        every run, so logs written late (e.g. replayed spill batches) are still
+        counted. Hours without logs are skipped. Called hourly by the
+        rollup_ai_costs task; safe to call more often.
+
+        Args:
+            now: Current time (default: datetime.now())
+
+        Returns:
+            dict with hours, days, rows and rolled_up_until (ISO string or None)
+        """
+        now = _to_naive(now) or datetime.now()
+        closed_until = _floor_hour(now - ROLLUP_GRACE_PERIOD)
+
+        rolled_up_until = self.rollup_repository.get_rolled_up_until()
+        since = rolled_up_until
+        if since is not None:
+            refresh_window = timedelta(hours=settings.ai_cost_rollup_refresh_hours)
+            since = min(since, closed_until - refresh_window)
+        first_log = self.log_repository.get_earliest_created_at(since=since)
+        result = {"hours": 0, "days": 0, "rows": 0, "rolled_up_until": None}
+
+        if first_log is None or _floor_hour(first_log) >= closed_until:
+            if rolled_up_until:
+                result["rolled_up_until"] = rolled_up_until.isoformat()
+            return result
+
+        try:
+            days = set()
+            hour = _floor_hour(first_log)
+            while hour < closed_until:
+                next_hour = hour + timedelta(hours=1)
+                buckets = self.log_repository.aggregate_rollup_buckets(hour, next_hour)
+                if buckets:
+                    result["rows"] += self.rollup_repository.replace_bucket(
+                        HOUR, hour, [_rollup_row(bucket) for bucket in buckets]
+                    )
+                    result["hours"] += 1
+                    days.add(_floor_day(hour))
+                hour = next_hour
+
+            self.session.flush()
+            for day in sorted(days):
+                buckets = self.rollup_repository.aggregate_buckets(
+                    HOUR, day, day + timedelta(days=1)
+                )
+                result["rows"] += self.rollup_repository.replace_bucket(
+                    DAY, day, [_rollup_row(bucket) for bucket in buckets]
+                )
+            result["days"] = len(days)
+
+            self.session.commit()
+
+        except Exception as e:
+            logger.error(f"Failed to refresh AI cost rollups: {e}")
+            self.session.rollback()
+            raise
+
+        rolled_up_until = self.rollup_repository.get_rolled_up_until()
+        result["rolled_up_until"] = rolled_up_until.isoformat() if rolled_up_until else None
+        logger.info(
+            f"📊 AI cost rollups refreshed | {result['hours']} hours, {result['days']} days, "
+            f"{result['rows']} rows | until {result['rolled_up_until']}"
+        )
+        return result
@@ -0,0 +1,459 @@
+"""
+AI Log Writer
+
+Buffered, fire-and-forget writes of ai_interaction_logs rows.
+
+AICostTracker.log_ai_call() and AILoggingService hand their rows to the
+process-wide AILogWriter instead of inserting and committing one row on the
+caller's session in the middle of a pipeline step. submit() only queues the row:
+
+- A background thread writes queued rows in one multi-row INSERT as soon as
+  AI_LOG_BATCH_SIZE rows are queued or the oldest row has waited
+  AI_LOG_FLUSH_INTERVAL_SECONDS.
+- Rows that do not fit into the queue (AI_LOG_QUEUE_SIZE), and batches the
+  database rejects, are appended to the Redis stream SPILL_STREAM. Writers read
+  them back through a consumer group while idle and insert them once the
+  database accepts writes again. A spilled batch whose insert failed
+  AI_LOG_MAX_WRITE_ATTEMPTS times (e.g. a row the database rejects) is moved
+  to DEAD_LETTER_STREAM, so it is kept for inspection but no longer retried.
+- If Redis is unavailable as well, rows are dropped and counted. Logging never
+  blocks or fails the caller.
+
+flush() writes everything still buffered; shutdown_ai_log_writer() runs on Celery
+pool process shutdown, FastAPI shutdown and interpreter exit.
+
+Spilled rows keep their original created_at. The cost rollup aggregates recent
+hours again on every run (AI_COST_ROLLUP_REFRESH_HOURS), so rows that are written
+late are still counted unless they stay spilled longer than that.
+
+With AI_LOG_BUFFERED_WRITES=false every submit() inserts its row immediately in
+a short-lived session (previous behaviour, without touching the caller's session).
+"""
+
+import atexit
+from datetime import datetime
+import json
+import logging
+import os
+import queue
+import socket
+import threading
+import time
+from typing import Any
+
+import redis
+from redis.exceptions import RedisError, ResponseError
+
+from app.core.config import settings
+from app.database.connection import get_db_session_context
+from app.repositories.ai_log_interaction_repository import AILogInteractionRepository
+
+logger = logging.getLogger(__name__)
+
+SPILL_STREAM = "docworker:ai_logs:spill"
+SPILL_GROUP = "ai-log-writers"
+DEAD_LETTER_STREAM = "docworker:ai_logs:dead_letter"
+# Spilled rows claimed by a consumer that has not acknowledged them for this
+# long (e.g. a pool process that exited mid-write) are taken over by others.
+SPILL_CLAIM_IDLE_MS = 5 * 60 * 1000
+# How often an idle writer checks the spill stream
+SPILL_DRAIN_INTERVAL_SECONDS = 30.0
+# Back-off after a failed database write before draining spilled rows again
+DB_RETRY_SECONDS = 15.0
+
+
+def _encode_row(row: dict[str, Any]) -> str:
+    return json.dumps(
+        {
+            key: value.isoformat() if isinstance(value, datetime) else value
+            for key, value in row.items()
+        },
+        default=str,
+    )
+
+
+def _decode_row(payload: str | bytes) -> dict[str, Any]:
+    row = json.loads(payload)
+    if row.get("created_at"):
+        row["created_at"] = datetime.fromisoformat(row["created_at"])
+    return row
+
+
+class AILogWriter:
+    """
+    Process-wide buffered writer for AI interaction log rows.
+
+    Thread-safe. The background thread is started on the first submit() in each
+    process, so the writer survives Celery's fork of pool processes (rows queued
+    in the parent before the fork are written by the parent).
+    """
+
+    def __init__(
+        self,
+        redis_url: str | None,
+        batch_size: int,
+        flush_interval: float,
+        max_queue: int,
+        spill_max_len: int,
+        buffered: bool = True,
+        max_write_attempts: int = 5,
+    ):
+        """
+        Initialize the writer.
+
+        Args:
+            redis_url: Redis URL for the spill stream (None: drop rows on overflow)
+            batch_size: Maximum rows per INSERT
+            flush_interval: Maximum seconds a row waits before its batch is written
+            max_queue: Rows buffered in memory before spilling to Redis
+            spill_max_len: Approximate maximum length of the spill and dead-letter streams
+            buffered: False writes every row synchronously
+            max_write_attempts: Failed inserts of a spilled batch before it is
+                moved to the dead-letter stream
+        """
+        self.redis_url = redis_url
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval
+        self.max_queue = max(1, max_queue)
+        self.spill_max_len = spill_max_len
+        self.buffered = buffered
+        self.max_write_attempts = max(1, max_write_attempts)
+
+        self._lock = threading.Lock()
+        self._queue: queue.Queue[dict[str, Any]] = queue.Queue(maxsize=self.max_queue)
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._pid: int | None = None
+        self._redis: redis.Redis | None = None
+        self._group_ready = False
+        self._consumer = f"{socket.gethostname()}-{os.getpid()}"
+        self._db_retry_at = 0.0
+        self._stats = {
+            "written": 0,
+            "batches": 0,
+            "spilled": 0,
+            "recovered": 0,
+            "dead_lettered": 0,
+            "dropped": 0,
+        }
+
+    # ==================== PUBLIC API ====================
+
+    def submit(self, row: dict[str, Any]) -> None:
+        """
+        Queue one ai_interaction_logs row for writing. Never blocks or raises.
+
+        Args:
+            row: Column values (created_at should be set by the caller)
+        """
+        try:
+            if not self.buffered:
+                self._write([row], spill_on_error=False)
+                return
+
+            self._ensure_thread()
+            try:
+                self._queue.put_nowait(row)
+            except queue.Full:
+                self._spill([row])
+        except Exception as e:
+            self._count("dropped")
+            logger.error(f"⚠️ Failed to queue AI log row (dropped): {e}")
+
+    def flush(self, timeout: float = 10.0) -> bool:
+        """
+        Wait until every queued row has been written (or spilled).
+
+        Args:
+            timeout: Maximum seconds to wait
+
+        Returns:
+            True if the queue was drained in time
+        """
+        if self._thread is None or self._pid != os.getpid() or not self._thread.is_alive():
+            # No writer thread in this process: write leftovers inline
+            self._write_batches(self._take_all())
+            return True
+
+        with self._queue.all_tasks_done:
+            return self._queue.all_tasks_done.wait_for(
+                lambda: self._queue.unfinished_tasks == 0, timeout
+            )
+
+    def shutdown(self, timeout: float = 10.0) -> None:
+        """Flush buffered rows and stop the background thread."""
+        if self._pid != os.getpid():
+            return
+        if not self.flush(timeout):
+            logger.warning(f"⚠️ AI log writer: {self._queue.qsize()} rows not flushed in time")
+        self._stop.set()
+        thread = self._thread
+        if thread is not None:
+            thread.join(timeout=self.flush_interval + 1)
+        self._thread = None
+        # Rows submitted while stopping
+        self._write_batches(self._take_all())
+        if self._redis is not None:
+            self._redis.close()
+            self._redis = None
+
+    def get_stats(self) -> dict[str, Any]:
+        """Counters for monitoring (this process only)."""
+        with self._lock:
+            stats = dict(self._stats)
+        stats.update(
+            {
+                "process_id": os.getpid(),
+                "buffered": self.buffered,
+                "queued": self._queue.qsize(),
+                "running": self._thread is not None and self._thread.is_alive(),
+            }
+        )
+        return stats
+
+    # ==================== BACKGROUND THREAD ====================
+
+    def _ensure_thread(self) -> None:
+        if self._thread is not None and self._pid == os.getpid() and self._thread.is_alive():
+            return
+        with self._lock:
+            if self._pid != os.getpid():
+                # Forked: the parent's queue, thread and Redis client are not ours
+                self._queue = queue.Queue(maxsize=self.max_queue)
+                self._redis = None
+                self._group_ready = False
+                self._consumer = f"{socket.gethostname()}-{os.getpid()}"
+                self._thread = None
+            if self._thread is None or not self._thread.is_alive():
+                self._stop.clear()
+                self._pid = os.getpid()
+                self._thread = threading.Thread(target=self._run, name="ai-log-writer", daemon=True)
+                self._thread.start()
+
+    def _run(self) -> None:
+        last_drain = 0.0
+        while not self._stop.is_set():
+            batch = self._take_batch()
+            if batch:
+                try:
+                    self._write(batch)
+                finally:
+                    for _ in batch:
+                        self._queue.task_done()
+            elif time.monotonic() - last_drain >= SPILL_DRAIN_INTERVAL_SECONDS:
+                last_drain = time.monotonic()
+                self._drain_spill()
+
+    def _take_batch(self) -> list[dict[str, Any]]:
+        """Wait for the first row, then collect rows until the batch is full or due."""
+        try:
+            batch = [self._queue.get(timeout=self.flush_interval)]
+        except queue.Empty:
+            return []
+
+        deadline = time.monotonic() + self.flush_interval
+        while len(batch) < self.batch_size and not self._stop.is_set():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+
+    def _take_all(self) -> list[dict[str, Any]]:
+        rows = []
+        while True:
+            try:
+                rows.append(self._queue.get_nowait())
+            except queue.Empty:
+                return rows
+            self._queue.task_done()
+
+    def _write_batches(self, rows: list[dict[str, Any]]) -> None:
+        for start in range(0, len(rows), self.batch_size):
+            self._write(rows[start : start + self.batch_size])
+
+    # ==================== DATABASE ====================
+
+    def _insert(self, rows: list[dict[str, Any]]) -> None:
+        with get_db_session_context() as db:
+            try:
+                AILogInteractionRepository(db).bulk_insert(rows)
+            except Exception:
+                db.rollback()
+                raise
+
+    def _write(self, rows: list[dict[str, Any]], spill_on_error: bool = True) -> bool:
+        """Insert rows; spill them to Redis if the database write fails."""
+        try:
+            self._insert(rows)
+        except Exception as e:
+            self._db_retry_at = time.monotonic() + DB_RETRY_SECONDS
+            logger.error(f"⚠️ Failed to write {len(rows)} AI log rows: {e}")
+            if spill_on_error:
+                self._spill(rows)
+            else:
+                self._count("dropped", len(rows))
+            return False
+
+        self._count("written", len(rows))
+        self._count("batches")
+        logger.debug(f"AI log writer: wrote {len(rows)} rows")
+        return True
+
+    # ==================== REDIS SPILL ====================
+
+    def _get_redis(self) -> redis.Redis | None:
+        if not self.redis_url:
+            return None
+        if self._redis is None:
+            self._redis = redis.Redis.from_url(
+                self.redis_url, socket_connect_timeout=2, socket_timeout=2
+            )
+        return self._redis
+
+    def _spill(self, rows: list[dict[str, Any]]) -> None:
+        """Append rows to the spill stream, dropping them if Redis is unavailable."""
+        client = self._get_redis()
+        if client is None:
+            self._count("dropped", len(rows))
+            logger.warning(f"⚠️ AI log buffer full, dropped {len(rows)} rows (no Redis)")
+            return
+        try:
+            pipe = client.pipeline(transaction=False)
+            for row in rows:
+                pipe.xadd(
+                    SPILL_STREAM,
+                    {"row": _encode_row(row)},
+                    maxlen=self.spill_max_len,
+                    approximate=True,
+                )
+            pipe.execute()
+            self._count("spilled", len(rows))
+        except (RedisError, OSError) as e:
+            self._count("dropped", len(rows))
+            logger.error(f"⚠️ Failed to spill {len(rows)} AI log rows to Redis (dropped): {e}")
+
+    def _ensure_group(self, client: redis.Redis) -> None:
+        if self._group_ready:
+            return
+        try:
+            client.xgroup_create(SPILL_STREAM, SPILL_GROUP, id="0", mkstream=True)
+        except ResponseError as e:
+            if "BUSYGROUP" not in str(e):
+                raise
+        self._group_ready = True
+
+    def _drain_spill(self) -> None:
+        """Insert spilled rows while the database accepts writes and the buffer is idle."""
+        client = self._get_redis()
+        if client is None or time.monotonic() < self._db_retry_at:
+            return
+        try:
+            self._ensure_group(client)
+            # Rows of consumers that died before acknowledging, then new rows
+            _, entries, *_ = client.xautoclaim(
+                SPILL_STREAM,
+                SPILL_GROUP,
+                self._consumer,
+                min_idle_time=SPILL_CLAIM_IDLE_MS,
+                count=self.batch_size,
+            )
+            while not self._stop.is_set() and self._queue.empty():
+                if not entries:
+                    response = client.xreadgroup(
+                        SPILL_GROUP, self._consumer, {SPILL_STREAM: ">"}, count=self.batch_size
+                    )
+                    entries = response[0][1] if response else []
+                if not entries:
+                    return
+
+                ids = [entry_id for entry_id, _ in entries]
+                rows = [_decode_row(fields[b"row"]) for _, fields in entries if fields]
+                try:
+                    self._insert(rows)
+                except Exception as e:
+                    # Left pending (reclaimed after SPILL_CLAIM_IDLE_MS) until out of attempts
+                    self._db_retry_at = time.monotonic() + DB_RETRY_SECONDS
+                    logger.error(f"⚠️ Failed to write {len(rows)} spilled AI log rows: {e}")
+                    self._dead_letter_exhausted(client, entries)
+                    return
+
+                client.xack(SPILL_STREAM, SPILL_GROUP, *ids)
+                client.xdel(SPILL_STREAM, *ids)
+                self._count("recovered", len(rows))
+                logger.info(f"📥 Recovered {len(rows)} spilled AI log rows")
+                entries = []
+        except (RedisError, OSError) as e:
+            self._group_ready = False
+            logger.warning(f"⚠️ Failed to read spilled AI log rows: {e}")
+
+    def _dead_letter_exhausted(
+        self, client: redis.Redis, entries: list[tuple[bytes, dict[bytes, bytes]]]
+    ) -> None:
+        """Move spilled rows that failed max_write_attempts inserts to the dead-letter stream."""
+        ids = [entry_id for entry_id, _ in entries]
+        # Each read or claim of an entry is one delivery, i.e. one insert attempt
+        pending = client.xpending_range(
+            SPILL_STREAM, SPILL_GROUP, min=ids[0], max=ids[-1], count=len(ids)
+        )
+        exhausted = {
+            item["message_id"]
+            for item in pending
+            if item["times_delivered"] >= self.max_write_attempts
+        }
+        if not exhausted:
+            return
+
+        dead = [(entry_id, fields) for entry_id, fields in entries if entry_id in exhausted]
+        pipe = client.pipeline(transaction=False)
+        for _, fields in dead:
+            if fields:
+                pipe.xadd(DEAD_LETTER_STREAM, fields, maxlen=self.spill_max_len, approximate=True)
+        pipe.xack(SPILL_STREAM, SPILL_GROUP, *[entry_id for entry_id, _ in dead])
+        pipe.xdel(SPILL_STREAM, *[entry_id for entry_id, _ in dead])
+        pipe.execute()
+        self._count("dead_lettered", len(dead))
+        logger.error(
+            f"⚠️ Moved {len(dead)} AI log rows to {DEAD_LETTER_STREAM} "
+            f"after {self.max_write_attempts} failed writes"
+        )
+
+    def _count(self, key: str, amount: int = 1) -> None:
+        with self._lock:
+            self._stats[key] += amount
+
+
+_writer: AILogWriter | None = None
+_writer_lock = threading.Lock()
+
+
+def get_ai_log_writer() -> AILogWriter:
+    """Get the process-wide AI log writer."""
+    global _writer
+    if _writer is None:
+        with _writer_lock:
+            if _writer is None:
+                _writer = AILogWriter(
+                    redis_url=settings.redis_url,
+                    batch_size=settings.ai_log_batch_size,
+                    flush_interval=settings.ai_log_flush_interval_seconds,
+                    max_queue=settings.ai_log_queue_size,
+                    spill_max_len=settings.ai_log_spill_max_len,
+                    buffered=settings.ai_log_buffered_writes,
+                    max_write_attempts=settings.ai_log_max_write_attempts,
+                )
+                atexit.register(shutdown_ai_log_writer)
+    return _writer
+
+
+def shutdown_ai_log_writer(timeout: float = 10.0) -> None:
+    """Flush and stop the AI log writer of this process, if it was used."""
+    if _writer is None:
+        return
+    try:
+        _writer.shutdown(timeout)
+    except Exception as e:
+        logger.error(f"⚠️ AI log writer shutdown failed: {e}")
@@ -83,8 +83,8 @@ from typing import Any
 
 from sqlalchemy.orm import Session
 
-from app.database.unified_models import AILogInteractionDB
 from app.repositories.ai_log_interaction_repository import AILogInteractionRepository
+from app.services.ai_log_writer import get_ai_log_writer
 
 logger = logging.getLogger(__name__)
 
@@ -126,14 +126,12 @@ class AILoggingService:
         ... )
 
     Note:
-        **Session Management**: Commits after each log write. Rollback on error.
+        **Session Management**: Log rows are written in background batches by
+        the AI log writer; the session is only used for reads.
         Caller responsible for session lifecycle (creation/close).
 
-        **Error Handling**: Database errors logged but don't propagate.
+        **Error Handling**: Write errors handled by the writer, never propagated.
         Logging failures shouldn't disrupt document processing.
-
-        **Performance**: Direct DB writes on each call. Consider async batching
-        for high-throughput scenarios.
     """
 
     def __init__(self, session: Session, log_repository: AILogInteractionRepository | None = None):
@@ -164,33 +162,38 @@ class AILoggingService:
         input_metadata: dict[str, Any] | None = None,
         output_metadata: dict[str, Any] | None = None,
     ):
-        """Log AI interaction to database"""
+        """Queue an AI interaction row for the batched AI log writer.
+
+        ai_interaction_logs has no text columns, so only the text lengths are
+        kept; status, error and request context go into log_metadata.
+        """
         try:
-            log_entry = AILogInteractionDB(
-                processing_id=processing_id,
-                step_name=step_name,
-                input_text=input_text,
-                output_text=output_text,
-                processing_time_ms=processing_time_ms or 0,
-                status=status,
-                error_message=error_message,
-                document_type=document_type,
-                user_id=user_id,
-                session_id=session_id,
-                request_id=request_id,
-                confidence_score=confidence_score,
-                model_name=model_name,
-                input_metadata=input_metadata,
-                output_metadata=output_metadata,
-                created_at=datetime.now(),
+            log_metadata = {
+                "status": status,
+                "error_message": error_message,
+                "input_length": len(input_text) if input_text else 0,
+                "output_length": len(output_text) if output_text else 0,
+                "user_id": user_id,
+                "session_id": session_id,
+                "request_id": request_id,
+                "input_metadata": input_metadata,
+                "output_metadata": output_metadata,
+            }
+            get_ai_log_writer().submit(
+                {
+                    "processing_id": processing_id,
+                    "step_name": step_name,
+                    "processing_time_seconds": (processing_time_ms or 0) / 1000,
+                    "confidence_score": confidence_score,
+                    "model_name": model_name,
+                    "document_type": document_type,
+                    "created_at": datetime.now(),
+                    "log_metadata": {k: v for k, v in log_metadata.items() if v is not None},
+                }
             )
 
-            self.session.add(log_entry)
-            self.session.commit()
-
         except Exception as e:
             logger.error(f"Failed to log AI interaction: {e}")
-            self.session.rollback()
 
     @contextmanager
     def log_interaction(
@@ -255,7 +258,7 @@ class AILoggingService:
             **Automatic Features**:
             - Timing: Calculates processing_time_ms from context entry to exit
             - Error capture: Exceptions set status="error" with exception message
-            - Database commit: Writes log entry on __exit__ (finally block)
+            - Database write: Queues the log entry on __exit__ (finally block)
 
             **Context Variables**:
             Uses instance attributes (_input_text, _output_text, _error_message)
@@ -267,8 +270,8 @@ class AILoggingService:
             - "error": Exception raised OR ctx['set_error']() called
 
             **Performance Overhead**:
-            ~1-5ms per logged interaction (DB write + timing). Negligible for
-            AI calls (typically 100ms-10s processing time).
+            Queuing the row takes microseconds; the INSERT happens in a
+            background batch.
 
             **Privacy Warning**:
             ⚠️ Logs full input/output text to database. Ensure compliance.
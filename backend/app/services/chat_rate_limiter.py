@@ -5,14 +5,24 @@ Provides rate limiting for chat API endpoints with:
 - Multi-window tracking (minute/hour/day)
 - Escalating penalties for repeat offenders
 - IP + session token tracking
-- Database persistence for state across restarts
+- Redis sliding windows and bans (RedisChatRateLimiter, used by the chat router)
+- Database persistence for state across restarts (ChatRateLimiter, also the
+  fallback when Redis is unavailable) and for the ban audit trail
 """
 
+import asyncio
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 import json
 import logging
-
+import math
+import time
+from uuid import uuid4
+
+import redis.asyncio as aioredis
+from redis.asyncio.connection import ConnectionPool
+from redis.commands.core import AsyncScript
+from redis.exceptions import RedisError
 from sqlalchemy import select
 from sqlalchemy.orm import Session
 
@@ -158,6 +168,73 @@ class ChatRateLimiter:
             logger.error(f"Failed to log audit event: {e}")
             db.rollback()
 
+    def _apply_penalty(
+        self,
+        db: Session,
+        record: ChatRateLimitDB,
+        identifier: str,
+        ip_address: str,
+        user_agent: str | None,
+        violations: int,
+        now: datetime,
+    ) -> bool:
+        """
+        Apply the escalating penalty for a violation count to a record and audit it.
+
+        Returns:
+            True if a formal warning was issued
+        """
+        action, ban_minutes = self._get_penalty_action(violations)
+
+        if action == "permanent_ban":
+            record.permanent_ban = True
+            record.ban_reason = f"Exceeded {violations} rate limit violations"
+            logger.warning(f"PERMANENT BAN applied to {ip_address} after {violations} violations")
+            self._log_audit(
+                db,
+                AuditAction.CHAT_PERMANENT_BAN,
+                ip_address,
+                user_agent,
+                {"violations": violations, "identifier": identifier},
+            )
+
+        elif action == "temp_ban" and ban_minutes:
+            record.temp_ban_until = now + timedelta(minutes=ban_minutes)
+            record.ban_reason = (
+                f"Temporary ban for {ban_minutes} minutes after {violations} violations"
+            )
+            logger.warning(
+                f"TEMP BAN ({ban_minutes}m) applied to {ip_address} after {violations} violations"
+            )
+            self._log_audit(
+                db,
+                AuditAction.CHAT_TEMP_BAN,
+                ip_address,
+                user_agent,
+                {
+                    "violations": violations,
+                    "ban_minutes": ban_minutes,
+                    "identifier": identifier,
+                },
+            )
+
+        elif action == "warning":
+            logger.warning(f"Rate limit WARNING for {ip_address}: {violations} violations")
+            self._log_audit(
+                db,
+                AuditAction.CHAT_RATE_LIMIT_WARNING,
+                ip_address,
+                user_agent,
+                {"violations": violations, "identifier": identifier},
+            )
+            return True
+
+        else:
+            # Just log the violation
+            logger.info(f"Rate limit violation #{violations} for {ip_address}")
+
+        return False
+
     def check_rate_limit(
         self,
         ip_address: str,
@@ -369,57 +446,9 @@ class ChatRateLimiter:
             violations = record.rate_limit_violations
 
             # Determine and apply penalty
-            action, ban_minutes = self._get_penalty_action(violations)
-            warning_issued = False
-
-            if action == "permanent_ban":
-                record.permanent_ban = True
-                record.ban_reason = f"Exceeded {violations} rate limit violations"
-                logger.warning(
-                    f"PERMANENT BAN applied to {ip_address} after {violations} violations"
-                )
-                self._log_audit(
-                    db,
-                    AuditAction.CHAT_PERMANENT_BAN,
-                    ip_address,
-                    user_agent,
-                    {"violations": violations, "identifier": identifier},
-                )
-
-            elif action == "temp_ban" and ban_minutes:
-                record.temp_ban_until = now + timedelta(minutes=ban_minutes)
-                record.ban_reason = (
-                    f"Temporary ban for {ban_minutes} minutes after {violations} violations"
-                )
-                logger.warning(
-                    f"TEMP BAN ({ban_minutes}m) applied to {ip_address} after {violations} violations"
-                )
-                self._log_audit(
-                    db,
-                    AuditAction.CHAT_TEMP_BAN,
-                    ip_address,
-                    user_agent,
-                    {
-                        "violations": violations,
-                        "ban_minutes": ban_minutes,
-                        "identifier": identifier,
-                    },
-                )
-
-            elif action == "warning":
-                warning_issued = True
-                logger.warning(f"Rate limit WARNING for {ip_address}: {violations} violations")
-                self._log_audit(
-                    db,
-                    AuditAction.CHAT_RATE_LIMIT_WARNING,
-                    ip_address,
-                    user_agent,
-                    {"violations": violations, "identifier": identifier},
-                )
-
-            else:
-                # Just log the violation
-                logger.info(f"Rate limit violation #{violations} for {ip_address}")
+            warning_issued = self._apply_penalty(
+                db, record, identifier, ip_address, user_agent, violations, now
+            )
 
             db.commit()
 
@@ -444,6 +473,49 @@ class ChatRateLimiter:
                 warning_issued=warning_issued,
             )
 
+    def mirror_penalty(
+        self,
+        ip_address: str,
+        session_token: str | None,
+        user_agent: str | None,
+        violations: int,
+    ) -> None:
+        """
+        Persist a penalty decided elsewhere (RedisChatRateLimiter) for audit.
+
+        Stores the violation count and ban on the identifier's row and writes the
+        audit log entry, without touching message counters.
+
+        Args:
+            ip_address: Client IP address
+            session_token: Optional client-side session token
+            user_agent: Optional user agent string
+            violations: Violation count after the violation
+        """
+        identifier = self._get_identifier(ip_address, session_token)
+        now = datetime.utcnow()
+
+        with get_db_session_context() as db:
+            stmt = select(ChatRateLimitDB).where(ChatRateLimitDB.identifier == identifier)
+            record = db.execute(stmt).scalar_one_or_none()
+
+            if not record:
+                record = ChatRateLimitDB(
+                    identifier=identifier,
+                    ip_address=ip_address,
+                    session_token=session_token,
+                    user_agent=user_agent,
+                    minute_window_start=now,
+                    hour_window_start=now,
+                    day_window_start=now,
+                )
+                db.add(record)
+
+            record.rate_limit_violations = violations
+            record.last_violation_at = now
+            self._apply_penalty(db, record, identifier, ip_address, user_agent, violations, now)
+            db.commit()
+
     def get_status(
         self,
         ip_address: str,
@@ -505,5 +577,421 @@ class ChatRateLimiter:
             }
 
 
-# Global singleton instance
-chat_rate_limiter = ChatRateLimiter()
+# ==================== REDIS IMPLEMENTATION ====================
+
+_REDIS_KEY_PREFIX = "docworker:chat_rate_limit"
+_WINDOWS = (("minute", 60), ("hour", 3600), ("day", 86400))
+# Back off from Redis for this long after an error (DB fallback is used meanwhile)
+REDIS_RETRY_SECONDS = 30
+
+# KEYS: messages (sorted set of timestamps), ban, violations
+# ARGV: now_ms, minute limit, hour limit, day limit
+# Returns: {limit_type or "", retry_after_ms (-1 = permanent), violations}
+_CHECK_SCRIPT = """
+local violations = tonumber(redis.call('HGET', KEYS[3], 'count') or '0')
+local ban = redis.call('GET', KEYS[2])
+if ban == 'permanent' then
+    return {'permanent_ban', -1, violations}
+elseif ban then
+    return {'temp_ban', redis.call('PTTL', KEYS[2]), violations}
+end
+
+local now = tonumber(ARGV[1])
+redis.call('ZREMRANGEBYSCORE', KEYS[1], '-inf', now - 86400000)
+local windows = {{'minute', 60000, ARGV[2]}, {'hour', 3600000, ARGV[3]}, {'day', 86400000, ARGV[4]}}
+for _, window in ipairs(windows) do
+    local since = '(' .. (now - window[2])
+    local limit = tonumber(window[3])
+    local count = redis.call('ZCOUNT', KEYS[1], since, '+inf')
+    if count >= limit then
+        -- Allowed again once enough of the oldest messages have left the window
+        local entry = redis.call(
+            'ZRANGEBYSCORE', KEYS[1], since, '+inf', 'WITHSCORES', 'LIMIT', count - limit, 1
+        )
+        return {window[1], tonumber(entry[2]) + window[2] - now, violations}
+    end
+end
+return {'', 0, violations}
+"""
+
+# KEYS: messages
+# ARGV: now_ms, unique member
+_RECORD_MESSAGE_SCRIPT = """
+local now = tonumber(ARGV[1])
+redis.call('ZADD', KEYS[1], now, ARGV[2])
+redis.call('ZREMRANGEBYSCORE', KEYS[1], '-inf', now - 86400000)
+redis.call('PEXPIRE', KEYS[1], 86400000)
+return redis.call('ZCARD', KEYS[1])
+"""
+
+# KEYS: violations (hash: count, last), ban
+# ARGV: now_s, decay days, decay rate, then (threshold, ban seconds; 0 = permanent)
+#       pairs from the highest threshold down
+# Returns: {violations, ban ("permanent", "temp" or ""), ban ttl ms}
+_RECORD_VIOLATION_SCRIPT = """
+local now = tonumber(ARGV[1])
+local decay_days = tonumber(ARGV[2])
+local count = tonumber(redis.call('HGET', KEYS[1], 'count') or '0')
+local last = tonumber(redis.call('HGET', KEYS[1], 'last') or '0')
+if count > 0 and last > 0 then
+    local days = math.floor((now - last) / 86400)
+    if days > decay_days then
+        count = math.max(0, count - (days - decay_days) * tonumber(ARGV[3]))
+    end
+end
+count = count + 1
+redis.call('HSET', KEYS[1], 'count', count, 'last', now)
+-- Violations have fully decayed by then
+redis.call('EXPIRE', KEYS[1], (decay_days + count + 1) * 86400)
+
+for i = 4, #ARGV, 2 do
+    if count >= tonumber(ARGV[i]) then
+        local seconds = tonumber(ARGV[i + 1])
+        if seconds == 0 then
+            redis.call('SET', KEYS[2], 'permanent')
+        elseif redis.call('GET', KEYS[2]) ~= 'permanent'
+            and redis.call('PTTL', KEYS[2]) < seconds * 1000 then
+            redis.call('SET', KEYS[2], 'temp', 'EX', seconds)
+        end
+        break
+    end
+end
+
+local ban = redis.call('GET', KEYS[2]) or ''
+return {count, ban, redis.call('PTTL', KEYS[2])}
+"""
+
+
+class RedisChatRateLimiter(ChatRateLimiter):
+    """
+    Chat rate limiter keeping all state in Redis.
+
+    - Sliding windows: one sorted set of message timestamps per identifier,
+      counted per minute/hour/day inside a Lua script (atomic, one round trip)
+    - Ban ladder: a ban key with a TTL matching the ban duration (no TTL for
+      permanent bans), set by the violation script together with the decayed
+      violation count
+    - Audit: warnings and bans are mirrored to Postgres in the background via
+      ChatRateLimiter.mirror_penalty()
+
+    The async methods (*_async) fall back to the inherited Postgres methods
+    (run in a worker thread) when Redis is not configured or unreachable.
+    Results follow the same RateLimitResult contract as ChatRateLimiter.
+
+    Usage:
+        result = await chat_rate_limiter.check_rate_limit_async(ip_address, session_token)
+        if not result.allowed:
+            result = await chat_rate_limiter.record_violation_async(
+                ip_address, session_token, limit_type=result.limit_type
+            )
+        ...
+        await chat_rate_limiter.record_message_async(ip_address, session_token)
+    """
+
+    _pool: ConnectionPool | None = None
+    _pool_loop_id: int | None = None
+
+    def __init__(self, redis_url: str | None = None):
+        super().__init__()
+        self.redis_url = redis_url
+        self._redis_retry_at = 0.0
+        self._scripts: dict[str, AsyncScript] = {}
+        self._scripts_client: aioredis.Redis | None = None
+        # Keep references to background audit tasks so they aren't garbage collected
+        self._mirror_tasks: set[asyncio.Task] = set()
+
+    def _key(self, identifier: str, kind: str) -> str:
+        return f"{_REDIS_KEY_PREFIX}:{identifier}:{kind}"
+
+    def _keys(self, identifier: str) -> list[str]:
+        return [self._key(identifier, kind) for kind in ("messages", "ban", "violations")]
+
+    def _ban_ladder(self) -> list[int]:
+        """Flatten the penalty thresholds into (threshold, ban seconds) script arguments."""
+        ladder = []
+        for name in ("permanent_ban", "temp_ban_24hour", "temp_ban_1hour", "temp_ban_15min"):
+            threshold = PENALTY_THRESHOLDS[name][0]
+            action, ban_minutes = self._get_penalty_action(threshold)
+            ladder += [threshold, 0 if action == "permanent_ban" else ban_minutes * 60]
+        return ladder
+
+    async def _get_client(self) -> aioredis.Redis | None:
+        """Get async Redis client. Recreates pool if event loop changed."""
+        if not self.redis_url or time.monotonic() < self._redis_retry_at:
+            return None
+
+        current_loop_id = id(asyncio.get_running_loop())
+        if (
+            RedisChatRateLimiter._pool is None
+            or RedisChatRateLimiter._pool_loop_id != current_loop_id
+        ):
+            RedisChatRateLimiter._pool = ConnectionPool.from_url(
+                self.redis_url,
+                max_connections=settings.redis_max_connections,
+                decode_responses=True,
+                socket_connect_timeout=1,
+                socket_timeout=1,
+            )
+            RedisChatRateLimiter._pool_loop_id = current_loop_id
+            self._scripts_client = None
+
+        if self._scripts_client is None:
+            client = aioredis.Redis(connection_pool=RedisChatRateLimiter._pool)
+            self._scripts = {
+                "check": client.register_script(_CHECK_SCRIPT),
+                "message": client.register_script(_RECORD_MESSAGE_SCRIPT),
+                "violation": client.register_script(_RECORD_VIOLATION_SCRIPT),
+            }
+            self._scripts_client = client
+        return self._scripts_client
+
+    def _redis_failed(self, operation: str, error: Exception) -> None:
+        logger.warning(
+            f"Chat rate limiter: Redis {operation} failed ({error}), "
+            f"using database for {REDIS_RETRY_SECONDS}s"
+        )
+        self._redis_retry_at = time.monotonic() + REDIS_RETRY_SECONDS
+
+    async def check_rate_limit_async(
+        self,
+        ip_address: str,
+        session_token: str | None = None,
+        user_agent: str | None = None,
+    ) -> RateLimitResult:
+        """
+        Check if a request is allowed under rate limits (does not count the request).
+
+        See ChatRateLimiter.check_rate_limit().
+        """
+        if not self.enabled:
+            return RateLimitResult(allowed=True)
+
+        client = await self._get_client()
+        if client is not None:
+            identifier = self._get_identifier(ip_address, session_token)
+            try:
+                limit_type, retry_after_ms, violations = await self._scripts["check"](
+                    keys=self._keys(identifier),
+                    args=[
+                        int(time.time() * 1000),
+                        self.limits["minute"],
+                        self.limits["hour"],
+                        self.limits["day"],
+                    ],
+                )
+                return self._check_result(limit_type, int(retry_after_ms), int(violations))
+            except (RedisError, OSError) as e:
+                self._redis_failed("check", e)
+
+        return await asyncio.to_thread(self.check_rate_limit, ip_address, session_token, user_agent)
+
+    def _check_result(
+        self, limit_type: str, retry_after_ms: int, violations: int
+    ) -> RateLimitResult:
+        """Build the RateLimitResult for a check script result (same messages as the DB path)."""
+        if not limit_type:
+            return RateLimitResult(allowed=True, violations=violations)
+
+        if limit_type == "permanent_ban":
+            return RateLimitResult(
+                allowed=False,
+                limit_type="permanent_ban",
+                retry_after=None,
+                message="Access permanently suspended. Contact support if you believe this is an error.",
+                violations=violations,
+            )
+
+        retry_after = max(1, math.ceil(retry_after_ms / 1000))
+        messages = {
+            "temp_ban": f"Temporarily suspended. Try again in {retry_after // 60} minutes.",
+            "minute": f"Too many messages. Please wait {retry_after} seconds.",
+            "hour": f"Hourly limit reached. Please wait {retry_after // 60} minutes.",
+            "day": f"Daily limit reached. Please try again in {retry_after // 3600} hours.",
+        }
+        return RateLimitResult(
+            allowed=False,
+            limit_type=limit_type,
+            retry_after=retry_after,
+            message=messages[limit_type],
+            violations=violations,
+        )
+
+    async def record_message_async(
+        self,
+        ip_address: str,
+        session_token: str | None = None,
+        user_agent: str | None = None,
+    ) -> None:
+        """Count a processed message in all windows. See ChatRateLimiter.record_message()."""
+        if not self.enabled:
+            return
+
+        client = await self._get_client()
+        if client is not None:
+            identifier = self._get_identifier(ip_address, session_token)
+            try:
+                await self._scripts["message"](
+                    keys=[self._key(identifier, "messages")],
+                    args=[int(time.time() * 1000), uuid4().hex],
+                )
+                return
+            except (RedisError, OSError) as e:
+                self._redis_failed("record_message", e)
+
+        await asyncio.to_thread(self.record_message, ip_address, session_token, user_agent)
+
+    async def record_violation_async(
+        self,
+        ip_address: str,
+        session_token: str | None = None,
+        user_agent: str | None = None,
+        limit_type: str = "minute",
+    ) -> RateLimitResult:
+        """
+        Record a violation, decay old ones and escalate penalties atomically.
+
+        See ChatRateLimiter.record_violation().
+        """
+        if not self.enabled:
+            return RateLimitResult(allowed=False, limit_type=limit_type)
+
+        client = await self._get_client()
+        if client is not None:
+            identifier = self._get_identifier(ip_address, session_token)
+            keys = self._keys(identifier)
+            try:
+                violations, ban, ban_ttl_ms = await self._scripts["violation"](
+                    keys=[keys[2], keys[1]],
+                    args=[
+                        int(time.time()),
+                        VIOLATION_DECAY_DAYS,
+                        VIOLATION_DECAY_RATE,
+                        *self._ban_ladder(),
+                    ],
+                )
+            except (RedisError, OSError) as e:
+                self._redis_failed("record_violation", e)
+            else:
+                violations = int(violations)
+                return self._violation_result(
+                    ip_address, session_token, user_agent, limit_type, violations, ban, ban_ttl_ms
+                )
+
+        return await asyncio.to_thread(
+            self.record_violation, ip_address, session_token, user_agent, limit_type
+        )
+
+    def _violation_result(
+        self,
+        ip_address: str,
+        session_token: str | None,
+        user_agent: str | None,
+        limit_type: str,
+        violations: int,
+        ban: str,
+        ban_ttl_ms: int,
+    ) -> RateLimitResult:
+        """Mirror escalations to Postgres and build the result (same messages as the DB path)."""
+        action, _ = self._get_penalty_action(violations)
+        if action == "log":
+            logger.info(f"Rate limit violation #{violations} for {ip_address}")
+        else:
+            self._mirror_in_background(ip_address, session_token, user_agent, violations)
+
+        retry_after = None
+        message = None
+        if ban == "permanent":
+            message = "Access permanently suspended due to repeated violations."
+            limit_type = "permanent_ban"
+        elif ban:
+            retry_after = max(1, math.ceil(int(ban_ttl_ms) / 1000))
+            message = (
+                f"Temporarily suspended for {retry_after // 60} minutes due to repeated violations."
+            )
+            limit_type = "temp_ban"
+
+        return RateLimitResult(
+            allowed=False,
+            limit_type=limit_type,
+            retry_after=retry_after,
+            message=message,
+            violations=violations,
+            warning_issued=action == "warning",
+        )
+
+    def _mirror_in_background(
+        self,
+        ip_address: str,
+        session_token: str | None,
+        user_agent: str | None,
+        violations: int,
+    ) -> None:
+        """Write the penalty to Postgres without delaying the response."""
+
+        async def mirror() -> None:
+            try:
+                await asyncio.to_thread(
+                    self.mirror_penalty, ip_address, session_token, user_agent, violations
+                )
+            except Exception as e:
+                logger.error(f"Failed to mirror chat rate limit penalty to database: {e}")
+
+        task = asyncio.create_task(mirror())
+        self._mirror_tasks.add(task)
+        task.add_done_callback(self._mirror_tasks.discard)
+
+    async def get_status_async(
+        self,
+        ip_address: str,
+        session_token: str | None = None,
+    ) -> dict:
+        """Get current rate limit status for an identifier. See ChatRateLimiter.get_status()."""
+        client = await self._get_client()
+        if client is None:
+            return await asyncio.to_thread(self.get_status, ip_address, session_token)
+
+        identifier = self._get_identifier(ip_address, session_token)
+        messages_key, ban_key, violations_key = self._keys(identifier)
+        now_ms = int(time.time() * 1000)
+        try:
+            async with client.pipeline(transaction=False) as pipe:
+                for _, seconds in _WINDOWS:
+                    pipe.zcount(messages_key, f"({now_ms - seconds * 1000}", "+inf")
+                pipe.zrange(messages_key, -1, -1, withscores=True)
+                pipe.get(ban_key)
+                pipe.pttl(ban_key)
+                pipe.hget(violations_key, "count")
+                minute, hour, day, last, ban, ban_ttl_ms, violations = await pipe.execute()
+        except (RedisError, OSError) as e:
+            self._redis_failed("get_status", e)
+            return await asyncio.to_thread(self.get_status, ip_address, session_token)
+
+        counts = {"minute": minute, "hour": hour, "day": day}
+        temp_ban_until = (
+            datetime.utcnow() + timedelta(milliseconds=ban_ttl_ms)
+            if ban == "temp" and ban_ttl_ms > 0
+            else None
+        )
+        return {
+            "identifier": identifier,
+            "exists": bool(day or ban or violations),
+            "messages_minute": minute,
+            "messages_hour": hour,
+            "messages_day": day,
+            "limits": self.limits,
+            **{
+                f"remaining_{window}": max(0, self.limits[window] - counts[window])
+                for window, _ in _WINDOWS
+            },
+            "violations": int(violations or 0),
+            "banned": bool(ban),
+            "temp_ban_until": temp_ban_until.isoformat() if temp_ban_until else None,
+            "permanent_ban": ban == "permanent",
+            "last_request": datetime.utcfromtimestamp(last[0][1] / 1000).isoformat()
+            if last
+            else None,
+        }
+
+
+# Global singleton instance (falls back to the database when Redis is unavailable)
+chat_rate_limiter = RedisChatRateLimiter(redis_url=settings.redis_url)
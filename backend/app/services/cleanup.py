@@ -198,6 +198,7 @@ async def cleanup_old_database_jobs():
         **Cascading Deletion**:
         When a job is deleted, these related records are also deleted:
         - pipeline_step_executions (by job_id) - contains input/output text with potential PII
+        - pipeline_text_blobs no longer referenced by any step execution
         - user_feedback (by processing_id, only if feedback consent also not given)
 
         **PRESERVED for statistics**:
@@ -217,13 +218,13 @@ async def cleanup_old_database_jobs():
         from sqlalchemy import or_
 
         from app.database.connection import get_db_session
-        from app.database.modular_pipeline_models import (
-            PipelineJobDB,
-            PipelineStepExecutionDB,
-            UserFeedbackDB,
+        from app.database.modular_pipeline_models import PipelineJobDB, UserFeedbackDB
+        from app.repositories.pipeline_step_execution_repository import (
+            PipelineStepExecutionRepository,
         )
 
         db = next(get_db_session())
+        step_execution_repo = PipelineStepExecutionRepository(db)
 
         try:
             cutoff_time = datetime.now() - timedelta(hours=DB_RETENTION_HOURS)
@@ -252,12 +253,8 @@ async def cleanup_old_database_jobs():
                         f"   Deleting job {job.processing_id} (age: {job_age_hours:.1f}h, status: {job.status})"
                     )
 
-                    # Delete related step executions (contains PII text)
-                    step_count = (
-                        db.query(PipelineStepExecutionDB)
-                        .filter(PipelineStepExecutionDB.job_id == job.job_id)
-                        .delete(synchronize_session=False)
-                    )
+                    # Delete related step executions and their text blobs (contain PII text)
+                    step_count = step_execution_repo.delete_by_job_id(job.job_id)
                     step_executions_removed += step_count
 
                     # NOTE: ai_interaction_logs are PRESERVED for cost statistics
@@ -325,10 +322,8 @@ async def cleanup_old_database_jobs():
                 )
 
                 for job in old_consented_jobs:
-                    # Delete related step executions (contains PII text)
-                    db.query(PipelineStepExecutionDB).filter(
-                        PipelineStepExecutionDB.job_id == job.job_id
-                    ).delete(synchronize_session=False)
+                    # Delete related step executions and their text blobs (contain PII text)
+                    step_execution_repo.delete_by_job_id(job.job_id)
 
                     # Delete related feedback (consent expires with job)
                     db.query(UserFeedbackDB).filter(
@@ -418,11 +413,11 @@ async def cleanup_orphaned_step_executions(db=None):
     try:
         from sqlalchemy import or_
 
-        from app.database.modular_pipeline_models import (
-            PipelineJobDB,
-            PipelineStepExecutionDB,
-            UserFeedbackDB,
+        from app.database.modular_pipeline_models import PipelineJobDB, UserFeedbackDB
+        from app.repositories.pipeline_step_execution_repository import (
+            PipelineStepExecutionRepository,
         )
+        from app.repositories.pipeline_text_blob_repository import PipelineTextBlobRepository
 
         if db is None:
             from app.database.connection import get_db_session
@@ -438,16 +433,8 @@ async def cleanup_orphaned_step_executions(db=None):
             }
 
             # Find and delete orphaned step executions (job_id not in valid jobs)
-            # These contain PII text and must be cleaned
-            if valid_job_ids:
-                orphaned_steps = (
-                    db.query(PipelineStepExecutionDB)
-                    .filter(~PipelineStepExecutionDB.job_id.in_(valid_job_ids))
-                    .delete(synchronize_session=False)
-                )
-            else:
-                # No jobs exist, all step executions are orphaned
-                orphaned_steps = db.query(PipelineStepExecutionDB).delete(synchronize_session=False)
+            # These contain PII text and must be cleaned (with their text blobs)
+            orphaned_steps = PipelineStepExecutionRepository(db).delete_orphaned(valid_job_ids)
 
             if orphaned_steps > 0:
                 logger.info(
@@ -455,6 +442,14 @@ async def cleanup_orphaned_step_executions(db=None):
                 )
                 total_removed += orphaned_steps
 
+            # Text blobs left without references (e.g. by a bulk delete elsewhere)
+            orphaned_blobs = PipelineTextBlobRepository(db).delete_unreferenced(
+                created_before=datetime.now() - timedelta(hours=1)
+            )
+            if orphaned_blobs > 0:
+                logger.info(f"   🗑️ Deleted {orphaned_blobs} unreferenced step text blobs")
+                total_removed += orphaned_blobs
+
             # NOTE: ai_interaction_logs are PRESERVED for cost/usage statistics
             # They only contain token counts and costs, no PII
 
@@ -755,12 +750,15 @@ async def cleanup_all_completed_jobs():
         from app.database.connection import get_db_session
         from app.database.modular_pipeline_models import (
             PipelineJobDB,
-            PipelineStepExecutionDB,
             StepExecutionStatus,
             UserFeedbackDB,
         )
+        from app.repositories.pipeline_step_execution_repository import (
+            PipelineStepExecutionRepository,
+        )
 
         db = next(get_db_session())
+        step_execution_repo = PipelineStepExecutionRepository(db)
 
         try:
             # Delete all completed jobs with cascade
@@ -771,12 +769,8 @@ async def cleanup_all_completed_jobs():
             )
 
             for job in completed_jobs:
-                # Delete related step executions (contains PII text)
-                step_count = (
-                    db.query(PipelineStepExecutionDB)
-                    .filter(PipelineStepExecutionDB.job_id == job.job_id)
-                    .delete(synchronize_session=False)
-                )
+                # Delete related step executions and their text blobs (contain PII text)
+                step_count = step_execution_repo.delete_by_job_id(job.job_id)
                 step_executions_removed += step_count
 
                 # NOTE: ai_interaction_logs are PRESERVED for cost statistics
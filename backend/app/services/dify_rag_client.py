@@ -10,8 +10,14 @@ Environment Variables:
     DIFY_RAG_API_KEY: Dify app API key (app-xxx)
     USE_DIFY_RAG: Set to 'true' to enable RAG queries
 
+Queries reuse one keep-alive HTTP connection pool per client and run through the
+"dify-rag" circuit breaker, so an unreachable service fails fast instead of
+holding every pipeline step for the full request timeout. Translations of
+guideline answers go through the LLM response cache (LLM_CACHE_ENABLED), since
+the same recommendations come back for similar documents.
+
 Usage:
-    >>> client = DifyRAGClient()
+    >>> client = get_dify_rag_client()  # app.services.provider_clients
     >>> answer, metadata = await client.query_guidelines("Diabetes Typ 2", "ARZTBRIEF", "en")
 """
 
@@ -20,6 +26,10 @@ import os
 
 import httpx
 
+from app.core.circuit_breaker import dify_rag_breaker
+from app.core.exceptions import ServiceUnavailableError
+from app.services.llm_response_cache import get_llm_response_cache, make_cache_key
+
 logger = logging.getLogger(__name__)
 
 # Configuration from environment
@@ -43,6 +53,7 @@ class DifyRAGClient:
         self.url = url or DIFY_RAG_URL
         self.api_key = api_key or DIFY_RAG_API_KEY
         self.timeout = timeout
+        self._http_client: httpx.AsyncClient | None = None
 
         if self.url:
             logger.info(f"Dify RAG Client initialized: {self.url}")
@@ -54,6 +65,19 @@ class DifyRAGClient:
         """Check if configured and enabled."""
         return bool(self.url) and bool(self.api_key) and USE_DIFY_RAG
 
+    @property
+    def http_client(self) -> httpx.AsyncClient:
+        """Keep-alive HTTP client for chat-messages queries (created on first use)."""
+        if self._http_client is None or self._http_client.is_closed:
+            self._http_client = httpx.AsyncClient(timeout=self.timeout)
+        return self._http_client
+
+    async def aclose(self) -> None:
+        """Close the keep-alive HTTP client."""
+        if self._http_client is not None:
+            await self._http_client.aclose()
+            self._http_client = None
+
     async def query_guidelines(
         self,
         medical_text: str,
@@ -86,7 +110,9 @@ class DifyRAGClient:
             query = self._build_query(medical_text, document_type)
 
             # Query Dify for German guideline recommendations
-            german_answer, rag_metadata = await self._query_dify(query, user_id)
+            german_answer, rag_metadata = await dify_rag_breaker.call_async(self._query_dify)(
+                query, user_id
+            )
 
             if not german_answer:
                 return "", {"skipped": True, "reason": "empty_response", **rag_metadata}
@@ -98,21 +124,43 @@ class DifyRAGClient:
 
             # Translate to target language via OVH
             try:
-                from app.services.ovh_client import OVHClient
+                from app.services.provider_clients import get_ovh_client
 
-                ovh = OVHClient()
+                ovh = get_ovh_client()
                 translation_prompt = (
                     f"Translate the following German medical guideline recommendations to "
                     f"{target_language}. Keep medical terms accurate and preserve formatting:\n\n"
                     f"{german_answer}"
                 )
-                translated_result = await ovh.process_medical_text_with_prompt(
-                    full_prompt=translation_prompt,
+                response_cache = get_llm_response_cache()
+                cache_key = make_cache_key(
+                    model=f"OVH:{ovh.main_model}",
+                    system_prompt=None,
+                    prompt=translation_prompt,
                     temperature=0.3,
                     max_tokens=4096,
-                    use_fast_model=False,
                 )
-                translated = translated_result.get("text", "")
+                cached = await response_cache.get(cache_key)
+                if cached is not None:
+                    translated = cached["text"]
+                    rag_metadata["translation_cached"] = True
+                else:
+                    translated_result = await ovh.process_medical_text_with_prompt(
+                        full_prompt=translation_prompt,
+                        temperature=0.3,
+                        max_tokens=4096,
+                        use_fast_model=False,
+                    )
+                    translated = translated_result.get("text", "")
+                    if translated and not translated.startswith("Error"):
+                        await response_cache.set(
+                            cache_key,
+                            {
+                                "text": translated,
+                                "input_tokens": translated_result.get("input_tokens", 0),
+                                "output_tokens": translated_result.get("output_tokens", 0),
+                            },
+                        )
 
                 if translated:
                     formatted = self._format_bilingual(german_answer, translated, target_language)
@@ -143,6 +191,9 @@ class DifyRAGClient:
 
         Returns:
             Tuple of (answer_text, metadata)
+
+        Raises:
+            ServiceUnavailableError: On 5xx responses or connection failures
         """
         headers = {
             "Authorization": f"Bearer {self.api_key}",
@@ -156,32 +207,40 @@ class DifyRAGClient:
             "inputs": {},
         }
 
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            response = await client.post(
+        try:
+            response = await self.http_client.post(
                 f"{self.url}/v1/chat-messages",
                 json=payload,
                 headers=headers,
             )
+        except httpx.TransportError as e:
+            raise ServiceUnavailableError(
+                f"Dify RAG unreachable: {e}", service_name="dify-rag"
+            ) from e
+
+        if response.status_code == 200:
+            result = response.json()
+            answer = result.get("answer", "")
+            metadata = {
+                "conversation_id": result.get("conversation_id"),
+                "message_id": result.get("message_id"),
+                "retriever_resources": result.get("metadata", {}).get("retriever_resources", []),
+            }
+            return answer, metadata
+
+        if response.status_code in (401, 403):
+            raise Exception(f"Dify RAG authentication failed: {response.status_code}")
+
+        if response.status_code == 429:
+            raise Exception("Dify RAG rate limit exceeded")
+
+        if response.status_code >= 500:
+            raise ServiceUnavailableError(
+                f"Dify RAG error: {response.status_code} - {response.text[:200]}",
+                service_name="dify-rag",
+            )
 
-            if response.status_code == 200:
-                result = response.json()
-                answer = result.get("answer", "")
-                metadata = {
-                    "conversation_id": result.get("conversation_id"),
-                    "message_id": result.get("message_id"),
-                    "retriever_resources": result.get("metadata", {}).get(
-                        "retriever_resources", []
-                    ),
-                }
-                return answer, metadata
-
-            if response.status_code in (401, 403):
-                raise Exception(f"Dify RAG authentication failed: {response.status_code}")
-
-            if response.status_code == 429:
-                raise Exception("Dify RAG rate limit exceeded")
-
-            raise Exception(f"Dify RAG error: {response.status_code} - {response.text[:200]}")
+        raise Exception(f"Dify RAG error: {response.status_code} - {response.text[:200]}")
 
     def _build_query(self, medical_text: str, document_type: str) -> str:
         """Build German query with medical context for patient-friendly output (max 2000 chars)."""
@@ -274,7 +333,7 @@ class DifyRAGClient:
                                     "enabled": self.is_enabled,
                                     "api_key_valid": True,
                                 }
-                            elif auth_response.status_code in (401, 403):
+                            if auth_response.status_code in (401, 403):
                                 return {
                                     "status": "auth_error",
                                     "url": self.url,
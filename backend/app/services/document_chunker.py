@@ -0,0 +1,121 @@
+"""
+Document Chunker
+
+Splits long OCR documents into chunks for pipeline steps with chunking enabled.
+
+Chunks follow the document structure: OCREngineManager joins pages with a
+"---" separator and Mistral OCR emits markdown headings, so text is split at
+page separators and headings first, then at paragraphs and lines, and only
+cuts inside a line as a last resort. Consecutive pieces are packed into chunks
+of at most max_tokens (estimated), keeping their original separators.
+
+Usage:
+    >>> chunks = split_into_chunks(ocr_markdown, max_tokens=3000)
+    >>> len(chunks)
+    4
+"""
+
+from collections.abc import Iterator
+import math
+import re
+
+# Average characters per token of German/English medical text for the
+# Llama/Mistral tokenizers (conservative: long compound words split into many tokens)
+CHARS_PER_TOKEN = 3.5
+
+# OCR page separator ("---" on its own line, see ocr_engine_manager.PAGE_SEPARATOR)
+_PAGE_SEPARATOR = re.compile(r"\n[ \t]*-{3,}[ \t]*\n")
+# Position before a markdown heading line
+_HEADING_START = re.compile(r"(?m)^(?=#{1,6}[ \t])")
+_PARAGRAPH_BREAK = re.compile(r"\n[ \t]*\n")
+_LINE_BREAK = re.compile(r"\n")
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimate the token count of a text without a tokenizer."""
+    return math.ceil(len(text) / CHARS_PER_TOKEN)
+
+
+def _split_keeping_separators(pattern: re.Pattern, text: str) -> list[tuple[str, str]]:
+    """Split text into (separator before piece, piece) pairs."""
+    pieces = []
+    separator = ""
+    position = 0
+    for match in pattern.finditer(text):
+        if match.start() == 0 and not match.group():
+            continue
+        pieces.append((separator, text[position : match.start()]))
+        separator = match.group()
+        position = match.end()
+    pieces.append((separator, text[position:]))
+    return pieces
+
+
+def _split_oversized(text: str, max_chars: int) -> Iterator[tuple[str, str]]:
+    """Split a piece longer than max_chars at paragraphs, then lines, then characters."""
+    for pattern in (_PARAGRAPH_BREAK, _LINE_BREAK):
+        parts = _split_keeping_separators(pattern, text)
+        if len(parts) > 1:
+            for separator, part in parts:
+                if len(part) > max_chars:
+                    first = True
+                    for inner_separator, inner in _split_oversized(part, max_chars):
+                        yield (separator if first else inner_separator), inner
+                        first = False
+                else:
+                    yield separator, part
+            return
+
+    for start in range(0, len(text), max_chars):
+        yield "", text[start : start + max_chars]
+
+
+def _pieces(text: str, max_chars: int) -> Iterator[tuple[str, str]]:
+    """Split text into structural pieces of at most max_chars each."""
+    for page_separator, page in _split_keeping_separators(_PAGE_SEPARATOR, text):
+        for index, (heading_separator, section) in enumerate(
+            _split_keeping_separators(_HEADING_START, page)
+        ):
+            separator = page_separator if index == 0 else heading_separator
+            if len(section) <= max_chars:
+                yield separator, section
+                continue
+            first = True
+            for inner_separator, inner in _split_oversized(section, max_chars):
+                yield (separator if first else inner_separator), inner
+                first = False
+
+
+def split_into_chunks(text: str, max_tokens: int) -> list[str]:
+    """
+    Split a document into chunks of at most max_tokens (estimated).
+
+    Args:
+        text: Document text (OCR markdown)
+        max_tokens: Maximum estimated tokens per chunk
+
+    Returns:
+        Chunks in document order (a single chunk if the text fits)
+    """
+    max_chars = max(1, int(max_tokens * CHARS_PER_TOKEN))
+    if len(text) <= max_chars:
+        return [text]
+
+    chunks: list[str] = []
+    current = ""
+    pending = ""
+    for separator, piece in _pieces(text, max_chars):
+        if not piece.strip():
+            # Keep blank pieces as part of the next separator
+            pending += separator + piece
+            continue
+        separator, pending = pending + separator, ""
+        if current and len(current) + len(separator) + len(piece) <= max_chars:
+            current += separator + piece
+        else:
+            if current:
+                chunks.append(current)
+            current = piece
+    if current:
+        chunks.append(current)
+    return chunks
@@ -7,7 +7,8 @@ Compares OCR text → PII-anonymized text → final translation to identify:
 - Translation quality issues
 - Optimization recommendations
 
-Uses Mistral Large for analysis.
+Uses Mistral Large for analysis. Responses go through the LLM response cache
+(LLM_CACHE_ENABLED), so re-analysing unchanged texts doesn't call the model again.
 """
 
 from datetime import datetime
@@ -23,6 +24,7 @@ from app.repositories.feedback_repository import FeedbackRepository
 from app.repositories.pipeline_job_repository import PipelineJobRepository
 from app.repositories.pipeline_step_execution_repository import PipelineStepExecutionRepository
 from app.services.ai_cost_tracker import AICostTracker
+from app.services.llm_response_cache import get_llm_response_cache, make_cache_key
 from app.services.mistral_client import MistralClient
 
 logger = logging.getLogger(__name__)
@@ -292,19 +294,40 @@ class FeedbackAnalysisService:
                 translated_text=texts["translated_text"],
             )
 
-            # Call Mistral Large with system/user role separation
-            logger.info(f"Calling Mistral Large for feedback {feedback_id}")
-            start_time = time.time()
-            response = await self.mistral_client.process_text(
+            # Re-analyses of unchanged texts reuse the cached response
+            response_cache = get_llm_response_cache()
+            cache_key = make_cache_key(
+                model="MISTRAL:mistral-large-latest",
+                system_prompt=ANALYSIS_SYSTEM_PROMPT,
                 prompt=prompt,
-                model="mistral-large-latest",
-                temperature=0.3,  # Lower temperature for more consistent analysis
+                temperature=0.3,
                 max_tokens=2000,
-                system_prompt=ANALYSIS_SYSTEM_PROMPT,
             )
+            start_time = time.time()
+            cached = await response_cache.get(cache_key)
+            if cached is not None:
+                logger.info(f"Using cached analysis response for feedback {feedback_id}")
+                response = {"content": cached["text"], "input_tokens": 0, "output_tokens": 0}
+            else:
+                # Call Mistral Large with system/user role separation
+                logger.info(f"Calling Mistral Large for feedback {feedback_id}")
+                response = await self.mistral_client.process_text(
+                    prompt=prompt,
+                    model="mistral-large-latest",
+                    temperature=0.3,  # Lower temperature for more consistent analysis
+                    max_tokens=2000,
+                    system_prompt=ANALYSIS_SYSTEM_PROMPT,
+                )
             processing_time = time.time() - start_time
 
-            # Log cost for feedback analysis
+            # Log cost for feedback analysis (a cache hit is a zero-cost call)
+            cost_metadata = {"feedback_id": feedback_id}
+            if cached is not None:
+                cost_metadata.update(
+                    cache_hit=True,
+                    saved_input_tokens=cached.get("input_tokens", 0),
+                    saved_output_tokens=cached.get("output_tokens", 0),
+                )
             self.cost_tracker.log_ai_call(
                 processing_id=f"feedback_{feedback_id}",
                 step_name="FEEDBACK_ANALYSIS",
@@ -314,7 +337,7 @@ class FeedbackAnalysisService:
                 model_name="mistral-large-latest",
                 processing_time_seconds=processing_time,
                 document_type="FEEDBACK",
-                metadata={"feedback_id": feedback_id},
+                metadata=cost_metadata,
             )
             logger.info(
                 f"Cost logged for feedback {feedback_id}: "
@@ -325,6 +348,15 @@ class FeedbackAnalysisService:
 
             # Parse response
             analysis = self.parse_analysis_response(response["content"])
+            if cached is None and not analysis.get("parse_error"):
+                await response_cache.set(
+                    cache_key,
+                    {
+                        "text": response["content"],
+                        "input_tokens": response.get("input_tokens", 0),
+                        "output_tokens": response.get("output_tokens", 0),
+                    },
+                )
 
             # Build summary (subset of analysis for quick display)
             summary = {
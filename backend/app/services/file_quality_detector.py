@@ -3,15 +3,20 @@ File Quality Detector for Conditional OCR Routing
 Analyzes documents to determine the best text extraction strategy
 """
 
+import asyncio
 from enum import Enum
-from io import BytesIO
 import logging
-from typing import Any
+import math
+import re
+import time
+from typing import Any, BinaryIO
 
 import pdfplumber
 from PIL import Image
 import pypdf as PyPDF2
 
+from app.services.file_validator import as_binary_stream
+
 # Optional OpenCV import - graceful fallback if not available
 try:
     import cv2
@@ -25,6 +30,82 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Long PDFs are sampled: at least this many pages (or all of a shorter PDF) ...
+MIN_SAMPLE_PAGES = 5
+# ... and up to sqrt(page_count) pages, capped by the caller's max_pages
+DEFAULT_MAX_SAMPLE_PAGES = 12
+# Leading pages always sampled (letterhead, patient and findings summary)
+LEADING_SAMPLE_PAGES = 3
+
+# Analysis keys the OCR stage needs (stored in the job's ocr_config)
+OCR_QUALITY_KEYS = (
+    "has_embedded_text",
+    "text_coverage",
+    "text_quality_score",
+    "page_count",
+    "pages_checked",
+    "text_pages",
+    "error",
+)
+
+
+def select_sample_pages(page_count: int, max_pages: int = DEFAULT_MAX_SAMPLE_PAGES) -> list[int]:
+    """Choose the 0-based page indices to analyze in a PDF.
+
+    Short PDFs are analyzed completely. Longer PDFs get the leading pages plus
+    pages spread evenly over the rest (always including the last page); the
+    sample grows with sqrt(page_count) up to max_pages.
+    """
+    sample_size = min(page_count, max(MIN_SAMPLE_PAGES, math.isqrt(page_count)), max_pages)
+    if sample_size >= page_count:
+        return list(range(page_count))
+
+    leading = min(LEADING_SAMPLE_PAGES, sample_size)
+    pages = list(range(leading))
+    spread = sample_size - leading
+    if spread > 0:
+        step = (page_count - 1 - leading) / spread
+        pages.extend(round(leading + step * (i + 1)) for i in range(spread))
+    return sorted(set(pages))
+
+
+def ocr_quality_summary(analysis: dict[str, Any]) -> dict[str, Any]:
+    """Reduce a PDF analysis to the keys the OCR stage reuses."""
+    return {key: analysis.get(key) for key in OCR_QUALITY_KEYS}
+
+
+def evaluate_text_quality(text: str) -> float:
+    """Score extracted text quality from 0.0 (poor) to 1.0 (excellent).
+
+    See FileQualityDetector._evaluate_text_quality for the scoring components.
+    Module-level so callers can score text without creating a detector.
+    """
+    if not text or len(text.strip()) < 10:
+        return 0.0
+
+    quality_score = 0.0
+
+    # Length indicator
+    if len(text) > 100:
+        quality_score += 0.2
+    if len(text) > 500:
+        quality_score += 0.2
+
+    # Character distribution (letters vs. noise)
+    letters = sum(1 for c in text if c.isalpha())
+    total_chars = len(text.replace(" ", "").replace("\n", ""))
+
+    if total_chars > 0:
+        letter_ratio = letters / total_chars
+        quality_score += letter_ratio * 0.4
+
+    # Word-like patterns
+    words = re.findall(r"\b[a-zA-ZäöüÄÖÜß]{3,}\b", text)
+    if len(words) > 10:
+        quality_score += 0.2
+
+    return min(quality_score, 1.0)
+
 
 class ExtractionStrategy(Enum):
     """Enumeration of available text extraction strategies"""
@@ -113,7 +194,7 @@ class FileQualityDetector:
             return False
 
     async def analyze_file(
-        self, file_content: bytes, file_type: str, filename: str
+        self, file_content: bytes | BinaryIO, file_type: str, filename: str
     ) -> tuple[ExtractionStrategy, DocumentComplexity, dict[str, Any]]:
         """Analyze document and recommend optimal text extraction strategy.
 
@@ -123,7 +204,8 @@ class FileQualityDetector:
         complexity, and medical content patterns.
 
         Args:
-            file_content: Raw file content as bytes (PDF or image data)
+            file_content: Raw file content as bytes or readable binary file, e.g. a
+                spooled upload (PDF or image data)
             file_type: File type identifier - "pdf" or "image"
             filename: Original filename for logging and analysis context
 
@@ -174,12 +256,41 @@ class FileQualityDetector:
             If analysis fails, defaults to VISION_LLM + COMPLEX to ensure
             processing completes with highest accuracy method.
         """
+        return await asyncio.to_thread(self.analyze, file_content, file_type, filename)
+
+    def analyze(
+        self,
+        file_content: bytes | BinaryIO,
+        file_type: str,
+        filename: str,
+        time_budget_seconds: float | None = None,
+        max_sample_pages: int = DEFAULT_MAX_SAMPLE_PAGES,
+    ) -> tuple[ExtractionStrategy, DocumentComplexity, dict[str, Any]]:
+        """Synchronous analysis behind analyze_file(), CPU-bound.
+
+        Called in a worker thread by analyze_file() or in a separate process by
+        app.services.quality_analysis_runner.
+
+        Args:
+            file_content: Raw file content as bytes or readable binary file
+            file_type: File type identifier - "pdf" or "image"
+            filename: Original filename for logging and analysis context
+            time_budget_seconds: Stop sampling further PDF pages once exceeded
+                (at least one page is always analyzed); None for no budget
+            max_sample_pages: Upper bound for sampled PDF pages
+
+        Returns:
+            Same as analyze_file()
+        """
         logger.info(f"🔍 Analyzing file: {filename} (type: {file_type})")
 
         if file_type == "pdf":
-            return await self._analyze_pdf(file_content, filename)
+            deadline = (
+                time.monotonic() + time_budget_seconds if time_budget_seconds is not None else None
+            )
+            return self._analyze_pdf(file_content, filename, deadline, max_sample_pages)
         if file_type == "image":
-            return await self._analyze_image(file_content, filename)
+            return self._analyze_image(file_content, filename)
         # Default to vision LLM for unknown types
         return (
             ExtractionStrategy.VISION_LLM,
@@ -278,8 +389,12 @@ class FileQualityDetector:
 
         return issues, suggestions
 
-    async def _analyze_pdf(
-        self, content: bytes, filename: str
+    def _analyze_pdf(
+        self,
+        content: bytes | BinaryIO,
+        filename: str,
+        deadline: float | None = None,
+        max_sample_pages: int = DEFAULT_MAX_SAMPLE_PAGES,
     ) -> tuple[ExtractionStrategy, DocumentComplexity, dict[str, Any]]:
         """Perform comprehensive PDF analysis for optimal extraction strategy.
 
@@ -289,8 +404,10 @@ class FileQualityDetector:
         lab value tables and complex clinical layouts.
 
         Args:
-            content: Raw PDF file content as bytes
+            content: Raw PDF file content as bytes or readable binary file
             filename: Original filename for logging context
+            deadline: time.monotonic() value after which no further pages are sampled
+            max_sample_pages: Upper bound for sampled pages
 
         Returns:
             tuple[ExtractionStrategy, DocumentComplexity, dict[str, Any]]:
@@ -299,6 +416,9 @@ class FileQualityDetector:
                 - text_coverage (float): Proportion of pages with text (0.0-1.0)
                 - text_quality_score (float): Text extraction quality (0.0-1.0)
                 - page_count (int): Total pages in PDF
+                - pages_checked (int): Pages inspected for embedded text
+                - text_pages (list[int]): 1-based inspected pages with embedded text
+                - time_budget_exhausted (bool): Sampling stopped early at the deadline
                 - has_images (bool): Whether PDF contains embedded images
                 - has_tables (bool): Whether medical tables detected
                 - reasons (list): Decision rationale for strategy selection
@@ -306,7 +426,7 @@ class FileQualityDetector:
         Example:
             >>> detector = FileQualityDetector()
             >>> # Clean medical report with embedded text
-            >>> strategy, complexity, meta = await detector._analyze_pdf(
+            >>> strategy, complexity, meta = detector._analyze_pdf(
             ...     content=report_pdf_bytes,
             ...     filename="discharge_summary.pdf"
             ... )
@@ -316,7 +436,7 @@ class FileQualityDetector:
             'local_text'
             >>>
             >>> # Scanned lab results with tables
-            >>> strategy, complexity, meta = await detector._analyze_pdf(
+            >>> strategy, complexity, meta = detector._analyze_pdf(
             ...     content=lab_pdf_bytes,
             ...     filename="blood_work.pdf"
             ... )
@@ -327,7 +447,7 @@ class FileQualityDetector:
 
         Note:
             **Analysis Stages**:
-            1. Embedded text detection (pdfplumber on first 5 pages)
+            1. Embedded text detection (pdfplumber on sampled pages)
             2. Text quality scoring (PyPDF2 validation)
             3. Medical table detection (structural + content analysis)
             4. Strategy determination (cost-optimized decision tree)
@@ -344,7 +464,9 @@ class FileQualityDetector:
             - No tables + good text (0.7+ coverage, 0.6+ quality) → LOCAL_TEXT
 
             **Performance**:
-            Analyzes only first 5 pages for speed, sufficient for strategy decision.
+            Analyzes all pages of PDFs up to 5 pages. Longer PDFs are sampled
+            (see select_sample_pages()), and sampling stops at the deadline, so
+            the cost per document stays bounded.
         """
 
         analysis = {
@@ -353,31 +475,40 @@ class FileQualityDetector:
             "has_embedded_text": False,
             "text_coverage": 0.0,
             "page_count": 0,
+            "pages_checked": 0,
+            "text_pages": [],
             "has_images": False,
             "has_tables": False,
             "text_quality_score": 0.0,
+            "time_budget_exhausted": False,
             "reasons": [],
         }
 
         try:
             # Step 1: Check for embedded text with pdfplumber
-            pdf_file = BytesIO(content)
+            pdf_file = as_binary_stream(content)
 
             with pdfplumber.open(pdf_file) as pdf:
                 analysis["page_count"] = len(pdf.pages)
                 total_text_length = 0
                 pages_with_text = 0
 
-                # Analyze first 5 pages for performance
-                pages_to_check = min(5, len(pdf.pages))
+                pages_to_check = 0
+                for page_index in select_sample_pages(len(pdf.pages), max_sample_pages):
+                    if pages_to_check and deadline is not None and time.monotonic() > deadline:
+                        analysis["time_budget_exhausted"] = True
+                        break
 
-                for _i, page in enumerate(pdf.pages[:pages_to_check]):
+                    page_num = page_index + 1
+                    page = pdf.pages[page_index]
+                    pages_to_check += 1
                     page_text = page.extract_text()
 
                     if page_text and len(page_text.strip()) > 20:
                         total_text_length += len(page_text)
                         pages_with_text += 1
                         analysis["has_embedded_text"] = True
+                        analysis["text_pages"].append(page_num)
 
                     # Check for images on the page
                     if page.images:
@@ -387,6 +518,11 @@ class FileQualityDetector:
                     if page.chars and self._detect_table_structure_in_page(page):
                         analysis["has_tables"] = True
 
+                    # Release the page's parsed objects (long PDFs)
+                    page.close()
+
+                analysis["pages_checked"] = pages_to_check
+
                 # Calculate text coverage
                 if pages_to_check > 0:
                     analysis["text_coverage"] = pages_with_text / pages_to_check
@@ -398,7 +534,7 @@ class FileQualityDetector:
             if analysis["has_embedded_text"]:
                 # Test with PyPDF2 as fallback
                 try:
-                    pdf_file = BytesIO(content)
+                    pdf_file = as_binary_stream(content)
                     pdf_reader = PyPDF2.PdfReader(pdf_file)
 
                     if len(pdf_reader.pages) > 0:
@@ -738,33 +874,7 @@ class FileQualityDetector:
             - Detecting garbled/corrupted text extraction
             - Optimizing cost by avoiding Vision LLM when unnecessary
         """
-        if not text or len(text.strip()) < 10:
-            return 0.0
-
-        quality_score = 0.0
-
-        # Length indicator
-        if len(text) > 100:
-            quality_score += 0.2
-        if len(text) > 500:
-            quality_score += 0.2
-
-        # Character distribution (letters vs. noise)
-        letters = sum(1 for c in text if c.isalpha())
-        total_chars = len(text.replace(" ", "").replace("\n", ""))
-
-        if total_chars > 0:
-            letter_ratio = letters / total_chars
-            quality_score += letter_ratio * 0.4
-
-        # Word-like patterns
-        import re
-
-        words = re.findall(r"\b[a-zA-ZäöüÄÖÜß]{3,}\b", text)
-        if len(words) > 10:
-            quality_score += 0.2
-
-        return min(quality_score, 1.0)
+        return evaluate_text_quality(text)
 
     def _determine_pdf_strategy(
         self, analysis: dict[str, Any]
@@ -902,8 +1012,8 @@ class FileQualityDetector:
             return ExtractionStrategy.LOCAL_OCR, DocumentComplexity.MODERATE
         return ExtractionStrategy.VISION_LLM, DocumentComplexity.MODERATE
 
-    async def _analyze_image(
-        self, content: bytes, filename: str
+    def _analyze_image(
+        self, content: bytes | BinaryIO, filename: str
     ) -> tuple[ExtractionStrategy, DocumentComplexity, dict[str, Any]]:
         """Analyze image quality and content for optimal OCR strategy selection.
 
@@ -912,7 +1022,7 @@ class FileQualityDetector:
         appropriate OCR engine based on visual complexity and quality metrics.
 
         Args:
-            content: Raw image file content as bytes (JPEG or PNG)
+            content: Raw image file content as bytes or readable binary file (JPEG or PNG)
             filename: Original filename for logging context
 
         Returns:
@@ -928,7 +1038,7 @@ class FileQualityDetector:
         Example:
             >>> detector = FileQualityDetector()
             >>> # High-quality scan with tables
-            >>> strategy, complexity, meta = await detector._analyze_image(
+            >>> strategy, complexity, meta = detector._analyze_image(
             ...     content=scan_bytes,
             ...     filename="lab_scan.jpg"
             ... )
@@ -938,7 +1048,7 @@ class FileQualityDetector:
             'vision_llm'
             >>>
             >>> # Simple clean scan without tables
-            >>> strategy, complexity, meta = await detector._analyze_image(
+            >>> strategy, complexity, meta = detector._analyze_image(
             ...     content=clean_scan_bytes,
             ...     filename="report.jpg"
             ... )
@@ -987,7 +1097,7 @@ class FileQualityDetector:
 
         try:
             # Load image
-            image = Image.open(BytesIO(content))
+            image = Image.open(as_binary_stream(content))
             analysis["image_size"] = image.size
 
             # Convert to OpenCV format for analysis
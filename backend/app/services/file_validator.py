@@ -1,5 +1,10 @@
+from collections.abc import Iterator
+import hashlib
+from io import BytesIO
 import logging
 from pathlib import Path
+from tempfile import SpooledTemporaryFile
+from typing import BinaryIO
 
 from fastapi import UploadFile
 import magic
@@ -26,6 +31,89 @@ FALLBACK_MIME_TYPES = {
 MAX_FILE_SIZE = 50 * 1024 * 1024  # 50MB für Handyfotos
 MIN_FILE_SIZE = 1024  # 1KB
 
+# Streaming-Ingestion: Chunk-Größe, In-Memory-Anteil des Spools, Bytes für MIME-Erkennung
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+SPOOL_MAX_MEMORY = 1024 * 1024
+MAGIC_HEADER_SIZE = 8192
+
+
+def as_binary_stream(content: bytes | BinaryIO) -> BinaryIO:
+    """Wrap bytes in a stream, or rewind a binary file, for PDF/image readers."""
+    if isinstance(content, bytes | bytearray):
+        return BytesIO(content)
+    content.seek(0)
+    return content
+
+
+class IngestedUpload:
+    """Uploaded file copied chunk by chunk into a spooled temporary file.
+
+    Holds at most SPOOL_MAX_MEMORY bytes in memory; larger files spill to disk.
+    Size, SHA-256 and MIME type are computed while the chunks arrive, so the
+    content never has to be read into memory as a whole.
+
+    Example:
+        >>> upload, error = await FileValidator.ingest_file(file)
+        >>> with upload:
+        ...     await detector.analyze_file(upload.open(), "pdf", upload.filename)
+        ...     token = encryptor.encrypt_binary_file(upload.open())
+    """
+
+    def __init__(self, filename: str, spool_dir: str | None = None):
+        self.filename = filename
+        self.size = 0
+        self.mime_type: str | None = None
+        # Closed by close() / the context manager, not within this method
+        self.file: BinaryIO = SpooledTemporaryFile(  # noqa: SIM115
+            max_size=SPOOL_MAX_MEMORY, dir=spool_dir
+        )
+        self._hash = hashlib.sha256()
+        self._header = bytearray()
+
+    @property
+    def sha256(self) -> str:
+        """SHA-256 hex digest of the content written so far."""
+        return self._hash.hexdigest()
+
+    @property
+    def spilled_to_disk(self) -> bool:
+        """Whether the content exceeded SPOOL_MAX_MEMORY and was moved to disk."""
+        return bool(getattr(self.file, "_rolled", False))
+
+    @property
+    def header(self) -> bytes:
+        """First MAGIC_HEADER_SIZE bytes (for magic-byte detection)."""
+        return bytes(self._header)
+
+    def write(self, chunk: bytes) -> None:
+        """Append a chunk, updating size, hash and header."""
+        self.file.write(chunk)
+        self.size += len(chunk)
+        self._hash.update(chunk)
+        if len(self._header) < MAGIC_HEADER_SIZE:
+            self._header += chunk[: MAGIC_HEADER_SIZE - len(self._header)]
+
+    def open(self) -> BinaryIO:
+        """Rewind and return the spooled file for reading."""
+        self.file.seek(0)
+        return self.file
+
+    def iter_chunks(self, chunk_size: int = UPLOAD_CHUNK_SIZE) -> Iterator[bytes]:
+        """Read the content from the start in chunks."""
+        file = self.open()
+        while chunk := file.read(chunk_size):
+            yield chunk
+
+    def close(self) -> None:
+        """Delete the spooled content."""
+        self.file.close()
+
+    def __enter__(self) -> "IngestedUpload":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
 
 class FileValidator:
     """Comprehensive file validation service for medical document uploads.
@@ -123,48 +211,9 @@ class FileValidator:
             detected_mime = magic.from_buffer(content, mime=True)
             logger.debug(f"📋 Detected MIME type: {detected_mime}")
 
-            # Dateiendung prüfen
-            filename_lower = file.filename.lower() if file.filename else ""
-            file_extension = Path(filename_lower).suffix
-
-            # MIME-Type validieren (mit Fallback-Unterstützung)
-            mime_valid = False
-            used_mime_type = detected_mime
-
-            if detected_mime in ALLOWED_MIME_TYPES:
-                # Direkter Match
-                allowed_extensions = ALLOWED_MIME_TYPES[detected_mime]
-                if file_extension in allowed_extensions:
-                    mime_valid = True
-                    logger.debug(
-                        f"✅ Direct MIME type match: {detected_mime} with extension {file_extension}"
-                    )
-            elif detected_mime in FALLBACK_MIME_TYPES:
-                # Fallback-Match basierend auf Dateiendung
-                allowed_extensions = FALLBACK_MIME_TYPES[detected_mime]
-                if file_extension in allowed_extensions:
-                    mime_valid = True
-                    logger.debug(
-                        f"⚠️ Fallback MIME type match: {detected_mime} with extension {file_extension}"
-                    )
-                    # Bestimme den eigentlichen MIME-Type basierend auf Endung
-                    if file_extension == ".pdf":
-                        used_mime_type = "application/pdf"
-                    elif file_extension in [".jpg", ".jpeg"]:
-                        used_mime_type = "image/jpeg"
-                    elif file_extension == ".png":
-                        used_mime_type = "image/png"
-
-            if not mime_valid:
-                logger.warning(
-                    f"❌ Unsupported MIME type/extension: {detected_mime} with {file_extension}"
-                )
-                logger.debug(f"Allowed MIME types: {list(ALLOWED_MIME_TYPES.keys())}")
-                logger.debug(f"Fallback MIME types: {list(FALLBACK_MIME_TYPES.keys())}")
-                return (
-                    False,
-                    f"Dateityp nicht unterstützt: {detected_mime} mit Endung {file_extension}",
-                )
+            used_mime_type, error = FileValidator._check_mime_type(detected_mime, file.filename)
+            if error:
+                return False, error
 
             # Spezifische Validierung nach erkanntem Dateityp
             if used_mime_type == "application/pdf":
@@ -185,14 +234,146 @@ class FileValidator:
             return False, f"Fehler bei der Dateivalidierung: {str(e)}"
 
     @staticmethod
-    async def _validate_pdf(content: bytes) -> tuple[bool, str | None]:
+    async def ingest_file(
+        file: UploadFile, chunk_size: int = UPLOAD_CHUNK_SIZE, spool_dir: str | None = None
+    ) -> tuple[IngestedUpload | None, str | None]:
+        """Stream an upload into a spooled temporary file while validating it.
+
+        Streaming counterpart of validate_file(): chunks are size-checked, hashed
+        and magic-byte-checked as they arrive, and reading stops as soon as the
+        upload is too large or of an unsupported type. Content validation (PDF
+        structure, image integrity) then reads from the spool, so the file is
+        never held in memory as a whole.
+
+        Args:
+            file: FastAPI UploadFile object containing uploaded file data
+            chunk_size: Bytes read from the upload per chunk
+            spool_dir: Directory for the spool file once it exceeds SPOOL_MAX_MEMORY
+
+        Returns:
+            tuple[IngestedUpload | None, str | None]: Validation result tuple containing:
+                - IngestedUpload | None: Spooled upload if valid (caller closes it)
+                - str | None: Error message if validation failed, None if valid
+
+        Example:
+            >>> upload, error = await FileValidator.ingest_file(file)
+            >>> if upload is None:
+            ...     raise HTTPException(400, detail=error)
+            >>> with upload:
+            ...     print(upload.size, upload.sha256, upload.mime_type)
+        """
+        upload = IngestedUpload(file.filename or "", spool_dir=spool_dir)
+        try:
+            logger.debug(f"📋 Ingesting file: {file.filename}")
+
+            used_mime_type = None
+            while chunk := await file.read(chunk_size):
+                upload.write(chunk)
+
+                if upload.size > MAX_FILE_SIZE:
+                    logger.warning(f"❌ File too large (> {MAX_FILE_SIZE}), upload aborted")
+                    upload.close()
+                    return None, f"Datei zu groß. Maximalgröße: {MAX_FILE_SIZE // 1024 // 1024}MB"
+
+                if used_mime_type is None and upload.size >= MAGIC_HEADER_SIZE:
+                    used_mime_type, error = FileValidator._detect_mime_type(upload)
+                    if error:
+                        upload.close()
+                        return None, error
+
+            logger.debug(f"📋 File size: {upload.size} bytes")
+            if upload.size < MIN_FILE_SIZE:
+                logger.warning(f"❌ File too small ({upload.size} < {MIN_FILE_SIZE})")
+                upload.close()
+                return None, f"Datei zu klein. Mindestgröße: {MIN_FILE_SIZE} Bytes"
+
+            if used_mime_type is None:
+                used_mime_type, error = FileValidator._detect_mime_type(upload)
+                if error:
+                    upload.close()
+                    return None, error
+
+            # Spezifische Validierung nach erkanntem Dateityp
+            if used_mime_type == "application/pdf":
+                is_valid, error = await FileValidator._validate_pdf(upload.open())
+            else:
+                is_valid, error = await FileValidator._validate_image(upload.open())
+            if not is_valid:
+                upload.close()
+                return None, error
+
+            logger.info(
+                f"✅ File ingested: {file.filename} ({upload.size} bytes, "
+                f"{'spooled to disk' if upload.spilled_to_disk else 'in memory'})"
+            )
+            return upload, None
+
+        except Exception as e:
+            upload.close()
+            logger.error(f"❌ File ingestion exception: {str(e)}")
+            return None, f"Fehler bei der Dateivalidierung: {str(e)}"
+
+    @staticmethod
+    def _detect_mime_type(upload: IngestedUpload) -> tuple[str | None, str | None]:
+        """Detect the MIME type of an ingested upload from its header bytes."""
+        detected_mime = magic.from_buffer(upload.header, mime=True)
+        logger.debug(f"📋 Detected MIME type: {detected_mime}")
+        used_mime_type, error = FileValidator._check_mime_type(detected_mime, upload.filename)
+        upload.mime_type = used_mime_type
+        return used_mime_type, error
+
+    @staticmethod
+    def _check_mime_type(detected_mime: str, filename: str | None) -> tuple[str | None, str | None]:
+        """Match a detected MIME type against the file extension.
+
+        Args:
+            detected_mime: MIME type detected by python-magic
+            filename: Original filename
+
+        Returns:
+            tuple[str | None, str | None]: MIME type to validate the content as
+                (resolved from the extension for fallback types), or an error message
+        """
+        # Dateiendung prüfen
+        filename_lower = filename.lower() if filename else ""
+        file_extension = Path(filename_lower).suffix
+
+        if detected_mime in ALLOWED_MIME_TYPES:
+            # Direkter Match
+            allowed_extensions = ALLOWED_MIME_TYPES[detected_mime]
+            if file_extension in allowed_extensions:
+                logger.debug(
+                    f"✅ Direct MIME type match: {detected_mime} with extension {file_extension}"
+                )
+                return detected_mime, None
+        elif detected_mime in FALLBACK_MIME_TYPES:
+            # Fallback-Match basierend auf Dateiendung
+            allowed_extensions = FALLBACK_MIME_TYPES[detected_mime]
+            if file_extension in allowed_extensions:
+                logger.debug(
+                    f"⚠️ Fallback MIME type match: {detected_mime} with extension {file_extension}"
+                )
+                # Bestimme den eigentlichen MIME-Type basierend auf Endung
+                if file_extension == ".pdf":
+                    return "application/pdf", None
+                if file_extension in [".jpg", ".jpeg"]:
+                    return "image/jpeg", None
+                return "image/png", None
+
+        logger.warning(f"❌ Unsupported MIME type/extension: {detected_mime} with {file_extension}")
+        logger.debug(f"Allowed MIME types: {list(ALLOWED_MIME_TYPES.keys())}")
+        logger.debug(f"Fallback MIME types: {list(FALLBACK_MIME_TYPES.keys())}")
+        return None, f"Dateityp nicht unterstützt: {detected_mime} mit Endung {file_extension}"
+
+    @staticmethod
+    async def _validate_pdf(content: bytes | BinaryIO) -> tuple[bool, str | None]:
         """Validate PDF file structure and constraints.
 
         Checks PDF file integrity, page count limits, and text extractability.
         Ensures PDF is processable by OCR and translation pipeline.
 
         Args:
-            content: Raw PDF file content as bytes
+            content: Raw PDF file content as bytes or readable binary file
 
         Returns:
             tuple[bool, str | None]: Validation result tuple containing:
@@ -216,9 +397,7 @@ class FileValidator:
             - Empty PDFs (scanned images) still pass - OCR handles them
         """
         try:
-            from io import BytesIO
-
-            pdf_file = BytesIO(content)
+            pdf_file = as_binary_stream(content)
             pdf_reader = PyPDF2.PdfReader(pdf_file)
 
             # Prüfen ob PDF geöffnet werden kann
@@ -244,14 +423,14 @@ class FileValidator:
             return False, f"Ungültige PDF-Datei: {str(e)}"
 
     @staticmethod
-    async def _validate_image(content: bytes) -> tuple[bool, str | None]:
+    async def _validate_image(content: bytes | BinaryIO) -> tuple[bool, str | None]:
         """Validate image file format, dimensions, and data integrity.
 
         Checks image format support, dimension constraints, and data corruption.
         Ensures image is processable by OCR vision models.
 
         Args:
-            content: Raw image file content as bytes
+            content: Raw image file content as bytes or readable binary file
 
         Returns:
             tuple[bool, str | None]: Validation result tuple containing:
@@ -279,9 +458,7 @@ class FileValidator:
             - Catches truncated files, invalid headers, corrupted data
         """
         try:
-            from io import BytesIO
-
-            image_file = BytesIO(content)
+            image_file = as_binary_stream(content)
 
             with Image.open(image_file) as img:
                 # Bildformat prüfen
@@ -0,0 +1,241 @@
+"""
+LLM Response Cache
+
+Caches responses of repeatable LLM calls by prompt hash. Classification and
+validation steps, the Dify guideline translation and feedback analysis often
+send byte-identical prompts (re-uploads, retries after a downstream failure,
+feedback re-analyses); a cached response skips the model call.
+
+The key is a SHA-256 hash of (model, system_prompt, prompt, temperature,
+max_tokens), so any change to the prompt or model parameters is a miss.
+Responses are kept in two tiers, both expiring after LLM_CACHE_TTL_SECONDS:
+    - a size-bounded LRU per process (LLM_CACHE_MAX_ENTRIES)
+    - Redis, shared by API and workers, encrypted with the field encryptor
+
+Caching is opt-in: nothing is cached unless LLM_CACHE_ENABLED is set, and
+pipeline steps additionally need cache_responses enabled. All methods degrade
+to a miss if Redis is unavailable.
+
+Usage:
+    >>> cache = get_llm_response_cache()
+    >>> key = make_cache_key(model, system_prompt, prompt, temperature, max_tokens)
+    >>> cached = await cache.get(key)
+    >>> if cached is None:
+    ...     result = await call_model(...)
+    ...     await cache.set(key, {"text": result["text"], "output_tokens": 120})
+"""
+
+import asyncio
+from collections import OrderedDict
+import hashlib
+import json
+import logging
+import threading
+import time
+from typing import Any
+
+import redis.asyncio as aioredis
+from redis.asyncio.connection import ConnectionPool
+from redis.exceptions import RedisError
+
+from app.core.config import settings
+from app.core.encryption import EncryptionError, encryptor
+
+logger = logging.getLogger(__name__)
+
+# Redis key prefix for cached responses
+_KEY_PREFIX = "docworker:llm_responses"
+
+
+def make_cache_key(
+    model: str,
+    system_prompt: str | None,
+    prompt: str,
+    temperature: float | None,
+    max_tokens: int | None,
+) -> str:
+    """
+    Build the cache key of an LLM call.
+
+    Args:
+        model: Model identifier (include the provider if names may collide)
+        system_prompt: System prompt (None if not used)
+        prompt: Fully rendered user prompt
+        temperature: Temperature sent to the model
+        max_tokens: Max tokens sent to the model
+
+    Returns:
+        SHA-256 hex digest
+    """
+    payload = json.dumps(
+        [model, system_prompt, prompt, temperature, max_tokens], ensure_ascii=False
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class LLMResponseCache:
+    """
+    Two-tier (process LRU + encrypted Redis) cache of LLM responses.
+
+    Values are JSON-serializable dicts, e.g. {"text": ..., "input_tokens": ...}.
+    """
+
+    _pool: ConnectionPool | None = None
+    _pool_loop_id: int | None = None
+
+    def __init__(self, max_entries: int = 256, ttl_seconds: int = 86400):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Responses kept in the process LRU
+            ttl_seconds: Expiry of responses in both tiers
+        """
+        self.max_entries = max(0, max_entries)
+        self.ttl_seconds = ttl_seconds
+        # key -> (monotonic expiry time, response)
+        self._entries: OrderedDict[str, tuple[float, dict[str, Any]]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {"local_hits": 0, "redis_hits": 0, "misses": 0, "errors": 0}
+
+    @property
+    def enabled(self) -> bool:
+        """Check if response caching is enabled (LLM_CACHE_ENABLED)."""
+        return settings.llm_cache_enabled
+
+    async def get(self, key: str) -> dict[str, Any] | None:
+        """
+        Get a cached response.
+
+        Args:
+            key: Key from make_cache_key()
+
+        Returns:
+            Cached response or None on a miss (or if caching is disabled)
+        """
+        if not self.enabled:
+            return None
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if time.monotonic() < expires_at:
+                    self._entries.move_to_end(key)
+                    self._stats["local_hits"] += 1
+                    return dict(value)
+                del self._entries[key]
+
+        value = await self._redis_get(key)
+        if value is None:
+            self._count("misses")
+            return None
+
+        self._count("redis_hits")
+        self._store_local(key, value)
+        return dict(value)
+
+    async def set(self, key: str, value: dict[str, Any]) -> None:
+        """
+        Cache a response in both tiers.
+
+        Args:
+            key: Key from make_cache_key()
+            value: JSON-serializable response
+        """
+        if not self.enabled:
+            return
+
+        self._store_local(key, value)
+
+        client = await self._get_client()
+        if client is None:
+            return
+        try:
+            encrypted = encryptor.encrypt_field(json.dumps(value, ensure_ascii=False))
+            await client.set(self._key(key), encrypted, ex=self.ttl_seconds)
+        except (RedisError, OSError, EncryptionError) as e:
+            self._count("errors")
+            logger.warning(f"LLM response cache: failed to store response: {e}")
+
+    def clear_local(self) -> None:
+        """Drop the responses cached in this process."""
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Counters for monitoring (this process only)."""
+        with self._lock:
+            stats = dict(self._stats)
+            stats["local_entries"] = len(self._entries)
+        stats["enabled"] = self.enabled
+        return stats
+
+    def _key(self, key: str) -> str:
+        return f"{_KEY_PREFIX}:{key}"
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self._stats[name] += 1
+
+    def _store_local(self, key: str, value: dict[str, Any]) -> None:
+        if self.max_entries == 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, dict(value))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    async def _redis_get(self, key: str) -> dict[str, Any] | None:
+        client = await self._get_client()
+        if client is None:
+            return None
+        try:
+            encrypted = await client.get(self._key(key))
+            if encrypted is None:
+                return None
+            return json.loads(encryptor.decrypt_field(encrypted))
+        except (RedisError, OSError, EncryptionError, TypeError, ValueError) as e:
+            self._count("errors")
+            logger.warning(f"LLM response cache: failed to read response: {e}")
+            return None
+
+    async def _get_client(self) -> aioredis.Redis | None:
+        """Get async Redis client. Recreates pool if event loop changed (Celery workers)."""
+        if not settings.redis_url:
+            return None
+
+        try:
+            current_loop_id = id(asyncio.get_running_loop())
+
+            if LLMResponseCache._pool is None or LLMResponseCache._pool_loop_id != current_loop_id:
+                # Pool doesn't exist or was created on a different event loop
+                LLMResponseCache._pool = ConnectionPool.from_url(
+                    settings.redis_url,
+                    max_connections=settings.redis_max_connections,
+                    decode_responses=True,
+                )
+                LLMResponseCache._pool_loop_id = current_loop_id
+
+            return aioredis.Redis(connection_pool=LLMResponseCache._pool)
+        except RedisError as e:
+            logger.warning(f"LLM response cache: Redis unavailable: {e}")
+            return None
+
+
+_cache: LLMResponseCache | None = None
+_cache_lock = threading.Lock()
+
+
+def get_llm_response_cache() -> LLMResponseCache:
+    """Get the process-wide LLM response cache."""
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = LLMResponseCache(
+                    max_entries=settings.llm_cache_max_entries,
+                    ttl_seconds=settings.llm_cache_ttl_seconds,
+                )
+    return _cache
@@ -3,6 +3,10 @@ Mistral AI Client
 
 Client for Mistral AI chat completions used in pipeline step processing.
 Uses the mistralai SDK (already installed for OCR).
+
+The SDK keeps an async HTTP connection pool per instance, so share one client
+via app.services.provider_clients.get_mistral_client() instead of creating one
+per call.
 """
 
 import logging
@@ -62,7 +66,7 @@ class MistralClient:
                 messages.append({"role": "system", "content": system_prompt})
             messages.append({"role": "user", "content": prompt})
 
-            response = self.client.chat.complete(
+            response = await self.client.chat.complete_async(
                 model=model,
                 messages=messages,
                 temperature=temperature,
@@ -86,3 +90,7 @@ class MistralClient:
         except Exception as e:
             logger.error(f"Mistral API error: {e}")
             raise
+
+    async def aclose(self) -> None:
+        """Close the SDK's async HTTP connection pool."""
+        await self.client.__aexit__(None, None, None)
@@ -5,15 +5,31 @@ Worker-ready service for executing user-configured pipeline steps.
 Designed to be stateless and compatible with Redis queue workers.
 """
 
+import asyncio
 from datetime import datetime
 import logging
 import time
 from typing import Any
 
 from sqlalchemy.orm import Session
-
+from tenacity import AsyncRetrying
+
+from app.core.circuit_breaker import CircuitBreaker, mistral_breaker, ovh_ai_breaker
+from app.core.config import settings
+from app.core.exceptions import (
+    CircuitBreakerError,
+    ExternalServiceError,
+    PipelineStepError,
+    ServiceUnavailableError,
+)
+from app.core.retry_policy import (
+    get_pipeline_step_retry_policy,
+    is_infrastructure_error,
+    is_transient_error,
+)
 from app.database.modular_pipeline_models import (
     AvailableModelDB,
+    DocumentClassDB,
     DynamicPipelineStepDB,
     ModelProvider,
     OCRConfigurationDB,
@@ -26,16 +42,20 @@ from app.repositories.pipeline_step_execution_repository import PipelineStepExec
 from app.repositories.pipeline_step_repository import PipelineStepRepository
 from app.services.ai_cost_tracker import AICostTracker
 from app.services.ai_logging_service import AILoggingService
+from app.services.document_chunker import split_into_chunks
 from app.services.document_class_manager import DocumentClassManager
-from app.services.mistral_client import MistralClient
+from app.services.llm_response_cache import get_llm_response_cache, make_cache_key
 from app.services.ovh_client import OVHClient
-from app.services.pipeline_progress_tracker import PipelineProgressTracker
+from app.services.pipeline_plan_cache import PipelinePlan, PipelinePlanCache, snapshot_record
+from app.services.pipeline_progress_tracker import PartialOutputPublisher, PipelineProgressTracker
+from app.services.pipeline_step_scheduler import PipelineStepScheduler
 from app.services.prompt_guard import (
     detect_injection,
     log_injection_detection,
     sanitize_for_prompt,
     validate_step_output,
 )
+from app.services.provider_clients import get_dify_rag_client, get_mistral_client, get_ovh_client
 
 logger = logging.getLogger(__name__)
 
@@ -46,6 +66,9 @@ SOURCE_LANGUAGE_INSTRUCTIONS = {
     "en": "The following text is in English.",
 }
 
+# Joins the outputs of a chunked step
+CHUNK_OUTPUT_SEPARATOR = "\n\n"
+
 
 class ModularPipelineExecutor:
     """
@@ -66,6 +89,7 @@ class ModularPipelineExecutor:
         step_execution_repository: PipelineStepExecutionRepository | None = None,
         ocr_config_repository: OCRConfigurationRepository | None = None,
         model_repository: AvailableModelRepository | None = None,
+        plan_cache: PipelinePlanCache | None = None,
     ):
         """
         Initialize executor with database session and repositories.
@@ -77,6 +101,9 @@ class ModularPipelineExecutor:
             step_execution_repository: Pipeline step execution repository (injected for encryption)
             ocr_config_repository: OCR configuration repository (injected for clean architecture)
             model_repository: Available model repository (injected for clean architecture)
+            plan_cache: Process-wide compiled pipeline plan cache. When given, steps,
+                models and document classes are read from cached plans instead of
+                being queried per job.
         """
         self.session = session
         self.job_repository = job_repository or PipelineJobRepository(session)
@@ -86,16 +113,77 @@ class ModularPipelineExecutor:
         )
         self.ocr_config_repository = ocr_config_repository or OCRConfigurationRepository(session)
         self.model_repository = model_repository or AvailableModelRepository(session)
-        self.ovh_client = OVHClient()
         self.doc_class_manager = DocumentClassManager(session)
         self.cost_tracker = AICostTracker(session)
         self.ai_logger = AILoggingService(session)
         self.progress_tracker = PipelineProgressTracker()
+        self.plan_cache = plan_cache
+        # Plans pinned for this executor (one job), so all phases see the same configuration
+        self._plans: dict[str | None, PipelinePlan] = {}
         logger.info("💰 Cost tracker initialized for pipeline executor")
         logger.info("📊 AI interaction logger initialized")
 
+    @property
+    def ovh_client(self) -> OVHClient:
+        """
+        Shared OVH client of the running event loop.
+
+        Resolved on use rather than in __init__: the worker creates executors
+        outside the event loop that later runs the steps.
+        """
+        return get_ovh_client()
+
     # ==================== CONFIGURATION LOADING ====================
 
+    def get_pipeline_plan(self, source_language: str | None = None) -> PipelinePlan:
+        """
+        Get the compiled pipeline plan from the plan cache.
+
+        The plan is pinned on first use, so one executor (one job) keeps working
+        with the same configuration even if it changes mid-job.
+
+        Args:
+            source_language: Source language code, or None for all enabled steps
+
+        Returns:
+            Compiled pipeline plan
+
+        Raises:
+            ValueError: If the executor was created without a plan cache
+        """
+        if self.plan_cache is None:
+            raise ValueError("Executor has no pipeline plan cache")
+
+        plan = self._plans.get(source_language)
+        if plan is None:
+            plan = self.plan_cache.get_plan(
+                source_language, lambda version: self._compile_plan(source_language, version)
+            )
+            self._plans[source_language] = plan
+        return plan
+
+    def _compile_plan(self, source_language: str | None, version: int) -> PipelinePlan:
+        """Load configuration records and compile snapshots of them into a plan."""
+        if source_language is None:
+            steps = self.step_repository.get_enabled_steps()
+        else:
+            steps = self.step_repository.get_steps_for_source_language(source_language)
+        models = self.model_repository.get_enabled_models()
+        document_classes = self.doc_class_manager.get_all_classes()
+
+        # The plan outlives this session and is shared across jobs: keep plain values only
+        return PipelinePlan.compile(
+            source_language=source_language,
+            version=version,
+            steps=[snapshot_record(step) for step in steps],
+            models=[snapshot_record(model) for model in models],
+            document_classes=[snapshot_record(doc_class) for doc_class in document_classes],
+        )
+
+    def _get_current_plan(self) -> PipelinePlan:
+        """Get any pinned plan (models and document classes are language independent)."""
+        return next(iter(self._plans.values()), None) or self.get_pipeline_plan()
+
     def load_pipeline_steps(self) -> list[DynamicPipelineStepDB]:
         """
         Load all enabled pipeline steps from database using repository pattern.
@@ -104,7 +192,10 @@ class ModularPipelineExecutor:
             List of pipeline steps ordered by 'order' field
         """
         try:
-            steps = self.step_repository.get_enabled_steps()
+            if self.plan_cache is not None:
+                steps = list(self.get_pipeline_plan().steps)
+            else:
+                steps = self.step_repository.get_enabled_steps()
 
             logger.info(f"📋 Loaded {len(steps)} enabled pipeline steps")
             return steps
@@ -125,19 +216,23 @@ class ModularPipelineExecutor:
             List of pre-branching universal pipeline steps ordered by execution order
         """
         try:
-            # Get steps filtered by source language (universal OR matching language)
-            all_steps = self.step_repository.get_steps_for_source_language(source_language)
+            if self.plan_cache is not None:
+                plan = self.get_pipeline_plan(source_language)
+                all_steps, steps = plan.steps, list(plan.universal_steps)
+            else:
+                # Get steps filtered by source language (universal OR matching language)
+                all_steps = self.step_repository.get_steps_for_source_language(source_language)
+
+                # Filter for universal (document_class_id = NULL) and pre-branching only
+                steps = [
+                    s for s in all_steps if s.document_class_id is None and not s.post_branching
+                ]
 
             # DEBUG: Log what we got from repository
             logger.info(
                 f"🔍 DEBUG: Repository returned {len(all_steps)} steps for source_language='{source_language}'"
             )
 
-            # Filter for universal (document_class_id = NULL) and pre-branching only
-            steps = [
-                s for s in all_steps if s.document_class_id is None and not s.post_branching
-            ]
-
             logger.info(
                 f"📋 Loaded {len(steps)} pre-branching universal pipeline steps for source_language='{source_language}'"
             )
@@ -166,13 +261,16 @@ class ModularPipelineExecutor:
             List of post-branching universal pipeline steps ordered by execution order
         """
         try:
-            # Get steps filtered by source language
-            all_steps = self.step_repository.get_steps_for_source_language(source_language)
+            if self.plan_cache is not None:
+                steps = list(self.get_pipeline_plan(source_language).post_branching_steps)
+            else:
+                # Get steps filtered by source language
+                all_steps = self.step_repository.get_steps_for_source_language(source_language)
 
-            # Filter for post-branching universal steps only
-            steps = [
-                s for s in all_steps if s.document_class_id is None and s.post_branching
-            ]
+                # Filter for post-branching universal steps only
+                steps = [
+                    s for s in all_steps if s.document_class_id is None and s.post_branching
+                ]
 
             logger.info(
                 f"📋 Loaded {len(steps)} post-branching universal pipeline steps for source_language='{source_language}'"
@@ -197,11 +295,14 @@ class ModularPipelineExecutor:
             List of document-specific pipeline steps ordered by execution order
         """
         try:
-            # Get steps filtered by source language
-            all_steps = self.step_repository.get_steps_for_source_language(source_language)
+            if self.plan_cache is not None:
+                steps = self.get_pipeline_plan(source_language).get_class_steps(document_class_id)
+            else:
+                # Get steps filtered by source language
+                all_steps = self.step_repository.get_steps_for_source_language(source_language)
 
-            # Filter for specific document class only
-            steps = [s for s in all_steps if s.document_class_id == document_class_id]
+                # Filter for specific document class only
+                steps = [s for s in all_steps if s.document_class_id == document_class_id]
 
             logger.info(
                 f"📋 Loaded {len(steps)} enabled steps for document class ID {document_class_id} (source_language='{source_language}')"
@@ -297,6 +398,16 @@ class ModularPipelineExecutor:
 
         return None
 
+    def _get_missing_context_variables(
+        self, step: DynamicPipelineStepDB, context: dict[str, Any]
+    ) -> list[str]:
+        """Get the required context variables of a step that are missing or None."""
+        return [
+            var
+            for var in step.required_context_variables or []
+            if var not in context or context[var] is None
+        ]
+
     def _log_step_execution(
         self,
         job_id: str,
@@ -344,6 +455,20 @@ class ModularPipelineExecutor:
             step_metadata=metadata,
         )
 
+    def _report_text_storage(self, job_id: str, execution_metadata: dict) -> None:
+        """Log how much step text the job references vs. stores after deduplication."""
+        try:
+            storage = self.step_execution_repository.get_text_storage(job_id)
+            saved = storage["logical_bytes"] - storage["stored_bytes"]
+            logger.info(
+                f"💾 Step text storage: {storage['logical_bytes'] / 1024:.1f} KB referenced by "
+                f"{storage['steps']} step(s), {storage['stored_bytes'] / 1024:.1f} KB stored "
+                f"({saved / 1024:.1f} KB deduplicated)"
+            )
+            execution_metadata["text_storage"] = storage
+        except Exception as e:
+            logger.warning(f"⚠️ Could not report step text storage: {e}")
+
     def _handle_stop_condition(
         self,
         step: DynamicPipelineStepDB,
@@ -468,7 +593,10 @@ class ModularPipelineExecutor:
         if branching_field == "document_type":
             # Get all valid document class keys from database
             try:
-                all_classes = self.doc_class_manager.get_all_classes()
+                if self.plan_cache is not None:
+                    all_classes = self._get_current_plan().document_classes.values()
+                else:
+                    all_classes = self.doc_class_manager.get_all_classes()
                 valid_classes = [c.class_key.upper() for c in all_classes if c.is_enabled]
             except Exception:
                 # Fallback to hardcoded values if database lookup fails
@@ -498,7 +626,7 @@ class ModularPipelineExecutor:
         # Determine branch type based on field name
         if branching_field == "document_type":
             # Document class branching - lookup class and load class-specific steps
-            doc_class = self.doc_class_manager.get_class_by_key(branch_value)
+            doc_class = self._get_document_class(branch_value)
             if doc_class:
                 logger.info(
                     f"✅ Document class branching: {branch_value} → {doc_class.display_name}"
@@ -540,6 +668,16 @@ class ModularPipelineExecutor:
             "target_display_name": None,
         }
 
+    def _get_document_class(self, class_key: str) -> DocumentClassDB | None:
+        """Look up a document class by key, from the pipeline plan if available."""
+        if self.plan_cache is not None:
+            try:
+                return self._get_current_plan().document_classes.get(class_key)
+            except Exception as e:
+                logger.error(f"❌ Failed to get document class by key '{class_key}': {e}")
+                return None
+        return self.doc_class_manager.get_class_by_key(class_key)
+
     def load_ocr_configuration(self) -> OCRConfigurationDB | None:
         """
         Load OCR configuration from database using repository pattern.
@@ -567,6 +705,8 @@ class ModularPipelineExecutor:
             Model information or None if not found
         """
         try:
+            if self.plan_cache is not None:
+                return self._get_current_plan().models.get(model_id)
             return self.model_repository.get_enabled_model_by_id(model_id)
         except Exception as e:
             logger.error(f"❌ Failed to load model info for ID {model_id}: {e}")
@@ -625,6 +765,19 @@ class ModularPipelineExecutor:
             source_lang, SOURCE_LANGUAGE_INSTRUCTIONS["de"]
         )
 
+        # Long inputs of steps with chunking enabled are processed chunk by chunk
+        chunks = self._get_step_chunks(step, model, input_text)
+        if len(chunks) > 1:
+            return await self._execute_chunked_step(
+                step=step,
+                model=model,
+                chunks=chunks,
+                input_text=input_text,
+                context=context,
+                processing_id=processing_id,
+                document_type=document_type,
+            )
+
         # Prepare prompt with variable substitution (sanitized input)
         try:
             prompt = step.prompt_template.format(
@@ -639,182 +792,482 @@ class ModularPipelineExecutor:
         # Get system_prompt for role separation (may be None for backward compat)
         system_prompt = getattr(step, "system_prompt", None)
 
-        # Execute with retries
-        max_retries = step.max_retries if step.retry_on_failure else 1
-        last_error = None
+        # Repeatable steps reuse the response to an identical earlier call
+        cache_key = self._get_response_cache_key(step, model, prompt, system_prompt)
+        if cache_key is not None:
+            cached = await get_llm_response_cache().get(cache_key)
+            if cached is not None:
+                self._log_cached_response(step, model, cached, processing_id, document_type)
+                logger.info(f"♻️ Step '{step.name}' served from response cache")
+                return True, cached["text"], None
 
-        for attempt in range(max_retries):
-            try:
-                logger.info(
-                    f"🔄 Executing step '{step.name}' (attempt {attempt + 1}/{max_retries})"
-                )
-                logger.info(
-                    f"   Model: {model.name} | Temp: {step.temperature} | Max Tokens: {step.max_tokens or model.max_tokens}"
-                )
-                logger.info(f"   Input length: {len(input_text)} characters")
+        # Execute with retries (async, jittered backoff; open circuit fails fast)
+        max_retries = step.max_retries if step.retry_on_failure else 1
+        breaker = self._get_provider_breaker(model.provider)
+        call_provider = breaker.call_async(self._call_provider) if breaker else self._call_provider
+        stream = self._should_stream(step, model, processing_id)
 
-                # Call AI model based on provider
-                start_time = time.time()
+        try:
+            async for attempt in AsyncRetrying(**get_pipeline_step_retry_policy(max_retries)):
+                with attempt:
+                    attempt_number = attempt.retry_state.attempt_number
+                    logger.info(
+                        f"🔄 Executing step '{step.name}' (attempt {attempt_number}/{max_retries})"
+                    )
+                    logger.info(
+                        f"   Model: {model.name} | Temp: {step.temperature} | Max Tokens: {step.max_tokens or model.max_tokens}"
+                    )
+                    logger.info(f"   Input length: {len(input_text)} characters")
 
-                if model.provider == ModelProvider.MISTRAL:
-                    # Use Mistral AI API
-                    mistral_client = MistralClient()
-                    mistral_result = await mistral_client.process_text(
+                    start_time = time.time()
+                    result_dict = await call_provider(
+                        step=step,
+                        model=model,
                         prompt=prompt,
-                        model=model.name,
-                        temperature=step.temperature or 0.7,
-                        max_tokens=step.max_tokens or model.max_tokens or 4096,
                         system_prompt=system_prompt,
+                        input_text=input_text,
+                        context=context,
+                        processing_id=processing_id,
+                        stream=stream,
+                        attempt=attempt_number,
                     )
-                    result_dict = {
-                        "text": mistral_result["content"],
-                        "input_tokens": mistral_result["input_tokens"],
-                        "output_tokens": mistral_result["output_tokens"],
+                    execution_time = time.time() - start_time
+                    result = result_dict["text"]
+
+                    cost_metadata = {
+                        "step_id": step.id,
+                        "temperature": step.temperature or 0.7,
+                        "max_tokens": step.max_tokens or model.max_tokens or 4096,
+                        "model_db_id": model.id,
+                        "attempt": attempt_number,
                     }
-
-                elif model.provider == ModelProvider.DIFY_RAG:
-                    # External RAG service (Dify on Hetzner)
-                    from app.services.dify_rag_client import DifyRAGClient
-
-                    rag_client = DifyRAGClient()
-                    if not rag_client.is_enabled:
-                        logger.info(f"Dify RAG not configured, skipping '{step.name}'")
-                        result_dict = {"text": "", "input_tokens": 0, "output_tokens": 0}
-                    else:
-                        target_language = context.get("target_language", "en")
-                        answer, rag_metadata = await rag_client.query_guidelines(
-                            medical_text=input_text,
-                            document_type=context.get("document_type", "UNKNOWN"),
-                            target_language=target_language,
-                            user_id=processing_id or "pipeline",
-                        )
-                        if rag_metadata.get("skipped"):
+                    if stream:
+                        time_to_first_token = result_dict.get("time_to_first_token")
+                        cost_metadata["streamed"] = True
+                        cost_metadata["time_to_first_token_seconds"] = time_to_first_token
+                        if time_to_first_token is not None:
                             logger.info(
-                                f"Dify RAG skipped for '{step.name}': {rag_metadata.get('reason', rag_metadata.get('error', 'unknown'))}"
+                                f"⚡ Step '{step.name}': first token after {time_to_first_token:.2f}s"
                             )
-                            result_dict = {"text": "", "input_tokens": 0, "output_tokens": 0}
-                        else:
-                            result_dict = {"text": answer, "input_tokens": 0, "output_tokens": 0}
 
-                else:
-                    # Use OVH AI Endpoints (default)
-                    result_dict = await self.ovh_client.process_medical_text_with_prompt(
-                        full_prompt=prompt,
-                        temperature=step.temperature or 0.7,
-                        max_tokens=step.max_tokens or model.max_tokens or 4096,
-                        use_fast_model=(model.name == "Mistral-Nemo-Instruct-2407"),
-                        system_prompt=system_prompt,
+                    # ✨ NEW: Log AI call with token usage (don't break pipeline if this fails!)
+                    try:
+                        self.cost_tracker.log_ai_call(
+                            processing_id=processing_id,
+                            step_name=step.name,
+                            input_tokens=result_dict.get("input_tokens", 0),
+                            output_tokens=result_dict.get("output_tokens", 0),
+                            model_provider="OVH",
+                            model_name=result_dict.get("model") or model.name,
+                            processing_time_seconds=execution_time,
+                            document_type=document_type,
+                            metadata=cost_metadata,
+                        )
+                        logger.info(
+                            f"💰 Logged {result_dict.get('total_tokens', 0)} tokens for step '{step.name}'"
+                        )
+                    except Exception as log_error:
+                        # Don't fail the pipeline if logging fails!
+                        logger.error(f"⚠️ Failed to log AI costs (non-critical): {log_error}")
+
+                    # Validate output
+                    expected_values = None
+                    stop_conds = getattr(step, "stop_conditions", None)
+                    if isinstance(stop_conds, dict) and stop_conds.get("stop_on_values"):
+                        # For classification/validation steps, check output format
+                        expected_values = list(stop_conds["stop_on_values"])
+
+                    is_valid, validation_msg = validate_step_output(
+                        step_name=step.name,
+                        output=result,
+                        input_text=input_text,
+                        expected_values=expected_values,
+                        system_prompt=system_prompt if isinstance(system_prompt, str) else None,
                     )
+                    if not is_valid:
+                        logger.warning(
+                            f"Output validation failed for '{step.name}': {validation_msg}"
+                        )
+                        # On structured steps (classification), retry
+                        if (
+                            getattr(step, "is_branching_step", False)
+                            and attempt_number < max_retries
+                        ):
+                            raise PipelineStepError(
+                                f"Output validation: {validation_msg}", step_name=step.name
+                            )
 
-                execution_time = time.time() - start_time
+                    if cache_key is not None and is_valid and result:
+                        await get_llm_response_cache().set(
+                            cache_key,
+                            {
+                                "text": result,
+                                "input_tokens": result_dict.get("input_tokens", 0),
+                                "output_tokens": result_dict.get("output_tokens", 0),
+                                "model": result_dict.get("model") or model.name,
+                            },
+                        )
 
-                # Extract text from dict response
-                result = result_dict["text"]
+                    # Success!
+                    logger.info(f"✅ Step '{step.name}' completed in {execution_time:.2f}s")
+                    return True, result, None
 
-                # Check for API errors
-                if result.startswith("Error"):
-                    last_error = result
+        except CircuitBreakerError as e:
+            logger.error(f"🔴 Step '{step.name}' not executed: {e}")
+            return False, "", str(e)
 
-                    # Detect 503 service unavailable errors (infrastructure issues)
-                    is_503_error = (
-                        "503" in result
-                        or "Service Unavailable" in result
-                        or "ring-balancer" in result
-                    )
+        except Exception as e:
+            logger.error(f"❌ Step '{step.name}' failed after {max_retries} attempt(s): {e}")
+            return False, "", str(e) or "Unknown error"
 
-                    if is_503_error and attempt < max_retries - 1:
-                        # Use longer backoff for 503 errors (infrastructure recovery time)
-                        retry_delay = 5 * (attempt + 1)  # 5s, 10s instead of 1s, 2s
-                        logger.warning(
-                            f"⚠️ OVH infrastructure error (503) on attempt {attempt + 1}: {result[:200]}"
+        # Unreachable: AsyncRetrying either returns a result or re-raises
+        return False, "", "Unknown error"
+
+    def _should_stream(
+        self, step: DynamicPipelineStepDB, model: AvailableModelDB, processing_id: str | None
+    ) -> bool:
+        """
+        Check if a step is executed in streaming mode.
+
+        Steps with stream_output enabled stream their output to the job's
+        progress events while it is generated. Only OVH models stream, and only
+        within a job (partial output is published per processing ID).
+        """
+        return (
+            getattr(step, "stream_output", False) is True
+            and model.provider == ModelProvider.OVH
+            and bool(processing_id)
+        )
+
+    def _get_response_cache_key(
+        self,
+        step: DynamicPipelineStepDB,
+        model: AvailableModelDB,
+        prompt: str,
+        system_prompt: str | None,
+    ) -> str | None:
+        """
+        Get the response cache key of a step call.
+
+        Only steps with cache_responses enabled are cached (and only with
+        LLM_CACHE_ENABLED). Dify RAG steps are never cached here: their answer
+        depends on the knowledge base, DifyRAGClient caches its translation.
+
+        Returns:
+            Cache key, or None if the call is not cached
+        """
+        if (
+            not settings.llm_cache_enabled
+            or getattr(step, "cache_responses", False) is not True
+            or model.provider == ModelProvider.DIFY_RAG
+        ):
+            return None
+
+        return make_cache_key(
+            model=f"{getattr(model.provider, 'value', model.provider)}:{model.name}",
+            system_prompt=system_prompt if isinstance(system_prompt, str) else None,
+            prompt=prompt,
+            temperature=0.7 if step.temperature is None else step.temperature,
+            max_tokens=step.max_tokens or model.max_tokens or 4096,
+        )
+
+    def _log_cached_response(
+        self,
+        step: DynamicPipelineStepDB,
+        model: AvailableModelDB,
+        cached: dict[str, Any],
+        processing_id: str | None,
+        document_type: str | None,
+    ) -> None:
+        """Log a cache hit as a zero-cost AI call, with the tokens it saved."""
+        try:
+            self.cost_tracker.log_ai_call(
+                processing_id=processing_id,
+                step_name=step.name,
+                input_tokens=0,
+                output_tokens=0,
+                model_provider="OVH",
+                model_name=cached.get("model") or model.name,
+                processing_time_seconds=0.0,
+                document_type=document_type,
+                metadata={
+                    "step_id": step.id,
+                    "temperature": step.temperature or 0.7,
+                    "max_tokens": step.max_tokens or model.max_tokens or 4096,
+                    "model_db_id": model.id,
+                    "cache_hit": True,
+                    "saved_input_tokens": cached.get("input_tokens", 0),
+                    "saved_output_tokens": cached.get("output_tokens", 0),
+                },
+            )
+        except Exception as log_error:
+            logger.error(f"⚠️ Failed to log AI costs (non-critical): {log_error}")
+
+    def _get_step_chunks(
+        self, step: DynamicPipelineStepDB, model: AvailableModelDB, input_text: str
+    ) -> list[str]:
+        """
+        Split the input of a step with chunking enabled.
+
+        Branching steps, steps with stop conditions and Dify RAG steps need the
+        whole document and are never chunked.
+
+        Returns:
+            Input chunks in document order (just the input if not chunked)
+        """
+        if (
+            getattr(step, "chunking_enabled", False) is not True
+            or step.is_branching_step
+            or step.stop_conditions
+            or model.provider == ModelProvider.DIFY_RAG
+        ):
+            return [input_text]
+
+        max_tokens = step.chunk_max_tokens or settings.pipeline_chunk_max_tokens
+        return split_into_chunks(input_text, max_tokens)
+
+    async def _execute_chunked_step(
+        self,
+        step: DynamicPipelineStepDB,
+        model: AvailableModelDB,
+        chunks: list[str],
+        input_text: str,
+        context: dict[str, Any],
+        processing_id: str | None,
+        document_type: str | None,
+    ) -> tuple[bool, str, str | None]:
+        """
+        Execute a step chunk by chunk and reassemble the outputs in order.
+
+        Chunks run concurrently (PIPELINE_CHUNK_MAX_PARALLEL at once), each with
+        the step's retry policy. The step fails if any chunk fails. Token usage of
+        all chunks is logged as one cost record.
+
+        Returns:
+            Tuple of (success: bool, output_text: str, error_message: str | None)
+        """
+        try:
+            prompts = [
+                step.prompt_template.format(input_text=sanitize_for_prompt(chunk)[0], **context)
+                for chunk in chunks
+            ]
+        except KeyError as e:
+            error = f"Missing required variable in prompt template: {e}"
+            logger.error(f"❌ {error}")
+            return False, "", error
+
+        system_prompt = getattr(step, "system_prompt", None)
+        max_retries = step.max_retries if step.retry_on_failure else 1
+        breaker = self._get_provider_breaker(model.provider)
+        call_provider = breaker.call_async(self._call_provider) if breaker else self._call_provider
+        semaphore = asyncio.Semaphore(max(1, settings.pipeline_chunk_max_parallel))
+        attempts = [0] * len(chunks)
+
+        async def run_chunk(index: int) -> dict[str, Any]:
+            async with semaphore:
+                async for attempt in AsyncRetrying(**get_pipeline_step_retry_policy(max_retries)):
+                    with attempt:
+                        attempts[index] = attempt.retry_state.attempt_number
+                        return await call_provider(
+                            step=step,
+                            model=model,
+                            prompt=prompts[index],
+                            system_prompt=system_prompt,
+                            input_text=chunks[index],
+                            context=context,
+                            processing_id=processing_id,
                         )
-                        logger.info(f"   Waiting {retry_delay}s for OVH infrastructure recovery...")
-                        time.sleep(retry_delay)
-                    else:
-                        logger.warning(f"⚠️ API error on attempt {attempt + 1}: {result}")
+            # The retry policy reraises the last error once out of attempts
+            raise RuntimeError(f"Chunk {index + 1} of step '{step.name}' was not executed")
 
-                    continue
+        logger.info(
+            f"🧩 Executing step '{step.name}' in {len(chunks)} chunks "
+            f"({len(input_text)} characters, model: {model.name})"
+        )
+        start_time = time.time()
+        tasks = [asyncio.create_task(run_chunk(index)) for index in range(len(chunks))]
+        try:
+            results = await asyncio.gather(*tasks)
+        except CircuitBreakerError as e:
+            logger.error(f"🔴 Step '{step.name}' not executed: {e}")
+            return False, "", str(e)
+        except Exception as e:
+            logger.error(f"❌ Step '{step.name}' failed in chunked execution: {e}")
+            return False, "", str(e) or "Unknown error"
+        finally:
+            # Stop the remaining chunks if one failed
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+        execution_time = time.time() - start_time
+
+        result = CHUNK_OUTPUT_SEPARATOR.join(r["text"].strip() for r in results)
+        input_tokens = sum(r.get("input_tokens", 0) for r in results)
+        output_tokens = sum(r.get("output_tokens", 0) for r in results)
+
+        # One cost record for the whole step (don't break pipeline if this fails!)
+        try:
+            self.cost_tracker.log_ai_call(
+                processing_id=processing_id,
+                step_name=step.name,
+                input_tokens=input_tokens,
+                output_tokens=output_tokens,
+                model_provider="OVH",
+                model_name=results[0].get("model") or model.name,
+                processing_time_seconds=execution_time,
+                document_type=document_type,
+                metadata={
+                    "step_id": step.id,
+                    "temperature": step.temperature or 0.7,
+                    "max_tokens": step.max_tokens or model.max_tokens or 4096,
+                    "model_db_id": model.id,
+                    "attempt": max(attempts),
+                    "chunks": len(chunks),
+                    "chunk_attempts": sum(attempts),
+                },
+            )
+            logger.info(
+                f"💰 Logged {input_tokens + output_tokens} tokens for step '{step.name}' "
+                f"({len(chunks)} chunks)"
+            )
+        except Exception as log_error:
+            logger.error(f"⚠️ Failed to log AI costs (non-critical): {log_error}")
 
-                # ✨ NEW: Log AI call with token usage (don't break pipeline if this fails!)
-                try:
-                    self.cost_tracker.log_ai_call(
-                        processing_id=processing_id,
-                        step_name=step.name,
-                        input_tokens=result_dict.get("input_tokens", 0),
-                        output_tokens=result_dict.get("output_tokens", 0),
-                        model_provider="OVH",
-                        model_name=result_dict.get("model") or model.name,
-                        processing_time_seconds=execution_time,
-                        document_type=document_type,
-                        metadata={
-                            "step_id": step.id,
-                            "temperature": step.temperature or 0.7,
-                            "max_tokens": step.max_tokens or model.max_tokens or 4096,
-                            "model_db_id": model.id,
-                            "attempt": attempt + 1,
-                        },
-                    )
-                    logger.info(
-                        f"💰 Logged {result_dict.get('total_tokens', 0)} tokens for step '{step.name}'"
-                    )
-                except Exception as log_error:
-                    # Don't fail the pipeline if logging fails!
-                    logger.error(f"⚠️ Failed to log AI costs (non-critical): {log_error}")
-
-                # Validate output
-                expected_values = None
-                stop_conds = getattr(step, "stop_conditions", None)
-                if isinstance(stop_conds, dict) and stop_conds.get("stop_on_values"):
-                    # For classification/validation steps, check output format
-                    expected_values = list(stop_conds["stop_on_values"])
-
-                is_valid, validation_msg = validate_step_output(
-                    step_name=step.name,
-                    output=result,
-                    input_text=input_text,
-                    expected_values=expected_values,
-                    system_prompt=system_prompt if isinstance(system_prompt, str) else None,
-                )
-                if not is_valid:
-                    logger.warning(
-                        f"Output validation failed for '{step.name}': {validation_msg}"
-                    )
-                    # On structured steps (classification), retry
-                    if getattr(step, "is_branching_step", False) and attempt < max_retries - 1:
-                        last_error = f"Output validation: {validation_msg}"
-                        continue
+        is_valid, validation_msg = validate_step_output(
+            step_name=step.name,
+            output=result,
+            input_text=input_text,
+            system_prompt=system_prompt if isinstance(system_prompt, str) else None,
+        )
+        if not is_valid:
+            logger.warning(f"Output validation failed for '{step.name}': {validation_msg}")
+
+        logger.info(
+            f"✅ Step '{step.name}' completed in {execution_time:.2f}s ({len(chunks)} chunks)"
+        )
+        return True, result, None
+
+    def _get_provider_breaker(self, provider: ModelProvider) -> CircuitBreaker | None:
+        """
+        Get the circuit breaker guarding a model provider.
+
+        Returns None for Dify RAG: DifyRAGClient guards its own queries with
+        dify_rag_breaker and degrades failures to a skipped step.
+        """
+        if provider == ModelProvider.MISTRAL:
+            return mistral_breaker
+        if provider == ModelProvider.DIFY_RAG:
+            return None
+        return ovh_ai_breaker
+
+    async def _call_provider(
+        self,
+        step: DynamicPipelineStepDB,
+        model: AvailableModelDB,
+        prompt: str,
+        system_prompt: str | None,
+        input_text: str,
+        context: dict[str, Any],
+        processing_id: str | None,
+        stream: bool = False,
+        attempt: int = 1,
+    ) -> dict[str, Any]:
+        """
+        Call the AI model's provider once.
 
-                # Success!
-                logger.info(f"✅ Step '{step.name}' completed in {execution_time:.2f}s")
-                return True, result, None
+        With stream, the OVH response is generated in streaming mode and its
+        partial output published as progress events (tagged with attempt, so a
+        retry replaces the failed attempt's output). The result is the same as
+        without streaming, plus the time to the first token.
 
+        Returns:
+            Dict with text, input_tokens, output_tokens (and model/total_tokens for OVH,
+            time_to_first_token when streamed)
+
+        Raises:
+            ServiceUnavailableError: Provider outage or transient failure (counted by
+                the provider's circuit breaker)
+            ExternalServiceError: Other provider errors
+        """
+        if model.provider == ModelProvider.MISTRAL:
+            # Use Mistral AI API (shared client, keep-alive connections)
+            try:
+                mistral_result = await get_mistral_client().process_text(
+                    prompt=prompt,
+                    model=model.name,
+                    temperature=step.temperature or 0.7,
+                    max_tokens=step.max_tokens or model.max_tokens or 4096,
+                    system_prompt=system_prompt,
+                )
             except Exception as e:
-                last_error = str(e)
-                logger.error(f"❌ Step '{step.name}' failed on attempt {attempt + 1}: {e}")
-
-                if attempt < max_retries - 1:
-                    # Detect 503 errors in exceptions (OVH infrastructure issues)
-                    error_str = str(e).lower()
-                    is_503_error = (
-                        "503" in error_str
-                        or "service unavailable" in error_str
-                        or "ring-balancer" in error_str
-                    )
+                if is_transient_error(e) or is_infrastructure_error(e):
+                    raise ServiceUnavailableError(str(e), service_name="mistral") from e
+                raise
+            return {
+                "text": mistral_result["content"],
+                "input_tokens": mistral_result["input_tokens"],
+                "output_tokens": mistral_result["output_tokens"],
+            }
 
-                    if is_503_error:
-                        # Use longer backoff for 503 errors (infrastructure recovery time)
-                        retry_delay = 5 * (attempt + 1)  # 5s, 10s
-                        logger.warning("⚠️ OVH infrastructure error (503) detected in exception")
-                        logger.info(f"   Waiting {retry_delay}s for OVH infrastructure recovery...")
-                        time.sleep(retry_delay)
-                    else:
-                        # Standard exponential backoff for other errors
-                        retry_delay = 1 * (attempt + 1)  # 1s, 2s
-                        logger.info(f"🔄 Retrying step '{step.name}' in {retry_delay}s...")
-                        time.sleep(retry_delay)
+        if model.provider == ModelProvider.DIFY_RAG:
+            # External RAG service (Dify on Hetzner)
+            rag_client = get_dify_rag_client()
+            if not rag_client.is_enabled:
+                logger.info(f"Dify RAG not configured, skipping '{step.name}'")
+                return {"text": "", "input_tokens": 0, "output_tokens": 0}
+
+            answer, rag_metadata = await rag_client.query_guidelines(
+                medical_text=input_text,
+                document_type=context.get("document_type", "UNKNOWN"),
+                target_language=context.get("target_language", "en"),
+                user_id=processing_id or "pipeline",
+            )
+            if rag_metadata.get("skipped"):
+                logger.info(
+                    f"Dify RAG skipped for '{step.name}': {rag_metadata.get('reason', rag_metadata.get('error', 'unknown'))}"
+                )
+                return {"text": "", "input_tokens": 0, "output_tokens": 0}
+            return {"text": answer, "input_tokens": 0, "output_tokens": 0}
+
+        # Use OVH AI Endpoints (default)
+        if stream:
+            publisher = PartialOutputPublisher(
+                self.progress_tracker,
+                processing_id,
+                step.name,
+                interval_seconds=settings.pipeline_stream_interval_ms / 1000,
+                attempt=attempt,
+            )
+            await publisher.start()
+            result_dict = await self.ovh_client.process_medical_text_with_prompt_streaming(
+                full_prompt=prompt,
+                on_delta=publisher.add,
+                temperature=step.temperature or 0.7,
+                max_tokens=step.max_tokens or model.max_tokens or 4096,
+                use_fast_model=(model.name == "Mistral-Nemo-Instruct-2407"),
+                system_prompt=system_prompt,
+            )
+            if not result_dict["text"].startswith("Error"):
+                await publisher.finish(result_dict["text"])
+        else:
+            result_dict = await self.ovh_client.process_medical_text_with_prompt(
+                full_prompt=prompt,
+                temperature=step.temperature or 0.7,
+                max_tokens=step.max_tokens or model.max_tokens or 4096,
+                use_fast_model=(model.name == "Mistral-Nemo-Instruct-2407"),
+                system_prompt=system_prompt,
+            )
 
-        # All retries failed
-        return False, "", last_error or "Unknown error"
+        # OVHClient reports API errors as "Error..." text instead of raising
+        result = result_dict["text"]
+        if result.startswith("Error"):
+            if is_infrastructure_error(Exception(result)):
+                logger.warning(f"⚠️ OVH infrastructure error (503): {result[:200]}")
+                raise ServiceUnavailableError(result, service_name="ovh-ai-api")
+            logger.warning(f"⚠️ API error: {result}")
+            raise ExternalServiceError(result, service_name="ovh-ai-api")
+
+        return result_dict
 
     # ==================== PIPELINE EXECUTION ====================
 
@@ -843,9 +1296,41 @@ class ModularPipelineExecutor:
             - success: True if pipeline completed, False if error occurred
             - final_output: Processed text from pipeline
             - execution_metadata: Complete metadata including errors if any
+
+        Steps that don't read the previous step's output (input_source) are
+        started as soon as their dependencies are done and run concurrently with
+        earlier steps (see PipelineStepScheduler); results are still applied,
+        logged and reported in step order.
         """
         context = context or {}
 
+        async def run_step(step, step_input, step_context):
+            return await self.execute_step(
+                step=step,
+                input_text=step_input,
+                context=step_context,
+                processing_id=processing_id,
+                document_type=step_context.get("document_type"),
+            )
+
+        scheduler = PipelineStepScheduler(
+            run_step=run_step, max_parallel=settings.pipeline_max_parallel_steps
+        )
+        try:
+            return await self._execute_pipeline_phases(
+                processing_id, input_text, context, scheduler
+            )
+        finally:
+            await scheduler.close()
+
+    async def _execute_pipeline_phases(
+        self,
+        processing_id: str,
+        input_text: str,
+        context: dict[str, Any],
+        scheduler: PipelineStepScheduler,
+    ) -> tuple[bool, str, dict[str, Any]]:
+        """Run the universal, class-specific and post-branching phases (see execute_pipeline)."""
         logger.info(
             f"🚀 Starting modular pipeline execution with branching support: {processing_id[:8]}"
         )
@@ -900,6 +1385,10 @@ class ModularPipelineExecutor:
         branch_metadata = None  # Stores branching metadata (replaces branch_value)
         document_class_specific_steps = []
 
+        scheduler.start_phase(
+            universal_steps,
+            should_run=lambda s: not self._get_missing_context_variables(s, context),
+        )
         for idx, step in enumerate(universal_steps):
             step_start_time = time.time()
             all_steps.append(step)
@@ -926,11 +1415,7 @@ class ModularPipelineExecutor:
 
             # Check if step has required context variables
             if step.required_context_variables:
-                missing_vars = [
-                    var
-                    for var in step.required_context_variables
-                    if var not in context or context[var] is None
-                ]
+                missing_vars = self._get_missing_context_variables(step, context)
 
                 if missing_vars:
                     logger.info(
@@ -968,16 +1453,13 @@ class ModularPipelineExecutor:
                     # Continue to next step without updating current_output
                     continue
 
-            # Execute step
-            success, output, error = await self.execute_step(
-                step=step,
-                input_text=current_output,
-                context=context,
-                processing_id=processing_id,
-                document_type=context.get("document_type"),
-            )
+            # Execute step (or wait for it, if it was started ahead of order)
+            scheduler.start_ready(idx, current_output, context)
+            outcome = await scheduler.result(idx)
+            success, output, error = outcome.success, outcome.output, outcome.error
 
-            step_execution_time = time.time() - step_start_time
+            step_start_time = min(step_start_time, outcome.started_at)
+            step_execution_time = outcome.finished_at - step_start_time
 
             # Prepare step metadata (will be populated for branching steps)
             step_metadata_dict = None
@@ -1063,7 +1545,7 @@ class ModularPipelineExecutor:
                 job_id=job_id,
                 step=step,
                 status=StepExecutionStatus.COMPLETED if success else StepExecutionStatus.FAILED,
-                input_text=current_output,
+                input_text=outcome.input_text,
                 output_text=output if success else None,
                 step_start_time=step_start_time,
                 error=error,
@@ -1116,6 +1598,7 @@ class ModularPipelineExecutor:
                 f"📋 Phase 2: Executing {len(document_class_specific_steps)} class-specific steps"
             )
 
+            scheduler.start_phase(document_class_specific_steps)
             for idx, step in enumerate(document_class_specific_steps):
                 step_start_time = time.time()
                 all_steps.append(step)
@@ -1139,16 +1622,13 @@ class ModularPipelineExecutor:
                     f"▶️  Step {idx + 1}/{len(document_class_specific_steps)}: {step.name} [{execution_metadata['document_class']['class_key']}]"
                 )
 
-                # Execute step
-                success, output, error = await self.execute_step(
-                    step=step,
-                    input_text=current_output,
-                    context=context,
-                    processing_id=processing_id,
-                    document_type=context.get("document_type"),
-                )
+                # Execute step (or wait for it, if it was started ahead of order)
+                scheduler.start_ready(idx, current_output, context)
+                outcome = await scheduler.result(idx)
+                success, output, error = outcome.success, outcome.output, outcome.error
 
-                step_execution_time = time.time() - step_start_time
+                step_start_time = min(step_start_time, outcome.started_at)
+                step_execution_time = outcome.finished_at - step_start_time
 
                 # Prepare step metadata (class-specific steps could also be branching)
                 step_metadata_dict = None
@@ -1206,7 +1686,7 @@ class ModularPipelineExecutor:
                     job_id=job_id,
                     step=step,
                     status=StepExecutionStatus.COMPLETED if success else StepExecutionStatus.FAILED,
-                    input_text=current_output,
+                    input_text=outcome.input_text,
                     output_text=output if success else None,
                     step_start_time=step_start_time,
                     error=error,
@@ -1256,6 +1736,10 @@ class ModularPipelineExecutor:
                 f"📋 Phase 3: Executing {len(post_branching_steps)} post-branching universal steps"
             )
 
+            scheduler.start_phase(
+                post_branching_steps,
+                should_run=lambda s: not self._get_missing_context_variables(s, context),
+            )
             for idx, step in enumerate(post_branching_steps):
                 step_start_time = time.time()
                 all_steps.append(step)
@@ -1285,11 +1769,7 @@ class ModularPipelineExecutor:
 
                 # Check if step has required context variables
                 if step.required_context_variables:
-                    missing_vars = [
-                        var
-                        for var in step.required_context_variables
-                        if var not in context or context[var] is None
-                    ]
+                    missing_vars = self._get_missing_context_variables(step, context)
 
                     if missing_vars:
                         logger.info(
@@ -1329,16 +1809,13 @@ class ModularPipelineExecutor:
                         # Continue to next step without updating current_output
                         continue
 
-                # Execute step
-                success, output, error = await self.execute_step(
-                    step=step,
-                    input_text=current_output,
-                    context=context,
-                    processing_id=processing_id,
-                    document_type=context.get("document_type"),
-                )
+                # Execute step (or wait for it, if it was started ahead of order)
+                scheduler.start_ready(idx, current_output, context)
+                outcome = await scheduler.result(idx)
+                success, output, error = outcome.success, outcome.output, outcome.error
 
-                step_execution_time = time.time() - step_start_time
+                step_start_time = min(step_start_time, outcome.started_at)
+                step_execution_time = outcome.finished_at - step_start_time
 
                 # Check for stop conditions (early termination) - PHASE 3
                 should_terminate, current_output, execution_metadata = self._handle_stop_condition(
@@ -1360,7 +1837,7 @@ class ModularPipelineExecutor:
                     job_id=job_id,
                     step=step,
                     status=StepExecutionStatus.COMPLETED if success else StepExecutionStatus.FAILED,
-                    input_text=current_output,
+                    input_text=outcome.input_text,
                     output_text=output if success else None,
                     step_start_time=step_start_time,
                     error=error,
@@ -1420,6 +1897,7 @@ class ModularPipelineExecutor:
             logger.info(
                 f"📄 Document class: {execution_metadata['document_class']['display_name']}"
             )
+        self._report_text_storage(job_id, execution_metadata)
 
         await self.progress_tracker.cleanup(processing_id)
 
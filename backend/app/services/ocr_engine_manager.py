@@ -4,8 +4,12 @@ OCR Engine Manager
 Simplified OCR service with two engines:
 1. Mistral OCR (primary) - Fast, accurate document OCR
 2. PaddleOCR Hetzner (fallback) - External service via EXTERNAL_OCR_URL
+
+Born-digital PDFs skip OCR: pages with a usable embedded text layer are
+extracted locally and only image-only pages go to the OCR engine.
 """
 
+import asyncio
 import base64
 from io import BytesIO
 import logging
@@ -14,12 +18,15 @@ import time
 from typing import Any
 
 import httpx
-from pdf2image import convert_from_bytes
+from pdf2image import convert_from_bytes, pdfinfo_from_bytes
+import pdfplumber
+from pypdf import PdfReader, PdfWriter
 from sqlalchemy.orm import Session
 
 from app.database.modular_pipeline_models import OCRConfigurationDB, OCREngineEnum
 from app.models.ocr_result import OCRResult
 from app.repositories.ocr_configuration_repository import OCRConfigurationRepository
+from app.services.file_quality_detector import evaluate_text_quality
 
 logger = logging.getLogger(__name__)
 
@@ -36,6 +43,17 @@ MISTRAL_API_KEY = os.getenv("MISTRAL_API_KEY", "")
 if MISTRAL_API_KEY:
     logger.info("🔮 Mistral OCR API key configured")
 
+# Max PDF pages rendered and sent to Mistral OCR at the same time
+MISTRAL_OCR_MAX_CONCURRENCY = max(1, int(os.getenv("MISTRAL_OCR_MAX_CONCURRENCY", "4")))
+MISTRAL_OCR_DPI = 200
+
+# Embedded-text fast path for PDFs (per-page hybrid extraction)
+OCR_EMBEDDED_TEXT_ENABLED = os.getenv("OCR_EMBEDDED_TEXT_ENABLED", "true").lower() == "true"
+EMBEDDED_TEXT_MIN_CHARS = 50  # Shorter text layers (page numbers, stamps) are OCR'd
+EMBEDDED_TEXT_MIN_QUALITY = 0.5  # evaluate_text_quality() score for a usable page
+EMBEDDED_TEXT_CONFIDENCE = 0.99
+PAGE_SEPARATOR = "\n\n---\n\n"
+
 
 class OCREngineManager:
     """Simplified OCR engine manager with Mistral (primary) and PaddleOCR (fallback).
@@ -103,14 +121,20 @@ class OCREngineManager:
         file_type: str,
         filename: str,
         override_engine: OCREngineEnum | None = None,
+        quality_analysis: dict[str, Any] | None = None,
     ) -> OCRResult:
         """Extract text from document using configured OCR engine.
 
+        PDFs first go through the embedded-text fast path: pages with a good text
+        layer are extracted locally, only the remaining pages are OCR'd.
+
         Args:
             file_content: Document content as bytes
             file_type: File type ('pdf', 'jpg', 'png')
             filename: Original filename
             override_engine: Optional engine override
+            quality_analysis: Upload-time FileQualityDetector PDF analysis (optional);
+                scanned PDFs are sent straight to OCR without probing the text layer
 
         Returns:
             OCRResult with extracted text, confidence, and metadata
@@ -123,15 +147,16 @@ class OCREngineManager:
         logger.info(f"🔍 Starting OCR with engine: {selected_engine}")
 
         try:
-            if selected_engine == OCREngineEnum.MISTRAL_OCR:
-                return await self._extract_with_mistral_ocr(file_content, file_type, filename)
-
-            if selected_engine == OCREngineEnum.PADDLEOCR:
-                return await self._extract_with_paddleocr(file_content, file_type, filename)
+            if file_type.lower() == "pdf" and OCR_EMBEDDED_TEXT_ENABLED:
+                hybrid_result = await self._extract_pdf_hybrid(
+                    file_content, filename, selected_engine, quality_analysis
+                )
+                if hybrid_result is not None:
+                    return hybrid_result
 
-            # Default to Mistral
-            logger.warning(f"⚠️ Unknown engine {selected_engine}, using Mistral OCR")
-            return await self._extract_with_mistral_ocr(file_content, file_type, filename)
+            return await self._extract_with_engine(
+                selected_engine, file_content, file_type, filename
+            )
 
         except Exception as e:
             logger.error(f"❌ OCR extraction failed: {e}")
@@ -139,6 +164,20 @@ class OCREngineManager:
                 text=f"OCR extraction error: {str(e)}", confidence=0.0, engine=str(selected_engine)
             )
 
+    async def _extract_with_engine(
+        self, engine: OCREngineEnum, file_content: bytes, file_type: str, filename: str
+    ) -> OCRResult:
+        """Run the given OCR engine on the whole document."""
+        if engine == OCREngineEnum.MISTRAL_OCR:
+            return await self._extract_with_mistral_ocr(file_content, file_type, filename)
+
+        if engine == OCREngineEnum.PADDLEOCR:
+            return await self._extract_with_paddleocr(file_content, file_type, filename)
+
+        # Default to Mistral
+        logger.warning(f"⚠️ Unknown engine {engine}, using Mistral OCR")
+        return await self._extract_with_mistral_ocr(file_content, file_type, filename)
+
     async def extract_text_legacy(
         self,
         file_content: bytes,
@@ -150,6 +189,140 @@ class OCREngineManager:
         result = await self.extract_text(file_content, file_type, filename, override_engine)
         return result.text, result.confidence
 
+    # ==================== EMBEDDED TEXT (HYBRID) ====================
+
+    @staticmethod
+    def _is_scanned_pdf(quality_analysis: dict[str, Any] | None) -> bool:
+        """Whether the upload-time analysis found no text layer on any page of the PDF."""
+        if not quality_analysis or quality_analysis.get("error"):
+            return False
+        page_count = quality_analysis.get("page_count", 0)
+        pages_checked = quality_analysis.get("pages_checked", min(5, page_count))
+        return (
+            not quality_analysis.get("has_embedded_text", False) and 0 < page_count <= pages_checked
+        )
+
+    @staticmethod
+    def _extract_embedded_pages(file_content: bytes) -> list[str]:
+        """Extract the embedded text layer of every PDF page (empty string if none)."""
+        with pdfplumber.open(BytesIO(file_content)) as pdf:
+            return [(page.extract_text() or "").strip() for page in pdf.pages]
+
+    @staticmethod
+    def _is_usable_text_page(page_text: str) -> bool:
+        """Whether a page's embedded text is good enough to skip OCR."""
+        return (
+            len(page_text) >= EMBEDDED_TEXT_MIN_CHARS
+            and evaluate_text_quality(page_text) >= EMBEDDED_TEXT_MIN_QUALITY
+        )
+
+    @staticmethod
+    def _build_page_range_pdf(file_content: bytes, first_page: int, last_page: int) -> bytes:
+        """Build a PDF containing only pages first_page..last_page (1-based, inclusive)."""
+        reader = PdfReader(BytesIO(file_content))
+        writer = PdfWriter()
+        for page_index in range(first_page - 1, last_page):
+            writer.add_page(reader.pages[page_index])
+        buffer = BytesIO()
+        writer.write(buffer)
+        return buffer.getvalue()
+
+    async def _extract_pdf_hybrid(
+        self,
+        file_content: bytes,
+        filename: str,
+        engine: OCREngineEnum,
+        quality_analysis: dict[str, Any] | None = None,
+    ) -> OCRResult | None:
+        """Per-page hybrid extraction: embedded text where usable, OCR elsewhere.
+
+        Consecutive pages without a usable text layer are OCR'd together as one
+        page-range PDF, and all parts are reassembled in page order.
+
+        Returns:
+            OCRResult, or None if no page has usable embedded text (caller runs
+            full-document OCR as before)
+        """
+        if self._is_scanned_pdf(quality_analysis):
+            logger.info("📄 Upload analysis found no text layer, using OCR for all pages")
+            return None
+
+        start_time = time.time()
+        try:
+            page_texts = await asyncio.to_thread(self._extract_embedded_pages, file_content)
+        except Exception as e:
+            logger.warning(f"⚠️ Embedded text extraction failed, using OCR: {e}")
+            return None
+
+        usable = [self._is_usable_text_page(text) for text in page_texts]
+        page_count = len(page_texts)
+        local_count = sum(usable)
+        if local_count == 0:
+            return None
+
+        local_latency = round((time.time() - start_time) / page_count, 3)
+        logger.info(
+            f"⚡ Embedded text fast path: {local_count}/{page_count} pages local, "
+            f"{page_count - local_count} pages via OCR"
+        )
+
+        parts: list[str] = []
+        page_latencies: list[float] = []
+        weighted_confidence = 0.0
+        ocr_engine_used = None
+
+        page_num = 1
+        while page_num <= page_count:
+            if usable[page_num - 1]:
+                parts.append(page_texts[page_num - 1])
+                page_latencies.append(local_latency)
+                weighted_confidence += EMBEDDED_TEXT_CONFIDENCE
+                page_num += 1
+                continue
+
+            # Collect the run of consecutive pages that need OCR
+            last_page = page_num
+            while last_page < page_count and not usable[last_page]:
+                last_page += 1
+            run_pages = last_page - page_num + 1
+
+            run_pdf = await asyncio.to_thread(
+                self._build_page_range_pdf, file_content, page_num, last_page
+            )
+            run_result = await self._extract_with_engine(
+                engine, run_pdf, "pdf", f"{filename} (pages {page_num}-{last_page})"
+            )
+            ocr_engine_used = ocr_engine_used or run_result.engine
+
+            if run_result.text:
+                parts.append(run_result.text)
+            if len(run_result.page_latencies) == run_pages:
+                page_latencies.extend(run_result.page_latencies)
+            else:
+                page_latencies.extend(
+                    [round(run_result.processing_time / run_pages, 3)] * run_pages
+                )
+            weighted_confidence += run_result.confidence * run_pages
+
+            page_num = last_page + 1
+
+        extracted_text = PAGE_SEPARATOR.join(parts)
+        processing_time = time.time() - start_time
+
+        logger.info(
+            f"✅ Hybrid extraction completed in {processing_time:.2f}s: {len(extracted_text)} chars"
+        )
+
+        return OCRResult(
+            text=extracted_text,
+            confidence=round(weighted_confidence / page_count, 4),
+            markdown=extracted_text,
+            processing_time=processing_time,
+            engine=ocr_engine_used or "EMBEDDED_TEXT",
+            mode="hybrid" if ocr_engine_used else "text",
+            page_latencies=page_latencies,
+        )
+
     # ==================== MISTRAL OCR ====================
 
     async def _extract_with_mistral_ocr(
@@ -169,39 +342,31 @@ class OCREngineManager:
             return await self._extract_with_paddleocr(file_content, file_type, filename)
 
         start_time = time.time()
+        page_latencies: list[float] = []
 
         try:
             client = Mistral(api_key=MISTRAL_API_KEY)
-            all_markdown = []
 
             if file_type.lower() == "pdf":
-                logger.info("📄 Converting PDF pages to images for Mistral OCR...")
-
                 try:
-                    images = convert_from_bytes(file_content, dpi=200, fmt="png")
-                    logger.info(f"📄 Converted PDF to {len(images)} page images")
+                    page_count = await asyncio.to_thread(self._count_pdf_pages, file_content)
                 except Exception as e:
-                    logger.error(f"❌ PDF to image conversion failed: {e}")
+                    logger.error(f"❌ PDF page count failed: {e}")
                     return await self._extract_with_paddleocr(file_content, file_type, filename)
 
-                for page_num, image in enumerate(images, 1):
-                    logger.info(f"📤 Processing page {page_num}/{len(images)} with Mistral OCR...")
-
-                    img_buffer = BytesIO()
-                    image.save(img_buffer, format="PNG")
-                    img_bytes = img_buffer.getvalue()
-                    b64_content = base64.b64encode(img_bytes).decode("utf-8")
-                    data_url = f"data:image/png;base64,{b64_content}"
-
-                    ocr_response = client.ocr.process(
-                        model="mistral-ocr-latest",
-                        document={"type": "image_url", "image_url": {"url": data_url}},
-                        include_image_base64=False,
-                    )
+                logger.info(
+                    f"📄 OCR of {page_count} PDF pages with Mistral "
+                    f"(max {MISTRAL_OCR_MAX_CONCURRENCY} concurrent)"
+                )
+                page_results = await self._ocr_pdf_pages_with_mistral(
+                    client, file_content, page_count
+                )
 
-                    for page in ocr_response.pages:
-                        if page.markdown:
-                            all_markdown.append(page.markdown)
+                # Reassemble in page order
+                all_markdown = []
+                for page_markdown, latency in page_results:
+                    all_markdown.extend(page_markdown)
+                    page_latencies.append(latency)
             else:
                 # For images, send directly
                 if file_type.lower() in ("jpg", "jpeg"):
@@ -216,17 +381,11 @@ class OCREngineManager:
 
                 logger.info("📤 Calling Mistral OCR API")
 
-                ocr_response = client.ocr.process(
-                    model="mistral-ocr-latest",
-                    document={"type": "image_url", "image_url": {"url": data_url}},
-                    include_image_base64=False,
-                )
-
-                for page in ocr_response.pages:
-                    if page.markdown:
-                        all_markdown.append(page.markdown)
+                page_start = time.time()
+                all_markdown = await self._mistral_ocr_image(client, data_url)
+                page_latencies.append(round(time.time() - page_start, 3))
 
-            extracted_text = "\n\n---\n\n".join(all_markdown)
+            extracted_text = PAGE_SEPARATOR.join(all_markdown)
             processing_time = time.time() - start_time
 
             logger.info(f"✅ Mistral OCR completed in {processing_time:.2f}s")
@@ -239,6 +398,7 @@ class OCREngineManager:
                 processing_time=processing_time,
                 engine="MISTRAL_OCR",
                 mode="mistral",
+                page_latencies=page_latencies,
             )
 
         except Exception as e:
@@ -246,6 +406,71 @@ class OCREngineManager:
             logger.info("🔄 Falling back to PaddleOCR")
             return await self._extract_with_paddleocr(file_content, file_type, filename)
 
+    @staticmethod
+    def _count_pdf_pages(file_content: bytes) -> int:
+        """Read the page count from the PDF without rendering it."""
+        return int(pdfinfo_from_bytes(file_content)["Pages"])
+
+    @staticmethod
+    def _render_pdf_page(file_content: bytes, page_num: int) -> str:
+        """Render a single PDF page (1-based) to a PNG data URL."""
+        images = convert_from_bytes(
+            file_content,
+            dpi=MISTRAL_OCR_DPI,
+            fmt="png",
+            first_page=page_num,
+            last_page=page_num,
+        )
+        img_buffer = BytesIO()
+        images[0].save(img_buffer, format="PNG")
+        b64_content = base64.b64encode(img_buffer.getvalue()).decode("utf-8")
+        return f"data:image/png;base64,{b64_content}"
+
+    @staticmethod
+    async def _mistral_ocr_image(client: Any, data_url: str) -> list[str]:
+        """Run Mistral OCR on one image and return the non-empty page markdown."""
+        ocr_response = await client.ocr.process_async(
+            model="mistral-ocr-latest",
+            document={"type": "image_url", "image_url": {"url": data_url}},
+            include_image_base64=False,
+        )
+        return [page.markdown for page in ocr_response.pages if page.markdown]
+
+    async def _ocr_pdf_pages_with_mistral(
+        self, client: Any, file_content: bytes, page_count: int
+    ) -> list[tuple[list[str], float]]:
+        """OCR all PDF pages concurrently with bounded parallelism.
+
+        Each page is rendered only once it holds a semaphore slot, so at most
+        MISTRAL_OCR_MAX_CONCURRENCY rendered pages are in memory at a time.
+
+        Returns:
+            List of (markdown_blocks, latency_seconds) in page order. Latency covers
+            rendering plus the OCR round trip, excluding time waiting for a slot.
+        """
+        semaphore = asyncio.Semaphore(MISTRAL_OCR_MAX_CONCURRENCY)
+
+        async def process_page(page_num: int) -> tuple[list[str], float]:
+            async with semaphore:
+                page_start = time.time()
+                data_url = await asyncio.to_thread(self._render_pdf_page, file_content, page_num)
+                markdown = await self._mistral_ocr_image(client, data_url)
+                latency = round(time.time() - page_start, 3)
+                logger.info(f"📤 Page {page_num}/{page_count} OCR done in {latency:.2f}s")
+                return markdown, latency
+
+        tasks = [
+            asyncio.create_task(process_page(page_num)) for page_num in range(1, page_count + 1)
+        ]
+        try:
+            # gather() preserves input order regardless of completion order
+            return await asyncio.gather(*tasks)
+        except Exception:
+            # Don't keep paying for pages once the document falls back to PaddleOCR
+            for task in tasks:
+                task.cancel()
+            raise
+
     # ==================== PADDLEOCR (HETZNER) ====================
 
     async def _extract_with_paddleocr(
@@ -1,5 +1,6 @@
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Awaitable, Callable
 import logging
+import time
 from typing import Any
 
 from openai import AsyncOpenAI
@@ -103,6 +104,11 @@ class OVHClient:
         # Alternative HTTP client for direct API calls
         self.timeout = settings.ai_timeout_seconds
 
+    async def aclose(self) -> None:
+        """Close the underlying HTTP connection pool."""
+        if self.client is not None:
+            await self.client.close()
+
     async def check_connection(self) -> tuple[bool, str]:
         """Verify connectivity and authentication with OVH AI Endpoints.
 
@@ -324,6 +330,115 @@ class OVHClient:
                 "model": model_to_use,
             }
 
+    async def process_medical_text_with_prompt_streaming(
+        self,
+        full_prompt: str,
+        on_delta: Callable[[str], Awaitable[None]],
+        temperature: float = 0.3,
+        max_tokens: int = 4000,
+        use_fast_model: bool = False,
+        system_prompt: str | None = None,
+    ) -> dict[str, Any]:
+        """Streaming variant of process_medical_text_with_prompt().
+
+        Sends the same request with stream=True and passes every generated text
+        fragment to on_delta as it arrives. The returned dict has the same shape
+        and text as the non-streaming call, so callers can switch modes without
+        changing how results are handled.
+
+        Args:
+            full_prompt: Complete prompt including instructions and input text
+            on_delta: Awaited with each generated text fragment
+            temperature: Sampling temperature (0.0-1.0)
+            max_tokens: Maximum tokens to generate in response
+            use_fast_model: If True, uses Mistral Nemo, otherwise Llama 3.3 70B
+            system_prompt: Optional system message for role separation
+
+        Returns:
+            dict[str, Any]: Same keys as process_medical_text_with_prompt(), plus
+                time_to_first_token (float | None): Seconds until the first text
+                fragment arrived (None if nothing was generated)
+        """
+        if not self.access_token:
+            logger.error("❌ OVH API token not configured")
+            return {
+                "text": "Error: OVH API token not configured. Please set OVH_AI_ENDPOINTS_ACCESS_TOKEN in .env",
+                "input_tokens": 0,
+                "output_tokens": 0,
+                "total_tokens": 0,
+                "model": None,
+                "time_to_first_token": None,
+            }
+
+        model_to_use = self.preprocessing_model if use_fast_model else self.main_model
+        time_to_first_token = None
+
+        try:
+            logger.debug(f"🚀 Streaming with OVH {model_to_use}")
+
+            messages = []
+            if system_prompt:
+                messages.append({"role": "system", "content": system_prompt})
+            messages.append({"role": "user", "content": full_prompt})
+
+            start_time = time.time()
+            stream = await self.client.chat.completions.create(
+                model=model_to_use,
+                messages=messages,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                top_p=0.9,
+                stream=True,
+                stream_options={"include_usage": True},
+            )
+
+            parts = []
+            usage = None
+            async for chunk in stream:
+                # The final chunk carries the token usage and no choices
+                if getattr(chunk, "usage", None):
+                    usage = chunk.usage
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta.content
+                if not delta:
+                    continue
+                if time_to_first_token is None:
+                    time_to_first_token = time.time() - start_time
+                parts.append(delta)
+                await on_delta(delta)
+
+            input_tokens = getattr(usage, "prompt_tokens", 0) if usage else 0
+            output_tokens = getattr(usage, "completion_tokens", 0) if usage else 0
+            total_tokens = getattr(usage, "total_tokens", 0) if usage else 0
+
+            if not usage:
+                logger.warning("⚠️ API stream has no usage data")
+
+            logger.debug(
+                f"✅ OVH streaming successful with {model_to_use} - {total_tokens} tokens"
+            )
+
+            return {
+                "text": "".join(parts).strip(),
+                "input_tokens": input_tokens,
+                "output_tokens": output_tokens,
+                "total_tokens": total_tokens,
+                "model": model_to_use,
+                "time_to_first_token": time_to_first_token,
+            }
+
+        except Exception as e:
+            logger.error(f"❌ OVH streaming error: {e}")
+            return {
+                "text": f"Error processing with OVH API: {str(e)}",
+                "input_tokens": 0,
+                "output_tokens": 0,
+                "total_tokens": 0,
+                "model": model_to_use,
+                "time_to_first_token": time_to_first_token,
+            }
+
     async def process_prompt_with_optimization(
         self,
         full_prompt: str,
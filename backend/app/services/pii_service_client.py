@@ -9,17 +9,27 @@ Environment Variables:
     EXTERNAL_PII_API_KEY: API key for authentication
     USE_EXTERNAL_PII: Set to 'true' to use external service
 
+Custom protection terms:
+    The custom terms from system_settings are cached per process (clients are
+    created per job) and registered once per service with
+    PUT /term-sets/{term_hash}. Requests then only send the hash. If the service
+    no longer knows the hash (restart, eviction) it answers 409 and the terms are
+    registered again; services without the endpoint get the terms inline.
+
 Usage:
     >>> client = PIIServiceClient()
     >>> cleaned, metadata = await client.remove_pii("Patient: Max Mustermann", "de")
 """
 
 import asyncio
+import hashlib
 import json
 import logging
 import os
 import re
-from typing import Literal
+import threading
+import time
+from typing import Any, Literal
 
 import httpx
 
@@ -133,6 +143,27 @@ USE_EXTERNAL_PII = os.getenv("USE_EXTERNAL_PII", "false").lower() == "true"
 FALLBACK_PII_URL = os.getenv("FALLBACK_PII_URL", "")
 FALLBACK_PII_API_KEY = os.getenv("FALLBACK_PII_API_KEY", "")
 
+# Custom protection terms are reloaded from the database after this many seconds
+CUSTOM_TERMS_CACHE_SECONDS = 60
+
+# Process-wide custom term cache: (normalized terms, term set hash)
+_custom_terms_lock = threading.Lock()
+_custom_terms_cache: tuple[list[str], str] | None = None
+_custom_terms_cache_time: float = 0
+
+# (service URL, term set hash) pairs the service has confirmed
+_registered_term_sets: set[tuple[str, str]] = set()
+
+
+def _normalize_terms(terms: list[str]) -> list[str]:
+    """Strip, lowercase, deduplicate and sort terms (must match the PII service)."""
+    return sorted({term.strip().lower() for term in terms if term and term.strip()})
+
+
+def _term_set_hash(normalized_terms: list[str]) -> str:
+    """SHA-256 of the normalized terms, as computed by the PII service."""
+    return hashlib.sha256("\n".join(normalized_terms).encode("utf-8")).hexdigest()
+
 
 class PIIServiceClient:
     """
@@ -143,7 +174,7 @@ class PIIServiceClient:
     - Automatic fallback to Railway service if Hetzner unavailable
     - Configurable timeout for large documents
     - Health check support
-    - Syncs custom protection terms from database with each request
+    - Syncs custom protection terms from database as a registered term set
     """
 
     def __init__(
@@ -176,8 +207,6 @@ class PIIServiceClient:
 
         self.timeout = timeout
         self.fallback_timeout = fallback_timeout
-        self._custom_terms_cache: list[str] | None = None
-        self._custom_terms_cache_time: float = 0
 
         if self.url:
             logger.info(f"PII Service Client initialized - Primary: {self.url}")
@@ -196,14 +225,26 @@ class PIIServiceClient:
         - privacy_filter.custom_eponyms
 
         Returns:
-            Combined list of all custom protection terms
+            Normalized (lowercase, unique, sorted) list of all custom protection terms
+        """
+        term_set = self._get_custom_term_set()
+        return term_set[0] if term_set else []
+
+    def _get_custom_term_set(self) -> tuple[list[str], str] | None:
         """
-        import time
+        Get the custom protection terms and their term set hash.
 
-        # Cache for 60 seconds to avoid DB hits on every request
-        if self._custom_terms_cache is not None:
-            if time.time() - self._custom_terms_cache_time < 60:
-                return self._custom_terms_cache
+        Cached per process for CUSTOM_TERMS_CACHE_SECONDS to avoid DB hits on
+        every request.
+
+        Returns:
+            Tuple of (normalized terms, hash), or None if there are no custom terms
+        """
+        global _custom_terms_cache, _custom_terms_cache_time
+
+        with _custom_terms_lock:
+            if time.time() - _custom_terms_cache_time < CUSTOM_TERMS_CACHE_SECONDS:
+                return _custom_terms_cache
 
         all_terms: list[str] = []
 
@@ -230,15 +271,86 @@ class PIIServiceClient:
                         except json.JSONDecodeError:
                             logger.warning(f"Invalid JSON in {key}")
 
-            # Update cache
-            self._custom_terms_cache = all_terms
-            self._custom_terms_cache_time = time.time()
-            logger.debug(f"Loaded {len(all_terms)} custom protection terms from database")
-
         except Exception as e:
             logger.warning(f"Could not load custom terms from database: {e}")
+            with _custom_terms_lock:
+                return _custom_terms_cache
+
+        normalized = _normalize_terms(all_terms)
+        term_set = (normalized, _term_set_hash(normalized)) if normalized else None
+
+        with _custom_terms_lock:
+            _custom_terms_cache = term_set
+            _custom_terms_cache_time = time.time()
+        logger.debug(f"Loaded {len(normalized)} custom protection terms from database")
+
+        return term_set
+
+    async def _register_term_set(
+        self,
+        client: httpx.AsyncClient,
+        url: str,
+        headers: dict[str, str],
+        terms: list[str],
+        term_hash: str,
+    ) -> bool:
+        """
+        Register custom protection terms with a PII service.
+
+        Returns:
+            True if registered, False if the service has no term set endpoint
+        """
+        response = await client.put(
+            f"{url}/term-sets/{term_hash}", json={"terms": terms}, headers=headers
+        )
+
+        if response.status_code == 200:
+            _registered_term_sets.add((url, term_hash))
+            logger.info(f"Registered {len(terms)} custom protection terms with {url}")
+            return True
+
+        if response.status_code in (404, 405):
+            logger.debug(f"PII service {url} has no term set endpoint, sending terms inline")
+            return False
+
+        if response.status_code in (401, 403):
+            raise Exception(f"PII service authentication failed: {response.status_code}")
+
+        raise Exception(f"PII term set registration failed: {response.status_code}")
+
+    async def _post_with_term_set(
+        self,
+        client: httpx.AsyncClient,
+        url: str,
+        path: str,
+        payload: dict[str, Any],
+        headers: dict[str, str],
+        term_set: tuple[list[str], str] | None,
+    ) -> httpx.Response:
+        """POST a PII request referencing the custom term set by hash."""
+        if term_set is None:
+            return await client.post(f"{url}{path}", json=payload, headers=headers)
+
+        terms, term_hash = term_set
+        for _ in range(2):
+            if (url, term_hash) not in _registered_term_sets:
+                if not await self._register_term_set(client, url, headers, terms, term_hash):
+                    return await client.post(
+                        f"{url}{path}",
+                        json={**payload, "custom_protection_terms": terms},
+                        headers=headers,
+                    )
+
+            response = await client.post(
+                f"{url}{path}", json={**payload, "custom_terms_hash": term_hash}, headers=headers
+            )
+            if response.status_code != 409:
+                return response
+
+            # Service restarted or evicted the term set: register it again
+            _registered_term_sets.discard((url, term_hash))
 
-        return all_terms
+        return response
 
     @property
     def is_external_enabled(self) -> bool:
@@ -402,19 +514,20 @@ class PIIServiceClient:
         if api_key:
             headers["X-API-Key"] = api_key
 
-        # Load custom terms from database to sync with external service
-        custom_terms = self._load_custom_terms_from_db()
+        # Custom terms from database, registered with the service as a term set
+        term_set = self._get_custom_term_set()
 
         payload = {
             "text": text,
             "language": language,
             "include_metadata": include_metadata,
-            "custom_protection_terms": custom_terms if custom_terms else None,
         }
 
         request_timeout = timeout or self.timeout
         async with httpx.AsyncClient(timeout=request_timeout) as client:
-            response = await client.post(f"{url}/remove-pii", json=payload, headers=headers)
+            response = await self._post_with_term_set(
+                client, url, "/remove-pii", payload, headers, term_set
+            )
 
             if response.status_code == 200:
                 result = response.json()
@@ -424,7 +537,7 @@ class PIIServiceClient:
                 cleaned_text = _post_process_pii_cleanup(cleaned_text)
 
                 metadata = result.get("metadata", {})
-                metadata["custom_terms_synced"] = len(custom_terms) if custom_terms else 0
+                metadata["custom_terms_synced"] = len(term_set[0]) if term_set else 0
                 metadata["post_processed"] = True
                 return cleaned_text, metadata
 
@@ -538,19 +651,20 @@ class PIIServiceClient:
         if api_key:
             headers["X-API-Key"] = api_key
 
-        # Load custom terms from database to sync with external service
-        custom_terms = self._load_custom_terms_from_db()
+        # Custom terms from database, registered with the service as a term set
+        term_set = self._get_custom_term_set()
 
         payload = {
             "texts": texts,
             "language": language,
             "batch_size": batch_size,
-            "custom_protection_terms": custom_terms if custom_terms else None,
         }
 
         request_timeout = timeout or (self.timeout * 2)
         async with httpx.AsyncClient(timeout=request_timeout) as client:
-            response = await client.post(f"{url}/remove-pii/batch", json=payload, headers=headers)
+            response = await self._post_with_term_set(
+                client, url, "/remove-pii/batch", payload, headers, term_set
+            )
 
             if response.status_code == 200:
                 result = response.json()
@@ -0,0 +1,378 @@
+"""
+Pipeline Plan Cache
+
+Process-local cache of compiled pipeline plans for ModularPipelineExecutor.
+
+A plan bundles everything a job needs from the pipeline configuration tables:
+the enabled steps for one source language split into execution phases, the
+enabled model records and the document classes, as frozen snapshots of the
+loaded rows. Plans are built once per worker process and reused by every job
+until the configuration changes.
+
+Invalidation:
+    The admin endpoints call publish_pipeline_config_change() after changing
+    steps, models or document classes. It increments a configuration version in
+    Redis and publishes it on a pub/sub channel; every process listening on the
+    channel drops its plans and rebuilds them on the next job.
+
+    Without Redis (or while the subscriber is down) plans expire after
+    FALLBACK_MAX_AGE_SECONDS so configuration changes still propagate.
+
+Usage:
+    >>> cache = get_pipeline_plan_cache()
+    >>> plan = cache.get_plan("de", build=lambda version: compile_plan("de", version))
+    >>> plan.universal_steps
+"""
+
+from collections.abc import Callable, Iterable
+import contextlib
+import copy
+from dataclasses import dataclass, field, fields, make_dataclass
+from functools import cache
+import logging
+import os
+import threading
+import time
+from typing import Any
+
+import redis
+import redis.asyncio as aioredis
+from redis.exceptions import RedisError
+from sqlalchemy import inspect
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+CONFIG_VERSION_KEY = "docworker:pipeline_config:version"
+CONFIG_CHANNEL = "docworker:pipeline_config:changed"
+
+# Safety net for missed pub/sub messages (e.g. during a reconnect)
+MAX_AGE_SECONDS = 900
+# Plan lifetime while no subscriber is running (Redis unavailable)
+FALLBACK_MAX_AGE_SECONDS = 60
+# Delay before trying to (re)start a failed subscriber
+LISTENER_RETRY_SECONDS = 30
+
+
+@cache
+def _snapshot_type(model: type) -> type:
+    """Frozen dataclass with one field per mapped column of an ORM model."""
+    columns = [attr.key for attr in inspect(model).column_attrs]
+    return make_dataclass(f"{model.__name__}Snapshot", columns, frozen=True)
+
+
+def snapshot_record(record: Any) -> Any:
+    """
+    Copy the column values of an ORM record into a frozen dataclass.
+
+    Snapshots are plain values: they never lazy-load or refresh from a session
+    and can't be changed, so one plan can be shared by all jobs of the process.
+
+    Args:
+        record: Loaded ORM record (e.g. DynamicPipelineStepDB)
+
+    Returns:
+        Snapshot with the record's column attributes
+    """
+    snapshot_type = _snapshot_type(type(record))
+    columns = [column.name for column in fields(snapshot_type)]
+    return snapshot_type(**{name: copy.deepcopy(getattr(record, name)) for name in columns})
+
+
+@dataclass(frozen=True)
+class PipelinePlan:
+    """
+    Compiled pipeline configuration for one source language.
+
+    Steps, models and document classes are snapshots (see snapshot_record), not
+    ORM records.
+    """
+
+    source_language: str | None
+    version: int
+    steps: tuple[Any, ...]
+    universal_steps: tuple[Any, ...]
+    post_branching_steps: tuple[Any, ...]
+    class_steps: dict[int, tuple[Any, ...]]
+    models: dict[int, Any]
+    document_classes: dict[str, Any]
+    built_at: float = field(default_factory=time.monotonic)
+
+    @classmethod
+    def compile(
+        cls,
+        source_language: str | None,
+        version: int,
+        steps: Iterable[Any],
+        models: Iterable[Any],
+        document_classes: Iterable[Any],
+    ) -> "PipelinePlan":
+        """
+        Build a plan from phase-ordered enabled steps, enabled models and document classes.
+
+        Args:
+            source_language: Source language the steps were filtered for (None = all)
+            version: Configuration version the records were loaded at
+            steps: Enabled steps, ordered by phase and order
+            models: Enabled AI models
+            document_classes: All document classes
+
+        Returns:
+            Compiled pipeline plan
+        """
+        steps = tuple(steps)
+        class_steps: dict[int, list[Any]] = {}
+        for step in steps:
+            if step.document_class_id is not None:
+                class_steps.setdefault(step.document_class_id, []).append(step)
+
+        return cls(
+            source_language=source_language,
+            version=version,
+            steps=steps,
+            universal_steps=tuple(
+                s for s in steps if s.document_class_id is None and not s.post_branching
+            ),
+            post_branching_steps=tuple(
+                s for s in steps if s.document_class_id is None and s.post_branching
+            ),
+            class_steps={class_id: tuple(items) for class_id, items in class_steps.items()},
+            models={model.id: model for model in models},
+            document_classes={doc_class.class_key: doc_class for doc_class in document_classes},
+        )
+
+    def get_class_steps(self, document_class_id: int) -> list[Any]:
+        """Get the steps of one document class in execution order."""
+        return list(self.class_steps.get(document_class_id, ()))
+
+
+class PipelinePlanCache:
+    """
+    Thread-safe, versioned cache of PipelinePlan objects keyed by source language.
+
+    One instance per process (see get_pipeline_plan_cache()). The Redis
+    subscriber is started lazily on first use, so it runs in each forked Celery
+    pool process rather than in the parent.
+    """
+
+    def __init__(
+        self,
+        redis_url: str | None = None,
+        max_age_seconds: float = MAX_AGE_SECONDS,
+        fallback_max_age_seconds: float = FALLBACK_MAX_AGE_SECONDS,
+    ):
+        """
+        Initialize the plan cache.
+
+        Args:
+            redis_url: Redis URL for version pub/sub (None disables the subscriber)
+            max_age_seconds: Maximum plan age while subscribed to invalidations
+            fallback_max_age_seconds: Maximum plan age without a subscriber
+        """
+        self.redis_url = redis_url
+        self.max_age_seconds = max_age_seconds
+        self.fallback_max_age_seconds = fallback_max_age_seconds
+
+        self._plans: dict[str | None, PipelinePlan] = {}
+        self._version = 0
+        self._remote_version: int | None = None
+        self._lock = threading.Lock()
+
+        self._listener_thread = None
+        self._listener_pubsub = None
+        self._listener_pid: int | None = None
+        self._listener_retry_at = 0.0
+
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def version(self) -> int:
+        """Local configuration version; increases on every invalidation."""
+        return self._version
+
+    def get_plan(
+        self, source_language: str | None, build: Callable[[int], PipelinePlan]
+    ) -> PipelinePlan:
+        """
+        Get the plan for a source language, building it on a miss.
+
+        Args:
+            source_language: Source language code (None = all languages)
+            build: Called with the current configuration version to compile a new plan
+
+        Returns:
+            Current pipeline plan
+        """
+        self._ensure_listener()
+
+        with self._lock:
+            plan = self._plans.get(source_language)
+            version = self._version
+            if plan is not None and self._is_fresh(plan):
+                self._hits += 1
+                return plan
+            self._misses += 1
+
+        plan = build(version)
+        with self._lock:
+            # Don't store a plan built from a configuration that changed meanwhile
+            if self._version == version:
+                self._plans[source_language] = plan
+
+        logger.info(
+            f"🗺️ Compiled pipeline plan (source_language={source_language}, "
+            f"version={version}, steps={len(plan.steps)})"
+        )
+        return plan
+
+    def invalidate(self, remote_version: int | None = None) -> None:
+        """
+        Drop all plans and move to a new local configuration version.
+
+        Args:
+            remote_version: Configuration version announced via Redis, if known
+        """
+        with self._lock:
+            self._version += 1
+            if remote_version is not None:
+                self._remote_version = remote_version
+            self._plans.clear()
+        logger.info(f"🗺️ Pipeline plans invalidated (version={self._version})")
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get cache statistics."""
+        with self._lock:
+            return {
+                "version": self._version,
+                "cached_plans": len(self._plans),
+                "hits": self._hits,
+                "misses": self._misses,
+                "listening": self._is_listening(),
+            }
+
+    def stop_listener(self) -> None:
+        """Stop the pub/sub subscriber of this process."""
+        thread, pubsub = self._listener_thread, self._listener_pubsub
+        self._listener_thread = None
+        self._listener_pubsub = None
+        if thread is not None:
+            thread.stop()
+        if pubsub is not None:
+            with contextlib.suppress(RedisError):
+                pubsub.close()
+
+    # ==================== INTERNALS ====================
+
+    def _is_fresh(self, plan: PipelinePlan) -> bool:
+        if plan.version != self._version:
+            return False
+        max_age = self.max_age_seconds if self._is_listening() else self.fallback_max_age_seconds
+        return time.monotonic() - plan.built_at < max_age
+
+    def _is_listening(self) -> bool:
+        return (
+            self._listener_thread is not None
+            and self._listener_thread.is_alive()
+            and self._listener_pid == os.getpid()
+        )
+
+    def _ensure_listener(self) -> None:
+        """Start the subscriber for this process if it isn't running."""
+        if not self.redis_url or self._is_listening():
+            return
+        if time.monotonic() < self._listener_retry_at:
+            return
+
+        with self._lock:
+            if self._is_listening():
+                return
+            self._listener_retry_at = time.monotonic() + LISTENER_RETRY_SECONDS
+            # Threads don't survive fork(): forget a parent's subscriber without closing it
+            if self._listener_pid != os.getpid():
+                self._listener_thread = None
+                self._listener_pubsub = None
+
+            try:
+                client = redis.Redis.from_url(
+                    self.redis_url, socket_connect_timeout=2, health_check_interval=30
+                )
+                pubsub = client.pubsub(ignore_subscribe_messages=True)
+                pubsub.subscribe(**{CONFIG_CHANNEL: self._on_message})
+                # Read after subscribing so no bump can slip in between
+                current = int(client.get(CONFIG_VERSION_KEY) or 0)
+                thread = pubsub.run_in_thread(
+                    sleep_time=1.0, daemon=True, exception_handler=self._on_listener_error
+                )
+            except (RedisError, OSError, ValueError) as e:
+                logger.warning(f"⚠️ Pipeline plan subscriber unavailable: {e}")
+                return
+
+            self._listener_pubsub = pubsub
+            self._listener_thread = thread
+            self._listener_pid = os.getpid()
+            changed = current != self._remote_version
+
+        if changed:
+            self.invalidate(current)
+        logger.info(f"🗺️ Subscribed to pipeline config changes (version={current})")
+
+    def _on_message(self, message: dict[str, Any]) -> None:
+        try:
+            version = int(message["data"])
+        except (KeyError, TypeError, ValueError):
+            version = None
+        self.invalidate(version)
+
+    def _on_listener_error(self, error: Exception, pubsub, thread) -> None:
+        logger.warning(f"⚠️ Pipeline plan subscriber stopped: {error}")
+        thread.stop()
+        with contextlib.suppress(RedisError):
+            pubsub.close()
+        # Plans may be stale from now on; fall back to max-age expiry until resubscribed
+        self.invalidate()
+
+
+_plan_cache: PipelinePlanCache | None = None
+_plan_cache_lock = threading.Lock()
+
+
+def get_pipeline_plan_cache() -> PipelinePlanCache:
+    """Get the process-wide pipeline plan cache."""
+    global _plan_cache
+    if _plan_cache is None:
+        with _plan_cache_lock:
+            if _plan_cache is None:
+                _plan_cache = PipelinePlanCache(redis_url=settings.redis_url)
+    return _plan_cache
+
+
+async def publish_pipeline_config_change() -> int | None:
+    """
+    Announce a change to pipeline steps, models or document classes.
+
+    Increments the configuration version in Redis and publishes it to all
+    processes. The local cache is invalidated even if Redis is unavailable.
+
+    Returns:
+        New configuration version, or None if Redis is unavailable
+    """
+    cache = get_pipeline_plan_cache()
+    if not settings.redis_url:
+        cache.invalidate()
+        return None
+
+    client = aioredis.Redis.from_url(settings.redis_url, socket_connect_timeout=2)
+    try:
+        version = await client.incr(CONFIG_VERSION_KEY)
+        await client.publish(CONFIG_CHANNEL, version)
+    except (RedisError, OSError) as e:
+        logger.warning(f"⚠️ Failed to publish pipeline config change: {e}")
+        cache.invalidate()
+        return None
+    finally:
+        await client.close()
+
+    cache.invalidate(version)
+    return version
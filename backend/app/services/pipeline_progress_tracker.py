@@ -4,12 +4,21 @@ Pipeline Progress Tracker
 Publishes real-time pipeline step state to Redis for live frontend tracking.
 Uses a Redis hash per job with TTL-based auto-cleanup.
 
+Every state change is also published on a per-job pub/sub channel so the API can
+push progress to clients over Server-Sent Events instead of being polled. Each
+event carries a per-job sequence number that clients send back as Last-Event-ID.
+
+Steps executed in streaming mode also publish their partial output. Partial
+output is only published, never written to the progress hash, so no document
+text is kept in Redis.
+
 All methods are no-ops if Redis is unavailable — pipeline execution is never blocked.
 """
 
 import asyncio
 import json
 import logging
+import time
 
 import redis.asyncio as aioredis
 from redis.asyncio.connection import ConnectionPool
@@ -23,6 +32,16 @@ logger = logging.getLogger(__name__)
 _KEY_PREFIX = "docworker:pipeline_progress"
 _TTL_SECONDS = 3600
 
+# Pub/sub channel prefix for progress events and key prefix for their sequence numbers
+EVENT_CHANNEL_PREFIX = "docworker:pipeline_events"
+EVENT_CHANNEL_PATTERN = f"{EVENT_CHANNEL_PREFIX}:*"
+_EVENT_SEQ_PREFIX = "docworker:pipeline_event_seq"
+
+
+def event_channel(processing_id: str) -> str:
+    """Get the pub/sub channel carrying progress events of one processing job."""
+    return f"{EVENT_CHANNEL_PREFIX}:{processing_id}"
+
 
 class PipelineProgressTracker:
     """
@@ -72,6 +91,17 @@ class PipelineProgressTracker:
     def _key(self, processing_id: str) -> str:
         return f"{_KEY_PREFIX}:{processing_id}"
 
+    def _seq_key(self, processing_id: str) -> str:
+        # Separate from the progress hash so cleanup() doesn't restart the sequence
+        return f"{_EVENT_SEQ_PREFIX}:{processing_id}"
+
+    async def _publish(self, client: aioredis.Redis, processing_id: str, event: dict) -> None:
+        """Publish an event with the next sequence number of the job."""
+        seq_key = self._seq_key(processing_id)
+        event_id = await client.incr(seq_key)
+        await client.expire(seq_key, _TTL_SECONDS)
+        await client.publish(event_channel(processing_id), json.dumps({"id": event_id, **event}))
+
     async def step_started(
         self,
         processing_id: str,
@@ -111,6 +141,20 @@ class PipelineProgressTracker:
             )
             # Reset TTL on each write (safe for any Redis version)
             await client.expire(key, _TTL_SECONDS)
+
+            await self._publish(
+                client,
+                processing_id,
+                {
+                    "type": "progress",
+                    "current_step_name": step_name,
+                    "ui_stage": ui_stage,
+                    "completed_count": completed_count,
+                    "total_steps": total_steps,
+                    "phase": phase,
+                    "progress_percent": effective_progress,
+                },
+            )
         except RedisError as e:
             logger.warning(f"Pipeline progress tracker: failed to write step_started: {e}")
 
@@ -133,9 +177,56 @@ class PipelineProgressTracker:
                     "completed_count": str(len(completed)),
                 },
             )
+
+            await self._publish(
+                client,
+                processing_id,
+                {
+                    "type": "step_completed",
+                    "step_name": step_name,
+                    "completed_count": len(completed),
+                },
+            )
         except RedisError as e:
             logger.warning(f"Pipeline progress tracker: failed to write step_completed: {e}")
 
+    async def step_output(
+        self,
+        processing_id: str,
+        step_name: str,
+        text: str,
+        final: bool = False,
+        attempt: int = 1,
+    ) -> None:
+        """
+        Publish the partial output of a streaming step.
+
+        Args:
+            processing_id: Processing job ID
+            step_name: Name of the generating step
+            text: Output generated so far (complete text, not a fragment)
+            final: True once generation has finished
+            attempt: Attempt of the step that generated the text (a retry starts over)
+        """
+        client = await self._get_client()
+        if not client:
+            return
+
+        try:
+            await self._publish(
+                client,
+                processing_id,
+                {
+                    "type": "partial_output",
+                    "step_name": step_name,
+                    "text": text,
+                    "final": final,
+                    "attempt": attempt,
+                },
+            )
+        except RedisError as e:
+            logger.warning(f"Pipeline progress tracker: failed to publish step output: {e}")
+
     async def update_total_steps(self, processing_id: str, total: int) -> None:
         """Update total step count (called after branching when total becomes known)."""
         client = await self._get_client()
@@ -147,6 +238,52 @@ class PipelineProgressTracker:
         except RedisError as e:
             logger.warning(f"Pipeline progress tracker: failed to update total_steps: {e}")
 
+    async def status_changed(
+        self,
+        processing_id: str,
+        status: str,
+        progress_percent: int | None = None,
+        error: str | None = None,
+    ) -> None:
+        """
+        Publish a job status transition (written to the database by the worker).
+
+        Args:
+            processing_id: Processing job ID
+            status: New StepExecutionStatus value (e.g. "RUNNING", "COMPLETED")
+            progress_percent: Job progress stored alongside the status, if changed
+            error: Error message for failed jobs
+        """
+        client = await self._get_client()
+        if not client:
+            return
+
+        try:
+            await self._publish(
+                client,
+                processing_id,
+                {
+                    "type": "status",
+                    "status": status,
+                    "progress_percent": progress_percent,
+                    "error": error,
+                },
+            )
+        except RedisError as e:
+            logger.warning(f"Pipeline progress tracker: failed to publish status: {e}")
+
+    async def get_last_event_id(self, processing_id: str) -> int:
+        """Get the sequence number of the last published event (0 if none or unavailable)."""
+        client = await self._get_client()
+        if not client:
+            return 0
+
+        try:
+            return int(await client.get(self._seq_key(processing_id)) or 0)
+        except RedisError as e:
+            logger.warning(f"Pipeline progress tracker: failed to read last event id: {e}")
+            return 0
+
     async def get_progress(self, processing_id: str) -> dict | None:
         """
         Read current progress from Redis.
@@ -191,3 +328,57 @@ class PipelineProgressTracker:
             await client.delete(self._key(processing_id))
         except RedisError as e:
             logger.warning(f"Pipeline progress tracker: failed to cleanup: {e}")
+
+
+class PartialOutputPublisher:
+    """
+    Collects the output fragments of a streaming step and publishes the text so far.
+
+    Publishing every token would flood the event channel, so the text is
+    published at most once per interval (the first fragment immediately).
+    Events carry the attempt number; a retry starts with an empty text, so
+    clients drop the output of the failed attempt.
+    """
+
+    def __init__(
+        self,
+        tracker: PipelineProgressTracker,
+        processing_id: str,
+        step_name: str,
+        interval_seconds: float = 0.5,
+        attempt: int = 1,
+    ):
+        self.tracker = tracker
+        self.processing_id = processing_id
+        self.step_name = step_name
+        self.interval_seconds = interval_seconds
+        self.attempt = attempt
+        self._parts: list[str] = []
+        self._last_published: float | None = None
+
+    @property
+    def text(self) -> str:
+        """Output received so far."""
+        return "".join(self._parts)
+
+    async def start(self) -> None:
+        """Publish an empty output when a retry starts (replaces the failed attempt's text)."""
+        if self.attempt > 1:
+            await self._publish("")
+
+    async def add(self, fragment: str) -> None:
+        """Add a generated fragment and publish if the interval has passed."""
+        self._parts.append(fragment)
+        now = time.monotonic()
+        if self._last_published is None or now - self._last_published >= self.interval_seconds:
+            self._last_published = now
+            await self._publish(self.text)
+
+    async def finish(self, text: str) -> None:
+        """Publish the completed output of the step."""
+        await self._publish(text, final=True)
+
+    async def _publish(self, text: str, final: bool = False) -> None:
+        await self.tracker.step_output(
+            self.processing_id, self.step_name, text, final=final, attempt=self.attempt
+        )
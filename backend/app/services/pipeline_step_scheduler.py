@@ -0,0 +1,221 @@
+"""
+Pipeline Step Scheduler
+
+Runs the steps of one pipeline phase as a dependency graph, so steps that do
+not consume the previous step's output (e.g. the Dify RAG guideline query on
+the original document) run while earlier steps are still generating.
+
+Dependencies:
+    A step reads either the pipeline text (input_source NULL or
+    "previous_output") or a context variable (e.g. "original_text"). A step
+    reading the pipeline text waits for the last earlier step that updates it
+    (input_from_previous_step). Every step also waits for the last earlier
+    branching step or step with stop conditions, so nothing runs past a
+    decision that may end the phase or the pipeline.
+
+Results are consumed in step order by ModularPipelineExecutor, so progress
+updates, stop conditions and PipelineStepExecutionDB records keep the order of
+sequential execution. Step executions of one job share a semaphore
+(PIPELINE_MAX_PARALLEL_STEPS).
+
+Usage:
+    >>> scheduler = PipelineStepScheduler(run_step=run_step, max_parallel=3)
+    >>> scheduler.start_phase(steps)
+    >>> for index, step in enumerate(steps):
+    ...     scheduler.start_ready(index, current_output, context)
+    ...     outcome = await scheduler.result(index)
+    >>> await scheduler.close()
+"""
+
+import asyncio
+from collections.abc import Awaitable, Callable, Sequence
+from dataclasses import dataclass
+import logging
+import time
+from typing import Any
+
+from app.database.modular_pipeline_models import DynamicPipelineStepDB
+
+logger = logging.getLogger(__name__)
+
+# input_source value for steps that read the output of the previous step
+INPUT_SOURCE_PREVIOUS_OUTPUT = "previous_output"
+
+StepRunner = Callable[
+    [DynamicPipelineStepDB, str, dict[str, Any]], Awaitable[tuple[bool, str, str | None]]
+]
+
+
+def get_input_source(step: DynamicPipelineStepDB) -> str | None:
+    """Get the context variable a step reads its input from (None: pipeline text)."""
+    source = getattr(step, "input_source", None)
+    if isinstance(source, str) and source and source != INPUT_SOURCE_PREVIOUS_OUTPUT:
+        return source
+    return None
+
+
+def is_barrier_step(step: DynamicPipelineStepDB) -> bool:
+    """Check if later steps must wait for this step (branching or stop conditions)."""
+    stop_conditions = getattr(step, "stop_conditions", None)
+    has_stop_values = isinstance(stop_conditions, dict) and bool(
+        stop_conditions.get("stop_on_values")
+    )
+    return bool(step.is_branching_step) or has_stop_values
+
+
+def build_step_dependencies(steps: Sequence[DynamicPipelineStepDB]) -> list[int]:
+    """
+    Get the dependency of each step in a phase.
+
+    Steps are committed in order, so one index per step is enough: the step can
+    start once every step up to that index is committed.
+
+    Args:
+        steps: Steps of one phase in execution order
+
+    Returns:
+        Index of the step each step waits for (-1: can start with the phase)
+    """
+    dependencies = []
+    last_writer = -1
+    last_barrier = -1
+    for index, step in enumerate(steps):
+        dependency = last_barrier
+        if get_input_source(step) is None:
+            dependency = max(dependency, last_writer)
+        dependencies.append(dependency)
+
+        if step.input_from_previous_step:
+            last_writer = index
+        if is_barrier_step(step):
+            last_barrier = index
+    return dependencies
+
+
+@dataclass(frozen=True)
+class StepOutcome:
+    """Result of one scheduled step execution."""
+
+    success: bool
+    output: str
+    error: str | None
+    input_text: str
+    started_at: float
+    finished_at: float
+
+
+class PipelineStepScheduler:
+    """
+    Starts pipeline steps as soon as their dependencies are committed.
+
+    One scheduler is used per job; its semaphore limits concurrent step
+    executions across all phases of the job.
+    """
+
+    def __init__(self, run_step: StepRunner, max_parallel: int = 3):
+        """
+        Initialize the scheduler.
+
+        Args:
+            run_step: Executes a step with (step, input_text, context) and returns
+                (success, output, error), like ModularPipelineExecutor.execute_step
+            max_parallel: Step executions running at once (1: sequential)
+        """
+        self._run_step = run_step
+        self._semaphore = asyncio.Semaphore(max(1, max_parallel))
+        self._steps: list[DynamicPipelineStepDB] = []
+        self._dependencies: list[int] = []
+        self._should_run: Callable[[DynamicPipelineStepDB], bool] | None = None
+        self._tasks: dict[int, asyncio.Task] = {}
+        self._all_tasks: list[asyncio.Task] = []
+
+    def start_phase(
+        self,
+        steps: Sequence[DynamicPipelineStepDB],
+        should_run: Callable[[DynamicPipelineStepDB], bool] | None = None,
+    ) -> None:
+        """
+        Start scheduling a new phase.
+
+        Args:
+            steps: Steps of the phase in execution order
+            should_run: Returns False for steps the caller skips (never started)
+        """
+        for task in self._tasks.values():
+            task.cancel()
+        self._steps = list(steps)
+        self._dependencies = build_step_dependencies(self._steps)
+        self._should_run = should_run
+        self._tasks = {}
+
+    def start_ready(self, next_index: int, current_output: str, context: dict[str, Any]) -> None:
+        """
+        Start every step that can run once all steps before next_index are committed.
+
+        Args:
+            next_index: Index of the next step to commit
+            current_output: Pipeline text after the committed steps
+            context: Pipeline context variables
+        """
+        for index, step in enumerate(self._steps):
+            if index in self._tasks or self._dependencies[index] >= next_index:
+                continue
+            if self._should_run is not None and not self._should_run(step):
+                continue
+
+            input_source = get_input_source(step)
+            if input_source is None:
+                input_text = current_output
+            else:
+                input_text = context.get(input_source)
+                if index > next_index:
+                    logger.info(
+                        f"⏩ Starting step '{step.name}' ahead of order (input: {input_source})"
+                    )
+
+            # Snapshot: execute_step adds variables, later steps may change the context
+            task = asyncio.create_task(self._execute(step, input_text, input_source, dict(context)))
+            self._tasks[index] = task
+            self._all_tasks.append(task)
+
+    async def result(self, index: int) -> StepOutcome:
+        """
+        Wait for the outcome of a step.
+
+        Raises:
+            KeyError: If the step was not started (call start_ready first)
+        """
+        return await self._tasks[index]
+
+    async def close(self) -> None:
+        """Cancel steps whose results are no longer needed and wait for them."""
+        pending = [task for task in self._all_tasks if not task.done()]
+        for task in pending:
+            task.cancel()
+        if pending:
+            logger.info(f"🛑 Cancelled {len(pending)} scheduled pipeline step(s)")
+        if self._all_tasks:
+            await asyncio.gather(*self._all_tasks, return_exceptions=True)
+        self._tasks = {}
+        self._all_tasks = []
+
+    async def _execute(
+        self,
+        step: DynamicPipelineStepDB,
+        input_text: str | None,
+        input_source: str | None,
+        context: dict[str, Any],
+    ) -> StepOutcome:
+        async with self._semaphore:
+            started_at = time.time()
+            if input_text is None:
+                error = f"Input source '{input_source}' not found in context"
+                logger.error(f"❌ Step '{step.name}': {error}")
+                return StepOutcome(False, "", error, "", started_at, time.time())
+
+            try:
+                success, output, error = await self._run_step(step, input_text, context)
+            except Exception as e:
+                logger.error(f"❌ Step '{step.name}' raised: {e}")
+                success, output, error = False, "", str(e) or "Unknown error"
+            return StepOutcome(success, output, error, input_text, started_at, time.time())
@@ -147,6 +147,47 @@ def _get_spacy_model() -> tuple:
                 return _SPACY_MODEL_SINGLETON
 
 
+# ==================== MULTI-TERM MATCHER (TRIE → SINGLE REGEX) ====================
+
+
+def _build_term_alternation(terms) -> str:
+    """Build one regex alternation for many literal terms from a character trie.
+
+    Shared prefixes are factored out (``hämo(?:globin|krit)``) so the regex engine
+    walks the text once instead of once per term. Children are emitted before the
+    end-of-term marker, so at any position the longest term that lets the rest of
+    the surrounding pattern match wins, backtracking to shorter terms otherwise.
+
+    Args:
+        terms: Iterable of literal strings (already case-normalized by the caller)
+
+    Returns:
+        Regex source string (without surrounding group); empty string if no terms
+    """
+    trie: dict = {}
+    for term in terms:
+        if not term:
+            continue
+        node = trie
+        for char in term:
+            node = node.setdefault(char, {})
+        node[""] = {}  # end-of-term marker
+
+    def _render(node: dict) -> str:
+        is_end = "" in node
+        branches = [
+            re.escape(char) + _render(child) for char, child in sorted(node.items()) if char
+        ]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        if is_end:
+            return (body if len(branches) > 1 else "(?:" + body + ")") + "?"
+        return body
+
+    return _render(trie)
+
+
 class AdvancedPrivacyFilter:
     """GDPR-compliant privacy filter for German medical documents.
 
@@ -1878,6 +1919,10 @@ class AdvancedPrivacyFilter:
         if self._load_custom_terms:
             self._load_custom_terms_from_db()
 
+        # Precompiled single-pass matchers for medical term protection
+        self._term_matcher_key: tuple | None = None
+        self._build_term_matchers()
+
     def _load_custom_terms_from_db(self) -> None:
         """Load custom medical terms, drugs, and eponyms from database.
 
@@ -2420,10 +2465,68 @@ class AdvancedPrivacyFilter:
 
         return results
 
+    def _build_term_matchers(self) -> None:
+        """Compile the LABVAL, LOINC and DRUG protection matchers from the term sets.
+
+        Each set becomes one trie-factored regex, so protection costs one scan per
+        category instead of one ``re.sub`` per term. Rebuilt automatically by
+        _protect_medical_terms() when the term sets change (e.g. custom terms).
+        """
+        self._term_matcher_key = (
+            frozenset(self.medical_terms),
+            frozenset(self.common_loinc_codes),
+            frozenset(self.drug_database),
+        )
+
+        lab_terms = {term.lower() for term in self.medical_terms if len(term) > 3}
+        self._labval_matcher: Pattern[str] | None = (
+            re.compile(
+                r"\b(" + _build_term_alternation(lab_terms) + r")"
+                r"\s*:?\s*([0-9]+[,.]?[0-9]*)\s*([a-zA-Z/%]*)\b",
+                re.IGNORECASE,
+            )
+            if lab_terms
+            else None
+        )
+
+        self._loinc_matcher: Pattern[str] | None = (
+            re.compile(r"\b(?:" + _build_term_alternation(self.common_loinc_codes) + r")\b")
+            if self.common_loinc_codes
+            else None
+        )
+
+        drug_terms = {drug for drug in self.drug_database if len(drug) > 3}
+        self._drug_placeholders = {drug.lower(): f"§DRUG_{drug.upper()}§" for drug in drug_terms}
+        self._drug_matcher: Pattern[str] | None = (
+            re.compile(
+                r"\b(?:" + _build_term_alternation(self._drug_placeholders) + r")\b",
+                re.IGNORECASE,
+            )
+            if drug_terms
+            else None
+        )
+
+    def _ensure_term_matchers(self) -> None:
+        """Rebuild term matchers if medical_terms, LOINC codes or drugs were modified."""
+        current_key = (
+            frozenset(self.medical_terms),
+            frozenset(self.common_loinc_codes),
+            frozenset(self.drug_database),
+        )
+        if current_key != self._term_matcher_key:
+            self._build_term_matchers()
+
     def _protect_medical_terms(self, text: str) -> str:
-        """Schützt medizinische Begriffe vor Entfernung"""
+        """Schützt medizinische Begriffe vor Entfernung
+
+        Medical terms (LABVAL), known LOINC codes and drug names are each protected
+        in a single pass with a precompiled trie matcher. Where several terms could
+        match at the same position the longest one wins.
+        """
         import re
 
+        self._ensure_term_matchers()
+
         # Schütze Vitamin-Kombinationen (z.B. "Vitamin D3", "Vitamin B12")
         vitamin_pattern = (
             r"\b(Vitamin|Vit\.?)\s*([A-Z][0-9]*|[0-9]+[-,]?[0-9]*[-]?OH[-]?[A-Z]?[0-9]*)\b"
@@ -2447,18 +2550,13 @@ class AdvancedPrivacyFilter:
         text = self.medical_code_patterns["loinc"].sub(lambda m: f"§LOINC_{m.group()}§", text)
 
         # Also protect explicitly known LOINC codes
-        for loinc in self.common_loinc_codes:
-            pattern = r"\b" + re.escape(loinc) + r"\b"
-            text = re.sub(pattern, f"§LOINC_{loinc}§", text)
+        if self._loinc_matcher:
+            text = self._loinc_matcher.sub(lambda m: f"§LOINC_{m.group()}§", text)
 
         # Schütze Laborwert-Zahlen-Kombinationen in Tabellen (z.B. "Hämoglobin 12.5")
-        # Pattern: Laborwert gefolgt von Zahl und Einheit
-        for term in self.medical_terms:
-            if len(term) > 3:  # Nur längere Begriffe
-                pattern = (
-                    r"\b(" + re.escape(term) + r")\s*:?\s*([0-9]+[,.]?[0-9]*)\s*([a-zA-Z/%]*)\b"
-                )
-                text = re.sub(pattern, r"§LABVAL_\1_\2_\3§", text, flags=re.IGNORECASE)
+        # Pattern: Laborwert gefolgt von Zahl und Einheit (nur Begriffe > 3 Zeichen)
+        if self._labval_matcher:
+            text = self._labval_matcher.sub(r"§LABVAL_\1_\2_\3§", text)
 
         # Ersetze medizinische Abkürzungen temporär
         for abbr in self.protected_abbreviations:
@@ -2467,11 +2565,14 @@ class AdvancedPrivacyFilter:
             text = re.sub(pattern, f"§{abbr}§", text, flags=re.IGNORECASE)
 
         # ==================== PHASE 4.2: PROTECT DRUG NAMES ====================
-        # Protect drug names from removal (both INN and brand names)
-        for drug in self.drug_database:
-            if len(drug) > 3:  # Only longer drug names to avoid false positives
-                pattern = r"\b" + re.escape(drug) + r"\b"
-                text = re.sub(pattern, f"§DRUG_{drug.upper()}§", text, flags=re.IGNORECASE)
+        # Protect drug names from removal (both INN and brand names, > 3 chars only)
+        if self._drug_matcher:
+            text = self._drug_matcher.sub(
+                lambda m: self._drug_placeholders.get(
+                    m.group().lower(), f"§DRUG_{m.group().upper()}§"
+                ),
+                text,
+            )
 
         return text
 
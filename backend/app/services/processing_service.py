@@ -36,6 +36,91 @@ STEP_DESCRIPTIONS: dict[str, str] = {
 }
 
 
+def map_status_to_api(db_status: StepExecutionStatus, progress: int = 0) -> ProcessingStatus:
+    """
+    Map database status to API status enum.
+
+    For RUNNING jobs, returns a more specific sub-status based on progress.
+
+    Args:
+        db_status: Database status
+        progress: Current progress percentage (used for RUNNING sub-statuses)
+
+    Returns:
+        API status enum value
+    """
+    if db_status == StepExecutionStatus.RUNNING:
+        if progress < 20:
+            return ProcessingStatus.EXTRACTING_TEXT
+        if progress < 70:
+            return ProcessingStatus.TRANSLATING
+        return ProcessingStatus.LANGUAGE_TRANSLATING
+
+    status_mapping = {
+        StepExecutionStatus.PENDING: ProcessingStatus.PENDING,
+        StepExecutionStatus.COMPLETED: ProcessingStatus.COMPLETED,
+        StepExecutionStatus.FAILED: ProcessingStatus.ERROR,
+        StepExecutionStatus.SKIPPED: ProcessingStatus.ERROR,
+    }
+    return status_mapping.get(db_status, ProcessingStatus.PENDING)
+
+
+def describe_step(db_status: StepExecutionStatus, progress: int = 0) -> str:
+    """
+    Get human-readable description of the current processing step.
+
+    Args:
+        db_status: Database status
+        progress: Current progress percentage
+
+    Returns:
+        Step description string
+    """
+    if db_status == StepExecutionStatus.RUNNING:
+        if progress < 10:
+            return "Text wird aus dem Dokument extrahiert (OCR)..."
+        if progress < 20:
+            return "Medizinischer Inhalt wird validiert..."
+        if progress < 30:
+            return "Dokumenttyp wird erkannt..."
+        if progress < 40:
+            return "Datenschutz-Filter wird angewendet..."
+        if progress < 55:
+            return "KI vereinfacht den medizinischen Text..."
+        if progress < 65:
+            return "Medizinische Fakten werden geprüft..."
+        if progress < 75:
+            return "Grammatik und Ausdruck werden optimiert..."
+        if progress < 85:
+            return "Sprachübersetzung wird durchgeführt..."
+        if progress < 95:
+            return "Qualitätsprüfung läuft..."
+        return "Formatierung wird abgeschlossen..."
+    if db_status == StepExecutionStatus.COMPLETED:
+        return "Verarbeitung abgeschlossen"
+    if db_status == StepExecutionStatus.FAILED:
+        return "Fehler bei Verarbeitung"
+    return "Warten auf Verarbeitung..."
+
+
+def apply_live_progress(status: dict[str, Any], live_progress: dict[str, Any] | None) -> None:
+    """
+    Enrich a processing status dict with real-time step info from PipelineProgressTracker.
+
+    Args:
+        status: Status dict as returned by ProcessingService.get_processing_status()
+        live_progress: Progress from PipelineProgressTracker.get_progress() (may be None)
+    """
+    if not live_progress or not live_progress.get("current_step_name"):
+        return
+    status["current_step_name"] = live_progress["current_step_name"]
+    status["ui_stage"] = live_progress.get("ui_stage")
+    status["progress_percent"] = live_progress["progress_percent"]
+    status["current_step"] = STEP_DESCRIPTIONS.get(
+        live_progress["current_step_name"], status["current_step"]
+    )
+
+
 class ProcessingService:
     """
     Service for managing document processing operations.
@@ -80,7 +165,7 @@ class ProcessingService:
         # No need to expire or expunge here - it's already safe from accidental overwrites.
 
         # Update job with processing options using repository to avoid overwriting encrypted fields
-        self.job_repository.update(job.id, processing_options=options)
+        self.job_repository.update_columns(job.id, processing_options=options)
 
         logger.info(f"📋 Processing options saved for {processing_id[:8]}: {options}")
 
@@ -255,71 +340,14 @@ class ProcessingService:
         """
         job = self.job_repository.get_by_processing_id(processing_id)
         if job:
-            self.job_repository.update(job.id, guidelines_text=guidelines_text)
+            self.job_repository.update_columns(job.id, guidelines_text=guidelines_text)
 
     def _map_status_to_api(
         self, db_status: StepExecutionStatus, progress: int = 0
     ) -> ProcessingStatus:
-        """
-        Map database status to API status enum.
-
-        For RUNNING jobs, returns a more specific sub-status based on progress.
-
-        Args:
-            db_status: Database status
-            progress: Current progress percentage (used for RUNNING sub-statuses)
-
-        Returns:
-            API status enum value
-        """
-        if db_status == StepExecutionStatus.RUNNING:
-            if progress < 20:
-                return ProcessingStatus.EXTRACTING_TEXT
-            if progress < 70:
-                return ProcessingStatus.TRANSLATING
-            return ProcessingStatus.LANGUAGE_TRANSLATING
-
-        status_mapping = {
-            StepExecutionStatus.PENDING: ProcessingStatus.PENDING,
-            StepExecutionStatus.COMPLETED: ProcessingStatus.COMPLETED,
-            StepExecutionStatus.FAILED: ProcessingStatus.ERROR,
-            StepExecutionStatus.SKIPPED: ProcessingStatus.ERROR,
-        }
-        return status_mapping.get(db_status, ProcessingStatus.PENDING)
+        """Map database status to API status enum (see map_status_to_api)."""
+        return map_status_to_api(db_status, progress)
 
     def _get_step_description(self, job) -> str:
-        """
-        Get human-readable description of current processing step.
-
-        Args:
-            job: Pipeline job instance
-
-        Returns:
-            Step description string
-        """
-        if job.status == StepExecutionStatus.RUNNING:
-            p = job.progress_percent
-            if p < 10:
-                return "Text wird aus dem Dokument extrahiert (OCR)..."
-            if p < 20:
-                return "Medizinischer Inhalt wird validiert..."
-            if p < 30:
-                return "Dokumenttyp wird erkannt..."
-            if p < 40:
-                return "Datenschutz-Filter wird angewendet..."
-            if p < 55:
-                return "KI vereinfacht den medizinischen Text..."
-            if p < 65:
-                return "Medizinische Fakten werden geprüft..."
-            if p < 75:
-                return "Grammatik und Ausdruck werden optimiert..."
-            if p < 85:
-                return "Sprachübersetzung wird durchgeführt..."
-            if p < 95:
-                return "Qualitätsprüfung läuft..."
-            return "Formatierung wird abgeschlossen..."
-        if job.status == StepExecutionStatus.COMPLETED:
-            return "Verarbeitung abgeschlossen"
-        if job.status == StepExecutionStatus.FAILED:
-            return "Fehler bei Verarbeitung"
-        return "Warten auf Verarbeitung..."
+        """Get human-readable description of a job's current step (see describe_step)."""
+        return describe_step(job.status, job.progress_percent)
@@ -0,0 +1,374 @@
+"""
+Progress Event Stream
+
+Server-Sent Events for processing jobs, replacing status polling.
+
+PipelineProgressTracker publishes every step and status change of a job on a
+Redis pub/sub channel. Each API process holds ONE pattern subscription for all
+jobs (ProgressEventBroker) and fans the events out to the open streams of that
+process, so an open stream costs no database or Redis reads after its initial
+snapshot.
+
+Stream protocol (text/event-stream):
+    event: progress        - full ProcessingProgress snapshot (same shape as /status)
+    event: step_completed  - {"step_name": ..., "completed_count": ...}
+    event: partial_output  - {"step_name": ..., "text": ..., "final": ..., "attempt": ...}
+                             output generated so far by a streaming step; a retry
+                             starts over with an empty text and the next attempt
+    : heartbeat            - keep-alive comment every few seconds
+
+    Events carry the job's event sequence number as "id". A reconnecting client
+    sends it back as Last-Event-ID; since every progress event is a full snapshot,
+    resuming only needs the current state, which is skipped if the client is
+    already up to date. The stream ends after a terminal status.
+"""
+
+import asyncio
+from collections.abc import AsyncIterator, Awaitable, Callable
+import contextlib
+import json
+import logging
+from typing import Any
+
+import redis.asyncio as aioredis
+from redis.exceptions import RedisError
+
+from app.core.config import settings
+from app.database.modular_pipeline_models import StepExecutionStatus
+from app.models.document import ProcessingProgress, ProcessingStatus
+from app.services.pipeline_progress_tracker import EVENT_CHANNEL_PATTERN, EVENT_CHANNEL_PREFIX
+from app.services.processing_service import STEP_DESCRIPTIONS, describe_step, map_status_to_api
+
+logger = logging.getLogger(__name__)
+
+# Statuses after which no further events are published for a job
+TERMINAL_STATUSES = {
+    ProcessingStatus.COMPLETED,
+    ProcessingStatus.ERROR,
+    ProcessingStatus.CANCELLED,
+    ProcessingStatus.TIMEOUT,
+    ProcessingStatus.NON_MEDICAL_CONTENT,
+}
+
+# Client reconnect delay sent in the "retry" field (milliseconds)
+RECONNECT_DELAY_MS = 3000
+
+# Queued in place of an event when the subscription is lost
+_SUBSCRIPTION_LOST: dict[str, Any] = {"type": "subscription_lost"}
+
+
+class StreamLimitError(Exception):
+    """Raised when this process already serves the maximum number of streams."""
+
+
+class ProgressEventBroker:
+    """
+    Process-wide fan-out of pipeline progress events to open SSE streams.
+
+    The Redis subscription is opened on the first stream and shared by all
+    streams of the process. If it drops, open streams are ended so clients
+    reconnect (and receive a fresh snapshot) once it is re-established.
+    """
+
+    def __init__(self, redis_url: str | None, max_streams: int):
+        """
+        Initialize the broker.
+
+        Args:
+            redis_url: Redis URL (None disables streaming)
+            max_streams: Maximum concurrent streams served by this process
+        """
+        self.redis_url = redis_url
+        self.max_streams = max_streams
+
+        self._queues: dict[str, set[asyncio.Queue]] = {}
+        self._active_streams = 0
+        self._client: aioredis.Redis | None = None
+        self._pubsub = None
+        self._listener: asyncio.Task | None = None
+        self._start_lock: asyncio.Lock | None = None
+
+    @property
+    def active_streams(self) -> int:
+        """Number of currently open streams."""
+        return self._active_streams
+
+    @property
+    def listening(self) -> bool:
+        """Whether the Redis subscription is running."""
+        return self._listener is not None and not self._listener.done()
+
+    async def start(self) -> bool:
+        """
+        Start the Redis subscription if it isn't running.
+
+        Returns:
+            True if events are being received
+        """
+        if not self.redis_url:
+            return False
+        if self.listening:
+            return True
+
+        if self._start_lock is None:
+            self._start_lock = asyncio.Lock()
+        async with self._start_lock:
+            if self.listening:
+                return True
+            try:
+                client = aioredis.Redis.from_url(
+                    self.redis_url, decode_responses=True, socket_connect_timeout=2
+                )
+                pubsub = client.pubsub(ignore_subscribe_messages=True)
+                await pubsub.psubscribe(EVENT_CHANNEL_PATTERN)
+            except (RedisError, OSError) as e:
+                logger.warning(f"⚠️ Progress event subscription unavailable: {e}")
+                return False
+
+            self._client, self._pubsub = client, pubsub
+            self._listener = asyncio.create_task(self._listen(pubsub))
+            logger.info("📡 Subscribed to pipeline progress events")
+            return True
+
+    async def stop(self) -> None:
+        """Stop the Redis subscription (open streams are ended)."""
+        listener, self._listener = self._listener, None
+        if listener is not None:
+            listener.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await listener
+        await self._close_connection()
+        self._notify_all(_SUBSCRIPTION_LOST)
+
+    def open_stream(self, processing_id: str) -> asyncio.Queue:
+        """
+        Register a stream for a job.
+
+        Args:
+            processing_id: Processing job ID
+
+        Returns:
+            Queue receiving the job's events
+
+        Raises:
+            StreamLimitError: If max_streams streams are already open
+        """
+        if self._active_streams >= self.max_streams:
+            raise StreamLimitError(f"Maximum of {self.max_streams} progress streams reached")
+        queue: asyncio.Queue = asyncio.Queue()
+        self._queues.setdefault(processing_id, set()).add(queue)
+        self._active_streams += 1
+        return queue
+
+    def close_stream(self, processing_id: str, queue: asyncio.Queue) -> None:
+        """Unregister a stream opened with open_stream()."""
+        queues = self._queues.get(processing_id)
+        if not queues or queue not in queues:
+            return
+        queues.discard(queue)
+        if not queues:
+            del self._queues[processing_id]
+        self._active_streams -= 1
+
+    def dispatch(self, processing_id: str, event: dict[str, Any]) -> None:
+        """Deliver an event to all open streams of a job."""
+        for queue in self._queues.get(processing_id, ()):
+            queue.put_nowait(event)
+
+    # ==================== INTERNALS ====================
+
+    async def _listen(self, pubsub) -> None:
+        prefix = f"{EVENT_CHANNEL_PREFIX}:"
+        try:
+            async for message in pubsub.listen():
+                if message.get("type") != "pmessage":
+                    continue
+                processing_id = message["channel"].removeprefix(prefix)
+                if processing_id not in self._queues:
+                    continue
+                try:
+                    event = json.loads(message["data"])
+                except (TypeError, ValueError):
+                    continue
+                self.dispatch(processing_id, event)
+        except (RedisError, OSError) as e:
+            logger.warning(f"⚠️ Progress event subscription lost: {e}")
+        finally:
+            await self._close_connection()
+            self._notify_all(_SUBSCRIPTION_LOST)
+
+    async def _close_connection(self) -> None:
+        pubsub, client = self._pubsub, self._client
+        self._pubsub = self._client = None
+        with contextlib.suppress(RedisError, OSError):
+            if pubsub is not None:
+                await pubsub.reset()
+            if client is not None:
+                await client.close()
+
+    def _notify_all(self, event: dict[str, Any]) -> None:
+        for queues in self._queues.values():
+            for queue in queues:
+                queue.put_nowait(event)
+
+
+def format_sse(data: Any, event: str | None = None, event_id: int | None = None) -> str:
+    """
+    Format one Server-Sent Event.
+
+    Args:
+        data: JSON-serializable payload
+        event: Event name
+        event_id: Event ID (echoed by the client as Last-Event-ID on reconnect)
+
+    Returns:
+        Event in text/event-stream format
+    """
+    lines = []
+    if event_id is not None:
+        lines.append(f"id: {event_id}")
+    if event:
+        lines.append(f"event: {event}")
+    lines.append(f"data: {json.dumps(data, default=str)}")
+    return "\n".join(lines) + "\n\n"
+
+
+def parse_last_event_id(value: str | None) -> int | None:
+    """Parse a Last-Event-ID header (None if missing or not an event sequence number)."""
+    try:
+        return int(value) if value else None
+    except ValueError:
+        return None
+
+
+def apply_event(status: dict[str, Any], event: dict[str, Any]) -> bool:
+    """
+    Apply a progress or status event to a processing status dict.
+
+    Args:
+        status: Status dict in ProcessingProgress shape (updated in place)
+        event: Event published by PipelineProgressTracker
+
+    Returns:
+        True if the status changed and a new snapshot should be sent
+    """
+    if event.get("type") == "progress":
+        step_name = event.get("current_step_name")
+        status["current_step_name"] = step_name
+        status["ui_stage"] = event.get("ui_stage")
+        status["progress_percent"] = max(status["progress_percent"], event["progress_percent"])
+        status["current_step"] = STEP_DESCRIPTIONS.get(step_name, status["current_step"])
+        return True
+
+    if event.get("type") == "status":
+        try:
+            db_status = StepExecutionStatus(event["status"])
+        except (KeyError, ValueError):
+            return False
+        progress = event.get("progress_percent")
+        if progress is not None:
+            status["progress_percent"] = max(status["progress_percent"], progress)
+        status["status"] = map_status_to_api(db_status, status["progress_percent"])
+        # Keep the live step description while the pipeline is running
+        if db_status != StepExecutionStatus.RUNNING or not status.get("current_step_name"):
+            status["current_step"] = describe_step(db_status, status["progress_percent"])
+        if event.get("error"):
+            status["error"] = event["error"]
+        return True
+
+    return False
+
+
+def _snapshot(status: dict[str, Any]) -> dict[str, Any]:
+    return ProcessingProgress(**status).model_dump(mode="json")
+
+
+async def stream_progress_events(
+    processing_id: str,
+    status: dict[str, Any],
+    queue: asyncio.Queue,
+    snapshot_event_id: int,
+    last_event_id: int | None,
+    is_disconnected: Callable[[], Awaitable[bool]],
+    heartbeat_seconds: float,
+) -> AsyncIterator[str]:
+    """
+    Generate the SSE stream of one job.
+
+    The queue must be opened before the snapshot is read: events up to
+    snapshot_event_id are already reflected in status and are skipped.
+
+    Args:
+        processing_id: Processing job ID
+        status: Current status in ProcessingProgress shape
+        queue: Event queue from ProgressEventBroker.open_stream()
+        snapshot_event_id: Last event ID published before the snapshot was read
+        last_event_id: Last-Event-ID sent by a reconnecting client
+        is_disconnected: Returns True once the client has gone away
+        heartbeat_seconds: Interval between keep-alive comments
+
+    Yields:
+        Events in text/event-stream format
+    """
+    yield f"retry: {RECONNECT_DELAY_MS}\n\n"
+
+    if last_event_id != snapshot_event_id:
+        yield format_sse(_snapshot(status), event="progress", event_id=snapshot_event_id)
+    if status["status"] in TERMINAL_STATUSES:
+        return
+
+    while True:
+        try:
+            event = await asyncio.wait_for(queue.get(), timeout=heartbeat_seconds)
+        except TimeoutError:
+            if await is_disconnected():
+                return
+            yield ": heartbeat\n\n"
+            continue
+
+        if event is _SUBSCRIPTION_LOST:
+            logger.debug(f"Progress stream {processing_id[:8]} ended: subscription lost")
+            return
+
+        event_id = event.get("id")
+        if isinstance(event_id, int) and event_id <= snapshot_event_id:
+            continue
+
+        if event.get("type") == "step_completed":
+            yield format_sse(
+                {
+                    "step_name": event.get("step_name"),
+                    "completed_count": event.get("completed_count"),
+                },
+                event="step_completed",
+                event_id=event_id,
+            )
+        elif event.get("type") == "partial_output":
+            yield format_sse(
+                {
+                    "step_name": event.get("step_name"),
+                    "text": event.get("text"),
+                    "final": event.get("final", False),
+                    "attempt": event.get("attempt", 1),
+                },
+                event="partial_output",
+                event_id=event_id,
+            )
+        elif apply_event(status, event):
+            yield format_sse(_snapshot(status), event="progress", event_id=event_id)
+            if status["status"] in TERMINAL_STATUSES:
+                return
+
+
+_broker: ProgressEventBroker | None = None
+
+
+def get_progress_event_broker() -> ProgressEventBroker:
+    """Get the process-wide progress event broker."""
+    global _broker
+    if _broker is None:
+        _broker = ProgressEventBroker(
+            redis_url=settings.redis_url,
+            max_streams=settings.progress_stream_max_connections,
+        )
+    return _broker
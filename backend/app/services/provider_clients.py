@@ -0,0 +1,92 @@
+"""
+Shared AI Provider Clients
+
+Long-lived provider clients for pipeline step execution. Every client owns an
+HTTP connection pool; creating one per step throws away the keep-alive
+connections and pays a fresh TLS handshake on every AI call.
+
+Clients are cached per event loop. Async HTTP connections are bound to the loop
+that opened them, and the worker runs coroutines on whichever loop await_sync()
+finds, so a client is shared by all steps and jobs running on the same loop and
+dropped together with that loop.
+
+Usage:
+    >>> client = get_mistral_client()
+    >>> result = await client.process_text(prompt="...", model="mistral-large-latest")
+"""
+
+import asyncio
+from collections.abc import Callable
+import logging
+import threading
+from typing import Any, TypeVar
+import weakref
+
+from app.services.dify_rag_client import DifyRAGClient
+from app.services.mistral_client import MistralClient
+from app.services.ovh_client import OVHClient
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# event loop -> {client name -> client}
+_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[str, Any]]" = (
+    weakref.WeakKeyDictionary()
+)
+_lock = threading.Lock()
+
+
+def _get_shared_client(name: str, factory: Callable[[], T]) -> T:
+    """
+    Return the client for the running event loop, creating it on first use.
+
+    Without a running loop there is nothing to bind connections to, so a
+    private (uncached) instance is returned.
+    """
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return factory()
+
+    with _lock:
+        loop_clients = _clients.setdefault(loop, {})
+        client = loop_clients.get(name)
+        if client is None:
+            client = factory()
+            loop_clients[name] = client
+            logger.info(f"🔗 Shared {name} client created")
+        return client
+
+
+def get_mistral_client() -> MistralClient:
+    """
+    Get the shared Mistral AI client.
+
+    Raises:
+        ValueError: If MISTRAL_API_KEY is not set
+    """
+    return _get_shared_client("mistral", MistralClient)
+
+
+def get_dify_rag_client() -> DifyRAGClient:
+    """Get the shared Dify RAG client."""
+    return _get_shared_client("dify-rag", DifyRAGClient)
+
+
+def get_ovh_client() -> OVHClient:
+    """Get the shared OVH AI Endpoints client."""
+    return _get_shared_client("ovh", OVHClient)
+
+
+async def close_provider_clients() -> None:
+    """Close and forget the shared clients of the running event loop."""
+    loop = asyncio.get_running_loop()
+    with _lock:
+        loop_clients = _clients.pop(loop, {})
+
+    for name, client in loop_clients.items():
+        try:
+            await client.aclose()
+        except Exception as e:
+            logger.warning(f"⚠️ Failed to close shared {name} client: {e}")
@@ -0,0 +1,263 @@
+"""
+Quality Analysis Runner
+
+Runs FileQualityDetector off the API event loop and caches its results.
+
+The analysis (pdfplumber parsing, character alignment, OpenCV) is CPU-bound and
+mostly pure Python, so it runs in a small process pool instead of a thread: the
+uvicorn worker keeps serving other requests while an upload is analyzed. Each
+document gets a time budget; the detector stops sampling PDF pages once it is
+spent, and the caller stops waiting shortly after.
+
+Pool processes don't get the document through the task queue: the upload is
+copied chunk by chunk to a named temporary file, and the pool process opens it
+and reads only the pages it samples, so no copy of the whole file is held in
+memory.
+
+Results are cached in Redis by content hash (SHA-256 of the file), so the same
+bytes are analyzed once: repeated uploads skip the analysis and the worker's OCR
+stage can look up the analysis when the upload didn't store it in the job (e.g.
+the quality gate timed out and the analysis finished later).
+
+Usage:
+    >>> strategy, complexity, analysis = await analyze_document(
+    ...     upload.open(), "pdf", upload.filename, content_hash=upload.sha256
+    ... )
+"""
+
+import asyncio
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+import hashlib
+import logging
+import multiprocessing
+from pathlib import Path
+import shutil
+import tempfile
+import time
+from typing import Any, BinaryIO
+
+from app.core.config import settings
+from app.services.cache_service import get_cache_service
+from app.services.file_quality_detector import (
+    DocumentComplexity,
+    ExtractionStrategy,
+    FileQualityDetector,
+)
+from app.services.file_validator import UPLOAD_CHUNK_SIZE, as_binary_stream
+
+logger = logging.getLogger(__name__)
+
+CACHE_NAMESPACE = "quality_analysis"
+# Bump when the detector's results change, so old cache entries are ignored
+ANALYZER_VERSION = 1
+# Time the caller waits beyond the budget (last page, process start-up)
+TIMEOUT_GRACE_SECONDS = 15
+# Recycle pool processes after this many documents (bounds parser memory growth)
+MAX_TASKS_PER_CHILD = 50
+
+_pool: ProcessPoolExecutor | None = None
+
+AnalysisResult = tuple[ExtractionStrategy, DocumentComplexity, dict[str, Any]]
+
+
+class QualityAnalysisTimeoutError(TimeoutError):
+    """Raised when a document's analysis didn't finish within its time budget."""
+
+
+def _get_pool() -> ProcessPoolExecutor:
+    global _pool
+    if _pool is None:
+        # spawn: forking the threaded API process (event loop, Redis, DB pools) is unsafe
+        _pool = ProcessPoolExecutor(
+            max_workers=settings.quality_analysis_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            max_tasks_per_child=MAX_TASKS_PER_CHILD,
+        )
+        logger.info(
+            f"🔍 Quality analysis pool started ({settings.quality_analysis_workers} workers)"
+        )
+    return _pool
+
+
+def shutdown_pool() -> None:
+    """Stop the analysis processes of this API process (on shutdown)."""
+    global _pool
+    if _pool is not None:
+        _pool.shutdown(wait=False, cancel_futures=True)
+        _pool = None
+
+
+def _cache_key(content_hash: str, file_type: str) -> str:
+    return f"{file_type}:{content_hash}:v{ANALYZER_VERSION}"
+
+
+def _analyze(
+    path: str, file_type: str, filename: str, time_budget_seconds: float, max_pages: int
+) -> tuple[str, str, dict[str, Any]]:
+    """Run the detector on a file (in a pool process); returns picklable enum values."""
+    with open(path, "rb") as file:
+        strategy, complexity, analysis = FileQualityDetector().analyze(
+            file,
+            file_type,
+            filename,
+            time_budget_seconds=time_budget_seconds,
+            max_sample_pages=max_pages,
+        )
+    return strategy.value, complexity.value, analysis
+
+
+def _hash_content(file_content: bytes | BinaryIO) -> str:
+    return hashlib.file_digest(as_binary_stream(file_content), "sha256").hexdigest()
+
+
+def _write_named_file(file_content: bytes | BinaryIO) -> str:
+    """Copy the content to a named temporary file that a pool process can open."""
+    # uploaded_ prefix: left-overs (e.g. after a crash) are removed by the temp file cleanup
+    with tempfile.NamedTemporaryFile(
+        prefix="uploaded_", dir=settings.temp_dir, delete=False
+    ) as file:
+        shutil.copyfileobj(as_binary_stream(file_content), file, UPLOAD_CHUNK_SIZE)
+    return file.name
+
+
+def _submit(*args: Any) -> Future:
+    try:
+        return _get_pool().submit(_analyze, *args)
+    except BrokenProcessPool:
+        # A pool process died (e.g. OOM-killed): start a fresh pool
+        shutdown_pool()
+        return _get_pool().submit(_analyze, *args)
+
+
+def _to_result(strategy: str, complexity: str, analysis: dict[str, Any]) -> AnalysisResult:
+    return ExtractionStrategy(strategy), DocumentComplexity(complexity), analysis
+
+
+async def get_cached_analysis(content_hash: str, file_type: str) -> AnalysisResult | None:
+    """
+    Look up the cached analysis of a file.
+
+    Args:
+        content_hash: SHA-256 hex digest of the file content
+        file_type: "pdf" or "image"
+
+    Returns:
+        (strategy, complexity, analysis) or None if not cached (or Redis unavailable)
+    """
+    cached = await get_cache_service().get(CACHE_NAMESPACE, _cache_key(content_hash, file_type))
+    if not cached:
+        return None
+    try:
+        return _to_result(cached["strategy"], cached["complexity"], cached["analysis"])
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+async def _store_analysis(
+    content_hash: str, file_type: str, strategy: str, complexity: str, analysis: dict[str, Any]
+) -> None:
+    # Failed analyses aren't cached; the filename is per upload, not per content
+    if analysis.get("error"):
+        return
+    await get_cache_service().set(
+        CACHE_NAMESPACE,
+        _cache_key(content_hash, file_type),
+        {
+            "strategy": strategy,
+            "complexity": complexity,
+            "analysis": {key: value for key, value in analysis.items() if key != "filename"},
+        },
+        ttl=settings.quality_analysis_cache_ttl_seconds,
+    )
+
+
+def _store_when_done(
+    future: Future, loop: asyncio.AbstractEventLoop, content_hash: str, file_type: str
+) -> None:
+    """Cache the result of an analysis the caller stopped waiting for."""
+
+    def callback(done: Future) -> None:
+        if done.cancelled() or done.exception() is not None or loop.is_closed():
+            return
+        asyncio.run_coroutine_threadsafe(
+            _store_analysis(content_hash, file_type, *done.result()), loop
+        )
+
+    future.add_done_callback(callback)
+
+
+async def analyze_document(
+    file_content: bytes | BinaryIO,
+    file_type: str,
+    filename: str,
+    content_hash: str | None = None,
+) -> AnalysisResult:
+    """
+    Analyze a document off the event loop, reusing a cached result for the same bytes.
+
+    Args:
+        file_content: File content as bytes or readable binary file (e.g. a spooled upload)
+        file_type: "pdf" or "image"
+        filename: Original filename (logging and analysis metadata)
+        content_hash: SHA-256 hex digest of the content if already known
+
+    Returns:
+        Same as FileQualityDetector.analyze_file(); analysis["cached"] tells
+        whether the result came from the cache
+
+    Raises:
+        QualityAnalysisTimeoutError: The analysis didn't finish in time (if it was
+            already running, it finishes in the pool and is cached when done)
+    """
+    if content_hash is None:
+        content_hash = await asyncio.to_thread(_hash_content, file_content)
+
+    cached = await get_cached_analysis(content_hash, file_type)
+    if cached is not None:
+        strategy, complexity, analysis = cached
+        analysis.update(filename=filename, cached=True)
+        logger.info(f"🔍 Quality analysis cache hit for {filename} ({strategy.value})")
+        return strategy, complexity, analysis
+
+    # Pool processes get the path of a copy (file objects can't be passed)
+    path = await asyncio.to_thread(_write_named_file, file_content)
+    budget = settings.quality_analysis_time_budget_seconds
+    args = (path, file_type, filename, budget, settings.quality_analysis_max_sample_pages)
+    start_time = time.time()
+
+    if settings.quality_analysis_workers > 0:
+        loop = asyncio.get_running_loop()
+        try:
+            future = _submit(*args)
+        except Exception:
+            Path(path).unlink(missing_ok=True)
+            raise
+        # Removed when the analysis is done, also if the caller stopped waiting
+        future.add_done_callback(lambda _: Path(path).unlink(missing_ok=True))
+        try:
+            # On timeout a queued analysis is cancelled, a running one finishes in the pool
+            strategy, complexity, analysis = await asyncio.wait_for(
+                asyncio.wrap_future(future), timeout=budget + TIMEOUT_GRACE_SECONDS
+            )
+        except TimeoutError as e:
+            _store_when_done(future, loop, content_hash, file_type)
+            raise QualityAnalysisTimeoutError(
+                f"Quality analysis of {filename} exceeded {budget + TIMEOUT_GRACE_SECONDS:.0f}s"
+            ) from e
+        except BrokenProcessPool:
+            shutdown_pool()
+            raise
+    else:
+        try:
+            strategy, complexity, analysis = await asyncio.to_thread(_analyze, *args)
+        finally:
+            Path(path).unlink(missing_ok=True)
+
+    logger.info(
+        f"🔍 Quality analysis for {filename}: {strategy} in {time.time() - start_time:.2f}s "
+        f"({analysis.get('pages_checked', '-')} pages sampled)"
+    )
+    await _store_analysis(content_hash, file_type, strategy, complexity, analysis)
+    analysis["cached"] = False
+    return _to_result(strategy, complexity, analysis)
@@ -0,0 +1,216 @@
+"""
+Streaming Export
+
+Row-by-row CSV/NDJSON export of large tables with constant memory.
+
+Exports open their own database session when the response body starts
+streaming (the request session may already be closed by then) and read the
+rows through a server-side cursor in batches of EXPORT_BATCH_SIZE. Rows are
+encoded one at a time into chunks of about CHUNK_BYTES, optionally gzip
+compressed, so memory does not grow with the number of exported rows.
+
+Used by the audit log, chat log and cost statistics exports.
+"""
+
+from collections.abc import Callable, Iterable, Iterator
+import csv
+from datetime import date, datetime
+from decimal import Decimal
+from enum import Enum
+import io
+import json
+import logging
+from typing import Any
+from uuid import UUID
+import zlib
+
+from sqlalchemy.orm import Session
+
+from app.database.connection import get_db_session_context
+
+logger = logging.getLogger(__name__)
+
+# Encoded bytes collected before a chunk is handed to the response
+CHUNK_BYTES = 64 * 1024
+
+# gzip container for zlib.compressobj (as opposed to raw zlib)
+_GZIP_WBITS = 16 + zlib.MAX_WBITS
+
+
+class ExportFormat(str, Enum):
+    """Export file formats"""
+
+    CSV = "csv"
+    NDJSON = "ndjson"
+
+
+_MEDIA_TYPES = {
+    ExportFormat.CSV: "text/csv; charset=utf-8",
+    ExportFormat.NDJSON: "application/x-ndjson",
+}
+
+
+def to_export_value(value: Any) -> Any:
+    """Convert a database value to a JSON/CSV friendly value."""
+    if isinstance(value, datetime | date):
+        return value.isoformat()
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, UUID | Decimal):
+        return str(value)
+    return value
+
+
+def encode_csv(rows: Iterable[dict[str, Any]], fieldnames: list[str]) -> Iterator[bytes]:
+    """
+    Encode rows as CSV with a header line.
+
+    Args:
+        rows: Rows keyed by field name (missing fields are written empty)
+        fieldnames: Column order
+
+    Yields:
+        UTF-8 encoded chunks of about CHUNK_BYTES
+    """
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=fieldnames, extrasaction="ignore")
+    writer.writeheader()
+    for row in rows:
+        writer.writerow({key: to_export_value(value) for key, value in row.items()})
+        if buffer.tell() >= CHUNK_BYTES:
+            yield buffer.getvalue().encode("utf-8")
+            buffer.seek(0)
+            buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue().encode("utf-8")
+
+
+def encode_ndjson(rows: Iterable[dict[str, Any]], fieldnames: list[str]) -> Iterator[bytes]:
+    """
+    Encode rows as newline-delimited JSON, one object per row.
+
+    Args:
+        rows: Rows keyed by field name
+        fieldnames: Keys written for each row, in order
+
+    Yields:
+        UTF-8 encoded chunks of about CHUNK_BYTES
+    """
+    parts: list[bytes] = []
+    size = 0
+    for row in rows:
+        line = json.dumps(
+            {key: row.get(key) for key in fieldnames}, default=to_export_value, ensure_ascii=False
+        )
+        encoded = (line + "\n").encode("utf-8")
+        parts.append(encoded)
+        size += len(encoded)
+        if size >= CHUNK_BYTES:
+            yield b"".join(parts)
+            parts.clear()
+            size = 0
+    if parts:
+        yield b"".join(parts)
+
+
+def gzip_chunks(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    """Compress a byte stream into a single gzip member, chunk by chunk."""
+    compressor = zlib.compressobj(wbits=_GZIP_WBITS)
+    for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
+
+
+class StreamingExport:
+    """
+    Iterable export body for a StreamingResponse.
+
+    The row source is called with a fresh session once iteration starts, so no
+    rows are read before the client starts receiving the response. Starlette
+    iterates sync bodies in its thread pool, keeping the database reads off the
+    event loop.
+
+    Usage:
+        export = StreamingExport(
+            rows=lambda db: AuditLogRepository(db).iter_export_rows(...),
+            fieldnames=AuditLogRepository.EXPORT_FIELDS,
+            filename_stem="audit_logs_20250101_120000",
+            export_format=ExportFormat.CSV,
+        )
+        return StreamingResponse(export, media_type=export.media_type, headers=export.headers)
+    """
+
+    def __init__(
+        self,
+        rows: Callable[[Session], Iterable[dict[str, Any]]],
+        fieldnames: list[str],
+        filename_stem: str,
+        export_format: ExportFormat = ExportFormat.CSV,
+        compress: bool = False,
+        on_complete: Callable[[int, bool], None] | None = None,
+    ):
+        """
+        Initialize the export.
+
+        Args:
+            rows: Called with a database session, returns the rows to export
+            fieldnames: Exported columns, in order
+            filename_stem: Download filename without extension
+            export_format: CSV or NDJSON
+            compress: Gzip the body (adds .gz to the filename)
+            on_complete: Called with (row_count, completed) when the stream ends;
+                completed is False if the client disconnected or reading failed
+        """
+        self.rows = rows
+        self.fieldnames = fieldnames
+        self.export_format = export_format
+        self.compress = compress
+        self.on_complete = on_complete
+        self.row_count = 0
+
+        extension = export_format.value + (".gz" if compress else "")
+        self.filename = f"{filename_stem}.{extension}"
+
+    @property
+    def media_type(self) -> str:
+        """Response media type."""
+        return "application/gzip" if self.compress else _MEDIA_TYPES[self.export_format]
+
+    @property
+    def headers(self) -> dict[str, str]:
+        """Response headers (download filename, no proxy buffering)."""
+        return {
+            "Content-Disposition": f"attachment; filename={self.filename}",
+            "X-Accel-Buffering": "no",
+        }
+
+    def _counted(self, rows: Iterable[dict[str, Any]]) -> Iterator[dict[str, Any]]:
+        for row in rows:
+            self.row_count += 1
+            yield row
+
+    def __iter__(self) -> Iterator[bytes]:
+        encode = encode_csv if self.export_format == ExportFormat.CSV else encode_ndjson
+        completed = False
+        try:
+            with get_db_session_context() as db:
+                chunks = encode(self._counted(self.rows(db)), self.fieldnames)
+                if self.compress:
+                    chunks = gzip_chunks(chunks)
+                yield from chunks
+            completed = True
+        except GeneratorExit:
+            logger.info(f"Export {self.filename} aborted by client after {self.row_count} rows")
+            raise
+        except Exception as e:
+            # Headers are already sent, so the client sees a truncated download
+            logger.error(f"Export {self.filename} failed after {self.row_count} rows: {e}")
+            raise
+        finally:
+            if self.on_complete:
+                try:
+                    self.on_complete(self.row_count, completed)
+                except Exception as e:
+                    logger.error(f"Export {self.filename} completion callback failed: {e}")
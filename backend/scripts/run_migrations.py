@@ -66,6 +66,18 @@ def run_all_migrations(database_url: str):
     from app.database.migrations.add_required_context_variables import (
         upgrade as required_context_vars_migration,
     )
+    from app.database.migrations.add_input_source_column import (
+        migrate_up as input_source_migration,
+    )
+    from app.database.migrations.add_step_chunking_columns import (
+        migrate_up as step_chunking_migration,
+    )
+    from app.database.migrations.add_step_cache_responses_column import (
+        migrate_up as step_cache_responses_migration,
+    )
+    from app.database.migrations.add_step_stream_output_column import (
+        migrate_up as step_stream_output_migration,
+    )
 
     migrations = [
         ("add_pii_toggle", pii_toggle_migration),
@@ -73,6 +85,10 @@ def run_all_migrations(database_url: str):
         ("add_stop_conditions", stop_conditions_migration),
         ("add_post_branching", post_branching_migration),
         ("add_required_context_variables", required_context_vars_migration),
+        ("add_input_source", input_source_migration),
+        ("add_step_chunking", step_chunking_migration),
+        ("add_step_cache_responses", step_cache_responses_migration),
+        ("add_step_stream_output", step_stream_output_migration),
     ]
 
     results = []
@@ -15,6 +15,7 @@ from sqlalchemy.pool import StaticPool
 
 from app.main import app
 from app.database.connection import get_session
+from app.services.file_validator import IngestedUpload
 
 # Import ALL models to register them with Base.metadata before create_all()
 from app.database import unified_models, modular_pipeline_models  # noqa: F401
@@ -139,6 +140,13 @@ def seed_full_pipeline(test_db):
     test_db.commit()
 
 
+async def ingest_without_validation(file, **kwargs):
+    """Spool an upload like FileValidator.ingest_file(), skipping validation"""
+    upload = IngestedUpload(file.filename)
+    upload.write(await file.read())
+    return upload, None
+
+
 def create_test_image():
     """Create a small test image file"""
     img = Image.new("RGB", (100, 100), color="white")
@@ -169,14 +177,14 @@ def test_complete_image_upload_and_processing_flow(client, test_db, seed_full_pi
 
     # Mock file validation, OCR, and AI processing
     with (
-        patch("app.services.file_validator.FileValidator.validate_file") as mock_validate,
+        patch("app.services.file_validator.FileValidator.ingest_file") as mock_validate,
         patch("app.services.ocr_engine_manager.OCREngineManager.extract_text") as mock_ocr,
         patch("app.services.ovh_client.OVHClient.process_medical_text_with_prompt") as mock_ai,
         patch("app.services.privacy_filter_advanced.AdvancedPrivacyFilter.remove_pii") as mock_pii,
         patch("app.routers.upload.Celery") as mock_celery,
     ):
         # Mock file validation (always pass)
-        mock_validate.return_value = (True, None)
+        mock_validate.side_effect = ingest_without_validation
 
         # Configure Celery mock
         mock_celery_instance = MagicMock()
@@ -275,9 +283,9 @@ def test_invalid_file_upload_flow(client, seed_full_pipeline):
     # Create invalid file (text file)
     invalid_file = io.BytesIO(b"This is not a valid document")
 
-    with patch("app.services.file_validator.FileValidator.validate_file") as mock_validate:
+    with patch("app.services.file_validator.FileValidator.ingest_file") as mock_validate:
         # Mock file validation to fail for invalid file type
-        mock_validate.return_value = (False, "Unsupported file type: text/plain")
+        mock_validate.return_value = (None, "Unsupported file type: text/plain")
 
         response = client.post(
             "/api/upload",
@@ -301,8 +309,8 @@ def test_oversized_file_upload_flow(client, seed_full_pipeline):
     # Create large file (simulate with metadata)
     large_file = io.BytesIO(b"x" * 100)  # Actual size check happens in validator
 
-    with patch("app.services.file_validator.FileValidator.validate_file") as mock_validate:
-        mock_validate.return_value = (False, "File size exceeds 50MB limit")
+    with patch("app.services.file_validator.FileValidator.ingest_file") as mock_validate:
+        mock_validate.return_value = (None, "File size exceeds 50MB limit")
 
         response = client.post(
             "/api/upload",
@@ -343,11 +351,11 @@ def test_concurrent_uploads_flow(client, seed_full_pipeline):
     mock_inspect.active.return_value = {"worker1": []}
 
     with (
-        patch("app.services.file_validator.FileValidator.validate_file") as mock_validate,
+        patch("app.services.file_validator.FileValidator.ingest_file") as mock_validate,
         patch("app.routers.upload.Celery") as mock_celery,
     ):
         # Mock file validation (always pass)
-        mock_validate.return_value = (True, None)
+        mock_validate.side_effect = ingest_without_validation
 
         mock_celery_instance = MagicMock()
         mock_celery_instance.control.inspect.return_value = mock_inspect
@@ -390,11 +398,11 @@ def test_processing_timeout_flow(client, test_db, seed_full_pipeline):
     mock_inspect.active.return_value = {"worker1": []}
 
     with (
-        patch("app.services.file_validator.FileValidator.validate_file") as mock_validate,
+        patch("app.services.file_validator.FileValidator.ingest_file") as mock_validate,
         patch("app.routers.upload.Celery") as mock_celery,
     ):
         # Mock file validation (always pass)
-        mock_validate.return_value = (True, None)
+        mock_validate.side_effect = ingest_without_validation
 
         mock_celery_instance = MagicMock()
         mock_celery_instance.control.inspect.return_value = mock_inspect
@@ -361,6 +361,24 @@ class TestAILogInteractionRepository:
 
         assert count >= 1
 
+    def test_aggregate_costs_grouped_by_model(self, repository, create_ai_log_interaction):
+        """Test SQL-side cost aggregation per model."""
+        create_ai_log_interaction(model_name="model-a", total_tokens=100, total_cost_usd=0.01)
+        create_ai_log_interaction(model_name="model-a", total_tokens=200, total_cost_usd=0.02)
+        create_ai_log_interaction(model_name="model-b", total_tokens=50, total_cost_usd=0.005)
+
+        rows = {row.key: row for row in repository.aggregate_costs(group_by="model_name")}
+
+        assert rows["model-a"].calls == 2
+        assert rows["model-a"].tokens == 300
+        assert rows["model-a"].cost == pytest.approx(0.03)
+        assert rows["model-b"].calls == 1
+
+    def test_aggregate_costs_rejects_unknown_column(self, repository):
+        """Test that only whitelisted columns can be grouped by."""
+        with pytest.raises(ValueError):
+            repository.aggregate_costs(group_by="processing_id; DROP TABLE")
+
     # ==================== DELETE OLD LOGS ====================
 
     def test_delete_old_logs(self, repository, create_ai_log_interaction, db_session):
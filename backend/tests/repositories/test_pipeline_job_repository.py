@@ -4,9 +4,12 @@ Tests for PipelineJobRepository with encryption support.
 Tests encryption/decryption of file_content (binary field).
 """
 
+from io import BytesIO
+
 import pytest
 from sqlalchemy.orm import Session
 
+from app.core.encryption import encryptor
 from app.database.modular_pipeline_models import PipelineJobDB, StepExecutionStatus
 from app.repositories.pipeline_job_repository import PipelineJobRepository
 
@@ -54,15 +57,11 @@ class TestPipelineJobRepositoryEncryption:
         assert db_job is not None
 
         # Check that stored value is encrypted (not plaintext)
-        stored_content = db_job.file_content
-        if isinstance(stored_content, bytes):
-            stored_content_str = stored_content.decode("utf-8", errors="ignore")
-        else:
-            stored_content_str = str(stored_content)
+        stored_content = bytes(db_job.file_content)
 
-        # Should be encrypted (base64-encoded Fernet token)
-        assert stored_content_str != sample_binary_content.decode("utf-8", errors="ignore")
-        assert len(stored_content_str) > len(sample_binary_content)  # Encrypted is larger
+        # Should be encrypted (raw binary token)
+        assert sample_binary_content not in stored_content
+        assert len(stored_content) > len(sample_binary_content)  # Encrypted is larger
 
     def test_get_job_decrypts_file_content(
         self, job_repository: PipelineJobRepository, sample_binary_content: bytes
@@ -235,3 +234,136 @@ class TestPipelineJobRepositoryEncryption:
 
         # Verify byte-by-byte match
         assert retrieved_job.file_content == sample_binary_content
+
+    def test_file_content_stored_as_binary_token(
+        self, job_repository: PipelineJobRepository, sample_binary_content: bytes
+    ):
+        """Test that file_content is stored as a raw binary token (no base64 overhead)."""
+        job = job_repository.create(
+            job_id="test-job-token",
+            processing_id="test-processing-token",
+            filename="test.pdf",
+            file_type="pdf",
+            file_size=len(sample_binary_content),
+            file_content=sample_binary_content,
+            status=StepExecutionStatus.PENDING,
+            pipeline_config={},
+            ocr_config={},
+        )
+
+        stored_content = (
+            job_repository.db.query(PipelineJobDB.file_content).filter_by(id=job.id).scalar()
+        )
+        assert encryptor.is_binary_token(stored_content)
+        assert len(stored_content) == len(sample_binary_content) + 32  # header + one tag
+
+    def test_legacy_text_token_still_decrypted(
+        self, job_repository: PipelineJobRepository, sample_binary_content: bytes
+    ):
+        """Test that file_content written in the legacy base64 token format is still read."""
+        legacy_token = encryptor.encrypt_binary_field(sample_binary_content).encode("utf-8")
+        job = PipelineJobDB(
+            job_id="test-job-legacy",
+            processing_id="test-processing-legacy",
+            filename="test.pdf",
+            file_type="pdf",
+            file_size=len(sample_binary_content),
+            file_content=legacy_token,
+            status=StepExecutionStatus.PENDING,
+            pipeline_config={},
+            ocr_config={},
+        )
+        job_repository.db.add(job)
+        job_repository.db.commit()
+
+        retrieved_job = job_repository.get_by_processing_id("test-processing-legacy")
+
+        assert retrieved_job.file_content == sample_binary_content
+
+    def test_create_from_file_encrypts_streamed_content(
+        self, job_repository: PipelineJobRepository, sample_binary_content: bytes
+    ):
+        """Test that create_from_file() stores the file as a binary token and returns the ID."""
+        job_id = job_repository.create_from_file(
+            BytesIO(sample_binary_content),
+            job_id="test-job-file",
+            processing_id="test-processing-file",
+            filename="test.pdf",
+            file_type="pdf",
+            file_size=len(sample_binary_content),
+            status=StepExecutionStatus.PENDING,
+            pipeline_config={},
+            ocr_config={},
+        )
+
+        stored_content = (
+            job_repository.db.query(PipelineJobDB.file_content).filter_by(id=job_id).scalar()
+        )
+        assert encryptor.is_binary_token(stored_content)
+        assert job_repository.get_by_id(job_id).file_content == sample_binary_content
+
+
+class TestPipelineJobRepositoryColumnUpdates:
+    """Test lightweight column-only updates and decryption accounting."""
+
+    def _create_job(self, job_repository: PipelineJobRepository, content: bytes) -> PipelineJobDB:
+        return job_repository.create(
+            job_id="test-job-columns",
+            processing_id="test-processing-columns",
+            filename="test.pdf",
+            file_type="pdf",
+            file_size=len(content),
+            file_content=content,
+            status=StepExecutionStatus.PENDING,
+            pipeline_config={},
+            ocr_config={},
+        )
+
+    def test_update_columns_writes_only_given_columns(
+        self, job_repository: PipelineJobRepository, sample_binary_content: bytes
+    ):
+        """Test that update_columns() persists the columns and leaves file_content intact."""
+        job = self._create_job(job_repository, sample_binary_content)
+
+        result = job_repository.update_columns(
+            job.id, progress_percent=42, status=StepExecutionStatus.RUNNING
+        )
+
+        assert result == {"progress_percent": 42, "status": StepExecutionStatus.RUNNING}
+
+        retrieved_job = job_repository.get_by_id(job.id)
+        assert retrieved_job.progress_percent == 42
+        assert retrieved_job.status == StepExecutionStatus.RUNNING
+        assert retrieved_job.file_content == sample_binary_content
+
+    def test_update_columns_does_not_decrypt(
+        self, job_repository: PipelineJobRepository, sample_binary_content: bytes
+    ):
+        """Test that update_columns() never decrypts, while update() re-fetches and decrypts."""
+        job = self._create_job(job_repository, sample_binary_content)
+
+        job_repository.update(job.id, progress_percent=10)
+        assert job_repository.last_decrypted_bytes > len(sample_binary_content)
+
+        job_repository.update_columns(job.id, progress_percent=20)
+        assert job_repository.last_decrypted_bytes == 0
+
+    def test_update_columns_encrypts_text_fields(
+        self, job_repository: PipelineJobRepository, sample_binary_content: bytes
+    ):
+        """Test that encrypted columns passed to update_columns() are stored encrypted."""
+        job = self._create_job(job_repository, sample_binary_content)
+
+        job_repository.update_columns(job.id, translated_text="Übersetzter Befund")
+
+        raw = (
+            job_repository.db.query(PipelineJobDB.translated_text)
+            .filter(PipelineJobDB.id == job.id)
+            .scalar()
+        )
+        assert raw != "Übersetzter Befund"
+        assert job_repository.get_by_id(job.id).translated_text == "Übersetzter Befund"
+
+    def test_update_columns_missing_row_returns_none(self, job_repository: PipelineJobRepository):
+        """Test that update_columns() returns None when no row matches."""
+        assert job_repository.update_columns(999999, progress_percent=50) is None
@@ -4,16 +4,23 @@ Tests for PipelineStepExecutionRepository with encryption support.
 Tests encryption/decryption of input_text and output_text fields.
 """
 
+from datetime import datetime
+import hashlib
+from unittest.mock import patch
+
+from pydantic import SecretStr
 import pytest
 from sqlalchemy.orm import Session
 
+from app.core.config import settings
 from app.database.modular_pipeline_models import (
+    PipelineJobDB,
     PipelineStepExecutionDB,
+    PipelineTextBlobDB,
     StepExecutionStatus,
 )
-from app.repositories.pipeline_step_execution_repository import (
-    PipelineStepExecutionRepository,
-)
+from app.repositories.pipeline_step_execution_repository import PipelineStepExecutionRepository
+from app.repositories.pipeline_text_blob_repository import hash_text
 
 
 @pytest.fixture
@@ -58,9 +65,15 @@ class TestPipelineStepExecutionRepositoryEncryption:
         )
         assert db_execution is not None
 
-        # Check that stored values are encrypted (not plaintext)
-        stored_input = db_execution.input_text
-        stored_output = db_execution.output_text
+        # Text is stored in content-addressed blobs, not inline
+        assert db_execution.input_text is None
+        assert db_execution.output_text is None
+        stored_input = step_execution_repository.db.get(
+            PipelineTextBlobDB, db_execution.input_hash
+        ).content
+        stored_output = step_execution_repository.db.get(
+            PipelineTextBlobDB, db_execution.output_hash
+        ).content
 
         assert stored_input != input_text  # Should be encrypted
         assert stored_output != output_text  # Should be encrypted
@@ -291,3 +304,134 @@ class TestPipelineStepExecutionRepositoryEncryption:
         assert retrieved_execution is not None
         assert retrieved_execution.input_text == input_text
         assert retrieved_execution.output_text == output_text
+
+
+class TestPipelineStepExecutionTextBlobs:
+    """Test content-addressed storage of step input/output text."""
+
+    def _create(self, repository, job_id, step_order, input_text, output_text):
+        return repository.create(
+            job_id=job_id,
+            step_id=step_order,
+            step_name=f"step{step_order}",
+            step_order=step_order,
+            status=StepExecutionStatus.COMPLETED,
+            input_text=input_text,
+            output_text=output_text,
+        )
+
+    def _blobs(self, repository):
+        return {
+            blob.content_hash: blob.ref_count
+            for blob in repository.db.query(PipelineTextBlobDB).all()
+        }
+
+    def test_consecutive_steps_share_blobs(
+        self, step_execution_repository: PipelineStepExecutionRepository
+    ):
+        """Test that one step's output and the next step's input are stored once."""
+        original, simplified = "Befund: " * 100, "Einfach: " * 100
+        self._create(step_execution_repository, "job-dedup", 1, original, simplified)
+        self._create(step_execution_repository, "job-dedup", 2, simplified, simplified)
+
+        assert sorted(self._blobs(step_execution_repository).values()) == [1, 3]
+
+        storage = step_execution_repository.get_text_storage("job-dedup")
+        assert storage["steps"] == 2
+        assert storage["logical_bytes"] == len(original) + 3 * len(simplified)
+        assert storage["stored_bytes"] == len(original) + len(simplified)
+
+        executions = step_execution_repository.get_by_job_id("job-dedup")
+        assert [e.input_text for e in executions] == [original, simplified]
+        assert [e.output_text for e in executions] == [simplified, simplified]
+
+    def test_delete_by_job_id_releases_blobs(
+        self, step_execution_repository: PipelineStepExecutionRepository
+    ):
+        """Test that deleting a job's steps keeps blobs still referenced by other jobs."""
+        self._create(step_execution_repository, "job-a", 1, "shared", "only a")
+        self._create(step_execution_repository, "job-b", 1, "shared", "only b")
+
+        assert step_execution_repository.delete_by_job_id("job-a") == 1
+        step_execution_repository.db.commit()
+
+        assert sorted(self._blobs(step_execution_repository).values()) == [1, 1]
+        assert step_execution_repository.get_by_job_id("job-b")[0].input_text == "shared"
+
+    def test_content_hash_is_keyed(self):
+        """Test that stored hashes can't be recomputed from a guessed text without the key."""
+        text = "Befund: Patient Max Mustermann"
+
+        with patch.object(settings, "pipeline_text_hash_key", SecretStr("key-1")):
+            keyed = hash_text(text)
+            assert hash_text(text) == keyed
+        with patch.object(settings, "pipeline_text_hash_key", SecretStr("key-2")):
+            assert hash_text(text) != keyed
+
+        assert keyed != hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+    async def test_emergency_cleanup_releases_blobs(
+        self, step_execution_repository: PipelineStepExecutionRepository
+    ):
+        """Test that the emergency deletion of completed jobs also removes their text."""
+        from app.services.cleanup import cleanup_all_completed_jobs
+
+        db = step_execution_repository.db
+        db.add(
+            PipelineJobDB(
+                job_id="job-done",
+                processing_id="proc-done",
+                filename="befund.pdf",
+                file_type="pdf",
+                file_size=100,
+                file_content=b"%PDF",
+                status=StepExecutionStatus.COMPLETED,
+                pipeline_config={},
+                ocr_config={},
+            )
+        )
+        db.commit()
+        self._create(step_execution_repository, "job-done", 1, "input", "output")
+
+        with patch("app.database.connection.get_db_session", return_value=iter([db])):
+            assert await cleanup_all_completed_jobs() == 1
+
+        assert db.query(PipelineStepExecutionDB).count() == 0
+        assert self._blobs(step_execution_repository) == {}
+
+    def test_clear_text_content_releases_blobs(
+        self, step_execution_repository: PipelineStepExecutionRepository
+    ):
+        """Test that GDPR clearing removes the job's text blobs."""
+        self._create(step_execution_repository, "job-clear", 1, "input", "output")
+
+        step_execution_repository.clear_text_content("job-clear")
+
+        assert self._blobs(step_execution_repository) == {}
+
+    async def test_orphan_cleanup_removes_blobs(
+        self, step_execution_repository: PipelineStepExecutionRepository
+    ):
+        """Test that retention cleanup of orphaned steps also removes their text."""
+        from app.services.cleanup import cleanup_orphaned_step_executions
+
+        self._create(step_execution_repository, "job-gone", 1, "input", "output")
+
+        removed = await cleanup_orphaned_step_executions(step_execution_repository.db)
+
+        assert removed == 1
+        assert step_execution_repository.db.query(PipelineStepExecutionDB).count() == 0
+        assert self._blobs(step_execution_repository) == {}
+
+    def test_delete_unreferenced_sweeps_leaked_blobs(
+        self, step_execution_repository: PipelineStepExecutionRepository
+    ):
+        """Test that blobs orphaned by a bulk delete are swept after the grace period."""
+        self._create(step_execution_repository, "job-bulk", 1, "input", "output")
+        db = step_execution_repository.db
+        db.query(PipelineStepExecutionDB).delete()
+        db.commit()
+
+        blob_repository = step_execution_repository.blob_repository
+        assert blob_repository.delete_unreferenced(created_before=datetime(2000, 1, 1)) == 0
+        assert blob_repository.delete_unreferenced(created_before=datetime(2100, 1, 1)) == 2
@@ -5,8 +5,11 @@ Tests comprehensive file validation including size checks, MIME type detection,
 and format-specific validation for PDFs and images.
 """
 
+import hashlib
+
 import pytest
 from io import BytesIO
+from fastapi import UploadFile
 from unittest.mock import Mock, AsyncMock, patch, MagicMock
 import pypdf as PyPDF2
 from PIL import Image
@@ -557,6 +560,69 @@ class TestFileValidator:
             assert is_valid is False
             assert "klein" in error.lower()
 
+    # ==================== STREAMING INGESTION TESTS ====================
+
+    @pytest.fixture
+    def create_streamed_upload(self):
+        """Factory for real UploadFile objects that are read in chunks."""
+
+        def _create(filename: str, content: bytes):
+            return UploadFile(file=BytesIO(content), filename=filename)
+
+        return _create
+
+    @pytest.mark.asyncio
+    async def test_ingest_file_spools_and_hashes(self, create_streamed_upload, valid_png_content):
+        """Test that an ingested upload is spooled, hashed and typed from its header."""
+        file = create_streamed_upload("scan.png", valid_png_content)
+
+        with patch("app.services.file_validator.SPOOL_MAX_MEMORY", 1024):
+            upload, error = await FileValidator.ingest_file(file, chunk_size=1000)
+
+        assert error is None
+        with upload:
+            assert upload.size == len(valid_png_content)
+            assert upload.sha256 == hashlib.sha256(valid_png_content).hexdigest()
+            assert upload.mime_type == "image/png"
+            assert upload.spilled_to_disk is True
+            assert b"".join(upload.iter_chunks(4096)) == valid_png_content
+
+    @pytest.mark.asyncio
+    async def test_ingest_file_stops_reading_when_too_large(self, create_streamed_upload):
+        """Test that reading stops once the upload exceeds MAX_FILE_SIZE."""
+        content = b"%PDF-1.4\n" + b"0" * 100_000
+        file = create_streamed_upload("big.pdf", content)
+
+        with patch("app.services.file_validator.MAX_FILE_SIZE", 20_000):
+            upload, error = await FileValidator.ingest_file(file, chunk_size=8192)
+
+        assert upload is None
+        assert "zu groß" in error.lower()
+        assert file.file.tell() < len(content)
+
+    @pytest.mark.asyncio
+    async def test_ingest_file_rejects_type_from_first_chunks(self, create_streamed_upload):
+        """Test that an unsupported type is rejected before the rest is read."""
+        content = b"plain text, not a document. " * 10_000
+        file = create_streamed_upload("notes.docx", content)
+
+        upload, error = await FileValidator.ingest_file(file, chunk_size=8192)
+
+        assert upload is None
+        assert "nicht unterstützt" in error
+        assert file.file.tell() == 8192
+
+    @pytest.mark.asyncio
+    async def test_ingest_file_validates_content(self, create_streamed_upload):
+        """Test that content validation reads from the spool."""
+        content = b"%PDF-1.4\n" + b"garbage" * 1000
+        file = create_streamed_upload("broken.pdf", content)
+
+        upload, error = await FileValidator.ingest_file(file)
+
+        assert upload is None
+        assert "Ungültige PDF-Datei" in error
+
     # ==================== CONSTANTS TESTS ====================
 
     def test_allowed_mime_types_defined(self):
@@ -34,7 +34,7 @@ class TestModularPipelineExecutorInitialization:
         mock_session = Mock()
 
         with (
-            patch("app.services.modular_pipeline_executor.OVHClient"),
+            patch("app.services.modular_pipeline_executor.get_ovh_client"),
             patch("app.services.modular_pipeline_executor.DocumentClassManager"),
             patch("app.services.modular_pipeline_executor.AICostTracker"),
         ):
@@ -55,7 +55,7 @@ class TestConfigurationLoading:
         """Create executor instance for testing"""
         mock_session = Mock()
         with (
-            patch("app.services.modular_pipeline_executor.OVHClient"),
+            patch("app.services.modular_pipeline_executor.get_ovh_client"),
             patch("app.services.modular_pipeline_executor.DocumentClassManager"),
             patch("app.services.modular_pipeline_executor.AICostTracker"),
         ):
@@ -211,7 +211,7 @@ class TestStopConditions:
         """Create executor instance for testing"""
         mock_session = Mock()
         with (
-            patch("app.services.modular_pipeline_executor.OVHClient"),
+            patch("app.services.modular_pipeline_executor.get_ovh_client"),
             patch("app.services.modular_pipeline_executor.DocumentClassManager"),
             patch("app.services.modular_pipeline_executor.AICostTracker"),
         ):
@@ -295,7 +295,7 @@ class TestBranchExtraction:
         """Create executor instance for testing"""
         mock_session = Mock()
         with (
-            patch("app.services.modular_pipeline_executor.OVHClient"),
+            patch("app.services.modular_pipeline_executor.get_ovh_client"),
             patch(
                 "app.services.modular_pipeline_executor.DocumentClassManager"
             ) as MockDocClassManager,
@@ -311,7 +311,7 @@ class TestBranchExtraction:
             mock_manager.get_class_by_key.return_value = mock_doc_class
 
             executor = ModularPipelineExecutor(session=mock_session)
-            return executor
+            yield executor
 
     def test_extract_branch_value_document_type_success(self, executor):
         """Test extracting document type branch value"""
@@ -388,7 +388,7 @@ class TestStepExecution:
         """Create executor instance for testing"""
         mock_session = Mock()
         with (
-            patch("app.services.modular_pipeline_executor.OVHClient") as MockOVH,
+            patch("app.services.modular_pipeline_executor.get_ovh_client") as MockOVH,
             patch("app.services.modular_pipeline_executor.DocumentClassManager"),
             patch("app.services.modular_pipeline_executor.AICostTracker") as MockCostTracker,
         ):
@@ -409,7 +409,7 @@ class TestStepExecution:
             mock_tracker.log_ai_call = Mock()
 
             executor = ModularPipelineExecutor(session=mock_session)
-            return executor
+            yield executor
 
     @pytest.fixture
     def mock_step(self):
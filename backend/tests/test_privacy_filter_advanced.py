@@ -7,93 +7,94 @@ Verifies that the consolidated privacy filter maintains all functionality.
 
 import pytest
 import os
+import re
 import sys
 
 # Add backend to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 
-from app.services.privacy_filter_advanced import AdvancedPrivacyFilter
+from app.services.privacy_filter_advanced import AdvancedPrivacyFilter, _build_term_alternation
 
 
 class TestAdvancedPrivacyFilter:
     """Test suite for AdvancedPrivacyFilter"""
 
     @pytest.fixture
-    def filter(self):
+    def privacy_filter(self):
         """Create filter instance for testing (without database loading)"""
         return AdvancedPrivacyFilter(load_custom_terms=False)
 
-    def test_initialization(self, filter):
+    def test_initialization(self, privacy_filter):
         """Test filter initializes correctly"""
-        assert filter is not None
-        assert filter.medical_terms is not None
-        assert filter.protected_abbreviations is not None
-        assert filter.patterns is not None
-        assert len(filter.medical_terms) >= 140  # Should have 300+ terms now
-        assert len(filter.protected_abbreviations) >= 200  # Should have 210+ abbreviations
-
-    def test_remove_patient_names(self, filter):
+        assert privacy_filter is not None
+        assert privacy_filter.medical_terms is not None
+        assert privacy_filter.protected_abbreviations is not None
+        assert privacy_filter.patterns is not None
+        assert len(privacy_filter.medical_terms) >= 140  # Should have 300+ terms now
+        assert len(privacy_filter.protected_abbreviations) >= 200  # Should have 210+ abbreviations
+
+    def test_remove_patient_names(self, privacy_filter):
         """Test removal of patient names"""
         text = """
         Patient: Müller, Hans
         Geburtsdatum: 15.05.1965
         """
-        result, _ = filter.remove_pii(text)
+        result, _ = privacy_filter.remove_pii(text)
 
         assert "Müller" not in result
         assert "Hans" not in result
         assert "15.05.1965" not in result
 
-    def test_remove_birthdates(self, filter):
+    def test_remove_birthdates(self, privacy_filter):
         """Test removal of birthdates"""
         text = "Patient geb. 01.01.1980 wurde untersucht"
-        result, _ = filter.remove_pii(text)
+        result, _ = privacy_filter.remove_pii(text)
 
         assert "01.01.1980" not in result
         assert "untersucht" in result
 
-    def test_remove_addresses(self, filter):
+    def test_remove_addresses(self, privacy_filter):
         """Test removal of street addresses and PLZ"""
         text = """
         Musterstraße 123, 12345 Berlin
         Hauptstraße 42
         """
-        result, _ = filter.remove_pii(text)
+        result, _ = privacy_filter.remove_pii(text)
 
         assert "Musterstraße" not in result
         assert "12345 Berlin" not in result or "PLZ/ORT ENTFERNT" in result
         assert "Hauptstraße" not in result
 
-    def test_remove_contact_information(self, filter):
+    def test_remove_contact_information(self, privacy_filter):
         """Test removal of phone and email"""
         text = """
         Telefon: +49 30 12345678
         Email: patient@example.com
         """
-        result, _ = filter.remove_pii(text)
+        result, _ = privacy_filter.remove_pii(text)
 
         assert "+49 30 12345678" not in result
         assert "patient@example.com" not in result
 
-    def test_remove_insurance_numbers(self, filter):
+    def test_remove_insurance_numbers(self, privacy_filter):
         """Test removal of insurance identifiers"""
         text = """
         Versichertennummer: A123456789
         Patientennummer: 98765
         """
-        result, _ = filter.remove_pii(text)
+        result, _ = privacy_filter.remove_pii(text)
 
         assert "A123456789" not in result
         assert "98765" not in result
 
-    def test_preserve_medical_terms(self, filter):
+    def test_preserve_medical_terms(self, privacy_filter):
         """Test that medical terminology is preserved"""
         text = """
         Diagnose: Diabetes mellitus Typ 2
         Behandlung mit Metformin 1000mg
         Laborwerte: Hämoglobin 14.5 g/dl
         """
-        result, _ = filter.remove_pii(text)
+        result, _ = privacy_filter.remove_pii(text)
 
         # Medical terms must be preserved
         assert "Diabetes" in result or "diabetes" in result.lower()
@@ -101,7 +102,7 @@ class TestAdvancedPrivacyFilter:
         assert "Hämoglobin" in result or "hämoglobin" in result.lower()
         assert "14.5" in result  # Lab value
 
-    def test_preserve_medical_abbreviations(self, filter):
+    def test_preserve_medical_abbreviations(self, privacy_filter):
         """Test preservation of medical abbreviations"""
         text = """
         HbA1c: 8.2%
@@ -109,7 +110,7 @@ class TestAdvancedPrivacyFilter:
         CRP: 5 mg/l
         eGFR: 90 ml/min
         """
-        result, _ = filter.remove_pii(text)
+        result, _ = privacy_filter.remove_pii(text)
 
         # All abbreviations should be preserved
         assert "HbA1c" in result or "hba1c" in result.lower()
@@ -121,7 +122,7 @@ class TestAdvancedPrivacyFilter:
         assert "2.1" in result
         assert "90" in result
 
-    def test_preserve_lab_values(self, filter):
+    def test_preserve_lab_values(self, privacy_filter):
         """Test preservation of laboratory values and measurements"""
         text = """
         Laborwerte vom 15.01.2024:
@@ -130,7 +131,7 @@ class TestAdvancedPrivacyFilter:
         - Thrombozyten: 250 /nl
         - Glucose: 95 mg/dl
         """
-        result, _ = filter.remove_pii(text)
+        result, _ = privacy_filter.remove_pii(text)
 
         # Lab values must be preserved
         assert "14.5" in result
@@ -138,14 +139,14 @@ class TestAdvancedPrivacyFilter:
         assert "250" in result
         assert "95" in result
 
-    def test_preserve_vitamin_d3(self, filter):
+    def test_preserve_vitamin_d3(self, privacy_filter):
         """Test preservation of Vitamin D3 and similar vitamins"""
         text = """
         Vitamin D3: 25 ng/ml (Mangel)
         Vitamin B12: 350 pg/ml
         25-OH-D3: 15 ng/ml
         """
-        result, _ = filter.remove_pii(text)
+        result, _ = privacy_filter.remove_pii(text)
 
         # Vitamin names should be preserved
         assert "Vitamin D3" in result or "D3" in result
@@ -153,7 +154,7 @@ class TestAdvancedPrivacyFilter:
         assert "25" in result  # Value
         assert "350" in result  # Value
 
-    def test_complex_medical_document(self, filter):
+    def test_complex_medical_document(self, privacy_filter):
         """Test with realistic doctor's letter"""
         text = """
         Universitätsklinikum München
@@ -181,7 +182,7 @@ class TestAdvancedPrivacyFilter:
         Mit freundlichen Grüßen
         Dr. med. Schmidt
         """
-        result, _ = filter.remove_pii(text)
+        result, _ = privacy_filter.remove_pii(text)
 
         # PII should be removed
         assert "Mustermann" not in result
@@ -200,7 +201,7 @@ class TestAdvancedPrivacyFilter:
         assert "Metformin" in result or "METFORMIN" in result
         assert "Ramipril" in result or "RAMIPRIL" in result
 
-    def test_validate_medical_content_preservation(self, filter):
+    def test_validate_medical_content_preservation(self, privacy_filter):
         """Test medical content validation method"""
         original = """
         Patient: Test Patient
@@ -208,23 +209,23 @@ class TestAdvancedPrivacyFilter:
         Laborwerte: Hämoglobin 14.5 g/dl, HbA1c 5.8%
         Medikament: Metformin 1000mg
         """
-        cleaned, _ = filter.remove_pii(original)
+        cleaned, _ = privacy_filter.remove_pii(original)
 
         # Validation should pass (medical terms preserved)
-        is_valid = filter.validate_medical_content(original, cleaned)
+        is_valid = privacy_filter.validate_medical_content(original, cleaned)
         assert is_valid is True, "Medical content validation failed"
 
-    def test_empty_text_handling(self, filter):
+    def test_empty_text_handling(self, privacy_filter):
         """Test handling of empty or None text"""
-        result, meta = filter.remove_pii("")
+        result, meta = privacy_filter.remove_pii("")
         assert result == ""
         assert meta == {}
 
-        result2, meta2 = filter.remove_pii(None)
+        result2, meta2 = privacy_filter.remove_pii(None)
         assert result2 is None
         assert meta2 == {}
 
-    def test_text_without_pii(self, filter):
+    def test_text_without_pii(self, privacy_filter):
         """Test text that has no PII (should be mostly unchanged)"""
         text = """
         Laborwerte:
@@ -232,7 +233,7 @@ class TestAdvancedPrivacyFilter:
         Leukozyten: 7.2 /nl
         Glucose: 95 mg/dl
         """
-        result, _ = filter.remove_pii(text)
+        result, _ = privacy_filter.remove_pii(text)
 
         # Should contain all original content
         assert "Hämoglobin" in result or "hämoglobin" in result.lower()
@@ -240,25 +241,25 @@ class TestAdvancedPrivacyFilter:
         assert "7.2" in result
         assert "95" in result
 
-    def test_gdpr_compliance_markers(self, filter):
+    def test_gdpr_compliance_markers(self, privacy_filter):
         """Test that PII is replaced with GDPR-compliant markers"""
         text = """
         Patient: Müller, Hans
         Geb.: 01.01.1980
         Tel: +49 30 12345678
         """
-        result, _ = filter.remove_pii(text)
+        result, _ = privacy_filter.remove_pii(text)
 
         # Should have replacement markers
         assert "[NAME ENTFERNT]" in result or "NAME ENTFERNT" in result.upper()
         assert "[GEBURTSDATUM ENTFERNT]" in result or "GEBURTSDATUM ENTFERNT" in result.upper()
         assert "[TELEFON ENTFERNT]" in result or "TELEFON ENTFERNT" in result.upper()
 
-    def test_spacy_availability(self, filter):
+    def test_spacy_availability(self, privacy_filter):
         """Test that filter works with or without spaCy"""
         # Filter should work regardless of spaCy availability
         text = "Patient: Max Mustermann"
-        result, _ = filter.remove_pii(text)
+        result, _ = privacy_filter.remove_pii(text)
         assert "Mustermann" not in result
 
 
@@ -266,20 +267,20 @@ class TestPhase4DrugDatabase:
     """Test Phase 4.2: Drug Database Integration (Issue #35)"""
 
     @pytest.fixture
-    def filter(self):
+    def privacy_filter(self):
         """Create filter instance without database loading"""
         return AdvancedPrivacyFilter(load_custom_terms=False)
 
-    def test_drug_database_initialized(self, filter):
+    def test_drug_database_initialized(self, privacy_filter):
         """Test that drug database is initialized with 100+ medications"""
-        assert hasattr(filter, "drug_database")
-        assert len(filter.drug_database) >= 100
+        assert hasattr(privacy_filter, "drug_database")
+        assert len(privacy_filter.drug_database) >= 100
         # Check some specific drugs
-        assert "metoprolol" in filter.drug_database
-        assert "ibuprofen" in filter.drug_database
-        assert "ramipril" in filter.drug_database
+        assert "metoprolol" in privacy_filter.drug_database
+        assert "ibuprofen" in privacy_filter.drug_database
+        assert "ramipril" in privacy_filter.drug_database
 
-    def test_preserve_generic_drug_names(self, filter):
+    def test_preserve_generic_drug_names(self, privacy_filter):
         """Test preservation of generic (INN) drug names"""
         text = """
         Medikation:
@@ -287,7 +288,7 @@ class TestPhase4DrugDatabase:
         - Ramipril 5mg 0-0-1
         - Omeprazol 20mg 1-0-0
         """
-        result, _ = filter.remove_pii(text)
+        result, _ = privacy_filter.remove_pii(text)
 
         # Generic drug names should be preserved
         assert "Metoprolol" in result or "METOPROLOL" in result
@@ -297,7 +298,7 @@ class TestPhase4DrugDatabase:
         assert "100mg" in result
         assert "5mg" in result
 
-    def test_preserve_brand_name_drugs(self, filter):
+    def test_preserve_brand_name_drugs(self, privacy_filter):
         """Test preservation of German brand name medications"""
         text = """
         Patient erhält:
@@ -306,7 +307,7 @@ class TestPhase4DrugDatabase:
         - Marcumar nach INR
         - Xarelto 20mg
         """
-        result, _ = filter.remove_pii(text)
+        result, _ = privacy_filter.remove_pii(text)
 
         # Brand names should be preserved
         assert "Beloc" in result or "BELOC" in result
@@ -314,7 +315,7 @@ class TestPhase4DrugDatabase:
         assert "Marcumar" in result or "MARCUMAR" in result
         assert "Xarelto" in result or "XARELTO" in result
 
-    def test_preserve_psychiatric_medications(self, filter):
+    def test_preserve_psychiatric_medications(self, privacy_filter):
         """Test preservation of psychiatric drug names"""
         text = """
         Psychiatrische Medikation:
@@ -322,20 +323,20 @@ class TestPhase4DrugDatabase:
         - Quetiapin 25mg zur Nacht
         - Lorazepam 0.5mg bei Bedarf
         """
-        result, _ = filter.remove_pii(text)
+        result, _ = privacy_filter.remove_pii(text)
 
         assert "Sertralin" in result or "SERTRALIN" in result
         assert "Quetiapin" in result or "QUETIAPIN" in result
         assert "Lorazepam" in result or "LORAZEPAM" in result
 
-    def test_drugs_not_removed_as_names(self, filter):
+    def test_drugs_not_removed_as_names(self, privacy_filter):
         """Test that drug names are not mistaken for patient names by NER"""
         # Some drug names could be mistaken for surnames
         text = """
         Therapie: Duloxetin, Pregabalin, Gabapentin
         Zusätzlich Marcumar nach Plan
         """
-        result, _ = filter.remove_pii(text)
+        result, _ = privacy_filter.remove_pii(text)
 
         # These should NOT be removed as names
         assert "Duloxetin" in result or "DULOXETIN" in result
@@ -347,18 +348,18 @@ class TestPhase4MedicalCodes:
     """Test Phase 4.3: Medical Coding Support (Issue #35)"""
 
     @pytest.fixture
-    def filter(self):
+    def privacy_filter(self):
         """Create filter instance without database loading"""
         return AdvancedPrivacyFilter(load_custom_terms=False)
 
-    def test_medical_code_patterns_initialized(self, filter):
+    def test_medical_code_patterns_initialized(self, privacy_filter):
         """Test that medical code patterns are compiled"""
-        assert hasattr(filter, "medical_code_patterns")
-        assert "icd10" in filter.medical_code_patterns
-        assert "ops" in filter.medical_code_patterns
-        assert "loinc" in filter.medical_code_patterns
+        assert hasattr(privacy_filter, "medical_code_patterns")
+        assert "icd10" in privacy_filter.medical_code_patterns
+        assert "ops" in privacy_filter.medical_code_patterns
+        assert "loinc" in privacy_filter.medical_code_patterns
 
-    def test_preserve_icd10_codes(self, filter):
+    def test_preserve_icd10_codes(self, privacy_filter):
         """Test preservation of ICD-10 diagnostic codes"""
         text = """
         Diagnosen:
@@ -367,7 +368,7 @@ class TestPhase4MedicalCodes:
         3. Herzinsuffizienz (I50.1)
         4. Mammakarzinom (C50.9)
         """
-        result, _ = filter.remove_pii(text)
+        result, _ = privacy_filter.remove_pii(text)
 
         # ICD-10 codes should be preserved
         assert "E11.9" in result
@@ -375,7 +376,7 @@ class TestPhase4MedicalCodes:
         assert "I50.1" in result
         assert "C50.9" in result
 
-    def test_preserve_ops_codes(self, filter):
+    def test_preserve_ops_codes(self, privacy_filter):
         """Test preservation of OPS procedure codes"""
         text = """
         Durchgeführte Operationen:
@@ -383,14 +384,14 @@ class TestPhase4MedicalCodes:
         - Diagnostische Laparoskopie (1-632.0)
         - Herzkatheter (8-854.3)
         """
-        result, _ = filter.remove_pii(text)
+        result, _ = privacy_filter.remove_pii(text)
 
         # OPS codes should be preserved
         assert "5-470.11" in result
         assert "1-632.0" in result
         assert "8-854.3" in result
 
-    def test_preserve_loinc_codes(self, filter):
+    def test_preserve_loinc_codes(self, privacy_filter):
         """Test preservation of LOINC laboratory codes"""
         text = """
         Laboruntersuchungen (LOINC):
@@ -399,7 +400,7 @@ class TestPhase4MedicalCodes:
         - Kreatinin: 2160-0
         - HbA1c: 4548-4
         """
-        result, _ = filter.remove_pii(text)
+        result, _ = privacy_filter.remove_pii(text)
 
         # LOINC codes should be preserved
         assert "2339-0" in result
@@ -407,14 +408,73 @@ class TestPhase4MedicalCodes:
         assert "2160-0" in result
         assert "4548-4" in result
 
-    def test_loinc_database_initialized(self, filter):
+    def test_loinc_database_initialized(self, privacy_filter):
         """Test that LOINC code database is initialized"""
-        assert hasattr(filter, "common_loinc_codes")
-        assert len(filter.common_loinc_codes) >= 50
+        assert hasattr(privacy_filter, "common_loinc_codes")
+        assert len(privacy_filter.common_loinc_codes) >= 50
         # Check specific codes
-        assert "2339-0" in filter.common_loinc_codes  # Glucose
-        assert "718-7" in filter.common_loinc_codes  # Hemoglobin
-        assert "4548-4" in filter.common_loinc_codes  # HbA1c
+        assert "2339-0" in privacy_filter.common_loinc_codes  # Glucose
+        assert "718-7" in privacy_filter.common_loinc_codes  # Hemoglobin
+        assert "4548-4" in privacy_filter.common_loinc_codes  # HbA1c
+
+
+class TestMedicalTermMatcher:
+    """Test single-pass trie matcher used by _protect_medical_terms()"""
+
+    @pytest.fixture
+    def privacy_filter(self):
+        """Create filter instance without database loading"""
+        return AdvancedPrivacyFilter(load_custom_terms=False)
+
+    def test_build_term_alternation_matches_all_terms(self):
+        """Test that the trie alternation matches every term and nothing else"""
+        terms = {"hämoglobin", "hämatokrit", "häm", "kalium"}
+        pattern = re.compile(r"\b(?:" + _build_term_alternation(terms) + r")\b")
+
+        for term in terms:
+            assert pattern.fullmatch(term)
+        assert not pattern.fullmatch("hämo")
+        assert _build_term_alternation([]) == ""
+
+    def test_labval_placeholders(self, privacy_filter):
+        """Test lab value protection emits LABVAL placeholders with original casing"""
+        result = privacy_filter._protect_medical_terms("Kreatinin: 1.1 mg und Hämoglobin 12.5 g")
+
+        assert "§LABVAL_Kreatinin_1.1_mg§" in result
+        assert "§LABVAL_Hämoglobin_12.5_g§" in result
+
+    def test_loinc_and_drug_placeholders(self, privacy_filter):
+        """Test known LOINC codes and drug names are protected in one pass"""
+        result = privacy_filter._protect_medical_terms("Glucose 2339-0, Therapie mit Metformin")
+
+        assert "§LOINC_2339-0§" in result
+        assert "§DRUG_METFORMIN§" in result
+
+    def test_matches_per_term_substitution(self, privacy_filter):
+        """Test output is identical to applying one re.sub per term"""
+        text = "Natrium 140 mmol/l\nKalium: 4,2 mmol/l\nRamipril 5mg, Metformin 1000mg\nLOINC 718-7"
+
+        expected = text
+        for term in privacy_filter.medical_terms:
+            if len(term) > 3:
+                expected = re.sub(
+                    r"\b(" + re.escape(term) + r")\s*:?\s*([0-9]+[,.]?[0-9]*)\s*([a-zA-Z/%]*)\b",
+                    r"§LABVAL_\1_\2_\3§",
+                    expected,
+                    flags=re.IGNORECASE,
+                )
+
+        assert privacy_filter._labval_matcher.sub(r"§LABVAL_\1_\2_\3§", text) == expected
+
+    def test_matcher_rebuilt_after_term_change(self, privacy_filter):
+        """Test custom terms added after init are picked up"""
+        assert "§LABVAL_" not in privacy_filter._protect_medical_terms("Spezialmarker 3.4 U")
+
+        privacy_filter.medical_terms.add("spezialmarker")
+
+        assert "§LABVAL_Spezialmarker_3.4_U§" in privacy_filter._protect_medical_terms(
+            "Spezialmarker 3.4 U"
+        )
 
 
 class TestPhase4DynamicDictionary:
@@ -423,26 +483,26 @@ class TestPhase4DynamicDictionary:
     def test_filter_works_without_database(self):
         """Test filter works when database is unavailable"""
         # Should not raise exception
-        filter = AdvancedPrivacyFilter(load_custom_terms=False)
-        assert filter is not None
-        assert filter._custom_terms_loaded is False
+        privacy_filter = AdvancedPrivacyFilter(load_custom_terms=False)
+        assert privacy_filter is not None
+        assert privacy_filter._custom_terms_loaded is False
 
     def test_default_terms_always_available(self):
         """Test that default terms are available even without database"""
-        filter = AdvancedPrivacyFilter(load_custom_terms=False)
+        privacy_filter = AdvancedPrivacyFilter(load_custom_terms=False)
 
         # Check core medical terms
-        assert "diabetes" in filter.medical_terms
-        assert "hypertonie" in filter.medical_terms
-        assert "hämoglobin" in filter.medical_terms
+        assert "diabetes" in privacy_filter.medical_terms
+        assert "hypertonie" in privacy_filter.medical_terms
+        assert "hämoglobin" in privacy_filter.medical_terms
 
         # Check drugs
-        assert "metformin" in filter.drug_database
-        assert "ramipril" in filter.drug_database
+        assert "metformin" in privacy_filter.drug_database
+        assert "ramipril" in privacy_filter.drug_database
 
         # Check eponyms
-        assert "parkinson" in filter.medical_eponyms
-        assert "alzheimer" in filter.medical_eponyms
+        assert "parkinson" in privacy_filter.medical_eponyms
+        assert "alzheimer" in privacy_filter.medical_eponyms
 
     def test_constructor_parameter(self):
         """Test load_custom_terms constructor parameter"""
@@ -459,11 +519,11 @@ class TestPhase4Integration:
     """Integration tests for Phase 4 features"""
 
     @pytest.fixture
-    def filter(self):
+    def privacy_filter(self):
         """Create filter instance without database loading"""
         return AdvancedPrivacyFilter(load_custom_terms=False)
 
-    def test_complex_document_with_drugs_and_codes(self, filter):
+    def test_complex_document_with_drugs_and_codes(self, privacy_filter):
         """Test realistic document with drugs, ICD codes, and LOINC codes"""
         text = """
         Arztbrief
@@ -492,7 +552,7 @@ class TestPhase4Integration:
         Mit freundlichen Grüßen
         Dr. med. Weber
         """
-        result, metadata = filter.remove_pii(text)
+        result, metadata = privacy_filter.remove_pii(text)
 
         # PII should be removed
         assert "Schmidt" not in result
@@ -527,10 +587,10 @@ class TestPhase4Integration:
         assert "entities_detected" in metadata
         assert metadata["has_ner"] is not None
 
-    def test_metadata_returned(self, filter):
+    def test_metadata_returned(self, privacy_filter):
         """Test that remove_pii returns metadata dictionary"""
         text = "Patient: Test Person, Diagnose: Diabetes E11.9"
-        result, metadata = filter.remove_pii(text)
+        result, metadata = privacy_filter.remove_pii(text)
 
         assert isinstance(metadata, dict)
         assert "entities_detected" in metadata
@@ -542,21 +602,21 @@ class TestPhase5ConfidenceScoring:
     """Test Phase 5.1: Confidence Scoring (Issue #35)"""
 
     @pytest.fixture
-    def filter(self):
+    def privacy_filter(self):
         """Create filter instance without database loading"""
         return AdvancedPrivacyFilter(load_custom_terms=False)
 
-    def test_confidence_counters_exist(self, filter):
+    def test_confidence_counters_exist(self, privacy_filter):
         """Test that confidence counters are initialized in metadata"""
         text = "Patient: Max Mustermann, Diagnose: Diabetes"
-        _, metadata = filter.remove_pii(text)
+        _, metadata = privacy_filter.remove_pii(text)
 
         assert "high_confidence_removals" in metadata
         assert "medium_confidence_removals" in metadata
         assert "low_confidence_removals" in metadata
         assert "pattern_based_removals" in metadata
 
-    def test_pattern_based_removals_tracked(self, filter):
+    def test_pattern_based_removals_tracked(self, privacy_filter):
         """Test that pattern-based PII removals are counted"""
         text = """
         Patient: Müller, Hans
@@ -564,15 +624,15 @@ class TestPhase5ConfidenceScoring:
         Tel: +49 30 12345678
         Email: test@example.com
         """
-        _, metadata = filter.remove_pii(text)
+        _, metadata = privacy_filter.remove_pii(text)
 
         # Pattern-based removals should be > 0
         assert metadata["pattern_based_removals"] > 0
 
-    def test_quality_summary_included(self, filter):
+    def test_quality_summary_included(self, privacy_filter):
         """Test that quality_summary is included in metadata"""
         text = "Patient: Test Person, Diagnose: Diabetes"
-        _, metadata = filter.remove_pii(text)
+        _, metadata = privacy_filter.remove_pii(text)
 
         assert "quality_summary" in metadata
         summary = metadata["quality_summary"]
@@ -584,7 +644,7 @@ class TestPhase5ConfidenceScoring:
         assert "pii_types_found" in summary
         assert "review_recommended" in summary
 
-    def test_quality_score_calculated(self, filter):
+    def test_quality_score_calculated(self, privacy_filter):
         """Test that quality score is calculated correctly"""
         text = """
         Arztbrief
@@ -592,7 +652,7 @@ class TestPhase5ConfidenceScoring:
         Geb.: 22.03.1958
         Diagnose: Diabetes mellitus Typ 2
         """
-        _, metadata = filter.remove_pii(text)
+        _, metadata = privacy_filter.remove_pii(text)
 
         quality_score = metadata["quality_summary"]["quality_score"]
         # Score should be between 0 and 100
@@ -603,33 +663,33 @@ class TestPhase5FalsePositiveTracking:
     """Test Phase 5.2: False Positive Tracking (Issue #35)"""
 
     @pytest.fixture
-    def filter(self):
+    def privacy_filter(self):
         """Create filter instance without database loading"""
         return AdvancedPrivacyFilter(load_custom_terms=False)
 
-    def test_false_positive_list_initialized(self, filter):
+    def test_false_positive_list_initialized(self, privacy_filter):
         """Test that potential_false_positives list exists"""
         text = "Patient: Test Person"
-        _, metadata = filter.remove_pii(text)
+        _, metadata = privacy_filter.remove_pii(text)
 
         assert "potential_false_positives" in metadata
         assert isinstance(metadata["potential_false_positives"], list)
 
-    def test_preserved_medical_terms_tracked(self, filter):
+    def test_preserved_medical_terms_tracked(self, privacy_filter):
         """Test that preserved medical terms are tracked"""
         text = """
         Diagnose: Morbus Parkinson
         Therapie: Madopar 125mg
         """
-        _, metadata = filter.remove_pii(text)
+        _, metadata = privacy_filter.remove_pii(text)
 
         assert "preserved_medical_terms" in metadata
         assert isinstance(metadata["preserved_medical_terms"], list)
 
-    def test_review_recommended_flag_exists(self, filter):
+    def test_review_recommended_flag_exists(self, privacy_filter):
         """Test that review_recommended flag is in metadata"""
         text = "Patient: Test Person"
-        _, metadata = filter.remove_pii(text)
+        _, metadata = privacy_filter.remove_pii(text)
 
         assert "review_recommended" in metadata
         assert isinstance(metadata["review_recommended"], bool)
@@ -639,11 +699,11 @@ class TestPhase5GDPRAuditTrail:
     """Test Phase 5.3: GDPR Audit Trail (Issue #35)"""
 
     @pytest.fixture
-    def filter(self):
+    def privacy_filter(self):
         """Create filter instance without database loading"""
         return AdvancedPrivacyFilter(load_custom_terms=False)
 
-    def test_pii_types_detected_populated(self, filter):
+    def test_pii_types_detected_populated(self, privacy_filter):
         """Test that pii_types_detected is populated with removed PII types"""
         text = """
         Patient: Müller, Hans
@@ -651,7 +711,7 @@ class TestPhase5GDPRAuditTrail:
         Tel: +49 30 12345678
         Email: patient@example.com
         """
-        _, metadata = filter.remove_pii(text)
+        _, metadata = privacy_filter.remove_pii(text)
 
         pii_types = metadata["pii_types_detected"]
         assert isinstance(pii_types, list)
@@ -662,29 +722,29 @@ class TestPhase5GDPRAuditTrail:
         assert "phone_number" in pii_types
         assert "email_address" in pii_types
 
-    def test_processing_timestamp_exists(self, filter):
+    def test_processing_timestamp_exists(self, privacy_filter):
         """Test that processing timestamp is recorded"""
         text = "Patient: Test Person"
-        _, metadata = filter.remove_pii(text)
+        _, metadata = privacy_filter.remove_pii(text)
 
         assert "processing_timestamp" in metadata
         assert metadata["processing_timestamp"] is not None
 
-    def test_gdpr_compliant_flag(self, filter):
+    def test_gdpr_compliant_flag(self, privacy_filter):
         """Test that GDPR compliant flag is set"""
         text = """
         Patient: Schmidt, Maria
         Diagnose: Diabetes mellitus Typ 2
         """
-        _, metadata = filter.remove_pii(text)
+        _, metadata = privacy_filter.remove_pii(text)
 
         assert "gdpr_compliant" in metadata
         assert isinstance(metadata["gdpr_compliant"], bool)
 
-    def test_removal_method_tracked(self, filter):
+    def test_removal_method_tracked(self, privacy_filter):
         """Test that removal method version is tracked"""
         text = "Patient: Test Person"
-        _, metadata = filter.remove_pii(text)
+        _, metadata = privacy_filter.remove_pii(text)
 
         assert "removal_method" in metadata
         assert "Phase5" in metadata["removal_method"]
@@ -694,11 +754,11 @@ class TestPhase5QualitySummary:
     """Test Phase 5.4: Quality Summary (Issue #35)"""
 
     @pytest.fixture
-    def filter(self):
+    def privacy_filter(self):
         """Create filter instance without database loading"""
         return AdvancedPrivacyFilter(load_custom_terms=False)
 
-    def test_quality_summary_structure(self, filter):
+    def test_quality_summary_structure(self, privacy_filter):
         """Test complete quality summary structure"""
         text = """
         Arztbrief
@@ -708,7 +768,7 @@ class TestPhase5QualitySummary:
         Diagnose: Arterielle Hypertonie (I10)
         Therapie: Ramipril 5mg
         """
-        _, metadata = filter.remove_pii(text)
+        _, metadata = privacy_filter.remove_pii(text)
 
         summary = metadata["quality_summary"]
 
@@ -722,10 +782,10 @@ class TestPhase5QualitySummary:
         assert "review_recommended" in summary
         assert "review_flags" in summary
 
-    def test_confidence_breakdown_structure(self, filter):
+    def test_confidence_breakdown_structure(self, privacy_filter):
         """Test confidence breakdown has all levels"""
         text = "Patient: Max Mustermann, Diagnose: Diabetes"
-        _, metadata = filter.remove_pii(text)
+        _, metadata = privacy_filter.remove_pii(text)
 
         breakdown = metadata["quality_summary"]["confidence_breakdown"]
 
@@ -734,10 +794,10 @@ class TestPhase5QualitySummary:
         assert "low_confidence" in breakdown
         assert "pattern_based" in breakdown
 
-    def test_review_flags_list(self, filter):
+    def test_review_flags_list(self, privacy_filter):
         """Test that review_flags is a list"""
         text = "Patient: Test Person"
-        _, metadata = filter.remove_pii(text)
+        _, metadata = privacy_filter.remove_pii(text)
 
         review_flags = metadata["quality_summary"]["review_flags"]
         assert isinstance(review_flags, list)
@@ -747,11 +807,11 @@ class TestPhase5MedicalValidation:
     """Test Phase 5.3: Medical Content Validation (Issue #35)"""
 
     @pytest.fixture
-    def filter(self):
+    def privacy_filter(self):
         """Create filter instance without database loading"""
         return AdvancedPrivacyFilter(load_custom_terms=False)
 
-    def test_medical_content_preserved(self, filter):
+    def test_medical_content_preserved(self, privacy_filter):
         """Test that medical content validation passes for valid documents"""
         text = """
         Arztbrief
@@ -760,7 +820,7 @@ class TestPhase5MedicalValidation:
         Laborwerte: HbA1c 7.2%
         Therapie: Metformin 1000mg
         """
-        result, metadata = filter.remove_pii(text)
+        result, metadata = privacy_filter.remove_pii(text)
 
         # Medical content should be preserved
         assert "Diabetes" in result
@@ -771,7 +831,7 @@ class TestPhase5MedicalValidation:
         # GDPR compliance should be True if medical content preserved
         assert metadata["gdpr_compliant"] is True
 
-    def test_pii_removed_medical_preserved(self, filter):
+    def test_pii_removed_medical_preserved(self, privacy_filter):
         """Test comprehensive PII removal with medical preservation"""
         text = """
         Universitätsklinikum München
@@ -799,7 +859,7 @@ class TestPhase5MedicalValidation:
         Mit freundlichen Grüßen
         Dr. med. Weber
         """
-        result, metadata = filter.remove_pii(text)
+        result, metadata = privacy_filter.remove_pii(text)
 
         # PII removed
         assert "Mustermann" not in result
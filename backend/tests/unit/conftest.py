@@ -0,0 +1,79 @@
+"""
+Shared fixtures for the pipeline executor unit tests.
+
+- executor: ModularPipelineExecutor with mocked provider client, document
+  classes and cost tracking; steps run on an OVH model
+- make_step: factory for step configurations
+"""
+
+from unittest.mock import Mock, patch
+
+import pytest
+
+from app.database.modular_pipeline_models import (
+    AvailableModelDB,
+    DynamicPipelineStepDB,
+    ModelProvider,
+)
+from app.services import modular_pipeline_executor
+from app.services.modular_pipeline_executor import ModularPipelineExecutor
+
+
+@pytest.fixture
+def executor():
+    """
+    Executor without database or provider access.
+
+    The OVH client is a MagicMock shared by all executors of the test; set the
+    provider responses on executor.ovh_client. Change the model's provider via
+    executor.get_model_info.return_value.provider.
+    """
+    with (
+        patch.object(modular_pipeline_executor, "get_ovh_client"),
+        patch.object(modular_pipeline_executor, "DocumentClassManager"),
+        patch.object(modular_pipeline_executor, "AICostTracker"),
+    ):
+        executor = ModularPipelineExecutor(session=Mock())
+        model = Mock(spec=AvailableModelDB)
+        model.id = 1
+        model.name = "Meta-Llama-3.3-70B"
+        model.max_tokens = 8192
+        model.provider = ModelProvider.OVH
+        executor.get_model_info = Mock(return_value=model)
+        yield executor
+
+
+@pytest.fixture
+def make_step():
+    """
+    Factory for step configurations.
+
+    Usage:
+        step = make_step(name="Translation", chunking_enabled=True)
+    """
+
+    def _make(**overrides) -> Mock:
+        options = {
+            "id": 1,
+            "name": "Translation",
+            "prompt_template": "Translate: {input_text}",
+            "selected_model_id": 1,
+            "temperature": 0.7,
+            "max_tokens": 4096,
+            "retry_on_failure": True,
+            "max_retries": 3,
+            "is_branching_step": False,
+            "system_prompt": None,
+            "stop_conditions": None,
+            "chunking_enabled": False,
+            "chunk_max_tokens": None,
+            "cache_responses": False,
+            "stream_output": False,
+        }
+        options.update(overrides)
+        step = Mock(spec=DynamicPipelineStepDB)
+        for name, value in options.items():
+            setattr(step, name, value)
+        return step
+
+    return _make
@@ -0,0 +1,211 @@
+"""
+Unit tests for AICostTracker aggregation and cost rollups.
+
+Tests cover:
+- SQL aggregates match per-log sums
+- Hourly/daily rollups are built incrementally from closed hours
+- Logs written late into rolled-up hours are counted on the next refresh
+- Date-range queries give identical results with and without rollups
+- Rolled-up history survives log retention
+"""
+
+from datetime import datetime, timedelta
+import random
+from unittest.mock import patch
+
+import pytest
+
+from app.core.config import settings
+from app.database.unified_models import AICostRollupDB, AILogInteractionDB
+from app.services.ai_cost_tracker import AICostTracker
+
+NOW = datetime(2025, 3, 10, 12, 30)
+MODELS = [("Meta-Llama-3_3-70B-Instruct", "OVH"), ("mistral-large-latest", "MISTRAL"), (None, None)]
+STEPS = ["CLASSIFICATION", "TRANSLATION", "FORMATTING"]
+
+
+@pytest.fixture
+def tracker(db_session):
+    return AICostTracker(db_session)
+
+
+@pytest.fixture
+def logs(db_session):
+    """Three days of logs at random times, ending just before NOW."""
+    rng = random.Random(42)
+    entries = []
+    for i in range(300):
+        model_name, provider = rng.choice(MODELS)
+        created_at = NOW - timedelta(minutes=rng.randint(1, 3 * 24 * 60))
+        entries.append(
+            AILogInteractionDB(
+                processing_id=f"proc-{i % 40}",
+                step_name=rng.choice(STEPS),
+                input_tokens=100,
+                output_tokens=50,
+                total_tokens=rng.randint(100, 2000),
+                total_cost_usd=rng.randint(1, 1000) / 100000,
+                model_provider=provider,
+                model_name=model_name,
+                document_type=rng.choice(["ARZTBRIEF", "LABORWERTE", None]),
+                created_at=created_at,
+            )
+        )
+    db_session.add_all(entries)
+    db_session.commit()
+    return entries
+
+
+def expected_totals(entries, start=None, end=None):
+    selected = [
+        e
+        for e in entries
+        if (start is None or e.created_at >= start) and (end is None or e.created_at <= end)
+    ]
+    return (
+        len(selected),
+        sum(e.total_tokens for e in selected),
+        round(sum(e.total_cost_usd for e in selected), 6),
+    )
+
+
+RANGES = [
+    (None, None),
+    (NOW - timedelta(days=2), None),
+    (None, NOW - timedelta(days=1)),
+    (datetime(2025, 3, 8, 0, 0), datetime(2025, 3, 10, 0, 0)),
+    (datetime(2025, 3, 7, 13, 17), datetime(2025, 3, 9, 22, 41)),
+    (datetime(2025, 3, 9, 10, 5), datetime(2025, 3, 9, 10, 50)),
+    (datetime(2025, 3, 10, 9, 0), NOW),
+]
+
+
+class TestSQLAggregation:
+    """Test aggregates computed in the database"""
+
+    @pytest.mark.parametrize("start,end", RANGES)
+    def test_total_cost_matches_log_sums(self, tracker, logs, start, end):
+        """Test that SQL totals equal summing the individual logs"""
+        result = tracker.get_total_cost(start_date=start, end_date=end)
+
+        calls, tokens, cost = expected_totals(logs, start, end)
+        assert result["total_calls"] == calls
+        assert result["total_tokens"] == tokens
+        assert result["total_cost_usd"] == pytest.approx(cost)
+
+    def test_total_cost_for_processing_id(self, tracker, logs):
+        """Test per-document totals"""
+        result = tracker.get_total_cost(processing_id="proc-7")
+        selected = [e for e in logs if e.processing_id == "proc-7"]
+
+        assert result["total_calls"] == len(selected)
+        assert result["total_tokens"] == sum(e.total_tokens for e in selected)
+
+    def test_breakdown_groups_unknown_model(self, tracker, logs):
+        """Test that logs without a model name are grouped as Unknown"""
+        breakdown = tracker.get_cost_breakdown()
+
+        assert set(breakdown["by_model"]) == {
+            "Meta-Llama-3_3-70B-Instruct",
+            "mistral-large-latest",
+            "Unknown",
+        }
+        assert breakdown["by_model"]["mistral-large-latest"]["provider"] == "MISTRAL"
+        assert sum(d["calls"] for d in breakdown["by_step"].values()) == len(logs)
+
+
+class TestCostRollups:
+    """Test hourly/daily rollups"""
+
+    def test_refresh_rolls_up_closed_hours_only(self, tracker, logs, db_session):
+        """Test that the current hour stays in the raw logs"""
+        result = tracker.refresh_rollups(now=NOW)
+
+        assert result["rolled_up_until"] <= datetime(2025, 3, 10, 12, 0).isoformat()
+        latest_hour = (
+            db_session.query(AICostRollupDB.bucket_start)
+            .filter(AICostRollupDB.granularity == "hour")
+            .order_by(AICostRollupDB.bucket_start.desc())
+            .first()[0]
+        )
+        assert latest_hour < datetime(2025, 3, 10, 12, 0)
+        assert result["days"] == 4
+
+    def test_refresh_is_incremental(self, tracker, logs, db_session):
+        """Test that a second run only re-reads the refresh window and new closed hours"""
+        tracker.refresh_rollups(now=NOW)
+        with patch.object(settings, "ai_cost_rollup_refresh_hours", 0):
+            assert tracker.refresh_rollups(now=NOW)["hours"] == 0
+        assert 0 < tracker.refresh_rollups(now=NOW)["hours"] <= 24
+
+        db_session.add(
+            AILogInteractionDB(
+                processing_id="late",
+                step_name="TRANSLATION",
+                total_tokens=10,
+                total_cost_usd=0.5,
+                model_name="mistral-large-latest",
+                created_at=NOW + timedelta(minutes=10),
+            )
+        )
+        db_session.commit()
+
+        with patch.object(settings, "ai_cost_rollup_refresh_hours", 0):
+            result = tracker.refresh_rollups(now=NOW + timedelta(hours=1, minutes=10))
+        assert result["hours"] == 1
+        assert result["rolled_up_until"] == datetime(2025, 3, 10, 13, 0).isoformat()
+
+    def test_refresh_counts_late_logs(self, tracker, logs, db_session):
+        """Test that logs written into already rolled-up hours are counted on the next run"""
+        tracker.refresh_rollups(now=NOW)
+        db_session.add(
+            AILogInteractionDB(
+                processing_id="spilled",
+                step_name="TRANSLATION",
+                total_tokens=10,
+                total_cost_usd=0.5,
+                model_name="mistral-large-latest",
+                created_at=NOW - timedelta(hours=3),
+            )
+        )
+        db_session.commit()
+
+        tracker.refresh_rollups(now=NOW)
+
+        assert tracker.get_total_cost()["total_calls"] == len(logs) + 1
+
+    @pytest.mark.parametrize("start,end", RANGES)
+    def test_results_identical_with_rollups(self, tracker, logs, start, end):
+        """Test that rollup-backed queries return the same numbers as raw queries"""
+        before_total = tracker.get_total_cost(start_date=start, end_date=end)
+        before_breakdown = tracker.get_cost_breakdown(start_date=start, end_date=end)
+
+        tracker.refresh_rollups(now=NOW)
+
+        after_total = tracker.get_total_cost(start_date=start, end_date=end)
+        after_breakdown = tracker.get_cost_breakdown(start_date=start, end_date=end)
+
+        assert after_total["total_calls"] == before_total["total_calls"]
+        assert after_total["total_tokens"] == before_total["total_tokens"]
+        assert after_total["total_cost_usd"] == pytest.approx(before_total["total_cost_usd"])
+        for section in ("by_model", "by_step"):
+            assert after_breakdown[section].keys() == before_breakdown[section].keys()
+            for key, data in before_breakdown[section].items():
+                assert after_breakdown[section][key]["calls"] == data["calls"]
+                assert after_breakdown[section][key]["tokens"] == data["tokens"]
+                assert after_breakdown[section][key]["cost_usd"] == pytest.approx(data["cost_usd"])
+
+    def test_history_survives_log_retention(self, tracker, logs, db_session):
+        """Test that rolled-up days still count after their raw logs are deleted"""
+        all_time = tracker.get_total_cost()
+        tracker.refresh_rollups(now=NOW)
+
+        db_session.query(AILogInteractionDB).filter(
+            AILogInteractionDB.created_at < datetime(2025, 3, 9)
+        ).delete()
+        db_session.commit()
+
+        assert tracker.get_total_cost()["total_calls"] == all_time["total_calls"]
+        assert tracker.get_total_cost()["total_cost_usd"] == pytest.approx(
+            all_time["total_cost_usd"]
+        )
@@ -0,0 +1,195 @@
+"""
+Unit tests for the buffered AI log writer.
+
+Tests cover:
+- Rows are written in batches of at most batch_size and flush() drains the buffer
+- Overflowing rows and failed batches spill to the Redis stream
+- Rows are dropped (never raised) when Redis is unavailable
+- Spilled rows are read back, inserted and acknowledged
+- Spilled rows the database keeps rejecting are moved to the dead-letter stream
+- Unbuffered mode writes every row immediately
+"""
+
+from datetime import datetime
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.services.ai_log_writer import (
+    DEAD_LETTER_STREAM,
+    SPILL_GROUP,
+    SPILL_STREAM,
+    AILogWriter,
+    _decode_row,
+    _encode_row,
+)
+
+
+def make_row(index=0):
+    return {
+        "processing_id": f"job-{index}",
+        "step_name": "TRANSLATION",
+        "input_tokens": 100,
+        "output_tokens": 50,
+        "total_tokens": 150,
+        "total_cost_usd": 0.0001,
+        "created_at": datetime(2025, 1, 1, 12, 0, index % 60),
+        "log_metadata": {"attempt": 1},
+    }
+
+
+def make_writer(**overrides):
+    options = {
+        "redis_url": None,
+        "batch_size": 3,
+        "flush_interval": 0.05,
+        "max_queue": 100,
+        "spill_max_len": 1000,
+    }
+    options.update(overrides)
+    return AILogWriter(**options)
+
+
+@pytest.fixture
+def inserted():
+    batches = []
+    with patch.object(AILogWriter, "_insert", lambda _self, rows: batches.append(list(rows))):
+        yield batches
+
+
+def test_rows_are_written_in_batches(inserted):
+    writer = make_writer()
+
+    for index in range(7):
+        writer.submit(make_row(index))
+
+    assert writer.flush(timeout=5)
+    writer.shutdown()
+    assert sum(len(batch) for batch in inserted) == 7
+    assert all(len(batch) <= 3 for batch in inserted)
+    assert writer.get_stats()["written"] == 7
+
+
+def test_full_queue_spills_to_redis(inserted):
+    writer = make_writer(redis_url="redis://localhost:6379/0", max_queue=1)
+    writer._redis = MagicMock()
+    pipe = writer._redis.pipeline.return_value
+
+    with patch.object(AILogWriter, "_ensure_thread"):
+        for index in range(3):
+            writer.submit(make_row(index))
+
+    assert pipe.xadd.call_count == 2
+    assert pipe.xadd.call_args.args[0] == SPILL_STREAM
+    assert pipe.xadd.call_args.kwargs["maxlen"] == 1000
+    assert writer.get_stats()["spilled"] == 2
+
+
+def test_failed_batch_spills_to_redis():
+    writer = make_writer(redis_url="redis://localhost:6379/0")
+    writer._redis = MagicMock()
+
+    with patch.object(AILogWriter, "_insert", side_effect=RuntimeError("db down")):
+        assert writer._write([make_row(1), make_row(2)]) is False
+
+    assert writer._redis.pipeline.return_value.xadd.call_count == 2
+    assert writer.get_stats()["spilled"] == 2
+
+
+def test_rows_are_dropped_without_redis():
+    writer = make_writer(max_queue=1)
+
+    with patch.object(AILogWriter, "_ensure_thread"):
+        writer.submit(make_row(1))
+        writer.submit(make_row(2))
+
+    assert writer.get_stats()["dropped"] == 1
+
+
+def test_submit_never_raises():
+    writer = make_writer()
+
+    with patch.object(AILogWriter, "_ensure_thread", side_effect=RuntimeError("boom")):
+        writer.submit(make_row())
+
+    assert writer.get_stats()["dropped"] == 1
+
+
+def test_spilled_rows_are_recovered(inserted):
+    writer = make_writer(redis_url="redis://localhost:6379/0")
+    client = MagicMock()
+    client.xautoclaim.return_value = [b"0-0", [], []]
+    client.xreadgroup.side_effect = [
+        [[SPILL_STREAM.encode(), [(b"1-0", {b"row": _encode_row(make_row(5)).encode()})]]],
+        [],
+    ]
+    writer._redis = client
+
+    writer._drain_spill()
+
+    assert inserted == [[make_row(5)]]
+    client.xack.assert_called_once_with(SPILL_STREAM, SPILL_GROUP, b"1-0")
+    client.xdel.assert_called_once_with(SPILL_STREAM, b"1-0")
+    assert writer.get_stats()["recovered"] == 1
+
+
+def rejecting_client(times_delivered):
+    client = MagicMock()
+    client.xautoclaim.return_value = [
+        b"0-0",
+        [(b"1-0", {b"row": _encode_row(make_row(5)).encode()})],
+        [],
+    ]
+    client.xpending_range.return_value = [
+        {
+            "message_id": b"1-0",
+            "consumer": b"c",
+            "time_since_delivered": 0,
+            "times_delivered": times_delivered,
+        }
+    ]
+    return client
+
+
+def test_rejected_spilled_rows_stay_pending_until_out_of_attempts():
+    writer = make_writer(redis_url="redis://localhost:6379/0", max_write_attempts=3)
+    writer._redis = client = rejecting_client(times_delivered=2)
+
+    with patch.object(AILogWriter, "_insert", side_effect=RuntimeError("value too long")):
+        writer._drain_spill()
+
+    client.xack.assert_not_called()
+    client.pipeline.assert_not_called()
+    assert writer.get_stats()["dead_lettered"] == 0
+
+
+def test_rejected_spilled_rows_are_dead_lettered():
+    writer = make_writer(redis_url="redis://localhost:6379/0", max_write_attempts=3)
+    writer._redis = client = rejecting_client(times_delivered=3)
+    pipe = client.pipeline.return_value
+
+    with patch.object(AILogWriter, "_insert", side_effect=RuntimeError("value too long")):
+        writer._drain_spill()
+
+    assert pipe.xadd.call_args.args == (
+        DEAD_LETTER_STREAM,
+        {b"row": _encode_row(make_row(5)).encode()},
+    )
+    pipe.xack.assert_called_once_with(SPILL_STREAM, SPILL_GROUP, b"1-0")
+    pipe.xdel.assert_called_once_with(SPILL_STREAM, b"1-0")
+    assert writer.get_stats()["dead_lettered"] == 1
+
+
+def test_unbuffered_writer_inserts_immediately(inserted):
+    writer = make_writer(buffered=False)
+
+    writer.submit(make_row(1))
+
+    assert inserted == [[make_row(1)]]
+    assert writer.get_stats()["running"] is False
+
+
+def test_row_encoding_round_trip():
+    row = make_row(7)
+
+    assert _decode_row(_encode_row(row)) == row
@@ -0,0 +1,173 @@
+"""
+Unit tests for the Redis-backed chat rate limiter.
+
+Tests cover:
+- Script results map to the same RateLimitResult contract as the DB limiter
+- Escalating penalties are passed to the violation script and mirrored for audit
+- The database limiter is used when Redis is unavailable
+"""
+
+from contextlib import contextmanager
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from app.database.auth_models import AuditAction, AuditLogDB
+from app.database.auth_models import Base as AuthBase
+from app.database.chat_models import ChatRateLimitDB
+from app.services import chat_rate_limiter as rate_limiter_module
+from app.services.chat_rate_limiter import ChatRateLimiter, RateLimitResult, RedisChatRateLimiter
+
+IP = "203.0.113.7"
+
+
+@pytest.fixture
+def limiter():
+    limiter = RedisChatRateLimiter(redis_url="redis://localhost:6379/0")
+    limiter.enabled = True
+    limiter._scripts = {"check": AsyncMock(), "message": AsyncMock(), "violation": AsyncMock()}
+    with patch.object(limiter, "_get_client", AsyncMock(return_value=Mock())):
+        yield limiter
+
+
+class TestRedisRateLimitResults:
+    """Test mapping of Lua script results"""
+
+    @pytest.mark.asyncio
+    async def test_allowed(self, limiter):
+        """Test that an empty limit type allows the request"""
+        limiter._scripts["check"].return_value = ["", 0, 2]
+
+        result = await limiter.check_rate_limit_async(IP, "token")
+
+        assert result == RateLimitResult(allowed=True, violations=2)
+        keys = limiter._scripts["check"].await_args.kwargs["keys"]
+        assert keys[0].endswith(f"{IP}:token:messages")
+
+    @pytest.mark.asyncio
+    async def test_minute_limit_retry_after(self, limiter):
+        """Test that retry_after comes from the oldest message in the window"""
+        limiter._scripts["check"].return_value = ["minute", 12345, 0]
+
+        result = await limiter.check_rate_limit_async(IP)
+
+        assert result.allowed is False
+        assert result.limit_type == "minute"
+        assert result.retry_after == 13
+        assert result.message == "Too many messages. Please wait 13 seconds."
+
+    @pytest.mark.asyncio
+    async def test_permanent_ban(self, limiter):
+        """Test that a permanent ban has no retry_after"""
+        limiter._scripts["check"].return_value = ["permanent_ban", -1, 51]
+
+        result = await limiter.check_rate_limit_async(IP)
+
+        assert (result.allowed, result.limit_type, result.retry_after) == (
+            False,
+            "permanent_ban",
+            None,
+        )
+        assert result.violations == 51
+
+    @pytest.mark.asyncio
+    async def test_record_message_uses_unique_members(self, limiter):
+        """Test that two messages in the same millisecond are both counted"""
+        await limiter.record_message_async(IP)
+        await limiter.record_message_async(IP)
+
+        first, second = (c.kwargs["args"][1] for c in limiter._scripts["message"].await_args_list)
+        assert first != second
+
+
+class TestRedisPenalties:
+    """Test the ban ladder and audit mirroring"""
+
+    def test_ban_ladder_matches_penalty_thresholds(self, limiter):
+        """Test that the script gets the same ladder as the DB implementation"""
+        assert limiter._ban_ladder() == [51, 0, 21, 24 * 3600, 11, 3600, 6, 15 * 60]
+
+    @pytest.mark.asyncio
+    async def test_temp_ban_result_and_mirror(self, limiter):
+        """Test that a temp ban is reported and written to the database in the background"""
+        limiter._scripts["violation"].return_value = [6, "temp", 900000]
+
+        with patch.object(limiter, "mirror_penalty") as mirror:
+            result = await limiter.record_violation_async(IP, "token", "agent", limit_type="minute")
+            await next(iter(limiter._mirror_tasks))
+
+        assert result.limit_type == "temp_ban"
+        assert result.retry_after == 900
+        assert result.violations == 6
+        mirror.assert_called_once_with(IP, "token", "agent", 6)
+
+    @pytest.mark.asyncio
+    async def test_plain_violation_not_mirrored(self, limiter):
+        """Test that violations below the warning threshold stay in Redis"""
+        limiter._scripts["violation"].return_value = [1, "", -2]
+
+        with patch.object(limiter, "mirror_penalty") as mirror:
+            result = await limiter.record_violation_async(IP, limit_type="hour")
+
+        assert (result.limit_type, result.retry_after, result.warning_issued) == (
+            "hour",
+            None,
+            False,
+        )
+        assert not limiter._mirror_tasks
+        mirror.assert_not_called()
+
+    def test_mirror_penalty_persists_ban_and_audit(self, db_session):
+        """Test that mirrored penalties land on the rate limit row and in the audit log"""
+        AuthBase.metadata.create_all(db_session.get_bind())
+
+        @contextmanager
+        def session_context():
+            yield db_session
+
+        with patch.object(rate_limiter_module, "get_db_session_context", session_context):
+            ChatRateLimiter().mirror_penalty(IP, None, "agent", 51)
+
+        record = db_session.query(ChatRateLimitDB).one()
+        assert record.permanent_ban is True
+        assert record.rate_limit_violations == 51
+        assert db_session.query(AuditLogDB).one().action == AuditAction.CHAT_PERMANENT_BAN
+
+
+class TestDatabaseFallback:
+    """Test fallback to the Postgres implementation"""
+
+    @pytest.mark.asyncio
+    async def test_no_redis_uses_database(self):
+        """Test that the DB limiter is used when Redis isn't configured"""
+        limiter = RedisChatRateLimiter(redis_url=None)
+        limiter.enabled = True
+
+        with patch.object(
+            ChatRateLimiter, "check_rate_limit", return_value=RateLimitResult(allowed=True)
+        ) as db_check:
+            result = await limiter.check_rate_limit_async(IP)
+
+        assert result.allowed is True
+        db_check.assert_called_once_with(IP, None, None)
+
+    @pytest.mark.asyncio
+    async def test_redis_error_falls_back_and_backs_off(self, limiter):
+        """Test that a Redis failure falls back to the DB and skips Redis for a while"""
+        limiter._scripts["check"].side_effect = RedisConnectionError("connection refused")
+
+        with (
+            patch.object(rate_limiter_module.ChatRateLimiter, "record_message") as db_record,
+            patch.object(
+                rate_limiter_module.ChatRateLimiter,
+                "check_rate_limit",
+                return_value=RateLimitResult(allowed=True),
+            ),
+        ):
+            assert (await limiter.check_rate_limit_async(IP)).allowed is True
+            limiter._get_client = RedisChatRateLimiter._get_client.__get__(limiter)
+            await limiter.record_message_async(IP)
+
+        db_record.assert_called_once()
+        limiter._scripts["message"].assert_not_awaited()
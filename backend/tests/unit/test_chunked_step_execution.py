@@ -0,0 +1,93 @@
+"""
+Unit tests for chunked execution of long documents.
+
+Tests cover:
+- Chunked steps reassemble outputs in order and log one cost record
+- Short inputs are executed in one call
+- A failing chunk fails the step
+"""
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from tenacity import wait_fixed
+
+from app.core.retry_policy import get_pipeline_step_retry_policy
+from app.services import modular_pipeline_executor
+from app.services.document_chunker import split_into_chunks
+from app.services.ocr_engine_manager import PAGE_SEPARATOR
+
+
+def make_page(number, lines=20):
+    body = "\n".join(f"Wert {number}.{i}: 12,5 mg/dl (Referenz 10-15)" for i in range(lines))
+    return f"## Seite {number}\n\n{body}"
+
+
+DOCUMENT = PAGE_SEPARATOR.join(make_page(number) for number in range(1, 7))
+
+
+@pytest.fixture
+def step(make_step):
+    return make_step(
+        name="Vereinfachung Laborwerte",
+        prompt_template="Vereinfache: {input_text}",
+        max_retries=2,
+        chunking_enabled=True,
+        chunk_max_tokens=800,
+    )
+
+
+class TestChunkedExecution:
+    """Test execute_step in chunking mode"""
+
+    @pytest.mark.asyncio
+    async def test_outputs_are_reassembled_in_order(self, executor, step):
+        async def simplify(full_prompt, **kwargs):
+            page = full_prompt.split("## Seite ")[1].split("\n")[0]
+            return {"text": f"Seite {page} vereinfacht", "input_tokens": 100, "output_tokens": 20}
+
+        executor.ovh_client.process_medical_text_with_prompt = AsyncMock(side_effect=simplify)
+        chunks = split_into_chunks(DOCUMENT, max_tokens=800)
+
+        success, output, error = await executor.execute_step(step=step, input_text=DOCUMENT)
+
+        assert (success, error) == (True, None)
+        pages = [line.split()[1] for line in output.split("\n\n")]
+        assert pages == sorted(pages, key=int)
+        assert executor.ovh_client.process_medical_text_with_prompt.await_count == len(chunks)
+
+        executor.cost_tracker.log_ai_call.assert_called_once()
+        logged = executor.cost_tracker.log_ai_call.call_args.kwargs
+        assert logged["input_tokens"] == 100 * len(chunks)
+        assert logged["output_tokens"] == 20 * len(chunks)
+        assert logged["metadata"]["chunks"] == len(chunks)
+
+    @pytest.mark.asyncio
+    async def test_short_input_is_not_chunked(self, executor, step):
+        executor.ovh_client.process_medical_text_with_prompt = AsyncMock(
+            return_value={"text": "Kurz", "input_tokens": 5, "output_tokens": 1}
+        )
+
+        success, output, _ = await executor.execute_step(step=step, input_text="Kurzer Befund")
+
+        assert (success, output) == (True, "Kurz")
+        assert executor.ovh_client.process_medical_text_with_prompt.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_failing_chunk_fails_step(self, executor, step):
+        async def simplify(full_prompt, **kwargs):
+            if "## Seite 2" in full_prompt:
+                return {"text": "Error: invalid request"}
+            return {"text": "ok", "input_tokens": 1, "output_tokens": 1}
+
+        executor.ovh_client.process_medical_text_with_prompt = AsyncMock(side_effect=simplify)
+        with patch.object(
+            modular_pipeline_executor,
+            "get_pipeline_step_retry_policy",
+            lambda attempts: {**get_pipeline_step_retry_policy(attempts), "wait": wait_fixed(0)},
+        ):
+            success, output, error = await executor.execute_step(step=step, input_text=DOCUMENT)
+
+        assert (success, output) == (False, "")
+        assert "invalid request" in error
+        executor.cost_tracker.log_ai_call.assert_not_called()
@@ -0,0 +1,93 @@
+"""
+Unit tests for the process-wide database engine registry.
+
+Tests cover:
+- Engine and session factory are created once per process
+- Fork detection replaces the connection pool
+- Pool status and checkout metrics reporting
+"""
+
+from sqlalchemy import text
+
+from app.database import connection
+from app.database.connection import (
+    InstrumentedQueuePool,
+    get_db_session_context,
+    get_engine,
+    get_pool_status,
+    get_session_factory,
+    pool_metrics,
+)
+
+
+class TestEngineRegistry:
+    """Test engine caching and fork handling"""
+
+    def test_get_engine_returns_cached_instance(self):
+        """Test that repeated calls share one engine and pool"""
+        assert get_engine() is get_engine()
+        assert get_engine() is connection.engine
+        assert get_engine().pool is get_engine().pool
+
+    def test_session_factory_bound_to_shared_engine(self):
+        """Test that sessions use the shared engine"""
+        session = get_session_factory()()
+        try:
+            assert session.get_bind() is get_engine()
+        finally:
+            session.close()
+
+    def test_engine_uses_instrumented_pool(self):
+        """Test that the pool records checkout metrics"""
+        assert isinstance(get_engine().pool, InstrumentedQueuePool)
+
+    def test_fork_replaces_pool(self, monkeypatch):
+        """Test that a different PID gets a fresh pool on the same engine"""
+        engine = get_engine()
+        old_pool = engine.pool
+        real_pid = connection._engine_pid
+
+        monkeypatch.setattr(connection.os, "getpid", lambda: real_pid + 1)
+        try:
+            assert get_engine() is engine
+            assert engine.pool is not old_pool
+            assert isinstance(engine.pool, InstrumentedQueuePool)
+        finally:
+            monkeypatch.undo()
+            connection._engine_pid = real_pid
+
+
+class TestPoolStatus:
+    """Test pool status reporting"""
+
+    def test_checkout_is_recorded(self):
+        """Test that a session query increments checkout counters"""
+        pool_metrics.reset()
+
+        with get_db_session_context() as db:
+            db.execute(text("SELECT 1"))
+
+        metrics = pool_metrics.snapshot()
+        assert metrics["checkouts"] >= 1
+        assert metrics["max_checkout_ms"] >= metrics["avg_checkout_ms"] >= 0.0
+        assert metrics["timeouts"] == 0
+
+    def test_pool_status_fields(self):
+        """Test that the status payload exposes pool sizing and metrics"""
+        status = get_pool_status()
+
+        assert status["pool_class"] == "InstrumentedQueuePool"
+        for key in ("pool_size", "max_overflow", "checked_out", "checked_in", "overflow"):
+            assert key in status
+        assert {"checkouts", "waits", "avg_wait_ms", "timeouts"} <= set(status["metrics"])
+
+    def test_wait_recorded_when_exhausted(self):
+        """Test that checkouts on an exhausted pool count as waits"""
+        pool_metrics.reset()
+        pool_metrics.record_checkout(12.5, waited=True)
+        pool_metrics.record_checkout(1.0, waited=False)
+
+        metrics = pool_metrics.snapshot()
+        assert metrics["checkouts"] == 2
+        assert metrics["waits"] == 1
+        assert metrics["max_wait_ms"] == 12.5
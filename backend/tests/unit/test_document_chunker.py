@@ -0,0 +1,53 @@
+"""
+Unit tests for splitting long documents into chunks.
+
+Tests cover:
+- Chunks follow page separators and headings and respect the token budget
+- Oversized sections are split at paragraphs and lines
+"""
+
+from app.services.document_chunker import estimate_tokens, split_into_chunks
+from app.services.ocr_engine_manager import PAGE_SEPARATOR
+
+
+def make_page(number, lines=20):
+    body = "\n".join(f"Wert {number}.{i}: 12,5 mg/dl (Referenz 10-15)" for i in range(lines))
+    return f"## Seite {number}\n\n{body}"
+
+
+DOCUMENT = PAGE_SEPARATOR.join(make_page(number) for number in range(1, 7))
+
+
+class TestSplitIntoChunks:
+    """Test structure-aware splitting"""
+
+    def test_short_text_is_one_chunk(self):
+        assert split_into_chunks("Kurzer Befund.", max_tokens=1000) == ["Kurzer Befund."]
+
+    def test_chunks_respect_token_budget_and_keep_order(self):
+        chunks = split_into_chunks(DOCUMENT, max_tokens=800)
+
+        assert len(chunks) > 1
+        assert all(estimate_tokens(chunk) <= 800 for chunk in chunks)
+        assert "".join(chunks).replace("\n", "").replace("-", "") == DOCUMENT.replace(
+            "\n", ""
+        ).replace("-", "")
+
+    def test_chunks_start_at_page_boundaries(self):
+        chunks = split_into_chunks(DOCUMENT, max_tokens=800)
+
+        assert all(chunk.startswith("## Seite") for chunk in chunks)
+
+    def test_headings_split_a_single_page(self):
+        text = "# Arztbrief\n\n" + "Anamnese. " * 200 + "\n\n## Diagnosen\n\n" + "Diagnose. " * 200
+
+        chunks = split_into_chunks(text, max_tokens=700)
+
+        assert chunks[-1].startswith("## Diagnosen")
+
+    def test_oversized_section_is_split_at_lines(self):
+        chunks = split_into_chunks(make_page(1, lines=200), max_tokens=500)
+
+        assert len(chunks) > 1
+        assert all(estimate_tokens(chunk) <= 500 for chunk in chunks)
+        assert all(chunk.split("\n")[0].startswith(("## Seite", "Wert")) for chunk in chunks)
@@ -17,11 +17,13 @@ import os
 import time
 from unittest.mock import patch
 
-import pytest
 from cryptography.fernet import Fernet, InvalidToken
+import pytest
 
+from app.core import encryption
 from app.core.encryption import (
     AES256GCM_VERSION,
+    BINARY_SEGMENT_SIZE,
     DecryptionError,
     EncryptionError,
     EncryptionKeyError,
@@ -622,6 +624,71 @@ class TestPerformance:
         assert decrypted == values
 
 
+class TestBinaryTokens:
+    """Test the raw binary token format for binary fields"""
+
+    # Exceptions are looked up on the module: other tests reload it, replacing the classes
+
+    @pytest.mark.parametrize(
+        "size", [0, 1, BINARY_SEGMENT_SIZE, BINARY_SEGMENT_SIZE + 1, 3 * BINARY_SEGMENT_SIZE + 7]
+    )
+    def test_round_trip(self, size):
+        """Test that binary tokens decrypt to the original bytes at segment boundaries"""
+        data = os.urandom(size)
+        token = encryptor.encrypt_binary(data)
+
+        assert encryptor.is_binary_token(token)
+        assert encryptor.decrypt_binary(token) == data
+        # 16-byte header plus one 16-byte tag per segment, no base64 expansion
+        segments = max(1, -(-size // BINARY_SEGMENT_SIZE))
+        assert len(token) == size + 16 + 16 * segments
+
+    def test_stream_round_trip(self):
+        """Test that streamed encryption/decryption matches the one-shot format"""
+        data = os.urandom(2 * BINARY_SEGMENT_SIZE + 100)
+        chunks = [data[i : i + 65536] for i in range(0, len(data), 65536)]
+
+        token = b"".join(encryptor.encrypt_binary_stream(chunks))
+        assert encryptor.decrypt_binary(token) == data
+
+        token = encryptor.encrypt_binary(data)
+        pieces = [token[i : i + 100000] for i in range(0, len(token), 100000)]
+        assert b"".join(encryptor.decrypt_binary_stream(pieces)) == data
+
+    def test_truncated_and_reordered_tokens_rejected(self):
+        """Test that dropping or reordering segments fails authentication"""
+        token = encryptor.encrypt_binary(os.urandom(2 * BINARY_SEGMENT_SIZE + 1))
+        sealed = BINARY_SEGMENT_SIZE + 16
+        header, first, rest = token[:16], token[16 : 16 + sealed], token[16 + sealed :]
+
+        for tampered in (header + first, header + rest, header + rest + first, token[:-1]):
+            with pytest.raises(encryption.DecryptionError):
+                encryptor.decrypt_binary(tampered)
+
+    def test_decrypt_with_previous_key(self):
+        """Test that binary tokens written with the previous key are read during rotation"""
+        old_key = FieldEncryptor.generate_key()
+        new_key = FieldEncryptor.generate_key()
+
+        with patch.dict(os.environ, {"ENCRYPTION_KEY": old_key}):
+            token = FieldEncryptor().encrypt_binary(b"%PDF-1.4 data")
+
+        with patch.dict(
+            os.environ, {"ENCRYPTION_KEY": new_key, "ENCRYPTION_KEY_PREVIOUS": old_key}
+        ):
+            assert FieldEncryptor().decrypt_binary(token) == b"%PDF-1.4 data"
+
+    def test_legacy_tokens_are_not_binary_tokens(self):
+        """Test that legacy text tokens and plaintext are not detected as binary tokens"""
+        legacy = encryptor.encrypt_binary_field(b"%PDF-1.4 data").encode("utf-8")
+
+        assert not encryptor.is_binary_token(legacy)
+        assert not encryptor.is_binary_token(b"%PDF-1.4 data" * 10)
+        assert not encryptor.is_binary_token(None)
+        with pytest.raises(encryption.DecryptionError):
+            encryptor.decrypt_binary(legacy)
+
+
 class TestEncryptionEnabledFlag:
     """Test ENCRYPTION_ENABLED flag functionality"""
 
@@ -0,0 +1,191 @@
+"""
+Unit tests for the LLM response cache.
+
+Tests cover:
+- Cache keys change with model, prompts, temperature and max tokens
+- Nothing is cached unless LLM_CACHE_ENABLED is set
+- The in-process tier is a size-bounded LRU whose entries expire after the TTL
+- Responses are stored encrypted in Redis with a TTL; Redis errors are misses
+- Cached pipeline steps skip the model call and log a zero-cost call
+"""
+
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from app.core.config import settings
+from app.services import llm_response_cache, modular_pipeline_executor
+from app.services.llm_response_cache import LLMResponseCache, make_cache_key
+
+RESPONSE = {"text": "ARZTBRIEF", "input_tokens": 812, "output_tokens": 3}
+
+
+@pytest.fixture
+def enabled():
+    with patch.object(settings, "llm_cache_enabled", True):
+        yield
+
+
+@pytest.fixture
+def redis():
+    """In-memory stand-in for Redis with a reversible fake encryption."""
+    store = {}
+    client = AsyncMock()
+    client.get.side_effect = lambda key: store[key][0] if key in store else None
+    client.set.side_effect = lambda key, value, ex=None: store.update({key: (value, ex)})
+    client.store = store
+    encryptor = Mock()
+    encryptor.encrypt_field.side_effect = lambda value: value[::-1]
+    encryptor.decrypt_field.side_effect = lambda value: value[::-1]
+    with (
+        patch.object(LLMResponseCache, "_get_client", AsyncMock(return_value=client)),
+        patch.object(llm_response_cache, "encryptor", encryptor),
+    ):
+        yield client
+
+
+def test_cache_key_covers_model_parameters():
+    key = make_cache_key("OVH:Llama", "system", "prompt", 0.2, 500)
+
+    assert key == make_cache_key("OVH:Llama", "system", "prompt", 0.2, 500)
+    assert key != make_cache_key("OVH:Nemo", "system", "prompt", 0.2, 500)
+    assert key != make_cache_key("OVH:Llama", None, "prompt", 0.2, 500)
+    assert key != make_cache_key("OVH:Llama", "system", "prompt!", 0.2, 500)
+    assert key != make_cache_key("OVH:Llama", "system", "prompt", 0.3, 500)
+    assert key != make_cache_key("OVH:Llama", "system", "prompt", 0.2, 501)
+
+
+@pytest.mark.asyncio
+async def test_disabled_cache_stores_nothing(redis):
+    cache = LLMResponseCache()
+
+    await cache.set("key", RESPONSE)
+
+    assert await cache.get("key") is None
+    assert redis.store == {}
+
+
+@pytest.mark.asyncio
+async def test_local_tier_evicts_least_recently_used(enabled):
+    with patch.object(settings, "redis_url", None):
+        cache = LLMResponseCache(max_entries=2)
+        await cache.set("a", {"text": "a"})
+        await cache.set("b", {"text": "b"})
+        assert await cache.get("a") == {"text": "a"}
+        await cache.set("c", {"text": "c"})
+
+        assert await cache.get("b") is None
+        assert await cache.get("a") == {"text": "a"}
+        assert cache.get_stats()["local_entries"] == 2
+
+
+@pytest.mark.asyncio
+async def test_local_entries_expire(enabled):
+    with (
+        patch.object(settings, "redis_url", None),
+        patch.object(llm_response_cache, "time") as clock,
+    ):
+        clock.monotonic.return_value = 1000.0
+        cache = LLMResponseCache(ttl_seconds=60)
+        await cache.set("a", {"text": "a"})
+
+        clock.monotonic.return_value = 1059.0
+        assert await cache.get("a") == {"text": "a"}
+
+        clock.monotonic.return_value = 1060.0
+        assert await cache.get("a") is None
+        assert cache.get_stats()["local_entries"] == 0
+        assert cache.get_stats()["misses"] == 1
+
+
+@pytest.mark.asyncio
+async def test_redis_tier_is_encrypted_and_shared(enabled, redis):
+    await LLMResponseCache(ttl_seconds=600).set("key", RESPONSE)
+
+    [(stored, ttl)] = redis.store.values()
+    assert ttl == 600
+    assert "ARZTBRIEF" not in stored
+
+    # Another process (empty local tier) reads the response from Redis
+    other = LLMResponseCache()
+    assert await other.get("key") == RESPONSE
+    assert other.get_stats()["redis_hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_redis_errors_are_misses(enabled, redis):
+    redis.get.side_effect = RedisConnectionError("down")
+
+    cache = LLMResponseCache()
+
+    assert await cache.get("key") is None
+    assert cache.get_stats()["errors"] == 1
+
+
+@pytest.fixture
+def executor(executor):
+    executor.ovh_client.process_medical_text_with_prompt = AsyncMock(return_value=dict(RESPONSE))
+    return executor
+
+
+@pytest.fixture
+def step(make_step):
+    return make_step(
+        name="Dokumentklassifizierung",
+        prompt_template="Klassifiziere: {input_text}",
+        temperature=0.1,
+        max_tokens=50,
+        max_retries=2,
+        is_branching_step=True,
+        cache_responses=True,
+    )
+
+
+class TestCachedStepExecution:
+    """Test execute_step with response caching"""
+
+    @pytest.fixture(autouse=True)
+    def fresh_cache(self, enabled, redis):
+        with patch.object(
+            modular_pipeline_executor, "get_llm_response_cache", return_value=LLMResponseCache()
+        ):
+            yield
+
+    @pytest.mark.asyncio
+    async def test_identical_prompt_served_from_cache(self, executor, step):
+        first = await executor.execute_step(step=step, input_text="Arztbrief ...")
+        second = await executor.execute_step(step=step, input_text="Arztbrief ...")
+
+        assert first == second == (True, "ARZTBRIEF", None)
+        assert executor.ovh_client.process_medical_text_with_prompt.await_count == 1
+
+        logged = executor.cost_tracker.log_ai_call.call_args.kwargs
+        assert (logged["input_tokens"], logged["output_tokens"]) == (0, 0)
+        assert logged["metadata"]["cache_hit"] is True
+        assert logged["metadata"]["saved_input_tokens"] == 812
+
+    @pytest.mark.asyncio
+    async def test_changed_input_calls_model(self, executor, step):
+        await executor.execute_step(step=step, input_text="Arztbrief ...")
+        await executor.execute_step(step=step, input_text="Laborbefund ...")
+
+        assert executor.ovh_client.process_medical_text_with_prompt.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_zero_temperature_is_keyed_as_zero(self, executor, step):
+        step.temperature = 0.0
+        await executor.execute_step(step=step, input_text="Arztbrief ...")
+        step.temperature = 0.7
+        await executor.execute_step(step=step, input_text="Arztbrief ...")
+
+        assert executor.ovh_client.process_medical_text_with_prompt.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_steps_without_opt_in_are_not_cached(self, executor, step):
+        step.cache_responses = False
+
+        await executor.execute_step(step=step, input_text="Arztbrief ...")
+        await executor.execute_step(step=step, input_text="Arztbrief ...")
+
+        assert executor.ovh_client.process_medical_text_with_prompt.await_count == 2
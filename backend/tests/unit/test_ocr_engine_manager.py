@@ -0,0 +1,232 @@
+"""
+Unit tests for OCREngineManager.
+
+Tests cover:
+- Pages are OCR'd concurrently up to the configured limit
+- Results are reassembled in page order with per-page latency
+- A failing page falls back to PaddleOCR
+- Embedded-text fast path for born-digital and mixed PDFs
+"""
+
+import asyncio
+from contextlib import ExitStack, contextmanager
+from io import BytesIO
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from pypdf import PdfReader
+import pytest
+from reportlab.pdfgen import canvas
+
+from app.database.modular_pipeline_models import OCREngineEnum
+from app.models.ocr_result import OCRResult
+from app.services import ocr_engine_manager
+from app.services.ocr_engine_manager import OCREngineManager
+
+
+class FakeOCR:
+    """Async Mistral OCR stub that finishes later pages first."""
+
+    def __init__(self, page_count: int, fail_page: int | None = None):
+        self.page_count = page_count
+        self.fail_page = fail_page
+        self.active = 0
+        self.max_active = 0
+
+    async def process_async(self, model, document, include_image_base64):
+        page_num = int(document["image_url"]["url"].rsplit("-", 1)[1])
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            await asyncio.sleep(0.01 * (self.page_count - page_num + 1))
+            if page_num == self.fail_page:
+                raise RuntimeError("Mistral OCR error")
+            return SimpleNamespace(pages=[SimpleNamespace(markdown=f"Seite {page_num}")])
+        finally:
+            self.active -= 1
+
+
+@pytest.fixture
+def manager():
+    return OCREngineManager(MagicMock(), config_repository=MagicMock())
+
+
+@contextmanager
+def mistral_pdf(page_count: int, fake_ocr: FakeOCR):
+    """Patch the Mistral client and PDF rendering for a page_count-page PDF."""
+    client = SimpleNamespace(ocr=fake_ocr)
+    with ExitStack() as stack:
+        stack.enter_context(patch.object(ocr_engine_manager, "MISTRAL_API_KEY", "test-key"))
+        stack.enter_context(patch.object(ocr_engine_manager, "MISTRAL_OCR_MAX_CONCURRENCY", 3))
+        stack.enter_context(patch("mistralai.Mistral", return_value=client))
+        stack.enter_context(
+            patch.object(OCREngineManager, "_count_pdf_pages", return_value=page_count)
+        )
+        stack.enter_context(
+            patch.object(
+                OCREngineManager,
+                "_render_pdf_page",
+                side_effect=lambda _content, page_num: f"data:image/png;base64,page-{page_num}",
+            )
+        )
+        yield
+
+
+class TestConcurrentMistralOCR:
+    """Test per-page concurrent Mistral OCR"""
+
+    @pytest.mark.asyncio
+    async def test_pages_reassembled_in_order(self, manager):
+        """Test that out-of-order completions keep page order"""
+        fake_ocr = FakeOCR(page_count=8)
+        with mistral_pdf(8, fake_ocr):
+            result = await manager._extract_with_mistral_ocr(b"%PDF", "pdf", "befund.pdf")
+
+        assert result.engine == "MISTRAL_OCR"
+        assert result.text == "\n\n---\n\n".join(f"Seite {n}" for n in range(1, 9))
+        assert len(result.page_latencies) == 8
+        assert all(latency >= 0 for latency in result.page_latencies)
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_bounded(self, manager):
+        """Test that no more than the configured number of pages run at once"""
+        fake_ocr = FakeOCR(page_count=10)
+        with mistral_pdf(10, fake_ocr):
+            await manager._extract_with_mistral_ocr(b"%PDF", "pdf", "befund.pdf")
+
+        assert fake_ocr.max_active == 3
+
+    @pytest.mark.asyncio
+    async def test_page_failure_falls_back_to_paddleocr(self, manager):
+        """Test that one failing page triggers the PaddleOCR fallback"""
+        fake_ocr = FakeOCR(page_count=4, fail_page=2)
+        fallback = OCRResult(text="paddle", confidence=0.8, engine="PADDLEOCR")
+        with (
+            mistral_pdf(4, fake_ocr),
+            patch.object(
+                OCREngineManager, "_extract_with_paddleocr", AsyncMock(return_value=fallback)
+            ),
+        ):
+            result = await manager._extract_with_mistral_ocr(b"%PDF", "pdf", "befund.pdf")
+
+        assert result is fallback
+
+    def test_to_dict_includes_page_latencies(self):
+        """Test that per-page latency is serialized"""
+        result = OCRResult(text="x", confidence=1.0, page_latencies=[0.5, 0.7])
+        assert result.to_dict()["page_latencies"] == [0.5, 0.7]
+
+
+BEFUND_TEXT = [
+    "Arztbrief: Die Patientin wurde zur weiteren Abklaerung der Beschwerden aufgenommen.",
+    "Diagnosen: Arterielle Hypertonie, Diabetes mellitus Typ zwei, Hypercholesterinaemie.",
+    "Verlauf: Unter der Therapie mit Metformin zeigte sich eine deutliche Besserung.",
+]
+
+
+def make_pdf(page_has_text: list[bool]) -> bytes:
+    """Build a PDF whose pages either carry a text layer or are blank (image-only stand-in)."""
+    buffer = BytesIO()
+    pdf = canvas.Canvas(buffer)
+    for page_num, has_text in enumerate(page_has_text, 1):
+        if has_text:
+            for line_num, line in enumerate(BEFUND_TEXT):
+                pdf.drawString(40, 800 - line_num * 20, f"Seite {page_num}. {line}")
+        pdf.showPage()
+    pdf.save()
+    return buffer.getvalue()
+
+
+def ocr_run_result(run_pdf: bytes) -> OCRResult:
+    pages = len(PdfReader(BytesIO(run_pdf)).pages)
+    return OCRResult(
+        text=f"OCR {pages} Seiten",
+        confidence=0.9,
+        engine="MISTRAL_OCR",
+        page_latencies=[1.0] * pages,
+    )
+
+
+class TestEmbeddedTextFastPath:
+    """Test per-page hybrid extraction for PDFs"""
+
+    @pytest.mark.asyncio
+    async def test_born_digital_pdf_skips_ocr(self, manager):
+        """Test that a PDF with a full text layer never reaches the OCR engine"""
+        engine = AsyncMock()
+        with patch.object(OCREngineManager, "_extract_with_engine", engine):
+            result = await manager.extract_text(
+                make_pdf([True, True]), "pdf", "brief.pdf", OCREngineEnum.MISTRAL_OCR
+            )
+
+        engine.assert_not_called()
+        assert result.engine == "EMBEDDED_TEXT"
+        assert result.mode == "text"
+        assert "Seite 1." in result.text and "Seite 2." in result.text
+        assert result.text.index("Seite 1.") < result.text.index("Seite 2.")
+        assert len(result.page_latencies) == 2
+
+    @pytest.mark.asyncio
+    async def test_mixed_pdf_ocrs_only_image_pages(self, manager):
+        """Test that consecutive image-only pages are OCR'd as runs in page order"""
+        calls = []
+
+        async def fake_engine(self, engine, content, file_type, filename):
+            calls.append(len(PdfReader(BytesIO(content)).pages))
+            return ocr_run_result(content)
+
+        with patch.object(OCREngineManager, "_extract_with_engine", fake_engine):
+            result = await manager.extract_text(
+                make_pdf([True, False, False, True, False]),
+                "pdf",
+                "befund.pdf",
+                OCREngineEnum.MISTRAL_OCR,
+            )
+
+        assert calls == [2, 1]
+        assert result.mode == "hybrid"
+        assert result.engine == "MISTRAL_OCR"
+        parts = result.text.split("\n\n---\n\n")
+        assert parts[0].startswith("Seite 1.")
+        assert parts[1] == "OCR 2 Seiten"
+        assert parts[2].startswith("Seite 4.")
+        assert parts[3] == "OCR 1 Seiten"
+        assert len(result.page_latencies) == 5
+        assert result.confidence == pytest.approx((0.99 * 2 + 0.9 * 3) / 5)
+
+    @pytest.mark.asyncio
+    async def test_scanned_analysis_skips_text_probe(self, manager):
+        """Test that upload-time analysis of a scanned PDF is reused"""
+        analysis = {"has_embedded_text": False, "page_count": 2, "pages_checked": 2}
+        full_ocr = OCRResult(text="OCR", confidence=0.9, engine="MISTRAL_OCR")
+
+        with (
+            patch.object(OCREngineManager, "_extract_embedded_pages", side_effect=AssertionError),
+            patch.object(
+                OCREngineManager, "_extract_with_engine", AsyncMock(return_value=full_ocr)
+            ),
+        ):
+            result = await manager.extract_text(
+                make_pdf([False, False]),
+                "pdf",
+                "scan.pdf",
+                OCREngineEnum.MISTRAL_OCR,
+                quality_analysis=analysis,
+            )
+
+        assert result is full_ocr
+
+    @pytest.mark.asyncio
+    async def test_pdf_without_text_layer_uses_full_ocr(self, manager):
+        """Test that PDFs without usable text fall through to whole-document OCR"""
+        pdf_bytes = make_pdf([False, False, False])
+        full_ocr = OCRResult(text="OCR", confidence=0.9, engine="MISTRAL_OCR")
+        engine = AsyncMock(return_value=full_ocr)
+
+        with patch.object(OCREngineManager, "_extract_with_engine", engine):
+            result = await manager.extract_text(
+                pdf_bytes, "pdf", "scan.pdf", OCREngineEnum.MISTRAL_OCR
+            )
+
+        assert result is full_ocr
+        engine.assert_awaited_once_with(OCREngineEnum.MISTRAL_OCR, pdf_bytes, "pdf", "scan.pdf")
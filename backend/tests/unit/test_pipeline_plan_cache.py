@@ -0,0 +1,210 @@
+"""
+Unit tests for the compiled pipeline plan cache.
+
+Tests cover:
+- Plans are split into execution phases and hold frozen record snapshots
+- Plans are reused until invalidated or expired
+- Executors backed by the cache make no configuration queries in steady state
+"""
+
+from dataclasses import FrozenInstanceError
+from unittest.mock import Mock, patch
+
+import pytest
+from sqlalchemy import event
+
+from app.services import modular_pipeline_executor, pipeline_plan_cache
+from app.services.modular_pipeline_executor import ModularPipelineExecutor
+from app.services.pipeline_plan_cache import (
+    PipelinePlan,
+    PipelinePlanCache,
+    publish_pipeline_config_change,
+)
+
+
+@pytest.fixture
+def plan_cache():
+    return PipelinePlanCache(redis_url=None)
+
+
+@pytest.fixture
+def make_executor(db_session, plan_cache):
+    def _make():
+        return ModularPipelineExecutor(db_session, plan_cache=plan_cache)
+
+    with (
+        patch.object(modular_pipeline_executor, "get_ovh_client"),
+        patch.object(modular_pipeline_executor, "AICostTracker"),
+    ):
+        yield _make
+
+
+@pytest.fixture
+def query_counter(test_db_engine):
+    statements = []
+
+    def count(conn, cursor, statement, *args):
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append(statement)
+
+    event.listen(test_db_engine, "before_cursor_execute", count)
+    yield statements
+    event.remove(test_db_engine, "before_cursor_execute", count)
+
+
+def make_step(step_id, document_class_id=None, post_branching=False):
+    return Mock(id=step_id, document_class_id=document_class_id, post_branching=post_branching)
+
+
+class TestPipelinePlan:
+    """Test plan compilation"""
+
+    def test_compile_splits_phases(self):
+        """Test phase-split step lists and lookups"""
+        steps = [make_step(1), make_step(2, document_class_id=7), make_step(3, post_branching=True)]
+        plan = PipelinePlan.compile(
+            "de", 1, steps, models=[Mock(id=5)], document_classes=[Mock(class_key="ARZTBRIEF")]
+        )
+
+        assert [s.id for s in plan.universal_steps] == [1]
+        assert [s.id for s in plan.get_class_steps(7)] == [2]
+        assert plan.get_class_steps(8) == []
+        assert [s.id for s in plan.post_branching_steps] == [3]
+        assert set(plan.models) == {5}
+        assert set(plan.document_classes) == {"ARZTBRIEF"}
+
+
+class TestPipelinePlanCache:
+    """Test caching and invalidation"""
+
+    def test_plan_built_once(self, plan_cache):
+        """Test that the plan is reused across lookups"""
+        build = Mock(side_effect=lambda version: PipelinePlan.compile("de", version, [], [], []))
+
+        first = plan_cache.get_plan("de", build)
+        assert plan_cache.get_plan("de", build) is first
+        assert build.call_count == 1
+
+    def test_invalidate_rebuilds_with_new_version(self, plan_cache):
+        """Test that invalidation drops plans and bumps the version"""
+        build = Mock(side_effect=lambda version: PipelinePlan.compile("de", version, [], [], []))
+
+        first = plan_cache.get_plan("de", build)
+        plan_cache.invalidate()
+        second = plan_cache.get_plan("de", build)
+
+        assert second is not first
+        assert second.version == first.version + 1
+
+    def test_plan_expires_without_subscriber(self):
+        """Test the max-age fallback when no Redis subscriber is running"""
+        plan_cache = PipelinePlanCache(redis_url=None, fallback_max_age_seconds=0)
+        build = Mock(side_effect=lambda version: PipelinePlan.compile("de", version, [], [], []))
+
+        plan_cache.get_plan("de", build)
+        plan_cache.get_plan("de", build)
+
+        assert build.call_count == 2
+
+    def test_plan_built_during_invalidation_not_cached(self, plan_cache):
+        """Test that a plan compiled from outdated configuration is not stored"""
+
+        def build(version):
+            plan_cache.invalidate()
+            return PipelinePlan.compile("de", version, [], [], [])
+
+        plan_cache.get_plan("de", build)
+        assert plan_cache.get_stats()["cached_plans"] == 0
+
+    @pytest.mark.asyncio
+    async def test_publish_without_redis_invalidates_locally(self):
+        """Test that a config change invalidates the local cache without Redis"""
+        plan_cache = PipelinePlanCache(redis_url=None)
+        with (
+            patch.object(pipeline_plan_cache, "_plan_cache", plan_cache),
+            patch.object(pipeline_plan_cache.settings, "redis_url", None),
+        ):
+            assert await publish_pipeline_config_change() is None
+
+        assert plan_cache.version == 1
+
+
+class TestExecutorWithPlanCache:
+    """Test executor configuration loading through the plan cache"""
+
+    def test_steady_state_makes_no_configuration_queries(
+        self, make_executor, sample_pipeline_with_steps, query_counter
+    ):
+        """Test that a second job reads steps, models and classes from the cached plan"""
+        first_job = make_executor()
+        first_job.load_universal_steps("de")
+        assert query_counter
+
+        query_counter.clear()
+        job = make_executor()
+        universal = job.load_universal_steps("de")
+        branch = job.extract_branch_value("ARZTBRIEF", "document_type")
+        class_steps = job.load_steps_by_document_class(branch["target_id"], "de")
+        post = job.load_post_branching_steps("de")
+        model = job.get_model_info(universal[0].selected_model_id)
+
+        assert query_counter == []
+        assert [s.name for s in universal] == ["Medical Validation", "Classification"]
+        assert [s.name for s in class_steps] == ["Arztbrief Translation"]
+        assert [s.name for s in post] == ["Final Check"]
+        assert branch["target_display_name"] == "Arztbrief"
+        assert model.name == "Meta-Llama-3_3-70B-Instruct"
+
+    def test_cached_records_survive_commit(
+        self, make_executor, db_session, sample_pipeline_with_steps
+    ):
+        """Test that cached records stay readable after the loading session commits"""
+        steps = make_executor().load_universal_steps("de")
+        db_session.commit()
+        db_session.close()
+
+        assert steps[0].name == "Medical Validation"
+
+    def test_cached_records_are_frozen_snapshots(self, make_executor, sample_pipeline_with_steps):
+        """Test that jobs share plain values that can't be changed or attached to a session"""
+        step = make_executor().load_universal_steps("de")[0]
+        model = make_executor().get_model_info(step.selected_model_id)
+
+        assert type(step).__name__ == "DynamicPipelineStepDBSnapshot"
+        assert type(model).__name__ == "AvailableModelDBSnapshot"
+        with pytest.raises(FrozenInstanceError):
+            step.prompt_template = "changed"
+
+    def test_config_change_picked_up_after_invalidation(
+        self, make_executor, plan_cache, db_session, sample_pipeline_with_steps
+    ):
+        """Test that new jobs see changed steps once the cache is invalidated"""
+        assert len(make_executor().load_universal_steps("de")) == 2
+
+        step = db_session.merge(sample_pipeline_with_steps[0])
+        step.enabled = False
+        db_session.commit()
+        assert len(make_executor().load_universal_steps("de")) == 2
+
+        plan_cache.invalidate()
+        assert [s.name for s in make_executor().load_universal_steps("de")] == ["Classification"]
+
+    @pytest.mark.asyncio
+    async def test_missing_prompt_variable_fails_step(
+        self, make_executor, sample_pipeline_with_steps, create_pipeline_step
+    ):
+        """Test that a missing template variable fails the step before calling the model"""
+        create_pipeline_step(
+            name="Language Step",
+            order=5,
+            prompt_template="Translate into {target_language}: {input_text}",
+            selected_model_id=sample_pipeline_with_steps[0].selected_model_id,
+        )
+        executor = make_executor()
+        step = next(s for s in executor.load_universal_steps("de") if s.name == "Language Step")
+
+        success, _, error = await executor.execute_step(step=step, input_text="Text")
+
+        assert success is False
+        assert error == "Missing required variable in prompt template: 'target_language'"
+        executor.ovh_client.process_medical_text_with_prompt.assert_not_called()
@@ -0,0 +1,220 @@
+"""
+Unit tests for pipeline step retries, circuit breakers and shared provider clients.
+
+Tests cover:
+- Backoff waits are jittered and longer for 503 infrastructure errors
+- Retries sleep asynchronously (other coroutines keep running)
+- An open provider circuit fails the step fast without calling the provider
+- Shared provider clients are reused per event loop (also by executors)
+"""
+
+import asyncio
+import time
+from unittest.mock import AsyncMock, Mock, patch
+
+import httpx
+import pytest
+from tenacity import RetryCallState, wait_fixed
+
+from app.core.circuit_breaker import dify_rag_breaker, mistral_breaker, ovh_ai_breaker
+from app.core.exceptions import ExternalServiceError, PipelineStepError, ServiceUnavailableError
+from app.core.retry_policy import get_pipeline_step_retry_policy
+from app.database.modular_pipeline_models import ModelProvider
+from app.services import modular_pipeline_executor, provider_clients
+from app.services.dify_rag_client import DifyRAGClient
+from app.services.modular_pipeline_executor import ModularPipelineExecutor
+
+OVH_503 = "Error processing with OVH API: 503 Service Unavailable (ring-balancer)"
+OK_RESULT = {"text": "Processed output", "input_tokens": 10, "output_tokens": 5}
+
+
+def failed_state(exception: Exception, attempt_number: int = 1) -> RetryCallState:
+    state = RetryCallState(retry_object=None, fn=None, args=(), kwargs={})
+    state.attempt_number = attempt_number
+    state.set_exception((type(exception), exception, None))
+    return state
+
+
+def fast_retry_policy(max_attempts: int) -> dict:
+    """Real pipeline policy with the waits shortened for tests."""
+    return {**get_pipeline_step_retry_policy(max_attempts), "wait": wait_fixed(0.05)}
+
+
+@pytest.fixture(autouse=True)
+def reset_breakers():
+    for breaker in (ovh_ai_breaker, mistral_breaker, dify_rag_breaker):
+        breaker.reset()
+    yield
+    for breaker in (ovh_ai_breaker, mistral_breaker, dify_rag_breaker):
+        breaker.reset()
+
+
+@pytest.fixture
+def step(make_step):
+    return make_step()
+
+
+class TestPipelineStepRetryPolicy:
+    """Test backoff selection"""
+
+    def test_infrastructure_errors_back_off_longer(self):
+        """Test that 503 errors wait ~5s/10s and other errors ~1s/2s, with jitter"""
+        wait = get_pipeline_step_retry_policy(3)["wait"]
+
+        assert 5 <= wait(failed_state(ServiceUnavailableError(OVH_503), 1)) <= 7
+        assert 10 <= wait(failed_state(ServiceUnavailableError(OVH_503), 2)) <= 12
+        assert 1 <= wait(failed_state(ExternalServiceError("Error: bad request"), 1)) <= 2
+        assert 2 <= wait(failed_state(ExternalServiceError("Error: bad request"), 2)) <= 3
+
+    def test_waits_are_jittered(self):
+        """Test that identical failures don't produce identical waits"""
+        wait = get_pipeline_step_retry_policy(3)["wait"]
+        waits = {wait(failed_state(ServiceUnavailableError(OVH_503))) for _ in range(20)}
+        assert len(waits) > 1
+
+    def test_validation_failures_retry_immediately(self):
+        """Test that output validation retries don't back off"""
+        wait = get_pipeline_step_retry_policy(3)["wait"]
+        assert wait(failed_state(PipelineStepError("Output validation", step_name="x"))) == 0
+
+
+class TestExecuteStepRetries:
+    """Test execute_step retry and circuit breaker behaviour"""
+
+    @pytest.mark.asyncio
+    async def test_backoff_does_not_block_event_loop(self, executor, step):
+        """Test that other coroutines run while a step waits to retry"""
+        executor.ovh_client.process_medical_text_with_prompt = AsyncMock(
+            side_effect=[{"text": OVH_503}, {"text": OVH_503}, OK_RESULT]
+        )
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        ticker_task = asyncio.create_task(ticker())
+        with patch.object(
+            modular_pipeline_executor, "get_pipeline_step_retry_policy", fast_retry_policy
+        ):
+            success, output, error = await executor.execute_step(step=step, input_text="Test")
+        ticker_task.cancel()
+
+        assert (success, output, error) == (True, "Processed output", None)
+        assert executor.ovh_client.process_medical_text_with_prompt.await_count == 3
+        assert ticks >= 5
+
+    @pytest.mark.asyncio
+    async def test_ovh_503_errors_count_towards_breaker(self, executor, step):
+        """Test that 503 error results are recorded by the OVH circuit breaker"""
+        executor.ovh_client.process_medical_text_with_prompt = AsyncMock(
+            return_value={"text": OVH_503}
+        )
+        with patch.object(
+            modular_pipeline_executor, "get_pipeline_step_retry_policy", fast_retry_policy
+        ):
+            success, _, error = await executor.execute_step(step=step, input_text="Test")
+
+        assert success is False
+        assert "503" in error
+        assert ovh_ai_breaker.get_status()["failure_count"] == 3
+
+    @pytest.mark.asyncio
+    async def test_open_circuit_fails_fast(self, executor, step):
+        """Test that an open circuit skips the provider call and all retries"""
+        executor.ovh_client.process_medical_text_with_prompt = AsyncMock(return_value=OK_RESULT)
+        for _ in range(ovh_ai_breaker.failure_threshold):
+            ovh_ai_breaker._handle_failure(ServiceUnavailableError(OVH_503))
+
+        start = time.monotonic()
+        success, _, error = await executor.execute_step(step=step, input_text="Test")
+
+        assert success is False
+        assert "OPEN" in error
+        assert time.monotonic() - start < 1
+        executor.ovh_client.process_medical_text_with_prompt.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_mistral_uses_shared_client(self, executor, step):
+        """Test that Mistral steps reuse one client instead of creating one per call"""
+        executor.get_model_info.return_value.provider = ModelProvider.MISTRAL
+        mistral = Mock()
+        mistral.process_text = AsyncMock(
+            return_value={"content": "Antwort", "input_tokens": 3, "output_tokens": 2}
+        )
+
+        with patch.object(provider_clients, "MistralClient", return_value=mistral) as factory:
+            for _ in range(3):
+                success, output, _ = await executor.execute_step(step=step, input_text="Test")
+                assert (success, output) == (True, "Antwort")
+
+        assert factory.call_count == 1
+        assert mistral.process_text.await_count == 3
+
+
+class TestSharedProviderClients:
+    """Test per-event-loop client sharing"""
+
+    @pytest.mark.asyncio
+    async def test_same_client_within_loop(self):
+        """Test that repeated lookups on one loop return the same client"""
+        assert provider_clients.get_dify_rag_client() is provider_clients.get_dify_rag_client()
+
+    def test_new_client_per_loop(self):
+        """Test that each event loop gets its own client (connections are loop-bound)"""
+
+        async def lookup():
+            return provider_clients.get_dify_rag_client()
+
+        assert asyncio.run(lookup()) is not asyncio.run(lookup())
+
+    def test_no_running_loop_returns_private_client(self):
+        """Test that lookups outside a loop are not cached"""
+        assert provider_clients.get_dify_rag_client() is not provider_clients.get_dify_rag_client()
+
+    @pytest.mark.asyncio
+    async def test_executors_share_ovh_client(self):
+        """Test that executors use the loop's OVH client instead of creating their own"""
+        with (
+            patch.object(modular_pipeline_executor, "DocumentClassManager"),
+            patch.object(modular_pipeline_executor, "AICostTracker"),
+        ):
+            first = ModularPipelineExecutor(session=Mock())
+            second = ModularPipelineExecutor(session=Mock())
+
+        assert first.ovh_client is second.ovh_client is provider_clients.get_ovh_client()
+        await provider_clients.close_provider_clients()
+
+    @pytest.mark.asyncio
+    async def test_close_provider_clients(self):
+        """Test that closing drops the loop's clients"""
+        client = provider_clients.get_dify_rag_client()
+        await provider_clients.close_provider_clients()
+        assert provider_clients.get_dify_rag_client() is not client
+
+
+class TestDifyRAGBreaker:
+    """Test Dify RAG outage handling"""
+
+    @pytest.mark.asyncio
+    async def test_unreachable_service_trips_breaker_and_skips(self):
+        """Test that connection failures are counted and the query degrades to skipped"""
+        client = DifyRAGClient(url="http://dify.test", api_key="app-key")
+        transport = httpx.MockTransport(
+            lambda _request: (_ for _ in ()).throw(httpx.ConnectError("refused"))
+        )
+        client._http_client = httpx.AsyncClient(transport=transport)
+
+        with patch("app.services.dify_rag_client.USE_DIFY_RAG", True):
+            for _ in range(dify_rag_breaker.failure_threshold):
+                answer, metadata = await client.query_guidelines("Diabetes", "ARZTBRIEF", "de")
+                assert answer == ""
+                assert metadata["skipped"] is True
+
+            answer, metadata = await client.query_guidelines("Diabetes", "ARZTBRIEF", "de")
+
+        assert dify_rag_breaker.is_open
+        assert "OPEN" in metadata["error"]
+        await client.aclose()
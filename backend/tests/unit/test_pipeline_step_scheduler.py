@@ -0,0 +1,181 @@
+"""
+Unit tests for the pipeline step scheduler.
+
+Tests cover:
+- Dependencies from input sources, writers and barrier steps
+- Steps reading a context variable run concurrently with earlier steps
+- Chained steps get the pipeline text after their dependency is committed
+- The per-job concurrency limit and cancellation of unneeded steps
+"""
+
+import asyncio
+from unittest.mock import Mock
+
+import pytest
+
+from app.database.modular_pipeline_models import DynamicPipelineStepDB
+from app.services.pipeline_step_scheduler import (
+    PipelineStepScheduler,
+    build_step_dependencies,
+    get_input_source,
+)
+
+
+def make_step(name, input_source=None, writes=True, branching=False, stop_values=None):
+    step = Mock(spec=DynamicPipelineStepDB)
+    step.name = name
+    step.input_source = input_source
+    step.input_from_previous_step = writes
+    step.is_branching_step = branching
+    step.stop_conditions = {"stop_on_values": stop_values} if stop_values else None
+    return step
+
+
+class Recorder:
+    """Step runner that records calls and finishes steps when released."""
+
+    def __init__(self):
+        self.calls = []
+        self.running = 0
+        self.max_running = 0
+        self.release = {}
+
+    async def __call__(self, step, input_text, context):
+        self.calls.append((step.name, input_text))
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        event = self.release.setdefault(step.name, asyncio.Event())
+        try:
+            await event.wait()
+        finally:
+            self.running -= 1
+        return True, f"{step.name}({input_text})", None
+
+    def finish(self, name):
+        self.release.setdefault(name, asyncio.Event()).set()
+
+
+def test_get_input_source():
+    assert get_input_source(make_step("a")) is None
+    assert get_input_source(make_step("a", input_source="previous_output")) is None
+    assert get_input_source(make_step("a", input_source="original_text")) == "original_text"
+
+
+def test_dependencies_follow_writers_and_barriers():
+    steps = [
+        make_step("validate", input_source="original_text", writes=False, stop_values=["NO"]),
+        make_step("translate"),
+        make_step("guidelines", input_source="original_text"),
+        make_step("check"),
+        make_step("side", writes=False),
+        make_step("format"),
+    ]
+
+    assert build_step_dependencies(steps) == [-1, 0, 0, 2, 3, 3]
+
+
+def test_steps_wait_for_branching_step():
+    steps = [
+        make_step("classify", branching=True),
+        make_step("guidelines", input_source="original_text"),
+    ]
+
+    assert build_step_dependencies(steps) == [-1, 0]
+
+
+@pytest.mark.asyncio
+async def test_context_step_runs_alongside_chained_step():
+    runner = Recorder()
+    scheduler = PipelineStepScheduler(run_step=runner, max_parallel=3)
+    steps = [make_step("translate"), make_step("guidelines", input_source="original_text")]
+    context = {"original_text": "original"}
+    scheduler.start_phase(steps)
+
+    scheduler.start_ready(0, "pii-free", context)
+    await asyncio.sleep(0)
+
+    assert runner.calls == [("translate", "pii-free"), ("guidelines", "original")]
+
+    runner.finish("guidelines")
+    runner.finish("translate")
+    first = await scheduler.result(0)
+    scheduler.start_ready(1, first.output, context)
+    second = await scheduler.result(1)
+
+    assert first.output == "translate(pii-free)"
+    assert second.output == "guidelines(original)"
+    assert second.input_text == "original"
+    await scheduler.close()
+
+
+@pytest.mark.asyncio
+async def test_chained_step_starts_after_its_dependency():
+    runner = Recorder()
+    scheduler = PipelineStepScheduler(run_step=runner, max_parallel=3)
+    scheduler.start_phase([make_step("translate"), make_step("check")])
+
+    scheduler.start_ready(0, "text", {})
+    await asyncio.sleep(0)
+    assert [name for name, _ in runner.calls] == ["translate"]
+
+    runner.finish("translate")
+    first = await scheduler.result(0)
+    scheduler.start_ready(1, first.output, {})
+    runner.finish("check")
+    second = await scheduler.result(1)
+
+    assert second.input_text == "translate(text)"
+    await scheduler.close()
+
+
+@pytest.mark.asyncio
+async def test_concurrency_limit():
+    runner = Recorder()
+    scheduler = PipelineStepScheduler(run_step=runner, max_parallel=2)
+    steps = [make_step(f"rag{i}", input_source="original_text") for i in range(4)]
+    scheduler.start_phase(steps)
+
+    scheduler.start_ready(0, "text", {"original_text": "original"})
+    await asyncio.sleep(0.01)
+    assert runner.max_running == 2
+
+    for step in steps:
+        runner.finish(step.name)
+    for index in range(4):
+        assert (await scheduler.result(index)).success
+    assert runner.max_running == 2
+    await scheduler.close()
+
+
+@pytest.mark.asyncio
+async def test_skipped_and_missing_input_steps():
+    runner = Recorder()
+    scheduler = PipelineStepScheduler(run_step=runner, max_parallel=3)
+    steps = [
+        make_step("optional", input_source="original_text"),
+        make_step("missing", input_source="guidelines_text"),
+    ]
+    scheduler.start_phase(steps, should_run=lambda step: step.name != "optional")
+
+    scheduler.start_ready(0, "text", {"original_text": "original"})
+    outcome = await scheduler.result(1)
+
+    assert runner.calls == []
+    assert outcome.success is False
+    assert "guidelines_text" in outcome.error
+    with pytest.raises(KeyError):
+        await scheduler.result(0)
+    await scheduler.close()
+
+
+@pytest.mark.asyncio
+async def test_close_cancels_unneeded_steps():
+    runner = Recorder()
+    scheduler = PipelineStepScheduler(run_step=runner, max_parallel=3)
+    scheduler.start_phase([make_step("translate"), make_step("rag", input_source="original_text")])
+
+    scheduler.start_ready(0, "text", {"original_text": "original"})
+    await asyncio.sleep(0)
+    await scheduler.close()
+
+    assert runner.running == 0
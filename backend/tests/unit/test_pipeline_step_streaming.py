@@ -0,0 +1,233 @@
+"""
+Unit tests for streaming execution of pipeline steps.
+
+Tests cover:
+- OVH streaming returns the same result shape and text as the blocking call
+- Partial output is published throttled, the completed text last
+- Streaming steps keep validation and return the complete text
+- A retried step publishes an empty output first, events carry the attempt
+- Time to first token is recorded with the AI cost log
+"""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+from tenacity import wait_fixed
+
+from app.core.retry_policy import get_pipeline_step_retry_policy
+from app.services import modular_pipeline_executor
+from app.services.ovh_client import OVHClient
+from app.services.pipeline_progress_tracker import PartialOutputPublisher
+
+PROCESSING_ID = "abc12345-job"
+
+
+def make_chunk(content=None, usage=None):
+    choices = [] if content is None else [SimpleNamespace(delta=SimpleNamespace(content=content))]
+    return SimpleNamespace(choices=choices, usage=usage)
+
+
+async def fake_stream(chunks):
+    for chunk in chunks:
+        yield chunk
+
+
+STREAM = [
+    make_chunk("Ihr Befund "),
+    make_chunk(""),
+    make_chunk("ist unauffällig.\n"),
+    make_chunk(usage=SimpleNamespace(prompt_tokens=40, completion_tokens=6, total_tokens=46)),
+]
+
+
+class TestOVHStreaming:
+    """Test OVHClient.process_medical_text_with_prompt_streaming"""
+
+    @pytest.fixture
+    def client(self):
+        client = OVHClient()
+        client.access_token = "test-token"
+        return client
+
+    @pytest.mark.asyncio
+    async def test_fragments_and_result(self, client):
+        fragments = []
+
+        async def on_delta(fragment):
+            fragments.append(fragment)
+
+        with patch.object(
+            client.client.chat.completions,
+            "create",
+            new_callable=AsyncMock,
+            return_value=fake_stream(STREAM),
+        ) as create:
+            result = await client.process_medical_text_with_prompt_streaming(
+                full_prompt="Vereinfache: ...", on_delta=on_delta, system_prompt="Du bist Arzt."
+            )
+
+        assert fragments == ["Ihr Befund ", "ist unauffällig.\n"]
+        assert result["text"] == "Ihr Befund ist unauffällig."
+        assert (result["input_tokens"], result["output_tokens"]) == (40, 6)
+        assert result["time_to_first_token"] is not None
+        assert create.await_args.kwargs["stream"] is True
+        assert create.await_args.kwargs["messages"][0]["role"] == "system"
+
+    @pytest.mark.asyncio
+    async def test_error_reported_as_text(self, client):
+        with patch.object(
+            client.client.chat.completions,
+            "create",
+            new_callable=AsyncMock,
+            side_effect=RuntimeError("connection reset"),
+        ):
+            result = await client.process_medical_text_with_prompt_streaming(
+                full_prompt="...", on_delta=AsyncMock()
+            )
+
+        assert result["text"].startswith("Error")
+        assert result["time_to_first_token"] is None
+
+
+@pytest.mark.asyncio
+async def test_publisher_throttles_partial_output():
+    tracker = Mock()
+    tracker.step_output = AsyncMock()
+    publisher = PartialOutputPublisher(tracker, PROCESSING_ID, "Translation", interval_seconds=60)
+
+    for fragment in ["Ihr ", "Befund ", "ist ", "gut."]:
+        await publisher.add(fragment)
+    await publisher.finish("Ihr Befund ist gut.")
+
+    assert [call.args[2] for call in tracker.step_output.await_args_list] == [
+        "Ihr ",
+        "Ihr Befund ist gut.",
+    ]
+    assert tracker.step_output.await_args.kwargs == {"final": True, "attempt": 1}
+
+
+@pytest.mark.asyncio
+async def test_publisher_resets_output_on_retry():
+    tracker = Mock()
+    tracker.step_output = AsyncMock()
+    first = PartialOutputPublisher(tracker, PROCESSING_ID, "Translation", attempt=1)
+    retry = PartialOutputPublisher(tracker, PROCESSING_ID, "Translation", attempt=2)
+
+    await first.start()
+    await first.add("Ihr ")
+    await retry.start()
+
+    assert [
+        (call.args[2], call.kwargs["attempt"]) for call in tracker.step_output.await_args_list
+    ] == [
+        ("Ihr ", 1),
+        ("", 2),
+    ]
+
+
+async def fake_streaming_call(full_prompt, on_delta, **kwargs):
+    for fragment in ["Ihr Befund ", "ist unauffällig."]:
+        await on_delta(fragment)
+    return {
+        "text": "Ihr Befund ist unauffällig.",
+        "input_tokens": 40,
+        "output_tokens": 6,
+        "model": "Meta-Llama-3.3-70B",
+        "time_to_first_token": 0.8,
+    }
+
+
+@pytest.fixture
+def executor(executor):
+    executor.progress_tracker = Mock()
+    executor.progress_tracker.step_output = AsyncMock()
+    ovh_client = executor.ovh_client
+    ovh_client.process_medical_text_with_prompt_streaming = AsyncMock(
+        side_effect=fake_streaming_call
+    )
+    ovh_client.process_medical_text_with_prompt = AsyncMock(
+        return_value={"text": "Ihr Befund ist unauffällig.", "input_tokens": 40, "output_tokens": 6}
+    )
+    return executor
+
+
+@pytest.fixture
+def step(make_step):
+    return make_step(
+        id=7,
+        name="Patient-Friendly Translation",
+        prompt_template="Übersetze: {input_text}",
+        temperature=0.3,
+        max_retries=2,
+        stream_output=True,
+    )
+
+
+class TestStreamingStepExecution:
+    """Test execute_step in streaming mode"""
+
+    @pytest.mark.asyncio
+    async def test_streamed_output_is_published_and_returned(self, executor, step):
+        result = await executor.execute_step(
+            step=step, input_text="Befund ...", processing_id=PROCESSING_ID
+        )
+
+        assert result == (True, "Ihr Befund ist unauffällig.", None)
+        executor.ovh_client.process_medical_text_with_prompt.assert_not_called()
+
+        published = executor.progress_tracker.step_output.await_args_list
+        assert published[0].args == (PROCESSING_ID, step.name, "Ihr Befund ")
+        assert published[-1].args[2] == "Ihr Befund ist unauffällig."
+        assert published[-1].kwargs == {"final": True, "attempt": 1}
+
+        metadata = executor.cost_tracker.log_ai_call.call_args.kwargs["metadata"]
+        assert metadata["streamed"] is True
+        assert metadata["time_to_first_token_seconds"] == 0.8
+
+    @pytest.mark.asyncio
+    async def test_without_job_the_step_is_not_streamed(self, executor, step):
+        result = await executor.execute_step(step=step, input_text="Befund ...")
+
+        assert result == (True, "Ihr Befund ist unauffällig.", None)
+        executor.ovh_client.process_medical_text_with_prompt_streaming.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_steps_without_opt_in_are_not_streamed(self, executor, step):
+        step.stream_output = False
+
+        await executor.execute_step(step=step, input_text="Befund ...", processing_id=PROCESSING_ID)
+
+        executor.ovh_client.process_medical_text_with_prompt_streaming.assert_not_called()
+        executor.progress_tracker.step_output.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_retry_replaces_partial_output(self, executor, step):
+        calls = 0
+
+        async def fail_first_attempt(full_prompt, on_delta, **kwargs):
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                await on_delta("Ihr Bef")
+                return {"text": "Error: connection reset", "time_to_first_token": 0.5}
+            return await fake_streaming_call(full_prompt, on_delta, **kwargs)
+
+        streaming = executor.ovh_client.process_medical_text_with_prompt_streaming
+        streaming.side_effect = fail_first_attempt
+        with patch.object(
+            modular_pipeline_executor,
+            "get_pipeline_step_retry_policy",
+            lambda attempts: {**get_pipeline_step_retry_policy(attempts), "wait": wait_fixed(0)},
+        ):
+            result = await executor.execute_step(
+                step=step, input_text="Befund ...", processing_id=PROCESSING_ID
+            )
+
+        assert result == (True, "Ihr Befund ist unauffällig.", None)
+        published = [
+            (call.args[2], call.kwargs["attempt"])
+            for call in executor.progress_tracker.step_output.await_args_list
+        ]
+        assert published[:3] == [("Ihr Bef", 1), ("", 2), ("Ihr Befund ", 2)]
+        assert published[-1] == ("Ihr Befund ist unauffällig.", 2)
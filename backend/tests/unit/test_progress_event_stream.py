@@ -0,0 +1,308 @@
+"""
+Unit tests for the processing progress event stream.
+
+Tests cover:
+- Tracker events are published with a per-job sequence number
+- Progress and status events update the ProcessingProgress snapshot
+- The stream skips stale events, resumes from Last-Event-ID and ends on terminal status
+- Partial output of streaming steps is forwarded
+- The per-process stream cap
+"""
+
+import json
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from app.models.document import ProcessingStatus
+from app.services.pipeline_progress_tracker import PipelineProgressTracker
+from app.services.progress_event_stream import (
+    ProgressEventBroker,
+    StreamLimitError,
+    apply_event,
+    format_sse,
+    parse_last_event_id,
+    stream_progress_events,
+)
+
+PROCESSING_ID = "abc12345-job"
+
+
+def make_status(**overrides):
+    status = {
+        "processing_id": PROCESSING_ID,
+        "status": ProcessingStatus.EXTRACTING_TEXT,
+        "progress_percent": 10,
+        "current_step": "Medizinischer Inhalt wird validiert...",
+        "message": None,
+        "error": None,
+    }
+    status.update(overrides)
+    return status
+
+
+def parse_events(chunks):
+    """Parse SSE chunks into (id, event, data) tuples, skipping comments and retry."""
+    events = []
+    for chunk in chunks:
+        fields = dict(line.split(": ", 1) for line in chunk.strip().split("\n") if ": " in line)
+        if "data" in fields:
+            events.append((fields.get("id"), fields.get("event"), json.loads(fields["data"])))
+    return events
+
+
+async def collect(queue, events, status=None, snapshot_event_id=3, last_event_id=None):
+    for event in events:
+        queue.put_nowait(event)
+    return [
+        chunk
+        async for chunk in stream_progress_events(
+            PROCESSING_ID,
+            status or make_status(),
+            queue,
+            snapshot_event_id=snapshot_event_id,
+            last_event_id=last_event_id,
+            is_disconnected=AsyncMock(return_value=True),
+            heartbeat_seconds=0.01,
+        )
+    ]
+
+
+@pytest.fixture
+def broker():
+    return ProgressEventBroker(redis_url=None, max_streams=2)
+
+
+class TestTrackerEvents:
+    """Test event publishing from PipelineProgressTracker"""
+
+    @pytest.mark.asyncio
+    async def test_status_changed_publishes_sequenced_event(self):
+        """Test that status events carry the next sequence number of the job"""
+        client = AsyncMock()
+        client.incr.return_value = 7
+        tracker = PipelineProgressTracker()
+
+        with patch.object(tracker, "_get_client", AsyncMock(return_value=client)):
+            await tracker.status_changed(PROCESSING_ID, "FAILED", error="boom")
+
+        channel, payload = client.publish.await_args.args
+        assert channel == f"docworker:pipeline_events:{PROCESSING_ID}"
+        assert json.loads(payload) == {
+            "id": 7,
+            "type": "status",
+            "status": "FAILED",
+            "progress_percent": None,
+            "error": "boom",
+        }
+
+    @pytest.mark.asyncio
+    async def test_step_started_publishes_monotonic_progress(self):
+        """Test that progress events report the stored (monotonic) percentage"""
+        client = AsyncMock()
+        client.hget.return_value = "60"
+        client.incr.return_value = 1
+        tracker = PipelineProgressTracker()
+
+        with patch.object(tracker, "_get_client", AsyncMock(return_value=client)):
+            await tracker.step_started(PROCESSING_ID, "Medical Fact Check", 1, 10, "universal")
+
+        event = json.loads(client.publish.await_args.args[1])
+        assert event["type"] == "progress"
+        assert event["progress_percent"] == 60
+
+
+class TestApplyEvent:
+    """Test merging events into the status snapshot"""
+
+    def test_progress_event(self):
+        """Test that step progress updates the live step fields"""
+        status = make_status()
+        changed = apply_event(
+            status,
+            {
+                "type": "progress",
+                "current_step_name": "Medical Fact Check",
+                "ui_stage": "translation",
+                "progress_percent": 55,
+            },
+        )
+
+        assert changed is True
+        assert status["current_step_name"] == "Medical Fact Check"
+        assert status["current_step"] == "Medizinische Fakten werden geprüft..."
+        assert status["progress_percent"] == 55
+
+    def test_status_events_map_to_api_status(self):
+        """Test that worker status transitions map like the polling endpoint"""
+        status = make_status()
+
+        apply_event(status, {"type": "status", "status": "RUNNING", "progress_percent": 20})
+        assert status["status"] == ProcessingStatus.TRANSLATING
+
+        apply_event(status, {"type": "status", "status": "FAILED", "error": "boom"})
+        assert status["status"] == ProcessingStatus.ERROR
+        assert status["error"] == "boom"
+        assert status["current_step"] == "Fehler bei Verarbeitung"
+
+    def test_unknown_event_ignored(self):
+        """Test that unknown event types don't produce a snapshot"""
+        assert apply_event(make_status(), {"type": "status", "status": "BOGUS"}) is False
+        assert apply_event(make_status(), {"type": "other"}) is False
+
+
+class TestStream:
+    """Test the SSE generator"""
+
+    @pytest.mark.asyncio
+    async def test_snapshot_events_and_terminal_close(self, broker):
+        """Test snapshot first, stale events skipped, stream ended after completion"""
+        queue = broker.open_stream(PROCESSING_ID)
+        chunks = await collect(
+            queue,
+            [
+                {"id": 2, "type": "status", "status": "FAILED"},
+                {"id": 4, "type": "step_completed", "step_name": "Medical Fact Check"},
+                {"id": 5, "type": "status", "status": "COMPLETED", "progress_percent": 100},
+                {"id": 6, "type": "status", "status": "FAILED"},
+            ],
+        )
+
+        assert chunks[0] == "retry: 3000\n\n"
+        events = parse_events(chunks)
+        assert [(event_id, name) for event_id, name, _ in events] == [
+            ("3", "progress"),
+            ("4", "step_completed"),
+            ("5", "progress"),
+        ]
+        assert events[0][2]["status"] == "extracting_text"
+        assert events[2][2]["status"] == "completed"
+        assert events[2][2]["progress_percent"] == 100
+
+    @pytest.mark.asyncio
+    async def test_partial_output_forwarded(self, broker):
+        """Test that partial output of a streaming step reaches the client"""
+        queue = broker.open_stream(PROCESSING_ID)
+        chunks = await collect(
+            queue,
+            [
+                {"id": 4, "type": "partial_output", "step_name": "Translation", "text": "Ihr"},
+                {
+                    "id": 5,
+                    "type": "partial_output",
+                    "step_name": "Translation",
+                    "text": "Ihr Befund",
+                    "final": True,
+                    "attempt": 2,
+                },
+                {"id": 6, "type": "status", "status": "COMPLETED", "progress_percent": 100},
+            ],
+        )
+
+        events = parse_events(chunks)
+        assert [name for _, name, _ in events] == [
+            "progress",
+            "partial_output",
+            "partial_output",
+            "progress",
+        ]
+        assert events[1][2] == {
+            "step_name": "Translation",
+            "text": "Ihr",
+            "final": False,
+            "attempt": 1,
+        }
+        assert events[2][2]["attempt"] == 2
+        assert events[2][2]["final"] is True
+
+    @pytest.mark.asyncio
+    async def test_resume_skips_snapshot_when_up_to_date(self, broker):
+        """Test that a client reconnecting with the latest event ID gets no duplicate"""
+        queue = broker.open_stream(PROCESSING_ID)
+        chunks = await collect(
+            queue, [{"id": 4, "type": "status", "status": "COMPLETED"}], last_event_id=3
+        )
+
+        assert [event_id for event_id, _, _ in parse_events(chunks)] == ["4"]
+
+    @pytest.mark.asyncio
+    async def test_terminal_snapshot_ends_stream(self, broker):
+        """Test that an already finished job yields one snapshot"""
+        queue = broker.open_stream(PROCESSING_ID)
+        chunks = await collect(queue, [], status=make_status(status=ProcessingStatus.COMPLETED))
+
+        assert len(parse_events(chunks)) == 1
+
+    @pytest.mark.asyncio
+    async def test_heartbeat_and_disconnect(self, broker):
+        """Test that idle streams send a heartbeat and stop once the client is gone"""
+        queue = broker.open_stream(PROCESSING_ID)
+        is_disconnected = AsyncMock(side_effect=[False, True])
+
+        chunks = [
+            chunk
+            async for chunk in stream_progress_events(
+                PROCESSING_ID,
+                make_status(),
+                queue,
+                snapshot_event_id=0,
+                last_event_id=0,
+                is_disconnected=is_disconnected,
+                heartbeat_seconds=0.01,
+            )
+        ]
+
+        assert chunks[1:] == [": heartbeat\n\n"]
+
+    @pytest.mark.asyncio
+    async def test_stop_ends_open_streams(self, broker):
+        """Test that losing the subscription ends streams so clients reconnect"""
+        queue = broker.open_stream(PROCESSING_ID)
+        await broker.stop()
+
+        events = parse_events(await collect(queue, []))
+
+        assert [name for _, name, _ in events] == ["progress"]
+
+
+class TestBroker:
+    """Test fan-out and the stream cap"""
+
+    def test_stream_cap(self, broker):
+        """Test that streams beyond the cap are refused until one closes"""
+        first = broker.open_stream(PROCESSING_ID)
+        broker.open_stream("other-job")
+
+        with pytest.raises(StreamLimitError):
+            broker.open_stream("third-job")
+
+        broker.close_stream(PROCESSING_ID, first)
+        broker.close_stream(PROCESSING_ID, first)
+        assert broker.active_streams == 1
+        broker.open_stream("third-job")
+
+    def test_dispatch_only_to_job_streams(self, broker):
+        """Test that events reach every stream of their job and no other"""
+        first = broker.open_stream(PROCESSING_ID)
+        second = broker.open_stream(PROCESSING_ID)
+        broker.max_streams = 3
+        other = broker.open_stream("other-job")
+
+        broker.dispatch(PROCESSING_ID, {"id": 1})
+
+        assert first.get_nowait() == second.get_nowait() == {"id": 1}
+        assert other.empty()
+
+    @pytest.mark.asyncio
+    async def test_start_without_redis(self, broker):
+        """Test that streaming is reported unavailable without Redis"""
+        assert await broker.start() is False
+
+    def test_format_and_parse_event_id(self):
+        """Test SSE framing and Last-Event-ID parsing"""
+        assert format_sse({"a": 1}, event="progress", event_id=5) == (
+            'id: 5\nevent: progress\ndata: {"a": 1}\n\n'
+        )
+        assert parse_last_event_id("5") == 5
+        assert parse_last_event_id("not-a-number") is None
+        assert parse_last_event_id(None) is None
@@ -0,0 +1,220 @@
+"""
+Unit tests for upload quality analysis off the event loop.
+
+Tests cover:
+- Adaptive page sampling for long PDFs
+- The per-document time budget stops page sampling
+- Results are cached by content hash (without the filename) and reused
+- Analysis in the process pool from a temporary file, and the timeout of a slow analysis
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+import json
+from pathlib import Path
+import time
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from reportlab.pdfgen import canvas
+
+from app.core.config import settings
+from app.services import quality_analysis_runner
+from app.services.file_quality_detector import (
+    ExtractionStrategy,
+    FileQualityDetector,
+    ocr_quality_summary,
+    select_sample_pages,
+)
+from app.services.quality_analysis_runner import QualityAnalysisTimeoutError, analyze_document
+
+
+def make_pdf(pages: int) -> bytes:
+    buffer = BytesIO()
+    pdf = canvas.Canvas(buffer)
+    for page in range(pages):
+        pdf.drawString(
+            72, 720, f"Befundbericht Seite {page + 1}: Patient zeigt keine Auffälligkeiten"
+        )
+        pdf.drawString(72, 700, "Die Laborwerte liegen im Normbereich, weitere Kontrolle empfohlen")
+        pdf.showPage()
+    pdf.save()
+    return buffer.getvalue()
+
+
+@pytest.fixture
+def cache():
+    """In-memory stand-in for the Redis cache service (JSON round trip like Redis)."""
+    store = {}
+    service = AsyncMock()
+    service.get.side_effect = lambda namespace, key: (
+        json.loads(store[(namespace, key)]) if (namespace, key) in store else None
+    )
+    service.set.side_effect = lambda namespace, key, value, **_: store.update(
+        {(namespace, key): json.dumps(value)}
+    )
+    service.store = store
+    with patch.object(quality_analysis_runner, "get_cache_service", return_value=service):
+        yield service
+
+
+@pytest.fixture
+def in_thread():
+    with patch.object(settings, "quality_analysis_workers", 0):
+        yield
+
+
+@pytest.fixture(autouse=True)
+def temp_dir(tmp_path):
+    with patch.object(settings, "temp_dir", str(tmp_path)):
+        yield tmp_path
+
+
+class TestPageSampling:
+    """Test adaptive page selection"""
+
+    def test_short_pdf_analyzed_completely(self):
+        """Test that PDFs up to the minimum sample are fully analyzed"""
+        assert select_sample_pages(4) == [0, 1, 2, 3]
+        assert select_sample_pages(5) == [0, 1, 2, 3, 4]
+
+    def test_long_pdf_sampled_across_document(self):
+        """Test leading pages plus an even spread up to the last page"""
+        pages = select_sample_pages(100)
+
+        assert len(pages) == 10  # sqrt(100)
+        assert pages[:3] == [0, 1, 2]
+        assert pages[-1] == 99
+        assert pages == sorted(set(pages))
+
+    def test_sample_capped(self):
+        """Test that very long PDFs sample at most max_pages"""
+        assert len(select_sample_pages(10_000, max_pages=12)) == 12
+        assert len(select_sample_pages(30, max_pages=3)) == 3
+
+
+class TestTimeBudget:
+    """Test the per-document time budget"""
+
+    def test_budget_stops_sampling(self):
+        """Test that an exhausted budget still analyzes one page and says so"""
+        detector = FileQualityDetector()
+
+        _, _, analysis = detector.analyze(make_pdf(8), "pdf", "long.pdf", time_budget_seconds=0)
+
+        assert analysis["page_count"] == 8
+        assert analysis["pages_checked"] == 1
+        assert analysis["time_budget_exhausted"] is True
+
+    def test_without_budget_all_sampled_pages(self):
+        """Test that all sampled pages are analyzed within the budget"""
+        detector = FileQualityDetector()
+
+        _, _, analysis = detector.analyze(make_pdf(3), "pdf", "short.pdf", time_budget_seconds=60)
+
+        assert analysis["pages_checked"] == 3
+        assert analysis["text_pages"] == [1, 2, 3]
+        assert analysis["time_budget_exhausted"] is False
+        assert ocr_quality_summary(analysis)["page_count"] == 3
+
+
+class TestAnalyzeDocument:
+    """Test analysis off the event loop with result caching"""
+
+    @pytest.mark.asyncio
+    async def test_result_cached_by_content_hash(self, cache, in_thread):
+        """Test that the second analysis of the same bytes comes from the cache"""
+        content = make_pdf(2)
+
+        with patch.object(
+            quality_analysis_runner, "_analyze", wraps=quality_analysis_runner._analyze
+        ) as analyze:
+            strategy, _, first = await analyze_document(BytesIO(content), "pdf", "a.pdf")
+            cached_strategy, _, second = await analyze_document(content, "pdf", "b.pdf")
+
+        assert analyze.call_count == 1
+        assert first["cached"] is False
+        assert second["cached"] is True
+        assert cached_strategy == strategy
+        assert second["filename"] == "b.pdf"
+        (stored,) = cache.store.values()
+        assert "filename" not in json.loads(stored)["analysis"]
+
+    @pytest.mark.asyncio
+    async def test_known_hash_skips_reading_on_hit(self, cache, in_thread):
+        """Test that a cache hit for a known hash doesn't read the file"""
+        await analyze_document(make_pdf(1), "pdf", "a.pdf", content_hash="abc")
+        stream = BytesIO(b"not read")
+
+        _, _, analysis = await analyze_document(stream, "pdf", "a.pdf", content_hash="abc")
+
+        assert analysis["cached"] is True
+        assert stream.tell() == 0
+
+    @pytest.mark.asyncio
+    async def test_failed_analysis_not_cached(self, cache, in_thread):
+        """Test that an analysis error isn't cached"""
+        strategy, _, analysis = await analyze_document(b"%PDF-broken", "pdf", "broken.pdf")
+
+        assert strategy == ExtractionStrategy.VISION_LLM
+        assert "error" in analysis
+        assert cache.store == {}
+
+    @pytest.mark.asyncio
+    async def test_process_pool(self, cache, temp_dir):
+        """Test that the analysis runs in a separate process on a temporary file"""
+        try:
+            with patch.object(settings, "quality_analysis_workers", 1):
+                _, _, analysis = await analyze_document(BytesIO(make_pdf(2)), "pdf", "a.pdf")
+        finally:
+            quality_analysis_runner.shutdown_pool()
+
+        assert analysis["page_count"] == 2
+        assert analysis["cached"] is False
+        assert list(temp_dir.iterdir()) == []
+
+    @pytest.mark.asyncio
+    async def test_pool_gets_file_path(self, cache, temp_dir):
+        """Test that pool processes get the path of a copy instead of the content"""
+        content = make_pdf(1)
+        submitted = []
+
+        def analyze(path, *args):
+            submitted.append((path, Path(path).read_bytes()))
+            return "local_text", "simple", {"page_count": 1}
+
+        with (
+            patch.object(quality_analysis_runner, "_get_pool", return_value=ThreadPoolExecutor(1)),
+            patch.object(quality_analysis_runner, "_analyze", analyze),
+            patch.object(settings, "quality_analysis_workers", 1),
+        ):
+            await analyze_document(BytesIO(content), "pdf", "a.pdf", content_hash="path")
+
+        [(path, copied)] = submitted
+        assert copied == content
+        assert Path(path).parent == temp_dir
+        assert not Path(path).exists()
+
+    @pytest.mark.asyncio
+    async def test_timeout_caches_late_result(self, cache):
+        """Test that a slow analysis times out and is cached when it finishes"""
+
+        def slow_analyze(*args):
+            time.sleep(0.2)
+            return "local_text", "simple", {"page_count": 1}
+
+        with (
+            patch.object(quality_analysis_runner, "_get_pool", return_value=ThreadPoolExecutor(1)),
+            patch.object(quality_analysis_runner, "_analyze", slow_analyze),
+            patch.object(quality_analysis_runner, "TIMEOUT_GRACE_SECONDS", 0),
+            patch.object(settings, "quality_analysis_workers", 1),
+            patch.object(settings, "quality_analysis_time_budget_seconds", 0.01),
+            pytest.raises(QualityAnalysisTimeoutError),
+        ):
+            await analyze_document(b"%PDF", "pdf", "slow.pdf", content_hash="slow")
+
+        await asyncio.sleep(0.3)
+        cached = await quality_analysis_runner.get_cached_analysis("slow", "pdf")
+        assert cached is not None
+        assert cached[0] == ExtractionStrategy.LOCAL_TEXT
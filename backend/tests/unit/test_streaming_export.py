@@ -0,0 +1,154 @@
+"""
+Unit tests for streaming exports.
+
+Tests cover:
+- CSV and NDJSON encoding, value conversion and chunking
+- Gzip output decompresses to the plain export
+- StreamingExport opens its own session, counts rows and reports completion
+"""
+
+from contextlib import contextmanager
+import csv
+from datetime import datetime
+import gzip
+import io
+import json
+from unittest.mock import MagicMock, patch
+from uuid import UUID
+
+import pytest
+
+from app.database.auth_models import AuditAction
+from app.services import streaming_export
+from app.services.streaming_export import (
+    ExportFormat,
+    StreamingExport,
+    encode_csv,
+    encode_ndjson,
+    gzip_chunks,
+)
+
+FIELDS = ["timestamp", "user_id", "action", "details"]
+
+
+def make_rows(count):
+    return (
+        {
+            "timestamp": datetime(2025, 1, 1, 12, 0, i % 60),
+            "user_id": UUID(int=i),
+            "action": AuditAction.AUDIT_EXPORT,
+            "details": f'{{"n": {i}, "note": "a,b"}}',
+        }
+        for i in range(count)
+    )
+
+
+@contextmanager
+def fake_session_context(db):
+    yield db
+
+
+def test_encode_csv_writes_header_and_converted_values():
+    output = b"".join(encode_csv(make_rows(2), FIELDS)).decode("utf-8")
+
+    rows = list(csv.DictReader(io.StringIO(output)))
+    assert output.startswith("timestamp,user_id,action,details")
+    assert rows[1]["timestamp"] == "2025-01-01T12:00:01"
+    assert rows[1]["user_id"] == str(UUID(int=1))
+    assert rows[1]["action"] == AuditAction.AUDIT_EXPORT.value
+    assert rows[1]["details"] == '{"n": 1, "note": "a,b"}'
+
+
+def test_encode_csv_chunks_large_exports(monkeypatch):
+    monkeypatch.setattr(streaming_export, "CHUNK_BYTES", 1024)
+
+    chunks = list(encode_csv(make_rows(500), FIELDS))
+
+    assert len(chunks) > 1
+    assert all(len(chunk) < 2048 for chunk in chunks)
+    assert len(list(csv.DictReader(io.StringIO(b"".join(chunks).decode("utf-8"))))) == 500
+
+
+def test_encode_ndjson_writes_one_object_per_line():
+    lines = b"".join(encode_ndjson(make_rows(3), FIELDS)).decode("utf-8").splitlines()
+
+    assert len(lines) == 3
+    record = json.loads(lines[2])
+    assert list(record) == FIELDS
+    assert record["user_id"] == str(UUID(int=2))
+    assert record["action"] == AuditAction.AUDIT_EXPORT.value
+
+
+def test_gzip_chunks_round_trip():
+    plain = b"".join(encode_csv(make_rows(200), FIELDS))
+
+    compressed = b"".join(gzip_chunks(encode_csv(make_rows(200), FIELDS)))
+
+    assert gzip.decompress(compressed) == plain
+
+
+def test_streaming_export_reads_rows_in_its_own_session():
+    db = MagicMock()
+    rows = MagicMock(side_effect=lambda _session: make_rows(5))
+    on_complete = MagicMock()
+    export = StreamingExport(
+        rows=rows,
+        fieldnames=FIELDS,
+        filename_stem="audit_logs_test",
+        export_format=ExportFormat.NDJSON,
+        compress=True,
+        on_complete=on_complete,
+    )
+
+    with patch.object(streaming_export, "get_db_session_context", lambda: fake_session_context(db)):
+        body = b"".join(export)
+
+    rows.assert_called_once_with(db)
+    assert len(gzip.decompress(body).splitlines()) == 5
+    assert export.filename == "audit_logs_test.ndjson.gz"
+    assert export.media_type == "application/gzip"
+    assert "audit_logs_test.ndjson.gz" in export.headers["Content-Disposition"]
+    on_complete.assert_called_once_with(5, True)
+
+
+def test_streaming_export_reports_incomplete_stream_on_disconnect(monkeypatch):
+    monkeypatch.setattr(streaming_export, "CHUNK_BYTES", 64)
+    on_complete = MagicMock()
+    export = StreamingExport(
+        rows=lambda _session: make_rows(100),
+        fieldnames=FIELDS,
+        filename_stem="audit_logs_test",
+        on_complete=on_complete,
+    )
+
+    with patch.object(
+        streaming_export, "get_db_session_context", lambda: fake_session_context(MagicMock())
+    ):
+        body = iter(export)
+        next(body)
+        body.close()
+
+    count, completed = on_complete.call_args.args
+    assert completed is False
+    assert count < 100
+
+
+def test_streaming_export_reports_failure_and_reraises():
+    def failing_rows(session):
+        yield from make_rows(2)
+        raise RuntimeError("connection lost")
+
+    on_complete = MagicMock()
+    export = StreamingExport(
+        rows=failing_rows, fieldnames=FIELDS, filename_stem="x", on_complete=on_complete
+    )
+
+    with (
+        patch.object(
+            streaming_export, "get_db_session_context", lambda: fake_session_context(MagicMock())
+        ),
+        pytest.raises(RuntimeError),
+    ):
+        b"".join(export)
+
+    on_complete.assert_called_once_with(2, False)
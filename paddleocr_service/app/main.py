@@ -5,12 +5,11 @@ Simple, fast OCR extraction using PaddleOCR.
 Optimized for speed - no heavy document structure analysis.
 """
 
-import io
 import logging
 import os
 import sys
 import time
-from typing import Dict, Any, Optional
+from typing import Any
 
 # ==================== ENVIRONMENT SETUP ====================
 MODEL_CACHE_DIR = os.environ.get("PADDLEX_HOME", "/home/appuser/.paddlex")
@@ -23,6 +22,7 @@ from pydantic import BaseModel
 from contextlib import asynccontextmanager
 
 from app.auth import verify_api_key
+from app.pipeline import ENGINE_OPTIONS, OCRPipeline, PipelineSaturatedError
 import uvicorn
 
 # Logging
@@ -54,6 +54,9 @@ except ImportError as e:
 # Global OCR engine
 ocr_engine = None
 
+# Runs the engine off the event loop (created after the engine loads)
+ocr_pipeline: OCRPipeline | None = None
+
 
 # ==================== MODELS ====================
 
@@ -71,13 +74,14 @@ class HealthResponse(BaseModel):
     version: str
     paddleocr_available: bool
     gpu_enabled: bool
+    pipeline: dict[str, Any] | None = None
 
 
 # ==================== LIFESPAN ====================
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    global ocr_engine
+    global ocr_engine, ocr_pipeline
 
     use_gpu = os.environ.get("USE_GPU", "false").lower() == "true"
     device = 'gpu' if use_gpu else 'cpu'
@@ -99,13 +103,7 @@ async def lifespan(app: FastAPI):
         try:
             logger.info(f"Initializing PaddleOCR ({device})...")
             start_init = time.time()
-            ocr_engine = PaddleOCR(
-                lang='german',
-                device=device,
-                use_doc_orientation_classify=False,
-                use_doc_unwarping=False,
-                use_textline_orientation=False,  # Disable to fix CPU kernel bug
-            )
+            ocr_engine = PaddleOCR(device=device, **ENGINE_OPTIONS)
             logger.info(f"PaddleOCR initialized in {time.time() - start_init:.2f}s")
         except Exception as e:
             import traceback
@@ -113,12 +111,15 @@ async def lifespan(app: FastAPI):
             logger.error(f"Full traceback:\n{traceback.format_exc()}")
 
     if ocr_engine:
+        ocr_pipeline = OCRPipeline.from_env(ocr_engine)
         logger.info(f"Service ready: PaddleOCR ({device})")
     else:
         logger.error("No OCR engine available!")
 
     yield
     logger.info("Shutting down...")
+    if ocr_pipeline:
+        ocr_pipeline.shutdown()
 
 
 # ==================== APP ====================
@@ -184,98 +185,6 @@ class AuditLoggingMiddleware(BaseHTTPMiddleware):
 app.add_middleware(AuditLoggingMiddleware)
 
 
-# ==================== HELPERS ====================
-
-def extract_text_from_file(file_content: bytes, is_pdf: bool) -> tuple[str, float, int]:
-    """Extract text using PaddleOCR."""
-    from PIL import Image
-    import numpy as np
-    import fitz  # PyMuPDF
-
-    all_text = []
-    all_confidences = []
-
-    if is_pdf:
-        pdf_document = fitz.open(stream=file_content, filetype="pdf")
-        total_pages = len(pdf_document)
-        logger.info(f"PDF has {total_pages} pages")
-
-        for page_num in range(total_pages):
-            page = pdf_document[page_num]
-            # Use 200 DPI for speed (was 300)
-            pix = page.get_pixmap(matrix=fitz.Matrix(200/72, 200/72))
-            image = Image.frombytes("RGB", [pix.width, pix.height], pix.samples)
-            image_array = np.array(image)
-
-            result = ocr_engine.ocr(image_array)
-            _parse_result(result, all_text, all_confidences)
-            logger.info(f"Page {page_num + 1}/{total_pages} done")
-
-        pdf_document.close()
-    else:
-        image = Image.open(io.BytesIO(file_content))
-        if image.mode != 'RGB':
-            image = image.convert('RGB')
-        image_array = np.array(image)
-
-        result = ocr_engine.ocr(image_array)
-        _parse_result(result, all_text, all_confidences)
-
-    full_text = "\n".join(all_text)
-    avg_confidence = sum(all_confidences) / len(all_confidences) if all_confidences else 0.0
-
-    return full_text, avg_confidence, len(all_text)
-
-
-def _parse_result(result: Any, all_text: list, all_confidences: list) -> None:
-    """Parse OCR result from PaddleOCR."""
-    if not result:
-        return
-
-    try:
-        for page_result in result:
-            if not page_result:
-                continue
-
-            # Handle OCRResult object (dict-like)
-            if hasattr(page_result, 'get'):
-                rec_texts = page_result.get('rec_texts', [])
-                rec_scores = page_result.get('rec_scores', [])
-                if rec_texts:
-                    for i, t in enumerate(rec_texts):
-                        if t:
-                            all_text.append(str(t))
-                            s = rec_scores[i] if i < len(rec_scores) else 0.9
-                            all_confidences.append(float(s) if s else 0.9)
-                    continue
-
-            # Handle list format
-            for line in page_result:
-                if not line:
-                    continue
-
-                if hasattr(line, 'rec_text'):
-                    text = line.rec_text
-                    score = getattr(line, 'rec_score', 0.9)
-                elif isinstance(line, dict):
-                    text = line.get('rec_text', '')
-                    score = line.get('rec_score', 0.9)
-                elif isinstance(line, (list, tuple)) and len(line) >= 2:
-                    text_part = line[1]
-                    if isinstance(text_part, (list, tuple)) and len(text_part) >= 2:
-                        text, score = text_part[0], text_part[1]
-                    else:
-                        text, score = str(text_part), 0.9
-                else:
-                    continue
-
-                if text:
-                    all_text.append(str(text))
-                    all_confidences.append(float(score) if score else 0.9)
-    except Exception as e:
-        logger.warning(f"Error parsing result: {e}")
-
-
 # ==================== ENDPOINTS ====================
 
 @app.get("/health", response_model=HealthResponse)
@@ -286,7 +195,8 @@ async def health_check():
         service="PaddleOCR Microservice v3.0 (Fast)",
         version="3.0.0",
         paddleocr_available=ocr_engine is not None,
-        gpu_enabled=use_gpu
+        gpu_enabled=use_gpu,
+        pipeline=ocr_pipeline.stats() if ocr_pipeline else None
     )
 
 
@@ -297,7 +207,7 @@ async def extract_text(
     """Extract text from document using PaddleOCR."""
     logger.info(f"Request: /extract ({file.filename})")
 
-    if ocr_engine is None:
+    if ocr_pipeline is None:
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail="OCR engine not available"
@@ -315,7 +225,7 @@ async def extract_text(
             (file.filename and file.filename.lower().endswith('.pdf'))
         )
 
-        text, confidence, lines = extract_text_from_file(file_content, is_pdf)
+        text, confidence, lines = await ocr_pipeline.run(file_content, is_pdf)
         processing_time = time.time() - start_time
 
         logger.info(f"Done: {len(text)} chars, {lines} lines, {processing_time:.2f}s")
@@ -330,6 +240,13 @@ async def extract_text(
 
     except HTTPException:
         raise
+    except PipelineSaturatedError as e:
+        logger.warning(f"Rejecting {file.filename}: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="OCR service busy. Retry later.",
+            headers={"Retry-After": str(e.retry_after)}
+        ) from e
     except Exception as e:
         logger.error(f"OCR failed: {e}", exc_info=True)
         raise HTTPException(
@@ -0,0 +1,375 @@
+"""
+Pipelined OCR for PDF and image documents.
+
+Previously the /extract endpoint rendered a PDF page, ran OCR on it and only then
+rendered the next page, all on the event loop thread, so the service handled one
+document at a time and /health stalled behind it. OCRPipeline moves the work off
+the event loop and overlaps the two stages:
+
+- A render thread rasterizes pages with PyMuPDF into a small prefetch queue. The
+  pixmap samples are viewed as a NumPy array (np.frombuffer), not copied through PIL.
+- The inference thread runs PaddleOCR on batches of already rendered pages (one
+  predict() call per batch on PaddleOCR 3.x). Paddle's inference releases the GIL,
+  so the next pages are rendered meanwhile.
+
+The OCR engine is not thread-safe, so one document is in inference at a time.
+Requests are admitted through a bounded queue: OCR_MAX_QUEUE documents may wait
+for the engine, further requests fail fast with PipelineSaturatedError so the
+endpoint can answer 503 + Retry-After.
+
+Configuration (environment):
+    OCR_PIPELINE_MODE  - "pipelined" (default) or "sequential" (render and OCR one
+                         page after another in the inference thread)
+    OCR_BATCH_SIZE     - Maximum pages per inference call (default: 4)
+    OCR_PREFETCH_PAGES - Rendered pages buffered ahead of inference (default: 2 x batch size)
+    OCR_MAX_QUEUE      - Documents allowed to wait for the OCR engine (default: 4)
+    OCR_RETRY_AFTER    - Retry-After seconds sent with 503 when saturated (default: 10)
+    OCR_RENDER_DPI     - Rasterization resolution (default: 200)
+"""
+
+import asyncio
+import io
+import logging
+import os
+import queue
+import threading
+import time
+from collections.abc import Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Literal
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+PipelineMode = Literal["pipelined", "sequential"]
+
+# PaddleOCR options shared by the service and scripts/benchmark_ocr.py
+ENGINE_OPTIONS = {
+    "lang": "german",
+    "use_doc_orientation_classify": False,
+    "use_doc_unwarping": False,
+    "use_textline_orientation": False,  # Disable to fix CPU kernel bug
+}
+
+# Seconds between checks for a cancelled document while the prefetch queue is full
+_PUT_POLL_SECONDS = 0.5
+
+_DONE = object()
+
+
+class PipelineSaturatedError(Exception):
+    """Raised when a document is in inference and the wait queue is full."""
+
+    def __init__(self, retry_after: int):
+        self.retry_after = retry_after
+        super().__init__(f"OCR pipeline saturated, retry after {retry_after}s")
+
+
+@dataclass
+class RenderedPage:
+    """A rasterized page. image is a view of pixmap's samples, so both travel together."""
+
+    page_num: int
+    image: np.ndarray
+    pixmap: Any
+
+
+def pixmap_to_array(pixmap: Any) -> np.ndarray:
+    """View a PyMuPDF pixmap's samples as a (height, width, channels) uint8 array (no copy)."""
+    return np.frombuffer(pixmap.samples_mv, dtype=np.uint8).reshape(
+        pixmap.height, pixmap.width, pixmap.n
+    )
+
+
+def iter_rendered_pages(
+    file_content: bytes, dpi: int, cancelled: threading.Event | None = None
+) -> Iterator[RenderedPage]:
+    """Rasterize the pages of a PDF in order (RGB, no alpha)."""
+    import fitz  # PyMuPDF
+
+    with fitz.open(stream=file_content, filetype="pdf") as document:
+        total_pages = len(document)
+        logger.info(f"PDF has {total_pages} pages")
+        matrix = fitz.Matrix(dpi / 72, dpi / 72)
+        for page_num in range(total_pages):
+            if cancelled is not None and cancelled.is_set():
+                return
+            pixmap = document[page_num].get_pixmap(matrix=matrix, alpha=False)
+            yield RenderedPage(page_num, pixmap_to_array(pixmap), pixmap)
+
+
+def parse_ocr_result(result: Any, all_text: list, all_confidences: list) -> None:
+    """Parse OCR result from PaddleOCR."""
+    if not result:
+        return
+
+    try:
+        for page_result in result:
+            if not page_result:
+                continue
+
+            # Handle OCRResult object (dict-like)
+            if hasattr(page_result, "get"):
+                rec_texts = page_result.get("rec_texts", [])
+                rec_scores = page_result.get("rec_scores", [])
+                if rec_texts:
+                    for i, t in enumerate(rec_texts):
+                        if t:
+                            all_text.append(str(t))
+                            s = rec_scores[i] if i < len(rec_scores) else 0.9
+                            all_confidences.append(float(s) if s else 0.9)
+                    continue
+
+            # Handle list format
+            for line in page_result:
+                if not line:
+                    continue
+
+                if hasattr(line, "rec_text"):
+                    text = line.rec_text
+                    score = getattr(line, "rec_score", 0.9)
+                elif isinstance(line, dict):
+                    text = line.get("rec_text", "")
+                    score = line.get("rec_score", 0.9)
+                elif isinstance(line, list | tuple) and len(line) >= 2:
+                    text_part = line[1]
+                    if isinstance(text_part, list | tuple) and len(text_part) >= 2:
+                        text, score = text_part[0], text_part[1]
+                    else:
+                        text, score = str(text_part), 0.9
+                else:
+                    continue
+
+                if text:
+                    all_text.append(str(text))
+                    all_confidences.append(float(score) if score else 0.9)
+    except Exception as e:
+        logger.warning(f"Error parsing result: {e}")
+
+
+class OCRPipeline:
+    """
+    Runs PaddleOCR off the event loop with pipelined page rendering and batched inference.
+
+    At most ``1 + max_queue`` documents are admitted at once; further calls fail
+    fast with PipelineSaturatedError.
+    """
+
+    def __init__(
+        self,
+        ocr_engine: Any,
+        mode: PipelineMode = "pipelined",
+        batch_size: int = 4,
+        prefetch_pages: int | None = None,
+        max_queue: int = 4,
+        retry_after: int = 10,
+        dpi: int = 200,
+    ):
+        if mode not in ("pipelined", "sequential"):
+            raise ValueError(f"Invalid pipeline mode: {mode}")
+
+        self.ocr_engine = ocr_engine
+        self.mode = mode
+        # Batched inference needs PaddleOCR 3.x predict(); 2.x ocr() takes one image
+        self.supports_batches = hasattr(ocr_engine, "predict")
+        self.batch_size = max(1, batch_size) if self.supports_batches else 1
+        self.prefetch_pages = prefetch_pages or 2 * self.batch_size
+        self.max_queue = max_queue
+        self.retry_after = retry_after
+        self.dpi = dpi
+
+        self._slots = threading.BoundedSemaphore(1 + self.max_queue)
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._completed = 0
+        self._rejected = 0
+        self._pages = 0
+        self._total_seconds = 0.0
+
+        self._inference_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ocr-inference")
+        self._render_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ocr-render")
+
+        logger.info(
+            f"OCR pipeline ready: mode={self.mode}, batch_size={self.batch_size}, "
+            f"prefetch_pages={self.prefetch_pages}, max_queue={self.max_queue}"
+        )
+
+    @classmethod
+    def from_env(cls, ocr_engine: Any) -> "OCRPipeline":
+        """Create a pipeline configured from OCR_* environment variables."""
+        prefetch_pages = os.getenv("OCR_PREFETCH_PAGES")
+        return cls(
+            ocr_engine,
+            mode=os.getenv("OCR_PIPELINE_MODE", "pipelined").lower(),
+            batch_size=int(os.getenv("OCR_BATCH_SIZE", "4")),
+            prefetch_pages=int(prefetch_pages) if prefetch_pages else None,
+            max_queue=int(os.getenv("OCR_MAX_QUEUE", "4")),
+            retry_after=int(os.getenv("OCR_RETRY_AFTER", "10")),
+            dpi=int(os.getenv("OCR_RENDER_DPI", "200")),
+        )
+
+    async def run(self, file_content: bytes, is_pdf: bool) -> tuple[str, float, int]:
+        """
+        Extract text from a document without blocking the event loop.
+
+        Returns:
+            Tuple of (text, average confidence, lines detected)
+
+        Raises:
+            PipelineSaturatedError: If a document is in inference and the queue is full
+        """
+        if not self._slots.acquire(blocking=False):
+            with self._lock:
+                self._rejected += 1
+            raise PipelineSaturatedError(self.retry_after)
+
+        with self._lock:
+            self._in_flight += 1
+
+        try:
+            future = self._inference_pool.submit(self.extract, file_content, is_pdf)
+        except BaseException:
+            self._release(None)
+            raise
+        # Released when the work is done, even if the request is cancelled meanwhile
+        future.add_done_callback(self._release)
+        return await asyncio.wrap_future(future)
+
+    def _release(self, _future: Future | None) -> None:
+        with self._lock:
+            self._in_flight -= 1
+        self._slots.release()
+
+    def extract(self, file_content: bytes, is_pdf: bool) -> tuple[str, float, int]:
+        """Extract text synchronously (in the inference thread, or directly from scripts)."""
+        start_time = time.perf_counter()
+        all_text: list[str] = []
+        all_confidences: list[float] = []
+
+        if is_pdf:
+            if self.mode == "pipelined":
+                pages = self._ocr_pdf_pipelined(file_content, all_text, all_confidences)
+            else:
+                pages = self._ocr_pdf_sequential(file_content, all_text, all_confidences)
+        else:
+            from PIL import Image
+
+            image = Image.open(io.BytesIO(file_content))
+            if image.mode != "RGB":
+                image = image.convert("RGB")
+            self._infer([np.asarray(image)], all_text, all_confidences)
+            pages = 1
+
+        elapsed = time.perf_counter() - start_time
+        with self._lock:
+            self._completed += 1
+            self._pages += pages
+            self._total_seconds += elapsed
+
+        full_text = "\n".join(all_text)
+        avg_confidence = sum(all_confidences) / len(all_confidences) if all_confidences else 0.0
+        return full_text, avg_confidence, len(all_text)
+
+    def _infer(self, images: list[np.ndarray], all_text: list, all_confidences: list) -> None:
+        if self.supports_batches:
+            # One result per input image, in input order
+            parse_ocr_result(self.ocr_engine.predict(images), all_text, all_confidences)
+        else:
+            for image in images:
+                parse_ocr_result(self.ocr_engine.ocr(image), all_text, all_confidences)
+
+    def _ocr_pdf_sequential(
+        self, file_content: bytes, all_text: list, all_confidences: list
+    ) -> int:
+        pages = 0
+        for page in iter_rendered_pages(file_content, self.dpi):
+            self._infer([page.image], all_text, all_confidences)
+            pages += 1
+            logger.info(f"Page {page.page_num + 1} done")
+        return pages
+
+    def _ocr_pdf_pipelined(self, file_content: bytes, all_text: list, all_confidences: list) -> int:
+        rendered: queue.Queue = queue.Queue(maxsize=self.prefetch_pages)
+        cancelled = threading.Event()
+        producer = self._render_pool.submit(self._render, file_content, rendered, cancelled)
+
+        pages = 0
+        try:
+            finished = False
+            while not finished:
+                # Wait for one page, then take whatever else is already rendered
+                batch = []
+                item = rendered.get()
+                while True:
+                    if item is _DONE:
+                        finished = True
+                        break
+                    if isinstance(item, Exception):
+                        raise item
+                    batch.append(item)
+                    if len(batch) >= self.batch_size:
+                        break
+                    try:
+                        item = rendered.get_nowait()
+                    except queue.Empty:
+                        break
+
+                if batch:
+                    self._infer([page.image for page in batch], all_text, all_confidences)
+                    pages += len(batch)
+                    logger.info(
+                        f"Pages {batch[0].page_num + 1}-{batch[-1].page_num + 1} done "
+                        f"(batch of {len(batch)})"
+                    )
+        finally:
+            cancelled.set()
+            producer.result()
+        return pages
+
+    def _render(
+        self, file_content: bytes, rendered: queue.Queue, cancelled: threading.Event
+    ) -> None:
+        """Producer: render pages into the prefetch queue (blocks while it is full)."""
+        try:
+            for page in iter_rendered_pages(file_content, self.dpi, cancelled):
+                if not self._put(rendered, page, cancelled):
+                    return
+        except Exception as e:
+            self._put(rendered, e, cancelled)
+        self._put(rendered, _DONE, cancelled)
+
+    @staticmethod
+    def _put(rendered: queue.Queue, item: Any, cancelled: threading.Event) -> bool:
+        """Put an item, giving up once the consumer has stopped."""
+        while not cancelled.is_set():
+            try:
+                rendered.put(item, timeout=_PUT_POLL_SECONDS)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def stats(self) -> dict[str, Any]:
+        """Return pipeline configuration and counters (for /health)."""
+        with self._lock:
+            return {
+                "mode": self.mode,
+                "batch_size": self.batch_size,
+                "max_queue": self.max_queue,
+                "in_flight": self._in_flight,
+                "queued": max(0, self._in_flight - 1),
+                "completed": self._completed,
+                "rejected": self._rejected,
+                "pages": self._pages,
+                "pages_per_second": round(self._pages / self._total_seconds, 2)
+                if self._total_seconds
+                else 0.0,
+            }
+
+    def shutdown(self) -> None:
+        """Stop the pipeline, waiting for the running document to finish."""
+        self._inference_pool.shutdown(wait=True, cancel_futures=True)
+        self._render_pool.shutdown(wait=True, cancel_futures=True)
+        logger.info("OCR pipeline shut down")
@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""OCR Throughput Benchmark.
+
+Measures pages/second of the OCR pipeline on CPU: the sequential mode (render a
+page, OCR it, render the next page) against the pipelined mode (rendering in a
+background thread, batched inference) for several batch sizes. Uses the same
+PaddleOCR options as the service.
+
+Without --pdf, a synthetic multi-page German medical letter is generated.
+
+Usage:
+    python scripts/benchmark_ocr.py
+    python scripts/benchmark_ocr.py --pdf sample.pdf --batch-sizes 1,2,4,8
+    python scripts/benchmark_ocr.py --pages 20 --output ocr_benchmark.json
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.pipeline import ENGINE_OPTIONS, OCRPipeline
+
+SAMPLE_LINES = [
+    "Universitätsklinikum – Medizinische Klinik",
+    "Arztbrief",
+    "Diagnosen: Diabetes mellitus Typ 2 (E11.9), Arterielle Hypertonie (I10)",
+    "Laborwerte: HbA1c 7,2 %, Kreatinin 1,1 mg/dl, Kalium 4,2 mmol/l",
+    "Therapie: Metformin 1000 mg 1-0-1, Ramipril 5 mg 1-0-0",
+    "Procedere: Kontrolle der Blutzuckerwerte in vier Wochen beim Hausarzt.",
+]
+
+
+def build_sample_pdf(pages: int) -> bytes:
+    """Generate a text-only PDF with the sample letter on every page."""
+    import fitz  # PyMuPDF
+
+    document = fitz.open()
+    for page_num in range(pages):
+        page = document.new_page()
+        y = 72
+        for _ in range(4):
+            for line in SAMPLE_LINES:
+                page.insert_text((72, y), line, fontsize=11)
+                y += 16
+            y += 12
+        page.insert_text((72, 800), f"Seite {page_num + 1} von {pages}", fontsize=9)
+    content = document.tobytes()
+    document.close()
+    return content
+
+
+def time_pipeline(pipeline: OCRPipeline, content: bytes, iterations: int) -> dict:
+    """Extract the document repeatedly and return timing statistics."""
+    timings = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        text, _, _ = pipeline.extract(content, is_pdf=True)
+        timings.append(time.perf_counter() - start)
+    return {"median_s": round(statistics.median(timings), 3), "chars": len(text)}
+
+
+def run_benchmark(content: bytes, page_count: int, batch_sizes: list[int], iterations: int) -> dict:
+    from paddleocr import PaddleOCR
+
+    engine = PaddleOCR(device="cpu", **ENGINE_OPTIONS)
+    configurations = [("sequential", 1)] + [("pipelined", size) for size in batch_sizes]
+    results = {
+        "pages": page_count,
+        "iterations": iterations,
+        "cpu_count": os.cpu_count(),
+        "batched_inference": hasattr(engine, "predict"),
+        "runs": [],
+    }
+
+    # Warm-up: the first inference initializes the predictors
+    OCRPipeline(engine, mode="sequential").extract(content, is_pdf=True)
+
+    print(f"\n{'Mode':<12} {'Batch':>6} {'Seconds':>9} {'Pages/s':>9} {'Speedup':>9} {'Chars':>8}")
+    print("-" * 58)
+
+    baseline = None
+    for mode, batch_size in configurations:
+        pipeline = OCRPipeline(engine, mode=mode, batch_size=batch_size)
+        try:
+            timing = time_pipeline(pipeline, content, iterations)
+        finally:
+            pipeline.shutdown()
+
+        pages_per_second = page_count / timing["median_s"] if timing["median_s"] else 0.0
+        baseline = baseline or pages_per_second
+        speedup = pages_per_second / baseline if baseline else 0.0
+        results["runs"].append(
+            {
+                "mode": mode,
+                "batch_size": pipeline.batch_size,
+                **timing,
+                "pages_per_second": round(pages_per_second, 2),
+                "speedup": round(speedup, 2),
+            }
+        )
+        print(
+            f"{mode:<12} {pipeline.batch_size:>6} {timing['median_s']:>9.2f} "
+            f"{pages_per_second:>9.2f} {speedup:>8.2f}x {timing['chars']:>8}"
+        )
+
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="PaddleOCR pipeline throughput benchmark (CPU)")
+    parser.add_argument("--pdf", type=str, default=None, help="PDF to OCR (default: synthetic)")
+    parser.add_argument(
+        "--pages", type=int, default=10, help="Pages of the synthetic PDF (default: 10)"
+    )
+    parser.add_argument(
+        "--batch-sizes",
+        type=str,
+        default="1,2,4",
+        help="Comma-separated batch sizes for the pipelined mode (default: 1,2,4)",
+    )
+    parser.add_argument(
+        "--iterations",
+        "-i",
+        type=int,
+        default=3,
+        help="Number of iterations per configuration (default: 3)",
+    )
+    parser.add_argument(
+        "--output", "-o", type=str, default=None, help="Output JSON file path (optional)"
+    )
+    args = parser.parse_args()
+
+    if args.pdf:
+        import fitz  # PyMuPDF
+
+        content = Path(args.pdf).read_bytes()
+        with fitz.open(stream=content, filetype="pdf") as document:
+            page_count = len(document)
+    else:
+        content = build_sample_pdf(args.pages)
+        page_count = args.pages
+
+    batch_sizes = [int(size) for size in args.batch_sizes.split(",") if size.strip()]
+    results = run_benchmark(content, page_count, batch_sizes, args.iterations)
+
+    if args.output:
+        output_path = Path(args.output)
+        with open(output_path, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"\nResults saved to: {output_path}")
+
+    sys.exit(0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,205 @@
+"""
+Worker pool for CPU-bound PII removal.
+
+PIIFilter.remove_pii() is synchronous and CPU-heavy (regex + SpaCy + Presidio).
+Running it directly inside an async endpoint blocks the event loop, so /health
+and every other request on the uvicorn worker stall behind one long document.
+PIIExecutor moves the work to a thread or process pool with a bounded queue.
+
+Configuration (environment):
+    PII_EXECUTOR_MODE        - "thread" (default) or "process"
+    PII_EXECUTOR_WORKERS     - Pool size (default: 2 threads / CPU count processes)
+    PII_EXECUTOR_MAX_QUEUE   - Requests allowed to wait for a free worker (default: 16)
+    PII_EXECUTOR_RETRY_AFTER - Retry-After seconds sent with 503 when saturated (default: 5)
+
+Process mode forks the workers from the fully initialized service process, so the
+loaded SpaCy/Presidio models are shared copy-on-write instead of loaded per worker.
+"""
+
+import asyncio
+import gc
+import logging
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Literal
+
+from app.pii_filter import PIIFilter
+
+logger = logging.getLogger(__name__)
+
+ExecutorMode = Literal["thread", "process"]
+
+# Filter used by pool workers. Set before the pool is created so forked
+# processes inherit the already-loaded models.
+_worker_filter: PIIFilter | None = None
+
+
+class ExecutorSaturatedError(Exception):
+    """Raised when all workers are busy and the wait queue is full."""
+
+    def __init__(self, retry_after: int):
+        self.retry_after = retry_after
+        super().__init__(f"PII executor saturated, retry after {retry_after}s")
+
+
+def _timed_call(method: str, kwargs: dict) -> tuple[Any, float, float]:
+    """
+    Run a PIIFilter method inside a pool worker.
+
+    Returns:
+        Tuple of (result, started_at, compute_ms). started_at uses time.monotonic(),
+        which is system-wide on Linux and therefore comparable across forked processes.
+    """
+    started_at = time.monotonic()
+    result = getattr(_worker_filter, method)(**kwargs)
+    compute_ms = (time.monotonic() - started_at) * 1000
+    return result, started_at, compute_ms
+
+
+def _warmup() -> int:
+    """No-op task used to start pool workers eagerly."""
+    return os.getpid()
+
+
+class PIIExecutor:
+    """
+    Bounded thread/process pool for PIIFilter calls.
+
+    At most ``workers + max_queue`` calls are admitted at once; further calls fail
+    fast with ExecutorSaturatedError so the endpoint can answer 503 + Retry-After
+    instead of piling up unbounded work.
+    """
+
+    def __init__(
+        self,
+        pii_filter: PIIFilter,
+        mode: ExecutorMode = "thread",
+        workers: int | None = None,
+        max_queue: int = 16,
+        retry_after: int = 5,
+    ):
+        global _worker_filter
+
+        if mode not in ("thread", "process"):
+            raise ValueError(f"Invalid executor mode: {mode}")
+
+        self.mode = mode
+        if workers is None:
+            workers = (os.cpu_count() or 1) if mode == "process" else 2
+        self.workers = workers
+        self.max_queue = max_queue
+        self.retry_after = retry_after
+
+        self._slots = threading.BoundedSemaphore(self.workers + self.max_queue)
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._completed = 0
+        self._rejected = 0
+        self._total_queue_wait_ms = 0.0
+        self._total_compute_ms = 0.0
+
+        _worker_filter = pii_filter
+        self._pool = self._create_pool()
+
+        logger.info(
+            f"PII executor ready: mode={self.mode}, workers={self.workers}, "
+            f"max_queue={self.max_queue}"
+        )
+
+    @classmethod
+    def from_env(cls, pii_filter: PIIFilter) -> "PIIExecutor":
+        """Create an executor configured from PII_EXECUTOR_* environment variables."""
+        workers = os.getenv("PII_EXECUTOR_WORKERS")
+        return cls(
+            pii_filter,
+            mode=os.getenv("PII_EXECUTOR_MODE", "thread").lower(),
+            workers=int(workers) if workers else None,
+            max_queue=int(os.getenv("PII_EXECUTOR_MAX_QUEUE", "16")),
+            retry_after=int(os.getenv("PII_EXECUTOR_RETRY_AFTER", "5")),
+        )
+
+    def _create_pool(self) -> Executor:
+        if self.mode == "thread":
+            return ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="pii-worker")
+
+        # Move the loaded models out of the GC's view so collections in the
+        # children don't touch (and thereby copy) the shared pages.
+        gc.collect()
+        gc.freeze()
+
+        pool = ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context("fork"),
+        )
+        # With the fork context all workers are started on first submit; do it
+        # now so no request pays the fork cost.
+        pool.submit(_warmup).result()
+        return pool
+
+    async def run(self, method: str, **kwargs) -> tuple[Any, dict[str, float]]:
+        """
+        Run ``PIIFilter.<method>(**kwargs)`` in the pool without blocking the event loop.
+
+        Returns:
+            Tuple of (result, timing) where timing has queue_wait_ms and compute_ms
+
+        Raises:
+            ExecutorSaturatedError: If all workers are busy and the queue is full
+        """
+        if not self._slots.acquire(blocking=False):
+            with self._lock:
+                self._rejected += 1
+            raise ExecutorSaturatedError(self.retry_after)
+
+        with self._lock:
+            self._in_flight += 1
+
+        try:
+            submitted_at = time.monotonic()
+            future = asyncio.get_running_loop().run_in_executor(
+                self._pool, _timed_call, method, kwargs
+            )
+            result, started_at, compute_ms = await future
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+            self._slots.release()
+
+        queue_wait_ms = max(0.0, (started_at - submitted_at) * 1000)
+        with self._lock:
+            self._completed += 1
+            self._total_queue_wait_ms += queue_wait_ms
+            self._total_compute_ms += compute_ms
+
+        return result, {
+            "queue_wait_ms": round(queue_wait_ms, 2),
+            "compute_ms": round(compute_ms, 2),
+        }
+
+    def stats(self) -> dict[str, Any]:
+        """Return pool configuration and counters (for /health)."""
+        with self._lock:
+            completed = self._completed
+            return {
+                "mode": self.mode,
+                "workers": self.workers,
+                "max_queue": self.max_queue,
+                "in_flight": self._in_flight,
+                "queued": max(0, self._in_flight - self.workers),
+                "completed": completed,
+                "rejected": self._rejected,
+                "avg_queue_wait_ms": round(self._total_queue_wait_ms / completed, 2)
+                if completed
+                else 0.0,
+                "avg_compute_ms": round(self._total_compute_ms / completed, 2)
+                if completed
+                else 0.0,
+            }
+
+    def shutdown(self) -> None:
+        """Stop the pool, waiting for running calls to finish."""
+        self._pool.shutdown(wait=True, cancel_futures=True)
+        logger.info("PII executor shut down")
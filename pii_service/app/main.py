@@ -8,6 +8,10 @@ Endpoints:
     GET  /health     - Health check with model status
     POST /remove-pii - Remove PII from text (requires language parameter)
     POST /remove-pii/batch - Batch PII removal
+    PUT  /term-sets/{term_hash} - Register custom protection terms (see app.term_sets)
+
+PII removal runs in a bounded worker pool (see app.executor) so the event loop
+stays responsive; a saturated pool answers 503 with Retry-After.
 """
 
 from contextlib import asynccontextmanager
@@ -21,7 +25,9 @@ from fastapi import FastAPI, Depends, HTTPException
 from pydantic import BaseModel, Field
 
 from app.auth import verify_api_key
+from app.executor import ExecutorSaturatedError, PIIExecutor
 from app.pii_filter import PIIFilter
+from app.term_sets import TermSetHashMismatchError, TermSetRegistry
 
 # Configure logging
 logging.basicConfig(
@@ -33,6 +39,12 @@ logger = logging.getLogger(__name__)
 # Global filter instance (loaded once at startup)
 pii_filter: PIIFilter | None = None
 
+# Worker pool running the filter off the event loop (created after models load)
+pii_executor: PIIExecutor | None = None
+
+# Custom protection term sets registered by clients, referenced by hash
+term_sets = TermSetRegistry.from_env()
+
 
 # =============================================================================
 # Request/Response Models
@@ -53,12 +65,18 @@ class PIIRemovalRequest(BaseModel):
         default=None,
         description="Additional terms to protect from removal (synced from database)"
     )
+    custom_terms_hash: str | None = Field(
+        default=None,
+        description="Hash of a term set registered via PUT /term-sets/{term_hash}"
+    )
 
 
 class PIIRemovalResponse(BaseModel):
     """Response model for PII removal."""
     cleaned_text: str
     processing_time_ms: float
+    queue_wait_ms: float = 0.0
+    compute_ms: float = 0.0
     language_used: str
     metadata: dict | None = None
 
@@ -72,6 +90,10 @@ class PIIBatchRequest(BaseModel):
         default=None,
         description="Additional terms to protect from removal (synced from database)"
     )
+    custom_terms_hash: str | None = Field(
+        default=None,
+        description="Hash of a term set registered via PUT /term-sets/{term_hash}"
+    )
 
 
 class PIIBatchResponse(BaseModel):
@@ -79,9 +101,22 @@ class PIIBatchResponse(BaseModel):
     results: list[dict]
     total_documents: int
     processing_time_ms: float
+    queue_wait_ms: float = 0.0
+    compute_ms: float = 0.0
     language_used: str
 
 
+class TermSetRequest(BaseModel):
+    """Request model for registering a custom protection term set."""
+    terms: list[str] = Field(..., description="Terms to protect from removal")
+
+
+class TermSetResponse(BaseModel):
+    """Response model for a registered term set."""
+    term_hash: str
+    term_count: int
+
+
 class HealthResponse(BaseModel):
     """Health check response."""
     status: str
@@ -95,6 +130,8 @@ class HealthResponse(BaseModel):
     medialpy_version: str | None = None
     medical_verifier_active: bool = False
     memory_usage_mb: float
+    executor: dict | None = None
+    term_sets: dict | None = None
 
 
 # =============================================================================
@@ -104,7 +141,7 @@ class HealthResponse(BaseModel):
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Load SpaCy models at startup."""
-    global pii_filter
+    global pii_filter, pii_executor
 
     logger.info("=" * 60)
     logger.info("SpaCy PII Service Starting...")
@@ -145,9 +182,20 @@ async def lifespan(app: FastAPI):
         logger.error(f"Failed to initialize PII filter: {e}")
         pii_filter = None
 
+    if pii_filter is not None:
+        try:
+            # Created after the models are loaded so process workers share them
+            pii_executor = PIIExecutor.from_env(pii_filter)
+        except Exception as e:
+            logger.error(f"Failed to start PII executor: {e}")
+            pii_filter = None
+
     yield
 
     logger.info("Shutting down PII service...")
+    if pii_executor is not None:
+        pii_executor.shutdown()
+        pii_executor = None
 
 
 # =============================================================================
@@ -245,6 +293,7 @@ async def root():
             "health": "/health",
             "remove_pii": "/remove-pii",
             "batch": "/remove-pii/batch",
+            "term_sets": "/term-sets/{term_hash}",
             "docs": "/docs"
         }
     }
@@ -298,10 +347,54 @@ async def health():
         medialpy_available=medialpy_available,
         medialpy_version=medialpy_version,
         medical_verifier_active=hasattr(pii_filter, 'medical_verifier'),
-        memory_usage_mb=memory_mb
+        memory_usage_mb=memory_mb,
+        executor=pii_executor.stats() if pii_executor else None,
+        term_sets=term_sets.stats()
     )
 
 
+async def _run_filter(method: str, **kwargs):
+    """Run a PIIFilter method in the worker pool, mapping saturation to 503."""
+    try:
+        return await pii_executor.run(method, **kwargs)
+    except ExecutorSaturatedError as e:
+        logger.warning(f"Rejecting {method}: {e}")
+        raise HTTPException(
+            status_code=503,
+            detail="PII service busy. Retry later.",
+            headers={"Retry-After": str(e.retry_after)}
+        ) from e
+
+
+def _resolve_term_set(term_hash: str | None) -> frozenset[str] | None:
+    """Look up a registered term set; 409 tells the client to register it again."""
+    if not term_hash:
+        return None
+    term_set = term_sets.get(term_hash)
+    if term_set is None:
+        raise HTTPException(
+            status_code=409,
+            detail="Unknown term set. Register it with PUT /term-sets/{term_hash}."
+        )
+    return term_set.terms
+
+
+@app.put("/term-sets/{term_hash}", response_model=TermSetResponse, dependencies=[Depends(verify_api_key)])
+async def register_term_set(term_hash: str, request: TermSetRequest):
+    """
+    Register custom protection terms under their content hash.
+
+    Idempotent. Afterwards, requests reference the terms with custom_terms_hash
+    instead of sending them.
+    """
+    try:
+        term_set = term_sets.register(term_hash, request.terms)
+    except TermSetHashMismatchError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+
+    return TermSetResponse(term_hash=term_set.term_hash, term_count=len(term_set.terms))
+
+
 @app.post("/remove-pii", response_model=PIIRemovalResponse, dependencies=[Depends(verify_api_key)])
 async def remove_pii(request: PIIRemovalRequest):
     """
@@ -310,7 +403,7 @@ async def remove_pii(request: PIIRemovalRequest):
     Removes personally identifiable information while preserving medical content.
     Supports German (de) and English (en) languages.
     """
-    if pii_filter is None:
+    if pii_filter is None or pii_executor is None:
         raise HTTPException(
             status_code=503,
             detail="PII filter not initialized. Check /health for status."
@@ -328,14 +421,20 @@ async def remove_pii(request: PIIRemovalRequest):
             detail="English language model not loaded. Check /health for status."
         )
 
+    custom_terms = _resolve_term_set(request.custom_terms_hash)
+
     start = time.perf_counter()
 
     try:
-        cleaned_text, metadata = pii_filter.remove_pii(
+        (cleaned_text, metadata), timing = await _run_filter(
+            "remove_pii",
             text=request.text,
             language=request.language,
-            custom_protection_terms=request.custom_protection_terms
+            custom_protection_terms=request.custom_protection_terms,
+            custom_terms=custom_terms
         )
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"PII removal failed: {e}")
         raise HTTPException(status_code=500, detail=f"PII removal failed: {str(e)}")
@@ -345,6 +444,8 @@ async def remove_pii(request: PIIRemovalRequest):
     return PIIRemovalResponse(
         cleaned_text=cleaned_text,
         processing_time_ms=round(processing_time_ms, 2),
+        queue_wait_ms=timing["queue_wait_ms"],
+        compute_ms=timing["compute_ms"],
         language_used=request.language,
         metadata=metadata if request.include_metadata else None
     )
@@ -357,21 +458,27 @@ async def remove_pii_batch(request: PIIBatchRequest):
 
     More efficient than calling /remove-pii multiple times.
     """
-    if pii_filter is None:
+    if pii_filter is None or pii_executor is None:
         raise HTTPException(
             status_code=503,
             detail="PII filter not initialized. Check /health for status."
         )
 
+    custom_terms = _resolve_term_set(request.custom_terms_hash)
+
     start = time.perf_counter()
 
     try:
-        results = pii_filter.remove_pii_batch(
+        results, timing = await _run_filter(
+            "remove_pii_batch",
             texts=request.texts,
             language=request.language,
             batch_size=request.batch_size,
-            custom_protection_terms=request.custom_protection_terms
+            custom_protection_terms=request.custom_protection_terms,
+            custom_terms=custom_terms
         )
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Batch PII removal failed: {e}")
         raise HTTPException(status_code=500, detail=f"Batch PII removal failed: {str(e)}")
@@ -382,6 +489,8 @@ async def remove_pii_batch(request: PIIBatchRequest):
         results=[{"cleaned_text": t, "metadata": m} for t, m in results],
         total_documents=len(request.texts),
         processing_time_ms=round(processing_time_ms, 2),
+        queue_wait_ms=timing["queue_wait_ms"],
+        compute_ms=timing["compute_ms"],
         language_used=request.language
     )
 
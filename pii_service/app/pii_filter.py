@@ -54,6 +54,9 @@ class PIIFilter:
     # Volume path for persisted models (Railway volume mount)
     MODELS_DIR = os.environ.get("SPACY_DATA_DIR", "/data/models")
 
+    # Worker processes for SpaCy nlp.pipe() in batch mode (1 = in-process)
+    NER_N_PROCESS = int(os.environ.get("PII_NER_N_PROCESS", "1"))
+
     # Model versions for finding versioned subdirectories
     MODEL_VERSIONS = {
         "de_core_news_lg": "3.8.0",
@@ -645,6 +648,10 @@ class PIIFilter:
             ),
         }
 
+        # Precompiled pass plans for _remove_pii_with_patterns
+        self.pattern_passes_de = self._build_pattern_passes(self.patterns_de)
+        self.pattern_passes_en = self._build_pattern_passes(self.patterns_en)
+
     def _init_medical_terms(self):
         """Initialize protected medical terms (not to be removed)."""
         self.medical_terms = {
@@ -2501,132 +2508,155 @@ class PIIFilter:
 
         return False
 
+    # Mapping of pattern names to context-aware placeholders
+    PLACEHOLDER_MAP = {
+        # Name patterns
+        "doctor_title_name": "[DOCTOR_NAME]",
+        "honorific_name": "[NAME]",
+        "name_comma_format": "[PATIENT_NAME]",
+        "labeled_name": "[PATIENT_NAME]",
+        "doctor_initial_name": "[DOCTOR_NAME]",
+        "name_in_header_block": "[NAME]",  # Names in patient header after PLZ/City
+
+        # Date patterns
+        "birthdate": "[BIRTHDATE]",
+        "date_standalone": "[DATE]",
+        "date_german_month": "[DATE]",
+        "date_english_month": "[DATE]",
+
+        # Reference patterns
+        "case_reference": "[REFERENCE_ID]",
+        "document_reference": "[REFERENCE_ID]",
+        "patient_id": "[PATIENT_ID]",
+
+        # Insurance patterns
+        "insurance": "[INSURANCE_ID]",
+        "insurance_company": "[INSURANCE_ID]",
+        "insurance_standalone": "[INSURANCE_ID]",
+        "insurance_status": "",  # Remove entirely (empty placeholder)
+        "case_number": "[CASE_ID]",
+
+        # Contact patterns
+        "phone": "[PHONE]",
+        "phone_spaced": "[PHONE]",
+        "phone_extension": "",  # Remove entirely (cleanup after main phone)
+        "phone_orphan": "[PHONE]",  # Replace orphaned extensions with single placeholder
+        "fax": "[FAX]",
+        "email": "[EMAIL]",
+        "email_full": "[EMAIL]",
+        "email_split": "[EMAIL]",
+        "email_local_part": "[EMAIL]",  # Replace full email (name + domain placeholder)
+        "named_email_domain": "[EMAIL_DOMAIN]",
+
+        # Address patterns
+        "address": "[ADDRESS]",
+        "address_no_suffix": "[ADDRESS]",  # Street addresses without common suffix
+        "plz_city": "[PLZ_CITY]",
+        "zipcode": "[ZIPCODE]",
+
+        # ID patterns
+        "tax_id": "[TAX_ID]",
+        "social_security": "[SOCIAL_SECURITY]",
+        "ssn": "[SSN]",
+
+        # Company/organization patterns
+        "company_registration": "[COMPANY_ID]",
+        "bank_location": "[BANK_INFO]",
+
+        # Letterhead patterns
+        "hospital_letterhead": "[HOSPITAL_INFO]",
+        "hospital_with_city": "[ORGANIZATION]",  # Hospital names with city
+    }
+
+    # Patterns processed first, in this order (names before generic patterns)
+    # This ensures titles like "Dr. med." are processed before generic patterns
+    PATTERN_PRIORITY_ORDER = (
+        "doctor_title_name",  # Must be first to catch "Dr. med. Schmidt"
+        "honorific_name",     # Then "Herr Müller", "Frau Schmidt"
+        "name_comma_format",  # Then "Müller, Anna"
+        "labeled_name",       # Then "Patient: Schmidt"
+        "name_in_header_block",  # Names after PLZ/City in header blocks
+    )
+
+    # Patterns that need context-aware processing (not simple substitution)
+    CONTEXT_AWARE_DATE_PATTERNS = frozenset(
+        {"date_standalone", "date_german_month", "date_english_month"}
+    )
+
     def _get_placeholder(self, pii_type: str) -> str:
         """Get the appropriate placeholder for each PII type."""
-        # Mapping of pattern names to context-aware placeholders
-        placeholder_map = {
-            # Name patterns
-            "doctor_title_name": "[DOCTOR_NAME]",
-            "honorific_name": "[NAME]",
-            "name_comma_format": "[PATIENT_NAME]",
-            "labeled_name": "[PATIENT_NAME]",
-            "doctor_initial_name": "[DOCTOR_NAME]",
-            "name_in_header_block": "[NAME]",  # Names in patient header after PLZ/City
-
-            # Date patterns
-            "birthdate": "[BIRTHDATE]",
-            "date_standalone": "[DATE]",
-            "date_german_month": "[DATE]",
-            "date_english_month": "[DATE]",
-
-            # Reference patterns
-            "case_reference": "[REFERENCE_ID]",
-            "document_reference": "[REFERENCE_ID]",
-            "patient_id": "[PATIENT_ID]",
-
-            # Insurance patterns
-            "insurance": "[INSURANCE_ID]",
-            "insurance_company": "[INSURANCE_ID]",
-            "insurance_standalone": "[INSURANCE_ID]",
-            "insurance_status": "",  # Remove entirely (empty placeholder)
-            "case_number": "[CASE_ID]",
-
-            # Contact patterns
-            "phone": "[PHONE]",
-            "phone_spaced": "[PHONE]",
-            "phone_extension": "",  # Remove entirely (cleanup after main phone)
-            "phone_orphan": "[PHONE]",  # Replace orphaned extensions with single placeholder
-            "fax": "[FAX]",
-            "email": "[EMAIL]",
-            "email_full": "[EMAIL]",
-            "email_split": "[EMAIL]",
-            "email_local_part": "[EMAIL]",  # Replace full email (name + domain placeholder)
-            "named_email_domain": "[EMAIL_DOMAIN]",
-
-            # Address patterns
-            "address": "[ADDRESS]",
-            "address_no_suffix": "[ADDRESS]",  # Street addresses without common suffix
-            "plz_city": "[PLZ_CITY]",
-            "zipcode": "[ZIPCODE]",
-
-            # ID patterns
-            "tax_id": "[TAX_ID]",
-            "social_security": "[SOCIAL_SECURITY]",
-            "ssn": "[SSN]",
-
-            # Company/organization patterns
-            "company_registration": "[COMPANY_ID]",
-            "bank_location": "[BANK_INFO]",
-
-            # Letterhead patterns
-            "hospital_letterhead": "[HOSPITAL_INFO]",
-            "hospital_with_city": "[ORGANIZATION]",  # Hospital names with city
-        }
-        return placeholder_map.get(pii_type, f"[{pii_type.upper()}]")
+        return self.PLACEHOLDER_MAP.get(pii_type, f"[{pii_type.upper()}]")
+
+    def _build_pattern_passes(self, patterns: dict) -> tuple:
+        """
+        Build the ordered pass plan for _remove_pii_with_patterns.
+
+        Priority patterns come first, the rest follow in definition order. Passes
+        stay sequential because later patterns rely on earlier placeholders
+        (e.g. phone_extension/phone_orphan clean up after phone).
+
+        Returns:
+            Tuple of (pii_type, pattern, placeholder, is_context_aware_date) entries
+        """
+        ordered = [t for t in self.PATTERN_PRIORITY_ORDER if t in patterns]
+        ordered += [t for t in patterns if t not in self.PATTERN_PRIORITY_ORDER]
+        return tuple(
+            (
+                pii_type,
+                patterns[pii_type],
+                self._get_placeholder(pii_type),
+                pii_type in self.CONTEXT_AWARE_DATE_PATTERNS,
+            )
+            for pii_type in ordered
+        )
+
+    def _replace_dates(self, pattern: re.Pattern, placeholder: str, text: str) -> tuple[str, int, int]:
+        """
+        Replace non-medical dates in one scan.
+
+        Context is judged on the text as it was before this pass; only the
+        characters before a match are inspected, so this matches replacing
+        dates one by one from the end of the text.
+
+        Returns:
+            Tuple of (text, dates_removed, dates_preserved)
+        """
+        preserved = 0
+
+        def replace(match: re.Match) -> str:
+            nonlocal preserved
+            # Check if date is in medical context (should be preserved)
+            if self._is_medical_context_date(text, match.start(), match.end()):
+                preserved += 1
+                logger.debug(f"Preserved medical context date: {match.group()}")
+                return match.group()
+            return placeholder
+
+        new_text, matched = pattern.subn(replace, text)
+        return new_text, matched - preserved, preserved
 
     def _remove_pii_with_patterns(self, text: str, language: str) -> tuple[str, dict]:
-        """Remove PII using regex patterns with context-aware date handling."""
-        patterns = self.patterns_de if language == "de" else self.patterns_en
+        """
+        Remove PII using regex patterns with context-aware date handling.
+
+        Each pattern is one pass with a single scan and a single string rebuild
+        (subn), in the precompiled order from _build_pattern_passes.
+        """
+        passes = self.pattern_passes_de if language == "de" else self.pattern_passes_en
         removed_count = 0
         pii_types = []
         dates_preserved = 0
 
-        # Process patterns in a specific order: names first, then others
-        # This ensures titles like "Dr. med." are processed before generic patterns
-        priority_order = [
-            "doctor_title_name",  # Must be first to catch "Dr. med. Schmidt"
-            "honorific_name",     # Then "Herr Müller", "Frau Schmidt"
-            "name_comma_format",  # Then "Müller, Anna"
-            "labeled_name",       # Then "Patient: Schmidt"
-            "name_in_header_block",  # Names after PLZ/City in header blocks
-        ]
-
-        # Patterns that need context-aware processing (not simple substitution)
-        context_aware_patterns = ["date_standalone", "date_german_month", "date_english_month"]
-
-        # Process priority patterns first
-        for pii_type in priority_order:
-            if pii_type in patterns:
-                pattern = patterns[pii_type]
-                matches = pattern.findall(text)
-                if matches:
-                    removed_count += len(matches)
-                    pii_types.append(pii_type)
-                    placeholder = self._get_placeholder(pii_type)
-                    text = pattern.sub(placeholder, text)
-
-        # Process remaining patterns
-        for pii_type, pattern in patterns.items():
-            if pii_type in priority_order:
-                continue  # Already processed
-
-            # Handle date patterns with context awareness
-            if pii_type in context_aware_patterns:
-                # Process dates individually with context checking
-                matches = list(pattern.finditer(text))
-                if matches:
-                    # Process in reverse order to maintain positions
-                    for match in reversed(matches):
-                        # Check if date is in medical context (should be preserved)
-                        if self._is_medical_context_date(text, match.start(), match.end()):
-                            dates_preserved += 1
-                            logger.debug(f"Preserved medical context date: {match.group()}")
-                            continue  # Don't remove this date
-
-                        # Remove non-medical dates
-                        placeholder = self._get_placeholder(pii_type)
-                        text = text[:match.start()] + placeholder + text[match.end():]
-                        removed_count += 1
-                        if pii_type not in pii_types:
-                            pii_types.append(pii_type)
+        for pii_type, pattern, placeholder, is_date in passes:
+            if is_date:
+                text, count, preserved = self._replace_dates(pattern, placeholder, text)
+                dates_preserved += preserved
             else:
-                # Standard pattern substitution
-                matches = pattern.findall(text)
-                if matches:
-                    removed_count += len(matches)
-                    pii_types.append(pii_type)
-                    placeholder = self._get_placeholder(pii_type)
-                    text = pattern.sub(placeholder, text)
+                text, count = pattern.subn(placeholder, text)
+
+            if count:
+                removed_count += count
+                pii_types.append(pii_type)
 
         return text, {
             "pattern_removals": removed_count,
@@ -2635,15 +2665,22 @@ class PIIFilter:
         }
 
     def _remove_names_with_ner(
-        self, text: str, language: str, custom_terms: set | None = None
+        self, text: str, language: str, custom_terms: set | None = None, doc=None
     ) -> tuple[str, dict]:
-        """Remove PII entities using SpaCy NER (names, locations, orgs, dates, times)."""
+        """
+        Remove PII entities using SpaCy NER (names, locations, orgs, dates, times).
+
+        Args:
+            doc: Pre-parsed SpaCy Doc for ``text`` (from nlp.pipe() in batch mode).
+                 Parsed here if not given.
+        """
         nlp = self.nlp_de if language == "de" else self.nlp_en
 
         if nlp is None:
             return text, {"ner_removals": 0, "ner_available": False}
 
-        doc = nlp(text)
+        if doc is None:
+            doc = nlp(text)
         entities_removed = 0
         locations_removed = 0
         orgs_removed = 0
@@ -2886,11 +2923,60 @@ class PIIFilter:
             "ner_available": True
         }
 
+    # Presidio entity types that match our registered recognizers
+    # Only request entities we have recognizers for (avoids warnings)
+    PRESIDIO_ENTITIES = [
+        "PERSON",           # Names (SpacyRecognizer)
+        "LOCATION",         # Locations (SpacyRecognizer)
+        "IBAN_CODE",        # IBAN (IbanRecognizer)
+        "CREDIT_CARD",      # Credit cards (CreditCardRecognizer)
+        "PHONE_NUMBER",     # Phone numbers (PhoneRecognizer)
+        "EMAIL_ADDRESS",    # Email addresses (EmailRecognizer)
+        "IP_ADDRESS",       # IP addresses (IpRecognizer)
+        "URL",              # URLs (UrlRecognizer)
+        "DATE_TIME",        # Date/time formats (DateRecognizer)
+    ]
+
+    # Balanced threshold - catches real PII but avoids medical term false positives
+    PRESIDIO_SCORE_THRESHOLD = 0.6
+
+    def _analyze_presidio_batch(
+        self, texts: list[str], language: str, batch_size: int
+    ) -> list | None:
+        """
+        Run Presidio analysis for many texts in one batched NLP pass.
+
+        Returns:
+            One list of RecognizerResult per text, or None if batching is unavailable
+            (callers then fall back to per-text analysis inside _remove_pii_with_presidio)
+        """
+        if not self.presidio_available or not self.presidio_analyzer:
+            return None
+
+        try:
+            from presidio_analyzer import BatchAnalyzerEngine
+
+            batch_analyzer = BatchAnalyzerEngine(analyzer_engine=self.presidio_analyzer)
+            return [
+                list(results)
+                for results in batch_analyzer.analyze_iterator(
+                    texts=texts,
+                    language=language,
+                    batch_size=batch_size,
+                    entities=self.PRESIDIO_ENTITIES,
+                    score_threshold=self.PRESIDIO_SCORE_THRESHOLD,
+                )
+            ]
+        except Exception as e:
+            logger.warning(f"Batched Presidio analysis failed, falling back to per-text: {e}")
+            return None
+
     def _remove_pii_with_presidio(
         self,
         text: str,
         language: str,
-        custom_terms: set | None = None
+        custom_terms: set | None = None,
+        analyzer_results: list | None = None
     ) -> tuple[str, dict]:
         """
         Secondary PII detection pass using Microsoft Presidio.
@@ -2900,34 +2986,26 @@ class PIIFilter:
         - IBAN codes
         - Credit card numbers
         - Additional phone/email formats
+
+        Args:
+            analyzer_results: Precomputed Presidio results for ``text`` (batch mode).
+                              Analyzed here if not given.
         """
         if not self.presidio_available or not self.presidio_analyzer:
             return text, {"presidio_available": False, "presidio_removals": 0}
 
         presidio_removals = 0
 
-        # Presidio entity types that match our registered recognizers
-        # Only request entities we have recognizers for (avoids warnings)
-        entities_to_detect = [
-            "PERSON",           # Names (SpacyRecognizer)
-            "LOCATION",         # Locations (SpacyRecognizer)
-            "IBAN_CODE",        # IBAN (IbanRecognizer)
-            "CREDIT_CARD",      # Credit cards (CreditCardRecognizer)
-            "PHONE_NUMBER",     # Phone numbers (PhoneRecognizer)
-            "EMAIL_ADDRESS",    # Email addresses (EmailRecognizer)
-            "IP_ADDRESS",       # IP addresses (IpRecognizer)
-            "URL",              # URLs (UrlRecognizer)
-            "DATE_TIME",        # Date/time formats (DateRecognizer)
-        ]
-
         try:
-            # Run Presidio analysis
-            results = self.presidio_analyzer.analyze(
-                text=text,
-                language=language,
-                entities=entities_to_detect,
-                score_threshold=0.6  # Balanced threshold - catches real PII but avoids medical term false positives
-            )
+            # Run Presidio analysis (unless already done by the batch path)
+            if analyzer_results is None:
+                analyzer_results = self.presidio_analyzer.analyze(
+                    text=text,
+                    language=language,
+                    entities=self.PRESIDIO_ENTITIES,
+                    score_threshold=self.PRESIDIO_SCORE_THRESHOLD,
+                )
+            results = analyzer_results
 
             # Sort by position (reverse) to preserve indices during replacement
             results = sorted(results, key=lambda x: x.start, reverse=True)
@@ -3419,40 +3497,34 @@ class PIIFilter:
 
         return text, max(0, fixes)
 
-    def remove_pii(
+    def _build_custom_terms(
         self,
-        text: str,
-        language: Literal["de", "en"] = "de",
-        custom_protection_terms: list[str] | None = None
-    ) -> tuple[str, dict]:
+        custom_protection_terms: list[str] | None,
+        custom_terms: frozenset[str] | None = None,
+    ) -> set | frozenset | None:
         """
-        Remove PII from text.
-
-        Args:
-            text: Input text to process
-            language: Language code ('de' for German, 'en' for English)
-            custom_protection_terms: Additional terms to protect (from database)
+        Build lowercase custom terms set for efficient lookup.
 
-        Returns:
-            Tuple of (cleaned_text, metadata_dict)
+        A precompiled set (registered term set) is used as is; only terms sent
+        inline with the request are lowercased here.
         """
-        if not text or not text.strip():
-            return text, {"entities_detected": 0, "error": "Empty text"}
-
-        # Build custom terms set for efficient lookup
-        custom_terms: set | None = None
-        if custom_protection_terms:
-            custom_terms = {term.lower() for term in custom_protection_terms}
-
-        original_length = len(text)
-        metadata = {
+        if not custom_protection_terms:
+            return custom_terms or None
+        inline_terms = {term.lower() for term in custom_protection_terms}
+        return inline_terms | custom_terms if custom_terms else inline_terms
+
+    def _new_metadata(self, text: str, language: str, custom_terms: set | None) -> dict:
+        """Create the per-document metadata dict."""
+        return {
             "language": language,
-            "original_length": original_length,
+            "original_length": len(text),
             "processing_timestamp": datetime.now().isoformat(),
             "gdpr_compliant": True,
             "custom_terms_count": len(custom_terms) if custom_terms else 0
         }
 
+    def _remove_pii_pre_ner(self, text: str, language: str, metadata: dict) -> str:
+        """Run the regex stages (letterhead + patterns) that precede NER."""
         # Step 0: Remove hospital letterhead (header block removal)
         text, letterhead_meta = self._remove_hospital_letterhead(text)
         metadata.update(letterhead_meta)
@@ -3461,14 +3533,10 @@ class PIIFilter:
         text, pattern_meta = self._remove_pii_with_patterns(text, language)
         metadata.update(pattern_meta)
 
-        # Step 2: Remove names with NER (with custom terms protection)
-        text, ner_meta = self._remove_names_with_ner(text, language, custom_terms)
-        metadata.update(ner_meta)
-
-        # Step 3: Secondary pass with Presidio (catches missed PII)
-        text, presidio_meta = self._remove_pii_with_presidio(text, language, custom_terms)
-        metadata.update(presidio_meta)
+        return text
 
+    def _finalize_pii_removal(self, text: str, metadata: dict) -> tuple[str, dict]:
+        """Placeholder cleanup and totals after all detection stages."""
         # Step 4: Post-processing cleanup (fix merged placeholders)
         text, placeholder_fixes = self._cleanup_placeholders(text)
         metadata["placeholder_fixes"] = placeholder_fixes
@@ -3487,27 +3555,121 @@ class PIIFilter:
 
         return text, metadata
 
+    def remove_pii(
+        self,
+        text: str,
+        language: Literal["de", "en"] = "de",
+        custom_protection_terms: list[str] | None = None,
+        custom_terms: frozenset[str] | None = None
+    ) -> tuple[str, dict]:
+        """
+        Remove PII from text.
+
+        Args:
+            text: Input text to process
+            language: Language code ('de' for German, 'en' for English)
+            custom_protection_terms: Additional terms to protect (from database)
+            custom_terms: Precompiled lowercase terms to protect (registered term set)
+
+        Returns:
+            Tuple of (cleaned_text, metadata_dict)
+        """
+        if not text or not text.strip():
+            return text, {"entities_detected": 0, "error": "Empty text"}
+
+        custom_terms = self._build_custom_terms(custom_protection_terms, custom_terms)
+        metadata = self._new_metadata(text, language, custom_terms)
+
+        # Steps 0-1: Letterhead and regex patterns
+        text = self._remove_pii_pre_ner(text, language, metadata)
+
+        # Step 2: Remove names with NER (with custom terms protection)
+        text, ner_meta = self._remove_names_with_ner(text, language, custom_terms)
+        metadata.update(ner_meta)
+
+        # Step 3: Secondary pass with Presidio (catches missed PII)
+        text, presidio_meta = self._remove_pii_with_presidio(text, language, custom_terms)
+        metadata.update(presidio_meta)
+
+        return self._finalize_pii_removal(text, metadata)
+
     def remove_pii_batch(
         self,
         texts: list[str],
         language: Literal["de", "en"] = "de",
         batch_size: int = 32,
-        custom_protection_terms: list[str] | None = None
+        custom_protection_terms: list[str] | None = None,
+        n_process: int | None = None,
+        custom_terms: frozenset[str] | None = None
     ) -> list[tuple[str, dict]]:
         """
         Remove PII from multiple texts.
 
+        Regex stages run per text, the SpaCy NER stage runs once over all texts
+        via nlp.pipe() and Presidio analysis is batched, so results are identical
+        to calling remove_pii() on each text but model overhead is shared.
+
         Args:
             texts: List of texts to process
             language: Language code
-            batch_size: Batch size for processing (not used currently, for future optimization)
+            batch_size: Number of texts per nlp.pipe()/Presidio batch
             custom_protection_terms: Additional terms to protect (from database)
+            n_process: SpaCy worker processes for nlp.pipe() (default: PII_NER_N_PROCESS)
+            custom_terms: Precompiled lowercase terms to protect (registered term set)
 
         Returns:
-            List of (cleaned_text, metadata) tuples
+            List of (cleaned_text, metadata) tuples, in input order
         """
-        results = []
-        for text in texts:
-            cleaned, meta = self.remove_pii(text, language, custom_protection_terms)
-            results.append((cleaned, meta))
+        if n_process is None:
+            n_process = self.NER_N_PROCESS
+
+        custom_terms = self._build_custom_terms(custom_protection_terms, custom_terms)
+        results: list[tuple[str, dict] | None] = [None] * len(texts)
+
+        # Steps 0-1 per text (empty texts short-circuit like remove_pii())
+        pending_indices: list[int] = []
+        pending_texts: list[str] = []
+        pending_metadata: list[dict] = []
+        for index, text in enumerate(texts):
+            if not text or not text.strip():
+                results[index] = (text, {"entities_detected": 0, "error": "Empty text"})
+                continue
+            metadata = self._new_metadata(text, language, custom_terms)
+            pending_indices.append(index)
+            pending_texts.append(self._remove_pii_pre_ner(text, language, metadata))
+            pending_metadata.append(metadata)
+
+        if not pending_texts:
+            return results
+
+        # Step 2: One nlp.pipe() pass over all texts, then per-text entity handling
+        nlp = self.nlp_de if language == "de" else self.nlp_en
+        if nlp is not None:
+            docs = nlp.pipe(list(pending_texts), batch_size=batch_size, n_process=n_process)
+        else:
+            docs = [None] * len(pending_texts)
+
+        for position, doc in enumerate(docs):
+            pending_texts[position], ner_meta = self._remove_names_with_ner(
+                pending_texts[position], language, custom_terms, doc=doc
+            )
+            pending_metadata[position].update(ner_meta)
+
+        # Step 3: Batched Presidio analysis (falls back to per-text analysis)
+        presidio_results = self._analyze_presidio_batch(pending_texts, language, batch_size)
+
+        for position, index in enumerate(pending_indices):
+            text, presidio_meta = self._remove_pii_with_presidio(
+                pending_texts[position],
+                language,
+                custom_terms,
+                analyzer_results=presidio_results[position] if presidio_results else None,
+            )
+            metadata = pending_metadata[position]
+            metadata.update(presidio_meta)
+            results[index] = self._finalize_pii_removal(text, metadata)
+
+        logger.info(
+            f"Batch PII removal: {len(texts)} texts (batch_size={batch_size}, n_process={n_process})"
+        )
         return results
@@ -0,0 +1,131 @@
+"""
+Registered custom protection term sets.
+
+Clients used to send the full list of custom medical terms, drug names and
+eponyms with every /remove-pii request, and the filter lowercased it into a new
+set each time. Instead, a client registers the list once with
+PUT /term-sets/{term_hash} and then sends only the hash. The service keeps the
+normalized terms as a frozenset, which the filter uses as is for its lookups.
+
+The hash is the SHA-256 of the normalized terms (stripped, lowercased, unique,
+sorted, joined with newlines), so identical lists share one entry and a client
+can compute it without asking the service.
+
+Term sets live in memory only. After a restart, or once evicted by newer sets
+(PII_TERM_SETS_MAX, least recently used first), requests with the hash get
+409 and the client registers the set again.
+"""
+
+import hashlib
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+
+logger = logging.getLogger(__name__)
+
+
+def normalize_terms(terms: Iterable[str]) -> list[str]:
+    """Strip, lowercase, deduplicate and sort terms (the hashed form)."""
+    return sorted({term.strip().lower() for term in terms if term and term.strip()})
+
+
+def _digest(normalized: list[str]) -> str:
+    return hashlib.sha256("\n".join(normalized).encode("utf-8")).hexdigest()
+
+
+def compute_term_set_hash(terms: Iterable[str]) -> str:
+    """SHA-256 hex digest of the normalized terms."""
+    return _digest(normalize_terms(terms))
+
+
+class TermSetHashMismatchError(ValueError):
+    """Raised when registered terms do not match the hash they are registered under."""
+
+
+@dataclass(frozen=True)
+class TermSet:
+    """Normalized custom protection terms registered under their hash."""
+
+    term_hash: str
+    terms: frozenset[str]
+    registered_at: float = field(default_factory=time.time)
+
+
+class TermSetRegistry:
+    """Thread-safe LRU registry of term sets keyed by hash."""
+
+    def __init__(self, max_sets: int = 32):
+        """
+        Initialize the registry.
+
+        Args:
+            max_sets: Term sets kept before the least recently used is evicted
+        """
+        self.max_sets = max(1, max_sets)
+        self._sets: OrderedDict[str, TermSet] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    @classmethod
+    def from_env(cls) -> "TermSetRegistry":
+        """Create a registry sized by PII_TERM_SETS_MAX."""
+        return cls(max_sets=int(os.getenv("PII_TERM_SETS_MAX", "32")))
+
+    def register(self, term_hash: str, terms: Iterable[str]) -> TermSet:
+        """
+        Register terms under their hash (idempotent).
+
+        Args:
+            term_hash: Hash computed by the client
+            terms: Terms to protect
+
+        Returns:
+            The registered term set
+
+        Raises:
+            TermSetHashMismatchError: If term_hash is not the hash of terms
+        """
+        normalized = normalize_terms(terms)
+        actual_hash = _digest(normalized)
+        if actual_hash != term_hash.lower():
+            raise TermSetHashMismatchError(
+                f"Term set hash mismatch: expected {actual_hash}, got {term_hash}"
+            )
+
+        with self._lock:
+            term_set = self._sets.get(actual_hash)
+            if term_set is None:
+                term_set = TermSet(term_hash=actual_hash, terms=frozenset(normalized))
+                self._sets[actual_hash] = term_set
+                while len(self._sets) > self.max_sets:
+                    evicted, _ = self._sets.popitem(last=False)
+                    logger.info(f"Evicted term set {evicted[:12]}")
+                logger.info(f"Registered term set {actual_hash[:12]} ({len(normalized)} terms)")
+            self._sets.move_to_end(actual_hash)
+            return term_set
+
+    def get(self, term_hash: str) -> TermSet | None:
+        """Get a registered term set, or None if unknown or evicted."""
+        with self._lock:
+            term_set = self._sets.get(term_hash.lower())
+            if term_set is None:
+                self._misses += 1
+                return None
+            self._sets.move_to_end(term_set.term_hash)
+            self._hits += 1
+            return term_set
+
+    def stats(self) -> dict:
+        """Return registry counters (for /health)."""
+        with self._lock:
+            return {
+                "registered": len(self._sets),
+                "max_sets": self.max_sets,
+                "hits": self._hits,
+                "misses": self._misses,
+            }
@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""Pattern Stage Microbenchmark.
+
+Compares PIIFilter._remove_pii_with_patterns() (one subn() scan per pattern, one
+callback scan for dates) with the previous implementation (findall() + sub() per
+pattern, per-match string slicing for dates) on the golden corpus and on a
+long multi-page document built from it. Outputs must be identical.
+
+Usage:
+    python scripts/benchmark_patterns.py
+    python scripts/benchmark_patterns.py --iterations 200
+    python scripts/benchmark_patterns.py --output pattern_benchmark.json
+"""
+
+import argparse
+import json
+import statistics
+import sys
+import time
+from functools import partial
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.pii_filter import PIIFilter
+
+GOLDEN_PATH = Path(__file__).parent.parent / "tests" / "data" / "pattern_golden.json"
+
+# Pages per language in the long document
+LONG_DOCUMENT_PAGES = 25
+
+
+def legacy_remove_pii_with_patterns(pii_filter: PIIFilter, text: str, language: str):
+    """Previous implementation: scans every pattern twice, rebuilds per date match."""
+    patterns = pii_filter.patterns_de if language == "de" else pii_filter.patterns_en
+    removed_count = 0
+    pii_types = []
+    dates_preserved = 0
+    priority_order = list(PIIFilter.PATTERN_PRIORITY_ORDER)
+    context_aware_patterns = list(PIIFilter.CONTEXT_AWARE_DATE_PATTERNS)
+
+    for pii_type in priority_order:
+        if pii_type in patterns:
+            pattern = patterns[pii_type]
+            matches = pattern.findall(text)
+            if matches:
+                removed_count += len(matches)
+                pii_types.append(pii_type)
+                text = pattern.sub(pii_filter._get_placeholder(pii_type), text)
+
+    for pii_type, pattern in patterns.items():
+        if pii_type in priority_order:
+            continue
+        if pii_type in context_aware_patterns:
+            for match in reversed(list(pattern.finditer(text))):
+                if pii_filter._is_medical_context_date(text, match.start(), match.end()):
+                    dates_preserved += 1
+                    continue
+                placeholder = pii_filter._get_placeholder(pii_type)
+                text = text[: match.start()] + placeholder + text[match.end() :]
+                removed_count += 1
+                if pii_type not in pii_types:
+                    pii_types.append(pii_type)
+        else:
+            matches = pattern.findall(text)
+            if matches:
+                removed_count += len(matches)
+                pii_types.append(pii_type)
+                text = pattern.sub(pii_filter._get_placeholder(pii_type), text)
+
+    return text, {
+        "pattern_removals": removed_count,
+        "pii_types": pii_types,
+        "dates_preserved": dates_preserved,
+    }
+
+
+def load_documents() -> dict[str, tuple[str, str]]:
+    """Golden corpus documents plus one long document per language."""
+    cases = json.loads(GOLDEN_PATH.read_text(encoding="utf-8"))
+    documents = {f"{c['language']}_{i}": (c["language"], c["text"]) for i, c in enumerate(cases)}
+    for language in ("de", "en"):
+        pages = [c["text"] for c in cases if c["language"] == language]
+        documents[f"{language}_long"] = (language, "\n\f\n".join(pages * LONG_DOCUMENT_PAGES))
+    return documents
+
+
+def time_call(func, iterations: int) -> dict:
+    """Run func repeatedly and return timing statistics in milliseconds."""
+    timings = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - start) * 1000)
+    return {
+        "mean_ms": round(statistics.mean(timings), 3),
+        "median_ms": round(statistics.median(timings), 3),
+        "min_ms": round(min(timings), 3),
+    }
+
+
+def run_benchmark(iterations: int) -> dict:
+    pii_filter = PIIFilter()
+    documents = load_documents()
+    results = {"iterations": iterations, "documents": {}, "outputs_identical": True}
+
+    print(f"\n{'Document':<12} {'Chars':>8} {'Legacy ms':>11} {'Engine ms':>11} {'Speedup':>9}")
+    print("-" * 55)
+
+    for name, (language, text) in documents.items():
+        legacy_output = legacy_remove_pii_with_patterns(pii_filter, text, language)
+        engine_output = pii_filter._remove_pii_with_patterns(text, language)
+        identical = legacy_output == engine_output
+        results["outputs_identical"] &= identical
+
+        legacy = time_call(
+            partial(legacy_remove_pii_with_patterns, pii_filter, text, language), iterations
+        )
+        engine = time_call(
+            partial(pii_filter._remove_pii_with_patterns, text, language), iterations
+        )
+        speedup = legacy["median_ms"] / engine["median_ms"] if engine["median_ms"] else 0.0
+
+        results["documents"][name] = {
+            "language": language,
+            "chars": len(text),
+            "legacy": legacy,
+            "engine": engine,
+            "speedup": round(speedup, 2),
+            "identical": identical,
+        }
+        marker = "" if identical else "  OUTPUT DIFFERS"
+        print(
+            f"{name:<12} {len(text):>8} {legacy['median_ms']:>11.3f} "
+            f"{engine['median_ms']:>11.3f} {speedup:>8.2f}x{marker}"
+        )
+
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="PII pattern stage microbenchmark")
+    parser.add_argument(
+        "--iterations",
+        "-i",
+        type=int,
+        default=50,
+        help="Number of iterations per document (default: 50)",
+    )
+    parser.add_argument(
+        "--output", "-o", type=str, default=None, help="Output JSON file path (optional)"
+    )
+    args = parser.parse_args()
+
+    results = run_benchmark(iterations=args.iterations)
+
+    if args.output:
+        output_path = Path(args.output)
+        with open(output_path, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"\nResults saved to: {output_path}")
+
+    if not results["outputs_identical"]:
+        print("\n⚠️  Pattern engine output differs from the legacy implementation!")
+        sys.exit(1)
+
+    sys.exit(0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""
+Unit tests for the PII worker pool.
+
+Tests cover:
+- Thread and process mode return the same results as direct calls
+- Queue-wait vs compute timing
+- Fail-fast saturation with Retry-After
+"""
+
+import asyncio
+import threading
+
+import pytest
+
+from app.executor import ExecutorSaturatedError, PIIExecutor
+from app.pii_filter import PIIFilter
+
+SAMPLE_TEXT = "Dr. med. Schmidt untersucht Herrn Müller. Tel.: 030 12345678"
+
+
+@pytest.fixture(scope="module")
+def pii_filter():
+    """Create PII filter instance for testing."""
+    return PIIFilter()
+
+
+class BlockingFilter:
+    """Filter whose calls block until released (to fill the pool)."""
+
+    def __init__(self):
+        self.release = threading.Event()
+
+    def remove_pii(self, text, **kwargs):
+        self.release.wait(timeout=5)
+        return text, {}
+
+
+class TestExecutorModes:
+    """Test that pooled calls match direct calls."""
+
+    @pytest.mark.parametrize("mode", ["thread", "process"])
+    def test_pooled_result_matches_direct(self, pii_filter, mode):
+        """Test pooled remove_pii returns the same text as a direct call."""
+        executor = PIIExecutor(pii_filter, mode=mode, workers=1)
+        try:
+            (cleaned, metadata), timing = asyncio.run(
+                executor.run("remove_pii", text=SAMPLE_TEXT, language="de")
+            )
+        finally:
+            executor.shutdown()
+
+        expected, _ = pii_filter.remove_pii(SAMPLE_TEXT, language="de")
+        assert cleaned == expected
+        assert "[DOCTOR_NAME]" in cleaned
+        assert timing["queue_wait_ms"] >= 0.0
+        assert timing["compute_ms"] > 0.0
+
+    def test_batch_method(self, pii_filter):
+        """Test batch calls are routed to remove_pii_batch."""
+        executor = PIIExecutor(pii_filter, mode="thread", workers=1)
+        try:
+            results, _ = asyncio.run(
+                executor.run("remove_pii_batch", texts=[SAMPLE_TEXT, ""], language="de")
+            )
+        finally:
+            executor.shutdown()
+
+        assert len(results) == 2
+        assert results[1][1]["error"] == "Empty text"
+
+    def test_invalid_mode(self, pii_filter):
+        """Test unknown modes are rejected."""
+        with pytest.raises(ValueError):
+            PIIExecutor(pii_filter, mode="gpu")
+
+
+class TestExecutorSaturation:
+    """Test bounded queue behaviour."""
+
+    def test_rejects_when_queue_full(self):
+        """Test calls beyond workers + max_queue fail fast."""
+        blocking = BlockingFilter()
+        executor = PIIExecutor(blocking, mode="thread", workers=1, max_queue=1, retry_after=7)
+
+        async def scenario():
+            running = asyncio.ensure_future(executor.run("remove_pii", text="a"))
+            queued = asyncio.ensure_future(executor.run("remove_pii", text="b"))
+            await asyncio.sleep(0.05)
+
+            with pytest.raises(ExecutorSaturatedError) as exc_info:
+                await executor.run("remove_pii", text="c")
+            assert exc_info.value.retry_after == 7
+
+            stats = executor.stats()
+            assert stats["in_flight"] == 2
+            assert stats["queued"] == 1
+            assert stats["rejected"] == 1
+
+            blocking.release.set()
+            first, second = await asyncio.gather(running, queued)
+            # The second call waited for the single worker
+            assert second[1]["queue_wait_ms"] >= first[1]["queue_wait_ms"]
+
+        try:
+            asyncio.run(scenario())
+        finally:
+            blocking.release.set()
+            executor.shutdown()
+
+        assert executor.stats()["completed"] == 2
+        assert executor.stats()["in_flight"] == 0
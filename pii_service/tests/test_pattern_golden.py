@@ -0,0 +1,58 @@
+"""
+Golden-output tests for the regex pattern stage.
+
+tests/data/pattern_golden.json holds German and English document fragments with
+the exact output of PIIFilter._remove_pii_with_patterns(). Any change to pattern
+order, placeholders or date context handling shows up here as a diff.
+"""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from app.pii_filter import PIIFilter
+
+GOLDEN_PATH = Path(__file__).parent / "data" / "pattern_golden.json"
+GOLDEN_CASES = json.loads(GOLDEN_PATH.read_text(encoding="utf-8"))
+
+
+@pytest.fixture(scope="module")
+def pii_filter():
+    """Create PII filter instance for testing."""
+    return PIIFilter()
+
+
+@pytest.mark.parametrize(
+    "case", GOLDEN_CASES, ids=[f"{c['language']}-{i}" for i, c in enumerate(GOLDEN_CASES)]
+)
+def test_pattern_stage_matches_golden_output(pii_filter, case):
+    """Test pattern removal output and metadata are unchanged."""
+    cleaned, metadata = pii_filter._remove_pii_with_patterns(case["text"], case["language"])
+
+    assert cleaned == case["expected_text"]
+    assert metadata == case["expected_metadata"]
+
+
+def test_pass_plan_keeps_priority_order(pii_filter):
+    """Test name patterns run before all other patterns."""
+    for passes in (pii_filter.pattern_passes_de, pii_filter.pattern_passes_en):
+        pii_types = [pii_type for pii_type, _, _, _ in passes]
+        priority = [t for t in PIIFilter.PATTERN_PRIORITY_ORDER if t in pii_types]
+        assert pii_types[: len(priority)] == priority
+
+
+def test_later_passes_see_earlier_placeholders(pii_filter):
+    """Test overlapping patterns are applied in order, not leftmost-first."""
+    cleaned, metadata = pii_filter._remove_pii_with_patterns(
+        "Versicherten-Nr.: 123456789\nUnser Zeichen: DS/2024/0815", "de"
+    )
+
+    assert cleaned == "Versicherten-Nr.: 1234[PLZ_CITY]: [REFERENCE_ID]"
+    assert metadata["pii_types"] == ["case_reference", "plz_city"]
+
+
+def test_date_passes_are_context_aware(pii_filter):
+    """Test date patterns are flagged for context-aware replacement."""
+    date_passes = {pii_type for pii_type, _, _, is_date in pii_filter.pattern_passes_de if is_date}
+    assert date_passes == {"date_standalone", "date_german_month"}
@@ -552,6 +552,50 @@ class TestEdgeCases:
         assert "Spezialmedikament" in result
 
 
+class TestBatchProcessing:
+    """Tests that batched processing matches single-text processing."""
+
+    BATCH_TEXTS = [
+        "Dr. med. Schmidt untersucht Herrn Müller, geb. 12.03.1965.",
+        "",
+        "Patient: Max Mustermann\nTel.: 030 12345678\nDiagnose: Diabetes mellitus Typ 2",
+        "Die Untersuchung ergab keine Auffälligkeiten.",
+        "   ",
+        "Frau Anna Weber, Hauptstraße 12, 10115 Berlin. HbA1c 7,2 %.",
+    ]
+
+    @staticmethod
+    def _without_timestamp(metadata):
+        return {k: v for k, v in metadata.items() if k != "processing_timestamp"}
+
+    def test_batch_matches_single(self, pii_filter):
+        """Test that remove_pii_batch returns the same results as remove_pii."""
+        batch_results = pii_filter.remove_pii_batch(
+            self.BATCH_TEXTS, language="de", batch_size=2
+        )
+
+        assert len(batch_results) == len(self.BATCH_TEXTS)
+        for text, (batch_text, batch_meta) in zip(self.BATCH_TEXTS, batch_results, strict=True):
+            single_text, single_meta = pii_filter.remove_pii(text, language="de")
+            assert batch_text == single_text
+            assert self._without_timestamp(batch_meta) == self._without_timestamp(single_meta)
+
+    def test_batch_with_custom_protection_terms(self, pii_filter):
+        """Test custom protection terms are applied to every text in the batch."""
+        texts = ["Der Patient Spezialmedikament nimmt täglich."] * 3
+        results = pii_filter.remove_pii_batch(
+            texts, language="de", custom_protection_terms=["Spezialmedikament"]
+        )
+        for cleaned, metadata in results:
+            assert "Spezialmedikament" in cleaned
+            assert metadata["custom_terms_count"] == 1
+
+    def test_batch_all_empty(self, pii_filter):
+        """Test batch of only empty texts."""
+        results = pii_filter.remove_pii_batch(["", "  "], language="de")
+        assert [metadata.get("error") for _, metadata in results] == ["Empty text"] * 2
+
+
 # =============================================================================
 # NEW PII OPTIMIZATION TESTS (Issue: PII Filter Optimization)
 # =============================================================================
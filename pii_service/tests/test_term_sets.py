@@ -0,0 +1,80 @@
+"""
+Unit tests for registered custom protection term sets.
+
+Tests cover:
+- Hash normalization (case, whitespace, duplicates, order)
+- Idempotent registration and hash mismatch rejection
+- LRU eviction and hit/miss counters
+"""
+
+import pytest
+
+from app.term_sets import (
+    TermSetHashMismatchError,
+    TermSetRegistry,
+    compute_term_set_hash,
+    normalize_terms,
+)
+
+
+def test_normalize_terms():
+    assert normalize_terms([" Morbus Crohn", "ASPIRIN", "aspirin", "", "  "]) == [
+        "aspirin",
+        "morbus crohn",
+    ]
+
+
+def test_hash_ignores_case_whitespace_and_order():
+    assert compute_term_set_hash(["Aspirin", " Morbus Crohn "]) == compute_term_set_hash(
+        ["morbus crohn", "aspirin", "ASPIRIN"]
+    )
+    assert compute_term_set_hash(["aspirin"]) != compute_term_set_hash(["ibuprofen"])
+
+
+def test_register_is_idempotent():
+    registry = TermSetRegistry()
+    terms = ["Aspirin", "Morbus Crohn"]
+    term_hash = compute_term_set_hash(terms)
+
+    first = registry.register(term_hash, terms)
+    second = registry.register(term_hash.upper(), reversed(terms))
+
+    assert first is second
+    assert first.terms == frozenset({"aspirin", "morbus crohn"})
+    assert registry.stats()["registered"] == 1
+
+
+def test_register_rejects_hash_mismatch():
+    registry = TermSetRegistry()
+
+    with pytest.raises(TermSetHashMismatchError):
+        registry.register(compute_term_set_hash(["aspirin"]), ["ibuprofen"])
+
+    assert registry.stats()["registered"] == 0
+
+
+def test_least_recently_used_set_is_evicted():
+    registry = TermSetRegistry(max_sets=2)
+    hashes = [compute_term_set_hash([term]) for term in ("a", "b", "c")]
+
+    registry.register(hashes[0], ["a"])
+    registry.register(hashes[1], ["b"])
+    assert registry.get(hashes[0]) is not None
+    registry.register(hashes[2], ["c"])
+
+    assert registry.get(hashes[1]) is None
+    assert registry.get(hashes[0]) is not None
+    assert registry.get(hashes[2]) is not None
+
+
+def test_get_counts_hits_and_misses():
+    registry = TermSetRegistry()
+    term_hash = compute_term_set_hash(["aspirin"])
+
+    assert registry.get(term_hash) is None
+    registry.register(term_hash, ["aspirin"])
+    assert registry.get(term_hash).terms == frozenset({"aspirin"})
+
+    stats = registry.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
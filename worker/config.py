@@ -49,6 +49,7 @@ CELERY_TASK_ROUTES = {
     'cleanup_old_files': {'queue': 'maintenance'},
     'database_maintenance': {'queue': 'maintenance'},
     'cleanup_orphaned_content': {'queue': 'maintenance'},  # GDPR cleanup (Issue #47)
+    'rollup_ai_costs': {'queue': 'maintenance'},
 }
 
 # ==================== RETRY CONFIGURATION ====================
@@ -145,6 +146,11 @@ CELERYBEAT_SCHEDULE = {
         'schedule': 3600.0,  # Run every hour - GDPR content cleanup (Issue #47)
         'options': {'queue': 'maintenance'}
     },
+    'rollup-ai-costs-hourly': {
+        'task': 'rollup_ai_costs',
+        'schedule': 3600.0,  # Run every hour - pre-aggregate cost dashboard data
+        'options': {'queue': 'maintenance'}
+    },
 }
 
 # ==================== MONITORING & LOGGING ====================
@@ -32,14 +32,27 @@ def _process_document_impl(self, processing_id: str, options: dict = None):
     logger.info(f"📄 Processing document: {processing_id}")
 
     # Import dependencies
+    from app.core.encryption import encryptor
     from app.database.connection import get_db_session
     from app.database.modular_pipeline_models import PipelineJobDB, StepExecutionStatus, OCRConfigurationDB
     from app.repositories.pipeline_job_repository import PipelineJobRepository
     from app.services.modular_pipeline_executor import ModularPipelineExecutor
     from app.services.ocr_engine_manager import OCREngineManager
+    from app.services.pipeline_plan_cache import get_pipeline_plan_cache
+    from app.services.pipeline_progress_tracker import PipelineProgressTracker
+    from app.services.file_quality_detector import ocr_quality_summary
+    from app.services.quality_analysis_runner import get_cached_analysis
     from sqlalchemy.orm import Session
 
     db: Session = next(get_db_session())
+    progress_tracker = PipelineProgressTracker()
+
+    def publish_status(status, progress_percent=None, error=None):
+        """Push a job status transition to open progress streams (never fails the task)."""
+        try:
+            await_sync(progress_tracker.status_changed(processing_id, status.value, progress_percent, error))
+        except Exception as publish_error:
+            logger.warning(f"⚠️ Failed to publish status event: {publish_error}")
 
     try:
         # Load job from database using repository (ensures file_content is decrypted)
@@ -66,13 +79,16 @@ def _process_document_impl(self, processing_id: str, options: dict = None):
             logger.info(f"📋 Loaded job: {job.filename} ({job.file_size} bytes)")
             logger.info(f"🔍 file_content after load: {file_content_len} bytes")
             
-            # Check if it's decrypted (should be PDF binary, not encrypted string)
-            if isinstance(file_content_for_processing, bytes):
+            # Check if it's decrypted (should be PDF binary, not encrypted token)
+            if encryptor.is_binary_token(file_content_for_processing):
+                logger.error("❌ ERROR: file_content is still ENCRYPTED! This should be decrypted!")
+                raise ValueError("file_content was not decrypted by repository!")
+            elif isinstance(file_content_for_processing, bytes):
                 try:
                     # Try to decode as UTF-8 to check if it's encrypted
                     decoded = file_content_for_processing[:100].decode('utf-8')
                     if decoded.startswith('gAAAAA') or decoded.startswith('Z0FBQUFB'):
-                        logger.error(f"❌ ERROR: file_content is still ENCRYPTED! This should be decrypted!")
+                        logger.error("❌ ERROR: file_content is still ENCRYPTED! This should be decrypted!")
                         logger.error(f"   Preview: {decoded[:50]}...")
                         raise ValueError("file_content was not decrypted by repository!")
                     else:
@@ -105,7 +121,8 @@ def _process_document_impl(self, processing_id: str, options: dict = None):
         if not job.started_at:
             update_data["started_at"] = datetime.now()
             logger.warning("⚠️ started_at was not set by upload endpoint, setting now")
-        job_repo.update(job_id_for_updates, **update_data)
+        job_repo.update_columns(job_id_for_updates, **update_data)
+        publish_status(StepExecutionStatus.RUNNING, progress_percent=0)
 
         # Update Celery task state
         self.update_state(
@@ -114,7 +131,7 @@ def _process_document_impl(self, processing_id: str, options: dict = None):
         )
 
         # Execute modular pipeline
-        executor = ModularPipelineExecutor(db)
+        executor = ModularPipelineExecutor(db, plan_cache=get_pipeline_plan_cache())
 
         # Step 1: OCR (if needed)
         extracted_text = ""
@@ -122,8 +139,9 @@ def _process_document_impl(self, processing_id: str, options: dict = None):
         ocr_confidence = 0.0
         if job.file_type in ["pdf", "image", "jpg", "jpeg", "png"]:
             logger.info(f"🔍 Starting OCR for {job.file_type.upper()}...")
-            # Use repository update to avoid overwriting encrypted file_content
-            job_repo.update(job_id_for_updates, progress_percent=10)
+            # Column-only update: never loads or decrypts file_content
+            job_repo.update_columns(job_id_for_updates, progress_percent=10)
+            publish_status(StepExecutionStatus.RUNNING, progress_percent=10)
             self.update_state(
                 state='PROCESSING',
                 meta={'progress': 10, 'status': 'ocr', 'current_step': 'Texterkennung (OCR)'}
@@ -132,13 +150,24 @@ def _process_document_impl(self, processing_id: str, options: dict = None):
             ocr_manager = OCREngineManager(db)
             start_time = time.time()
 
+            # Upload-time quality analysis lets scanned PDFs skip the embedded-text probe.
+            # If the upload didn't wait for it, it may have been cached by content hash since.
+            quality_analysis = (job.ocr_config or {}).get("quality_analysis")
+            content_sha256 = (job.ocr_config or {}).get("content_sha256")
+            if quality_analysis is None and content_sha256 and job.file_type == "pdf":
+                cached_analysis = await_sync(get_cached_analysis(content_sha256, "pdf"))
+                if cached_analysis is not None:
+                    quality_analysis = ocr_quality_summary(cached_analysis[2])
+                    logger.info("🔍 Using cached upload quality analysis for OCR")
+
             # Call OCR engine (selected engine from database configuration)
             # Use file_content_for_processing (local copy) instead of job.file_content
             ocr_result = await_sync(
                 ocr_manager.extract_text(
                     file_content=file_content_for_processing,
                     file_type=job.file_type,
-                    filename=job.filename
+                    filename=job.filename,
+                    quality_analysis=quality_analysis,
                 )
             )
 
@@ -148,8 +177,8 @@ def _process_document_impl(self, processing_id: str, options: dict = None):
             ocr_markdown = ocr_result.markdown
 
             ocr_time = time.time() - start_time
-            # Use repository update to avoid overwriting encrypted file_content
-            job_repo.update(job_id_for_updates, ocr_time_seconds=ocr_time)
+            # Column-only update: never loads or decrypts file_content
+            job_repo.update_columns(job_id_for_updates, ocr_time_seconds=ocr_time)
             logger.info(f"✅ OCR completed in {ocr_time:.2f}s: {len(extracted_text)} characters, confidence: {ocr_confidence:.2%}")
 
             # ⚡ Step 1.5: PII Removal (BEFORE sending to AI pipeline)
@@ -161,8 +190,9 @@ def _process_document_impl(self, processing_id: str, options: dict = None):
 
             if pii_enabled:
                 logger.info("🔒 Starting PII removal (external service)...")
-                # Use repository update to avoid overwriting encrypted file_content
-                job_repo.update(job_id_for_updates, progress_percent=15)
+                # Column-only update: never loads or decrypts file_content
+                job_repo.update_columns(job_id_for_updates, progress_percent=15)
+                publish_status(StepExecutionStatus.RUNNING, progress_percent=15)
                 self.update_state(
                     state='PROCESSING',
                     meta={'progress': 15, 'status': 'pii_removal', 'current_step': 'Entfernung persönlicher Daten'}
@@ -195,8 +225,9 @@ def _process_document_impl(self, processing_id: str, options: dict = None):
             else:
                 logger.info("⏭️  PII removal disabled - skipping privacy filter")
 
-        # Update progress (use repository to avoid overwriting encrypted file_content)
-        job_repo.update(job_id_for_updates, progress_percent=20)
+        # Update progress (column-only update, never loads file_content)
+        job_repo.update_columns(job_id_for_updates, progress_percent=20)
+        publish_status(StepExecutionStatus.RUNNING, progress_percent=20)
 
         # Step 2: Execute pipeline steps
         logger.info("🔄 Starting pipeline execution...")
@@ -227,8 +258,8 @@ def _process_document_impl(self, processing_id: str, options: dict = None):
         )
 
         pipeline_time = time.time() - pipeline_start
-        # Use repository update to avoid overwriting encrypted file_content
-        job_repo.update(job_id_for_updates, ai_processing_time_seconds=pipeline_time)
+        # Column-only update: never loads or decrypts file_content
+        job_repo.update_columns(job_id_for_updates, ai_processing_time_seconds=pipeline_time)
 
         # Check if pipeline succeeded or terminated early
         if not success:
@@ -260,13 +291,14 @@ def _process_document_impl(self, processing_id: str, options: dict = None):
                 logger.error(f"   Error type: {error_type}, Step ID: {failed_step_id}")
 
                 # Store error details in job (using repository)
-                job_repo.update(
+                job_repo.update_columns(
                     job_id_for_updates,
                     status=StepExecutionStatus.FAILED,
                     failed_at=datetime.now(),
                     error_message=f"[{failed_step}] {error_msg}",
                     error_step_id=failed_step_id,
                 )
+                publish_status(StepExecutionStatus.FAILED, error=f"[{failed_step}] {error_msg}")
 
                 # Update Celery state with proper serializable error (avoid exception serialization issues)
                 self.update_state(
@@ -305,7 +337,7 @@ def _process_document_impl(self, processing_id: str, options: dict = None):
         # ==================== FINALIZE JOB (SINGLE SOURCE OF TRUTH) ====================
         # Update job columns directly (Issue #55: separate encrypted DB columns)
         # Content columns will be encrypted by repository automatically
-        job_repo.update(
+        job_repo.update_columns(
             job_id_for_updates,
             status=StepExecutionStatus.COMPLETED,
             completed_at=datetime.now(),
@@ -338,6 +370,7 @@ def _process_document_impl(self, processing_id: str, options: dict = None):
             termination_step=metadata.get('termination_step'),
             matched_value=metadata.get('matched_value'),
         )
+        publish_status(StepExecutionStatus.COMPLETED, progress_percent=100)
 
         logger.info(f"✅ Document processed successfully: {processing_id}")
 
@@ -358,7 +391,7 @@ def _process_document_impl(self, processing_id: str, options: dict = None):
         # Update job status using repository
         try:
             if 'job_id_for_updates' in locals():
-                job_repo.update(
+                job_repo.update_columns(
                     job_id_for_updates,
                     status=StepExecutionStatus.FAILED,
                     failed_at=datetime.now(),
@@ -368,6 +401,7 @@ def _process_document_impl(self, processing_id: str, options: dict = None):
                         "Please try with a smaller document or contact support."
                     ),
                 )
+                publish_status(StepExecutionStatus.FAILED, error="Processing timeout exceeded")
         except Exception as update_error:
             logger.error(f"Failed to update job status after timeout: {update_error}")
 
@@ -396,12 +430,13 @@ def _process_document_impl(self, processing_id: str, options: dict = None):
         # Update job status to FAILED using repository
         try:
             if 'job_id_for_updates' in locals():
-                job_repo.update(
+                job_repo.update_columns(
                     job_id_for_updates,
                     status=StepExecutionStatus.FAILED,
                     failed_at=datetime.now(),
                     error_message=str(e),
                 )
+                publish_status(StepExecutionStatus.FAILED, error=str(e))
         except Exception as update_error:
             logger.error(f"Failed to update job status after error: {update_error}")
 
@@ -3,6 +3,7 @@ Scheduled Background Tasks
 
 Tasks that run on a schedule (hourly, daily, etc.)
 """
+import contextlib
 import logging
 from worker.worker import celery_app
 
@@ -47,6 +48,48 @@ def database_maintenance():
         raise
 
 
+@celery_app.task(name='rollup_ai_costs')
+def rollup_ai_costs():
+    """
+    Roll up AI cost logs into hourly/daily buckets (ai_cost_rollups).
+
+    Aggregates every closed hour since the last run by model, step and
+    document type, so the cost dashboard reads pre-aggregated rows instead of
+    scanning ai_interaction_logs. Runs hourly via Celery Beat - well inside the
+    7-day log retention of database_maintenance.
+    """
+    logger.info("📊 Rolling up AI cost logs...")
+
+    try:
+        import sys
+        sys.path.insert(0, '/app/backend')
+        from app.database.connection import get_session
+        from app.services.ai_cost_tracker import AICostTracker
+
+        # Get session from generator
+        session_gen = get_session()
+        session = next(session_gen)
+
+        try:
+            result = AICostTracker(session).refresh_rollups()
+
+            logger.info(
+                f"✅ AI cost rollup complete: {result['hours']} hours, {result['days']} days "
+                f"(rolled up until {result['rolled_up_until']})"
+            )
+
+            return {'status': 'completed', **result}
+
+        finally:
+            # Close the session generator
+            with contextlib.suppress(StopIteration):
+                next(session_gen)
+
+    except Exception as e:
+        logger.error(f"❌ AI cost rollup error: {str(e)}")
+        raise
+
+
 @celery_app.task(name='health_check_worker')
 def health_check_worker():
     """
@@ -7,6 +7,7 @@ import os
 import sys
 import logging
 from celery import Celery
+from celery.signals import worker_process_init, worker_process_shutdown
 
 # Add paths for imports
 sys.path.insert(0, '/app/backend')
@@ -98,6 +99,33 @@ celery_app.conf.update(
     beat_schedule=config.CELERYBEAT_SCHEDULE,
 )
 
+
+
+@worker_process_init.connect
+def init_worker_process(**kwargs):
+    """Give each forked pool process its own SQLAlchemy connection pool."""
+    from app.database.connection import reset_engine_after_fork
+
+    reset_engine_after_fork()
+
+
+@worker_process_shutdown.connect
+def shutdown_worker_process(**kwargs):
+    """Flush buffered AI logs and close shared clients and pooled connections when a pool process exits."""
+    from app.database.connection import dispose_engine
+    from app.services.ai_log_writer import shutdown_ai_log_writer
+    from app.services.provider_clients import close_provider_clients
+    from worker.tasks.document_processing import await_sync
+
+    shutdown_ai_log_writer()
+    try:
+        # Pipeline steps run on the process' event loop (await_sync), which owns the clients
+        await_sync(close_provider_clients())
+    except Exception as e:
+        logger.warning(f"⚠️ Failed to close shared provider clients: {e}")
+    dispose_engine()
+
+
 logger.info("✅ Celery worker initialized with enhanced configuration")
 logger.info(f"⚙️  Worker settings:")
 logger.info(f"   - Concurrency: {config.WORKER_CONCURRENCY}")
@@ -121,6 +149,7 @@ logger.info("   - cleanup_orphaned_jobs: every 10 minutes → maintenance queue"
 logger.info("   - cleanup_celery_results: every hour → maintenance queue")
 logger.info("   - cleanup_old_files: every 24 hours → maintenance queue")
 logger.info("   - database_maintenance: every 24 hours → maintenance queue")
+logger.info("   - rollup_ai_costs: every hour → maintenance queue")
 logger.info("   ℹ️  This worker processes scheduled tasks, beat-service schedules them")
 
 if __name__ == '__main__':